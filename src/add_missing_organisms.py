@@ -11,9 +11,15 @@ import argparse
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Optional
-import time
 from Bio import Entrez
 
+try:
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import entrez_call
+except ImportError:
+    from apis.rate_limits import throttle
+    from apis.snapshots import entrez_call
+
 # Configure Entrez
 Entrez.email = "your.email@example.com"
 
@@ -43,10 +49,10 @@ def get_ncbi_taxon_id(organism_name: str) -> Optional[int]:
     def try_search(search_term: str) -> Optional[int]:
         """Try searching with a specific term."""
         try:
-            time.sleep(0.5)  # Rate limiting
-
             # Search taxonomy database
-            search_handle = Entrez.esearch(
+            throttle('ncbi')
+            search_handle = entrez_call(
+                Entrez.esearch,
                 db="taxonomy",
                 term=search_term,
                 retmax=1
@@ -60,8 +66,9 @@ def get_ncbi_taxon_id(organism_name: str) -> Optional[int]:
             taxon_id = int(search_results["IdList"][0])
 
             # Fetch taxonomy details to verify
-            time.sleep(0.5)
-            fetch_handle = Entrez.efetch(
+            throttle('ncbi')
+            fetch_handle = entrez_call(
+                Entrez.efetch,
                 db="taxonomy",
                 id=taxon_id,
                 retmode="xml"
@@ -112,10 +119,10 @@ def get_ncbi_assembly_info(taxon_id: int) -> Optional[Dict[str, str]]:
     """
     try:
         print(f"  Searching NCBI Assembly for taxon {taxon_id}")
-        time.sleep(0.5)  # Rate limiting
-
         # Search assembly database
-        search_handle = Entrez.esearch(
+        throttle('ncbi')
+        search_handle = entrez_call(
+            Entrez.esearch,
             db="assembly",
             term=f"txid{taxon_id}[Organism:exp]",
             retmax=1,
@@ -131,8 +138,9 @@ def get_ncbi_assembly_info(taxon_id: int) -> Optional[Dict[str, str]]:
         assembly_id = search_results["IdList"][0]
 
         # Fetch assembly details
-        time.sleep(0.5)
-        summary_handle = Entrez.esummary(
+        throttle('ncbi')
+        summary_handle = entrez_call(
+            Entrez.esummary,
             db="assembly",
             id=assembly_id,
             retmode="xml"
@@ -6,22 +6,44 @@ and sets the value to 'extend1' for all existing records.
 
 import argparse
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
+try:
+    from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
+except ImportError:
+    from sheet_store import DEFAULT_STORE_NAME, SheetStore
 
-def add_source_column(tsv_path: Path, source_value: str = "extend1", dry_run: bool = False):
+
+def add_source_column(
+    tsv_path: Path,
+    source_value: str = "extend1",
+    dry_run: bool = False,
+    store: Optional[SheetStore] = None
+):
     """Add source column to TSV file.
 
     Args:
         tsv_path: Path to TSV file
         source_value: Default source value for existing records
         dry_run: If True, print changes without modifying files
+        store: Working store holding the sheet; only the rows without a
+            source are updated there, and the TSV is left for its export
     """
     if not tsv_path.exists():
         print(f"  Skipping {tsv_path.name} (file not found)")
         return
 
+    if store is not None and not dry_run:
+        if 'source' in store.columns(tsv_path):
+            print(f"  {tsv_path.name}: source column already exists")
+        else:
+            print(f"  {tsv_path.name}: adding source column")
+        filled = store.fill_empty(tsv_path, 'source', source_value)
+        print(f"    Updated {filled} records with source='{source_value}'")
+        return
+
     # Read TSV with string dtype to preserve integer formats
     # (pandas converts int columns to float when there are NaN values)
     df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False)
@@ -70,6 +92,12 @@ def main():
         action='store_true',
         help='Print changes without modifying files'
     )
+    parser.add_argument(
+        '--store',
+        action='store_true',
+        help=f'Update the DuckDB working store (<data-dir>/{DEFAULT_STORE_NAME}) '
+             'instead of rewriting the TSVs; export it with src/sheet_store.py'
+    )
 
     args = parser.parse_args()
 
@@ -97,9 +125,15 @@ def main():
         print("DRY RUN - No files will be modified")
     print("")
 
-    for filename in all_files:
-        file_path = args.data_dir / filename
-        add_source_column(file_path, args.source_value, args.dry_run)
+    store = SheetStore(args.data_dir / DEFAULT_STORE_NAME) if args.store and not args.dry_run else None
+
+    try:
+        for filename in all_files:
+            file_path = args.data_dir / filename
+            add_source_column(file_path, args.source_value, args.dry_run, store=store)
+    finally:
+        if store is not None:
+            store.close()
 
     print("")
     print("Done!")
@@ -3,6 +3,22 @@
 This package provides clients for programmatic access to biological databases.
 """
 
+from .kegg_client import KEGGClient
+from .rate_limits import RateLimiterRegistry, rate_limit, registry, throttle
+from .snapshots import SnapshotMissError, configure_snapshots, entrez_call, snapshot_get
 from .uniprot_client import UniProtClient
+from .uniprot_id_mapping import IDMappingManager
 
-__all__ = ['UniProtClient']
+__all__ = [
+    'UniProtClient',
+    'IDMappingManager',
+    'KEGGClient',
+    'RateLimiterRegistry',
+    'rate_limit',
+    'registry',
+    'throttle',
+    'SnapshotMissError',
+    'configure_snapshots',
+    'entrez_call',
+    'snapshot_get',
+]
@@ -0,0 +1,353 @@
+"""KEGG REST API client with batched entry retrieval and a local mirror cache.
+
+KEGG's `get` endpoint accepts up to 10 IDs per request, and `list`/`link`
+return whole-database tables. This client:
+- Batches `get` requests (10 IDs each) and memoizes parsed entries
+- Downloads `list/<db>` and `link/<target>/<source>` tables once, stores them
+  as TSV files under a cache directory and indexes them in memory
+- Answers keyword, name and cross-reference lookups from those local tables,
+  so pathway/gene/reaction enrichment becomes local joins
+
+All network requests go through the shared 'kegg' rate limiter.
+
+API Documentation: https://www.kegg.jp/kegg/rest/keggapi.html
+"""
+
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+import requests
+
+try:
+    from .rate_limits import rate_limit
+    from .snapshots import SnapshotSession
+except ImportError:
+    from rate_limits import rate_limit
+    from snapshots import SnapshotSession
+
+
+KEGG_BASE_URL = "https://rest.kegg.jp"
+
+# Server-side limit on IDs per `get` request
+KEGG_GET_MAX_IDS = 10
+
+# Default location of the local KEGG mirror
+DEFAULT_KEGG_CACHE_DIR = "data/kegg"
+
+# Re-download cached tables older than this
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+def strip_db_prefix(kegg_id: str) -> str:
+    """Remove the database prefix from a KEGG identifier.
+
+    Args:
+        kegg_id: KEGG identifier, with or without prefix
+
+    Returns:
+        Identifier without prefix
+
+    Examples:
+        >>> strip_db_prefix("path:map00680")
+        'map00680'
+        >>> strip_db_prefix("ko:K23995")
+        'K23995'
+        >>> strip_db_prefix("K23995")
+        'K23995'
+    """
+    return kegg_id.split(':', 1)[1] if ':' in kegg_id else kegg_id
+
+
+def parse_flat_file(text: str) -> List[Dict[str, List[str]]]:
+    """Parse KEGG flat-file output from `get` into field dictionaries.
+
+    Each entry maps a field name (ENTRY, NAME, DEFINITION, ...) to its lines;
+    continuation lines are appended to the preceding field.
+
+    Args:
+        text: Raw `get` response with one or more entries separated by '///'
+
+    Returns:
+        List of entries
+
+    Examples:
+        >>> text = ("ENTRY       K23995                      KO\\n"
+        ...         "NAME        xoxF\\n"
+        ...         "DEFINITION  lanthanide-dependent methanol dehydrogenase [EC:1.1.2.10]\\n"
+        ...         "///\\n")
+        >>> entry = parse_flat_file(text)[0]
+        >>> entry['ENTRY'], entry['NAME']
+        (['K23995                      KO'], ['xoxF'])
+    """
+    entries = []
+    current: Dict[str, List[str]] = {}
+    field = None
+
+    for line in text.split('\n'):
+        if line.startswith('///'):
+            if current:
+                entries.append(current)
+            current, field = {}, None
+            continue
+        if not line.strip():
+            continue
+        key = line[:12].strip()
+        value = line[12:].strip()
+        if key:
+            field = key
+            current.setdefault(field, []).append(value)
+        elif field:
+            current[field].append(value)
+
+    if current:
+        entries.append(current)
+    return entries
+
+
+def parse_ec_from_definition(definition: str) -> List[str]:
+    """Extract EC numbers from a KEGG definition string.
+
+    Args:
+        definition: e.g. "alcohol dehydrogenase [EC:1.1.1.1 1.1.1.71]"
+
+    Returns:
+        List of EC numbers
+
+    Examples:
+        >>> parse_ec_from_definition("alcohol dehydrogenase [EC:1.1.1.1 1.1.1.71]")
+        ['1.1.1.1', '1.1.1.71']
+        >>> parse_ec_from_definition("no enzyme here")
+        []
+    """
+    match = re.search(r'\[EC:([^\]]+)\]', definition)
+    return match.group(1).split() if match else []
+
+
+class KEGGClient:
+    """Client for the KEGG REST API backed by a local table mirror.
+
+    Examples:
+        >>> client = KEGGClient()
+        >>> pathways = client.find_local("pathway", "methane")  # doctest: +SKIP
+        >>> client.linked("ko:K23995", "pathway")  # doctest: +SKIP
+        ['path:ko00680', 'path:map00680']
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_KEGG_CACHE_DIR,
+        timeout: int = 60,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS
+    ):
+        """Initialize KEGG client.
+
+        Args:
+            cache_dir: Directory for downloaded list/link tables
+            timeout: Request timeout in seconds
+            max_age_days: Refresh cached tables older than this
+        """
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self.max_age_days = max_age_days
+        self.session = SnapshotSession()
+
+        self._entries: Dict[str, Dict[str, List[str]]] = {}
+        self._lists: Dict[str, Dict[str, str]] = {}
+        self._links: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+
+    def _request(self, path: str) -> str:
+        """GET a KEGG REST path under the shared 'kegg' rate limiter.
+
+        Returns:
+            Response text ('' when KEGG reports no results)
+        """
+        with rate_limit('kegg'):
+            response = self.session.get(f"{KEGG_BASE_URL}/{path}", timeout=self.timeout)
+        if response.status_code == 404:
+            return ''
+        response.raise_for_status()
+        return response.text
+
+    def _cached_table(self, path: str, refresh: bool = False) -> List[Tuple[str, str]]:
+        """Load a two-column KEGG table, downloading it if missing or stale.
+
+        Args:
+            path: REST path, e.g. 'list/pathway' or 'link/pathway/ko'
+            refresh: Force re-download
+
+        Returns:
+            List of (column1, column2) rows
+        """
+        cache_file = self.cache_dir / f"{path.replace('/', '_')}.tsv"
+        max_age = self.max_age_days * 86400
+        stale = not cache_file.exists() or (time.time() - cache_file.stat().st_mtime) > max_age
+
+        if refresh or stale:
+            try:
+                text = self._request(path)
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+                tmp_file.write_text(text)
+                tmp_file.replace(cache_file)
+                print(f"  Downloaded KEGG {path} → {cache_file}")
+            except requests.RequestException as e:
+                if not cache_file.exists():
+                    print(f"  Error downloading KEGG {path}: {e}")
+                    return []
+                print(f"  Using stale KEGG cache for {path} ({e})")
+
+        rows = []
+        with open(cache_file) as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t', 1)
+                if len(parts) == 2:
+                    rows.append((parts[0], parts[1]))
+        return rows
+
+    def list_table(self, database: str, refresh: bool = False) -> Dict[str, str]:
+        """Get the `list/<database>` table as ID → description.
+
+        IDs are stored without database prefix (e.g. 'map00680', 'K23995').
+
+        Args:
+            database: KEGG database (pathway, ko, reaction, enzyme, ...)
+            refresh: Force re-download
+
+        Returns:
+            Dictionary mapping ID to description
+        """
+        if refresh or database not in self._lists:
+            self._lists[database] = {
+                strip_db_prefix(kegg_id): description
+                for kegg_id, description in self._cached_table(f"list/{database}", refresh)
+            }
+        return self._lists[database]
+
+    def link_table(
+        self,
+        target_db: str,
+        source_db: str,
+        refresh: bool = False
+    ) -> Dict[str, List[str]]:
+        """Get the `link/<target>/<source>` table indexed by source ID.
+
+        Args:
+            target_db: Target database (e.g. 'pathway')
+            source_db: Source database (e.g. 'ko', 'enzyme', 'reaction')
+            refresh: Force re-download
+
+        Returns:
+            Dictionary mapping prefixed source ID (e.g. 'ko:K23995') to
+            prefixed target IDs (e.g. ['path:map00680'])
+        """
+        key = (target_db, source_db)
+        if refresh or key not in self._links:
+            index: Dict[str, List[str]] = defaultdict(list)
+            for source_id, target_id in self._cached_table(f"link/{target_db}/{source_db}", refresh):
+                index[source_id].append(target_id)
+            self._links[key] = dict(index)
+        return self._links[key]
+
+    def linked(self, kegg_id: str, target_db: str) -> List[str]:
+        """Look up cross-references for one prefixed KEGG ID locally.
+
+        Args:
+            kegg_id: Prefixed source ID (e.g. 'ko:K23995', 'ec:3.8.1.2')
+            target_db: Target database (e.g. 'pathway')
+
+        Returns:
+            List of prefixed target IDs
+        """
+        source_db = {'ec': 'enzyme', 'rn': 'reaction', 'path': 'pathway'}.get(
+            kegg_id.split(':', 1)[0], kegg_id.split(':', 1)[0]
+        )
+        return self.link_table(target_db, source_db).get(kegg_id, [])
+
+    def find_local(self, database: str, keyword: str) -> List[Tuple[str, str]]:
+        """Keyword search against the local `list/<database>` table.
+
+        Matches case-insensitively on the description, like KEGG's `find`.
+
+        Args:
+            database: KEGG database (pathway, ko, reaction, ...)
+            keyword: Search keyword
+
+        Returns:
+            List of (ID, description) tuples
+        """
+        keyword_lower = keyword.lower()
+        return [
+            (kegg_id, description)
+            for kegg_id, description in self.list_table(database).items()
+            if keyword_lower in description.lower()
+        ]
+
+    def get_entries(self, ids: Iterable[str]) -> Dict[str, Dict[str, List[str]]]:
+        """Retrieve full flat-file entries, batching up to 10 IDs per request.
+
+        Args:
+            ids: KEGG IDs (prefixed or not)
+
+        Returns:
+            Dictionary mapping each requested ID to its parsed entry.
+            IDs KEGG does not know are omitted.
+        """
+        requested = list(dict.fromkeys(ids))
+        todo = [i for i in requested if strip_db_prefix(i) not in self._entries]
+
+        for start in range(0, len(todo), KEGG_GET_MAX_IDS):
+            batch = todo[start:start + KEGG_GET_MAX_IDS]
+            try:
+                text = self._request(f"get/{'+'.join(batch)}")
+            except requests.RequestException as e:
+                print(f"  Error fetching KEGG entries {', '.join(batch)}: {e}")
+                continue
+            for entry in parse_flat_file(text):
+                entry_id = entry.get('ENTRY', [''])[0].split()
+                if entry_id:
+                    self._entries[entry_id[0]] = entry
+
+        return {
+            i: self._entries[strip_db_prefix(i)]
+            for i in requested
+            if strip_db_prefix(i) in self._entries
+        }
+
+    def ko_ec_numbers(self, ko_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """Map KO IDs to EC numbers using the local `list/ko` table.
+
+        Args:
+            ko_ids: KO identifiers (e.g. 'K23995')
+
+        Returns:
+            Dictionary mapping KO ID to EC numbers (KOs without EC omitted)
+        """
+        ko_table = self.list_table('ko')
+        result = {}
+        for ko_id in ko_ids:
+            ec_numbers = parse_ec_from_definition(ko_table.get(strip_db_prefix(ko_id), ''))
+            if ec_numbers:
+                result[ko_id] = ec_numbers
+        return result
+
+    def pathways_for_ec(self, ec_numbers: Iterable[str]) -> Set[str]:
+        """Collect KEGG reference pathways linked to EC numbers (local join).
+
+        Args:
+            ec_numbers: EC numbers, with or without 'EC:' prefix
+
+        Returns:
+            Set of pathway IDs without prefix (e.g. 'map00625')
+        """
+        pathways = set()
+        for ec in ec_numbers:
+            ec_clean = ec.replace('EC:', '').strip()
+            for pathway_id in self.linked(f"ec:{ec_clean}", 'pathway'):
+                pathway_id = strip_db_prefix(pathway_id)
+                # link/pathway/enzyme lists both map and ec variants of each map
+                if pathway_id.startswith('map'):
+                    pathways.add(pathway_id)
+        return pathways
@@ -0,0 +1,284 @@
+"""Shared per-service rate limiting for external API calls.
+
+Every module that talks to an external service takes a token from that
+service's bucket instead of sleeping a fixed interval. Buckets are shared by
+all threads and asyncio tasks in the process, so concurrent callers are
+spaced out against the service's real allowance rather than stacking sleeps.
+
+Each bucket records how long callers waited for a token and, when used as a
+context manager, how long the request itself took. Set
+PFAS_RATE_LIMIT_STATS=1 to print a summary at interpreter exit, or call
+print_rate_limit_report() directly.
+
+Examples:
+    >>> from src.apis.rate_limits import rate_limit, throttle
+    >>> with rate_limit('ncbi'):  # doctest: +SKIP
+    ...     handle = Entrez.esearch(db="taxonomy", term="Pseudomonas")
+    >>> throttle('kegg')  # doctest: +SKIP
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+
+def ncbi_api_key() -> Optional[str]:
+    """NCBI API key attached to Biopython's Entrez requests, if any.
+
+    NCBI_API_KEY is set as Entrez.api_key here, where the ncbi rate is chosen,
+    so the 10 req/s allowance is only used when every Entrez request carries
+    the key. Without Biopython nothing is attached and the anonymous rate applies.
+    """
+    try:
+        from Bio import Entrez
+    except ImportError:
+        return None
+    if not Entrez.api_key and os.environ.get('NCBI_API_KEY'):
+        Entrez.api_key = os.environ['NCBI_API_KEY']
+    return Entrez.api_key
+
+
+# Requests per second and burst size per service. NCBI allows 3 req/s
+# without an API key and 10 req/s with one; 'ncbi' covers the Entrez calls,
+# which carry the key, and 'ncbi_anonymous' other NCBI endpoints, which do not.
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    'ncbi': (10.0 if ncbi_api_key() else 3.0, 1),
+    'ncbi_anonymous': (3.0, 1),
+    'uniprot': (5.0, 5),
+    'pubchem': (5.0, 5),
+    'kegg': (3.0, 1),
+    'ebi': (5.0, 2),
+}
+
+
+@dataclass
+class RateLimitStats:
+    """Telemetry for one rate-limited service."""
+    calls: int = 0
+    wait_seconds: float = 0.0
+    request_seconds: float = 0.0
+    timed_requests: int = 0
+    max_wait: float = 0.0
+    first_call: Optional[float] = None
+    last_call: Optional[float] = None
+
+    @property
+    def idle_fraction(self) -> float:
+        """Share of the service's active wall time spent waiting for tokens."""
+        if self.first_call is None or self.last_call is None:
+            return 0.0
+        span = self.last_call - self.first_call
+        return min(1.0, self.wait_seconds / span) if span > 0 else 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from threads and asyncio tasks.
+
+    Tokens are reserved under a lock and the caller sleeps outside it, so
+    concurrent callers queue up behind each other in arrival order.
+
+    Examples:
+        >>> bucket = TokenBucket('test', rate=1000.0, capacity=2)
+        >>> bucket.reserve() == 0.0 and bucket.reserve() == 0.0
+        True
+        >>> bucket.reserve() > 0.0
+        True
+    """
+
+    def __init__(self, name: str, rate: float, capacity: int = 1):
+        """Initialize bucket.
+
+        Args:
+            name: Service name (used in reports)
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.stats = RateLimitStats()
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take tokens and return how long the caller must wait before using them.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds to wait (0.0 when tokens were available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+            self.stats.calls += 1
+            self.stats.wait_seconds += wait
+            self.stats.max_wait = max(self.stats.max_wait, wait)
+            if self.stats.first_call is None:
+                self.stats.first_call = now
+            self.stats.last_call = now + wait
+        return wait
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block the calling thread until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """Suspend the calling task until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_request(self, seconds: float) -> None:
+        """Record the duration of a request made under this bucket."""
+        with self._lock:
+            self.stats.request_seconds += seconds
+            self.stats.timed_requests += 1
+            self.stats.last_call = max(self.stats.last_call or 0.0, time.monotonic())
+
+
+class RateLimiterRegistry:
+    """Named token buckets, created on first use from DEFAULT_RATE_LIMITS."""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        """Initialize registry.
+
+        Args:
+            limits: Service name → (requests per second, burst size)
+        """
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        # Switched off when no request reaches the network (snapshot replay)
+        self.enabled = True
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service: str) -> TokenBucket:
+        """Get the bucket for a service.
+
+        Unknown services get a conservative 1 request per second.
+        """
+        with self._lock:
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                rate, capacity = self.limits.get(service, (1.0, 1))
+                bucket = TokenBucket(service, rate, capacity)
+                self._buckets[service] = bucket
+            return bucket
+
+    def configure(self, service: str, rate: float, capacity: int = 1) -> TokenBucket:
+        """Set (or replace) the limit for a service.
+
+        Args:
+            service: Service name
+            rate: Requests per second
+            capacity: Burst size
+
+        Returns:
+            The new bucket
+        """
+        with self._lock:
+            self.limits[service] = (rate, capacity)
+            bucket = TokenBucket(service, rate, capacity)
+            self._buckets[service] = bucket
+            return bucket
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Snapshot of telemetry for every service used so far."""
+        with self._lock:
+            return {name: bucket.stats for name, bucket in sorted(self._buckets.items())}
+
+    def report(self) -> str:
+        """Format telemetry as a table of wait time vs. request time."""
+        lines = [
+            f"{'service':<12} {'calls':>7} {'waited s':>10} {'request s':>10} "
+            f"{'max wait':>9} {'idle':>6}"
+        ]
+        for name, s in self.stats().items():
+            if s.calls == 0:
+                continue
+            request = f"{s.request_seconds:.1f}" if s.timed_requests else "-"
+            lines.append(
+                f"{name:<12} {s.calls:>7} {s.wait_seconds:>10.1f} {request:>10} "
+                f"{s.max_wait:>9.2f} {s.idle_fraction:>6.0%}"
+            )
+        return "\n".join(lines)
+
+
+registry = RateLimiterRegistry()
+
+
+def throttle(service: str, tokens: int = 1) -> float:
+    """Wait for a token from the named service's bucket.
+
+    Args:
+        service: Service name (e.g. 'ncbi', 'uniprot', 'kegg')
+        tokens: Number of tokens to take
+
+    Returns:
+        Seconds waited
+    """
+    if not registry.enabled:
+        return 0.0
+    return registry.get(service).acquire(tokens)
+
+
+async def throttle_async(service: str, tokens: int = 1) -> float:
+    """Async variant of throttle() for use inside coroutines."""
+    if not registry.enabled:
+        return 0.0
+    return await registry.get(service).acquire_async(tokens)
+
+
+@contextmanager
+def rate_limit(service: str) -> Iterator[TokenBucket]:
+    """Take a token, then time the enclosed request for telemetry.
+
+    Args:
+        service: Service name
+
+    Yields:
+        The service's bucket
+    """
+    bucket = registry.get(service)
+    if registry.enabled:
+        bucket.acquire()
+    start = time.monotonic()
+    try:
+        yield bucket
+    finally:
+        bucket.record_request(time.monotonic() - start)
+
+
+def print_rate_limit_report() -> None:
+    """Print wait-time vs. request-time telemetry for all services."""
+    if not any(s.calls for s in registry.stats().values()):
+        return
+    print("\nRate limiting summary:")
+    print(registry.report())
+
+
+if os.environ.get('PFAS_RATE_LIMIT_STATS'):
+    atexit.register(print_rate_limit_report)
@@ -0,0 +1,318 @@
+"""Record/replay snapshots of external API responses.
+
+The extend-* pipelines depend on live NCBI, UniProt, PubChem, KEGG and EBI
+endpoints. Snapshot mode makes those runs reproducible and fast:
+- record: every response is fetched live and stored in the snapshot archive
+- replay: responses are served from the archive; nothing touches the network
+  and rate limiting is switched off, so runs complete at local-disk speed
+- off (default): normal live behaviour
+
+The mode and archive are chosen with environment variables so whole make
+targets can be recorded or replayed:
+
+    PFAS_SNAPSHOT_MODE=record make extend-api
+    PFAS_SNAPSHOT_MODE=replay make extend-api
+
+The archive is a zip file (deflate-compressed) holding one body per response
+plus a manifest.json with the format version and a request index. Recording
+into an existing archive adds to it.
+
+HTTP calls go through snapshot_session()/snapshot_get(); Bio.Entrez calls go
+through entrez_call().
+"""
+
+import atexit
+import hashlib
+import io
+import json
+import os
+import threading
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+try:
+    from .rate_limits import registry as rate_limit_registry
+except ImportError:
+    from rate_limits import registry as rate_limit_registry
+
+
+# Bump when the archive layout changes; replay refuses other versions
+SNAPSHOT_FORMAT_VERSION = 1
+
+DEFAULT_SNAPSHOT_PATH = "data/snapshots/api_snapshot.zip"
+
+SNAPSHOT_MODES = ('off', 'record', 'replay')
+
+
+class SnapshotMissError(requests.exceptions.ConnectionError):
+    """Raised in replay mode when a request is not in the archive.
+
+    Subclasses requests' ConnectionError so existing network error handling
+    treats a miss like an unreachable service.
+    """
+
+
+def request_key(method: str, url: str, params: Any = None, data: Any = None) -> str:
+    """Build a stable key for a request.
+
+    Args:
+        method: HTTP method or Entrez function name
+        url: Request URL (or Entrez utility name)
+        params: Query parameters
+        data: Request body parameters
+
+    Returns:
+        Hex digest identifying the request
+
+    Examples:
+        >>> request_key('GET', 'https://x.org', {'b': 1, 'a': 2}) == request_key('GET', 'https://x.org', {'a': 2, 'b': 1})
+        True
+        >>> request_key('GET', 'https://x.org') == request_key('POST', 'https://x.org')
+        False
+    """
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return sorted((str(k), normalize(v)) for k, v in value.items())
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return str(value) if value is not None else None
+
+    payload = json.dumps([method.upper(), url, normalize(params), normalize(data)])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SnapshotStore:
+    """In-memory view of a snapshot archive, saved atomically on demand."""
+
+    def __init__(self, path: str, mode: str = 'off'):
+        """Initialize store and load an existing archive.
+
+        Args:
+            path: Snapshot archive path
+            mode: 'off', 'record' or 'replay'
+
+        Raises:
+            ValueError: If mode is unknown or the archive version is incompatible
+            FileNotFoundError: If replaying and the archive does not exist
+        """
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"Unknown snapshot mode '{mode}' (expected one of {SNAPSHOT_MODES})")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.index: Dict[str, Dict] = {}
+        self.bodies: Dict[str, bytes] = {}
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            self._load()
+        elif mode == 'replay':
+            raise FileNotFoundError(f"Snapshot archive not found: {self.path}")
+
+    def _load(self) -> None:
+        """Read manifest and bodies from the archive."""
+        with zipfile.ZipFile(self.path) as archive:
+            manifest = json.loads(archive.read('manifest.json'))
+            version = manifest.get('format_version')
+            if version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(
+                    f"Snapshot {self.path} has format version {version}, "
+                    f"expected {SNAPSHOT_FORMAT_VERSION}; re-record it"
+                )
+            self.created = manifest.get('created', self.created)
+            self.index = manifest['responses']
+            for key in self.index:
+                self.bodies[key] = archive.read(f"responses/{key}")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a recorded response.
+
+        Returns:
+            Metadata dict with the body under 'body', or None if not recorded
+        """
+        with self._lock:
+            meta = self.index.get(key)
+            if meta is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(meta, body=self.bodies[key])
+
+    def put(self, key: str, meta: Dict, body: bytes) -> None:
+        """Record a response (a later response for the same key wins)."""
+        with self._lock:
+            self.index[key] = meta
+            self.bodies[key] = body
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the archive atomically if anything was recorded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            manifest = {
+                'format_version': SNAPSHOT_FORMAT_VERSION,
+                'created': self.created,
+                'updated': datetime.now().isoformat(timespec='seconds'),
+                'responses': self.index,
+            }
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('manifest.json', json.dumps(manifest, indent=1, sort_keys=True))
+                for key, body in self.bodies.items():
+                    archive.writestr(f"responses/{key}", body)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            print(f"✓ Saved {len(self.index)} API responses to snapshot {self.path}")
+
+
+_store: Optional[SnapshotStore] = None
+_store_lock = threading.Lock()
+
+# Callers throttle before their first request, i.e. before the store is
+# configured lazily, so switch rate limiting off as soon as replay is requested
+if os.environ.get('PFAS_SNAPSHOT_MODE', '').lower() == 'replay':
+    rate_limit_registry.enabled = False
+
+
+def configure_snapshots(mode: str, path: str = DEFAULT_SNAPSHOT_PATH) -> SnapshotStore:
+    """Select the snapshot mode and archive for this process.
+
+    Replay mode disables the shared rate limiters, since no request reaches
+    the network.
+
+    Args:
+        mode: 'off', 'record' or 'replay'
+        path: Snapshot archive path
+
+    Returns:
+        The active snapshot store
+    """
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.save()
+        _store = SnapshotStore(path, mode)
+        rate_limit_registry.enabled = not _store.replaying
+        if _store.recording:
+            atexit.register(_store.save)
+        return _store
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """Get the active store, configuring it from the environment on first use."""
+    if _store is None:
+        configure_snapshots(
+            os.environ.get('PFAS_SNAPSHOT_MODE', 'off').lower(),
+            os.environ.get('PFAS_SNAPSHOT_PATH', DEFAULT_SNAPSHOT_PATH)
+        )
+    return _store
+
+
+class SnapshotSession(requests.Session):
+    """requests.Session that records or replays responses per snapshot mode."""
+
+    def request(self, method, url, params=None, data=None, **kwargs):
+        store = get_snapshot_store()
+        if store.mode == 'off':
+            return super().request(method, url, params=params, data=data, **kwargs)
+
+        key = request_key(method, url, params, data)
+
+        if store.replaying:
+            recorded = store.get(key)
+            if recorded is None:
+                raise SnapshotMissError(f"No snapshot for {method} {url} (params={params})")
+            response = requests.Response()
+            response.status_code = recorded['status']
+            response.headers.update(recorded['headers'])
+            response.url = recorded['url']
+            response.encoding = recorded.get('encoding')
+            response._content = recorded['body']
+            response.request = requests.Request(method, url).prepare()
+            return response
+
+        # Snapshots hold whole bodies, so read streamed responses eagerly
+        kwargs.pop('stream', None)
+        response = super().request(method, url, params=params, data=data, **kwargs)
+        store.put(key, {
+            'method': method.upper(),
+            'url': response.url,
+            'params': params if isinstance(params, dict) else None,
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+        }, response.content)
+        return response
+
+
+_default_session: Optional[SnapshotSession] = None
+
+
+def snapshot_session() -> SnapshotSession:
+    """Create a snapshot-aware session (drop-in for requests.Session())."""
+    return SnapshotSession()
+
+
+def snapshot_get(url: str, **kwargs) -> requests.Response:
+    """Snapshot-aware drop-in for requests.get() using a shared session."""
+    global _default_session
+    if _default_session is None:
+        _default_session = SnapshotSession()
+    return _default_session.get(url, **kwargs)
+
+
+def entrez_call(func: Callable, **kwargs) -> io.IOBase:
+    """Call a Bio.Entrez utility (esearch, efetch, ...) through the snapshot store.
+
+    Args:
+        func: Entrez function, e.g. Entrez.esearch
+        **kwargs: Arguments for the Entrez function
+
+    Returns:
+        A handle usable with Entrez.read() or .read(): binary for XML
+        responses, text for plain-text responses (matching Bio.Entrez)
+
+    Raises:
+        SnapshotMissError: In replay mode, if the call was not recorded
+    """
+    store = get_snapshot_store()
+    if store.mode == 'off':
+        return func(**kwargs)
+
+    name = getattr(func, '__name__', str(func))
+    key = request_key('ENTREZ', name, kwargs)
+
+    if store.replaying:
+        recorded = store.get(key)
+        if recorded is None:
+            raise SnapshotMissError(f"No snapshot for Entrez.{name}({kwargs})")
+        body = recorded['body']
+        return io.StringIO(body.decode('utf-8')) if recorded['text'] else io.BytesIO(body)
+
+    handle = func(**kwargs)
+    try:
+        content = handle.read()
+    finally:
+        handle.close()
+    is_text = isinstance(content, str)
+    body = content.encode('utf-8') if is_text else content
+    store.put(key, {'method': 'ENTREZ', 'url': name, 'params': None, 'text': is_text}, body)
+    return io.StringIO(content) if is_text else io.BytesIO(content)
@@ -4,7 +4,7 @@ This module provides a comprehensive client for the UniProt REST API with suppor
 - Protein search and retrieval
 - ID mapping between databases
 - GO, EC, CHEBI, Rhea, pathway, and publication extraction
-- Rate limiting and retry logic
+- Rate limiting (shared 'uniprot' token bucket) and retry logic
 - Batch operations
 
 API Documentation: https://www.uniprot.org/help/api
@@ -15,10 +15,16 @@ import time
 import requests
 from typing import Dict, List, Optional, Set, Tuple, Iterator, Any
 from dataclasses import dataclass
-from functools import wraps
 import json
 from pathlib import Path
 
+try:
+    from .rate_limits import rate_limit
+    from .snapshots import SnapshotMissError, SnapshotSession
+except ImportError:
+    from rate_limits import rate_limit
+    from snapshots import SnapshotMissError, SnapshotSession
+
 
 # UniProt REST API base URLs
 UNIPROT_BASE_URL = "https://rest.uniprot.org"
@@ -62,27 +68,6 @@ UNIPROT_FIELDS = {
 }
 
 
-def rate_limited(min_interval: float = 0.5):
-    """Decorator to enforce minimum time between API calls.
-
-    Args:
-        min_interval: Minimum seconds between calls (default 0.5)
-    """
-    last_call = {'time': 0}
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_call['time']
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-            result = func(*args, **kwargs)
-            last_call['time'] = time.time()
-            return result
-        return wrapper
-    return decorator
-
-
 @dataclass
 class UniProtSearchResult:
     """Container for UniProt search results."""
@@ -116,12 +101,24 @@ class UniProtClient:
         """
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self._id_mapper = None
+        self.session = SnapshotSession()
         self.session.headers.update({
             'User-Agent': 'CMM-AI/1.0 (https://github.com/yourusername/CMM-AI)'
         })
 
-    @rate_limited(0.5)
+    @property
+    def id_mapper(self):
+        """ID mapping job manager (created on first use, caches mappings).
+
+        Returns:
+            IDMappingManager bound to this client
+        """
+        if self._id_mapper is None:
+            from .uniprot_id_mapping import IDMappingManager
+            self._id_mapper = IDMappingManager(self)
+        return self._id_mapper
+
     def _make_request(self, url: str, params: Dict = None, method: str = 'GET') -> requests.Response:
         """Make HTTP request with retry logic.
 
@@ -135,17 +132,22 @@ class UniProtClient:
 
         Raises:
             requests.RequestException: If request fails after retries
+
+        Every attempt takes a token from the shared 'uniprot' rate limiter.
         """
         for attempt in range(self.max_retries):
             try:
-                if method == 'GET':
-                    response = self.session.get(url, params=params, timeout=self.timeout)
-                else:
-                    response = self.session.post(url, data=params, timeout=self.timeout)
+                with rate_limit('uniprot'):
+                    if method == 'GET':
+                        response = self.session.get(url, params=params, timeout=self.timeout)
+                    else:
+                        response = self.session.post(url, data=params, timeout=self.timeout)
 
                 response.raise_for_status()
                 return response
 
+            except SnapshotMissError:
+                raise  # Replaying again cannot find a missing response
             except requests.exceptions.RequestException as e:
                 if attempt == self.max_retries - 1:
                     raise
@@ -374,6 +376,10 @@ class UniProtClient:
         Returns:
             Dictionary mapping source IDs to list of target IDs
 
+        Large inputs are split into chunks and submitted concurrently, and
+        completed mappings are cached (see IDMappingManager), so repeating a
+        lookup does not hit the service again.
+
         Supported databases:
             - Gene_Name, Gene_Synonym
             - KEGG, EMBL-GenBank-DDBJ, RefSeq_Protein
@@ -390,52 +396,7 @@ class UniProtClient:
         if not ids:
             return {}
 
-        # Submit ID mapping job
-        submit_url = f"{UNIPROT_ID_MAPPING_URL}/run"
-        params = {
-            'from': from_db,
-            'to': to_db,
-            'ids': ','.join(ids)
-        }
-
-        try:
-            # Submit job
-            response = self._make_request(submit_url, params, method='POST')
-            job_id = response.json()['jobId']
-
-            # Poll for results
-            status_url = f"{UNIPROT_ID_MAPPING_URL}/status/{job_id}"
-            max_polls = 20
-
-            for _ in range(max_polls):
-                time.sleep(1)  # Wait between polls
-                response = self._make_request(status_url)
-                status = response.json()
-
-                if 'results' in status or 'failedIds' in status:
-                    # Job complete, get results
-                    results_url = f"{UNIPROT_ID_MAPPING_URL}/results/{job_id}"
-                    response = self._make_request(results_url, params={'format': 'json'})
-                    results_data = response.json()
-
-                    # Parse results into dict
-                    mapping = {}
-                    for result in results_data.get('results', []):
-                        from_id = result.get('from')
-                        to_id = result.get('to', {}).get('primaryAccession', '')
-                        if from_id and to_id:
-                            if from_id not in mapping:
-                                mapping[from_id] = []
-                            mapping[from_id].append(to_id)
-
-                    return mapping
-
-            print(f"ID mapping timed out for job {job_id}")
-            return {}
-
-        except Exception as e:
-            print(f"Error mapping IDs: {e}")
-            return {}
+        return self.id_mapper.map_ids(ids, from_db=from_db, to_db=to_db)
 
     def extract_go_terms(self, entry: Dict) -> List[Tuple[str, str, str]]:
         """Extract GO terms from protein entry with evidence codes.
@@ -0,0 +1,326 @@
+"""Chunked, concurrent job manager for the UniProt ID mapping service.
+
+The ID mapping service runs asynchronously: a job is submitted, polled until
+it finishes, and its results are fetched separately. This module wraps that
+protocol for large inputs:
+- Split IDs into server-sized chunks and submit them concurrently
+- Poll all outstanding jobs together with exponential backoff
+- Fetch results through the stream endpoint (falling back to paging /results)
+- Cache completed mappings by (from_db, to_db, id), optionally on disk
+
+API Documentation: https://www.uniprot.org/help/id_mapping
+"""
+
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .rate_limits import rate_limit
+from .uniprot_client import UNIPROT_ID_MAPPING_URL
+
+# Server-side limit on IDs per mapping job
+ID_MAPPING_MAX_IDS = 100000
+
+# Page size used when the stream endpoint is unavailable
+ID_MAPPING_PAGE_SIZE = 500
+
+CacheKey = Tuple[str, str, str]
+
+
+def chunk_ids(ids: List[str], chunk_size: int) -> List[List[str]]:
+    """Split IDs into consecutive chunks.
+
+    Args:
+        ids: Identifiers to split
+        chunk_size: Maximum chunk length
+
+    Returns:
+        List of chunks
+
+    Examples:
+        >>> chunk_ids(["a", "b", "c", "d", "e"], 2)
+        [['a', 'b'], ['c', 'd'], ['e']]
+        >>> chunk_ids([], 2)
+        []
+    """
+    return [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+
+
+def parse_mapping_results(results: List[Dict]) -> Dict[str, List[str]]:
+    """Convert ID mapping result records into a source → targets dictionary.
+
+    UniProtKB targets come back as full entries; other databases return the
+    target identifier as a plain string.
+
+    Args:
+        results: Records from the 'results' list of a mapping response
+
+    Returns:
+        Dictionary mapping source IDs to list of target IDs
+
+    Examples:
+        >>> parse_mapping_results([
+        ...     {"from": "K23995", "to": {"primaryAccession": "C5B164"}},
+        ...     {"from": "K23995", "to": {"primaryAccession": "A0A0F6"}},
+        ...     {"from": "P12345", "to": "12345"},
+        ... ])
+        {'K23995': ['C5B164', 'A0A0F6'], 'P12345': ['12345']}
+    """
+    mapping: Dict[str, List[str]] = {}
+    for result in results:
+        from_id = result.get('from')
+        to = result.get('to')
+        to_id = to.get('primaryAccession', '') if isinstance(to, dict) else to
+        if from_id and to_id:
+            mapping.setdefault(from_id, []).append(to_id)
+    return mapping
+
+
+class IDMappingManager:
+    """Run UniProt ID mapping for arbitrarily large ID lists.
+
+    Examples:
+        >>> from src.apis.uniprot_client import UniProtClient
+        >>> manager = IDMappingManager(UniProtClient())
+        >>> manager.map_ids([], from_db="KEGG")
+        {}
+    """
+
+    def __init__(
+        self,
+        client,
+        chunk_size: int = 10000,
+        max_workers: int = 4,
+        max_wait: float = 600.0,
+        initial_poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        cache_file: Optional[str] = None
+    ):
+        """Initialize ID mapping manager.
+
+        Args:
+            client: UniProtClient used for HTTP requests (retries, rate limiting)
+            chunk_size: IDs per submitted job (capped at ID_MAPPING_MAX_IDS)
+            max_workers: Concurrent submissions, polls and result fetches
+            max_wait: Give up on jobs still running after this many seconds
+            initial_poll_interval: First delay between polling rounds
+            max_poll_interval: Upper bound for the backoff delay
+            cache_file: Optional JSON file to persist completed mappings
+        """
+        self.client = client
+        self.chunk_size = max(1, min(chunk_size, ID_MAPPING_MAX_IDS))
+        self.max_workers = max_workers
+        self.max_wait = max_wait
+        self.initial_poll_interval = initial_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._cache: Dict[CacheKey, List[str]] = {}
+
+        if self.cache_file and self.cache_file.exists():
+            self._load_cache()
+
+    def _load_cache(self) -> None:
+        """Load persisted mappings from cache_file."""
+        with open(self.cache_file) as f:
+            data = json.load(f)
+        for entry in data:
+            key = (entry['from_db'], entry['to_db'], entry['id'])
+            self._cache[key] = entry['targets']
+
+    def save_cache(self) -> None:
+        """Persist completed mappings to cache_file (atomic replace)."""
+        if not self.cache_file:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = [
+            {'from_db': from_db, 'to_db': to_db, 'id': id_, 'targets': targets}
+            for (from_db, to_db, id_), targets in sorted(self._cache.items())
+        ]
+        tmp_path = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_file)
+
+    def clear_cache(self) -> None:
+        """Clear all cached mappings (in memory only)."""
+        self._cache.clear()
+
+    def _submit(self, ids: List[str], from_db: str, to_db: str) -> Optional[str]:
+        """Submit one mapping job and return its job ID."""
+        params = {'from': from_db, 'to': to_db, 'ids': ','.join(ids)}
+        try:
+            response = self.client._make_request(
+                f"{UNIPROT_ID_MAPPING_URL}/run", params, method='POST'
+            )
+            return response.json()['jobId']
+        except Exception as e:
+            print(f"Error submitting ID mapping job ({len(ids)} IDs): {e}")
+            return None
+
+    def _poll(self, job_id: str) -> str:
+        """Check a job once.
+
+        Returns:
+            'FINISHED', 'RUNNING' or 'ERROR'
+        """
+        try:
+            with rate_limit('uniprot'):
+                response = self.client.session.get(
+                    f"{UNIPROT_ID_MAPPING_URL}/status/{job_id}",
+                    timeout=self.client.timeout,
+                    allow_redirects=False
+                )
+            if response.status_code == 303:
+                return 'FINISHED'
+            response.raise_for_status()
+            status = response.json()
+        except Exception as e:
+            print(f"Error polling ID mapping job {job_id}: {e}")
+            return 'RUNNING'
+
+        job_status = status.get('jobStatus')
+        if job_status in ('NEW', 'RUNNING'):
+            return 'RUNNING'
+        if job_status == 'FINISHED' or 'results' in status or 'failedIds' in status:
+            return 'FINISHED'
+        print(f"ID mapping job {job_id} failed: {status.get('errors', status)}")
+        return 'ERROR'
+
+    def _wait_for_jobs(self, job_ids: List[str]) -> List[str]:
+        """Poll all outstanding jobs together until done or max_wait elapses.
+
+        Returns:
+            Job IDs that finished successfully
+        """
+        finished: List[str] = []
+        pending = list(job_ids)
+        interval = self.initial_poll_interval
+        deadline = time.monotonic() + self.max_wait
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                time.sleep(interval)
+                statuses = list(executor.map(self._poll, pending))
+                still_pending = []
+                for job_id, status in zip(pending, statuses):
+                    if status == 'FINISHED':
+                        finished.append(job_id)
+                    elif status == 'RUNNING':
+                        still_pending.append(job_id)
+                pending = still_pending
+
+                if pending and time.monotonic() >= deadline:
+                    print(f"ID mapping timed out for {len(pending)} job(s): {', '.join(pending)}")
+                    break
+                interval = min(interval * 2, self.max_poll_interval)
+
+        return finished
+
+    def _results_url(self, job_id: str) -> str:
+        """Resolve the results URL for a finished job.
+
+        The details endpoint reports a target-specific redirect URL (e.g.
+        /idmapping/uniprotkb/results/{job}); fall back to the generic one.
+        """
+        try:
+            response = self.client._make_request(f"{UNIPROT_ID_MAPPING_URL}/details/{job_id}")
+            redirect_url = response.json().get('redirectURL')
+            if redirect_url:
+                return redirect_url
+        except Exception:
+            pass
+        return f"{UNIPROT_ID_MAPPING_URL}/results/{job_id}"
+
+    def _iter_result_pages(self, results_url: str) -> Iterator[Dict]:
+        """Page through a /results URL by following Link rel="next" headers."""
+        url = results_url
+        params: Optional[Dict] = {'format': 'json', 'size': str(ID_MAPPING_PAGE_SIZE)}
+        while url:
+            response = self.client._make_request(url, params=params)
+            yield response.json()
+            match = re.search(r'<([^>]+)>;\s*rel="next"', response.headers.get('Link', ''))
+            url = match.group(1) if match else None
+            params = None  # The next link already carries the query string
+
+    def _fetch_results(self, job_id: str) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Fetch all results of a finished job.
+
+        Returns:
+            Tuple of (mapping, failed_ids)
+        """
+        results_url = self._results_url(job_id)
+        stream_url = results_url.replace('/results/', '/results/stream/', 1)
+        params = {'format': 'json'}
+        if '/uniprotkb/' in results_url:
+            params['fields'] = 'accession'
+
+        try:
+            data = self.client._make_request(stream_url, params=params).json()
+            return parse_mapping_results(data.get('results', [])), data.get('failedIds', [])
+        except Exception as e:
+            print(f"Stream endpoint failed for job {job_id} ({e}), paging results instead")
+
+        mapping: Dict[str, List[str]] = {}
+        failed: List[str] = []
+        try:
+            for page in self._iter_result_pages(results_url):
+                for from_id, targets in parse_mapping_results(page.get('results', [])).items():
+                    mapping.setdefault(from_id, []).extend(targets)
+                failed.extend(page.get('failedIds', []))
+        except Exception as e:
+            print(f"Error fetching results for job {job_id}: {e}")
+        return mapping, failed
+
+    def map_ids(
+        self,
+        ids: List[str],
+        from_db: str,
+        to_db: str = "UniProtKB"
+    ) -> Dict[str, List[str]]:
+        """Map identifiers between databases, using the cache where possible.
+
+        Args:
+            ids: List of identifiers to map
+            from_db: Source database (e.g., 'KEGG', 'Gene_Name', 'RefSeq_Protein')
+            to_db: Target database (default 'UniProtKB')
+
+        Returns:
+            Dictionary mapping source IDs to list of target IDs. IDs that the
+            service could not map are omitted.
+        """
+        unique_ids = list(dict.fromkeys(i for i in ids if i))
+        todo = [i for i in unique_ids if (from_db, to_db, i) not in self._cache]
+
+        if todo:
+            chunks = chunk_ids(todo, self.chunk_size)
+            print(f"Submitting {len(todo)} IDs as {len(chunks)} ID mapping job(s) "
+                  f"({from_db} → {to_db}, {len(unique_ids) - len(todo)} cached)")
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                job_ids = list(executor.map(lambda c: self._submit(c, from_db, to_db), chunks))
+            finished = self._wait_for_jobs([j for j in job_ids if j])
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetched = list(executor.map(self._fetch_results, finished))
+
+            for job_id, (mapping, failed_ids) in zip(finished, fetched):
+                chunk = chunks[job_ids.index(job_id)]
+                # Only cache IDs the server actually answered for, so a
+                # truncated or failed fetch is retried on the next call
+                answered = set(mapping) | set(failed_ids)
+                for id_ in chunk:
+                    if id_ in answered:
+                        self._cache[(from_db, to_db, id_)] = mapping.get(id_, [])
+
+            self.save_cache()
+
+        result = {}
+        for id_ in unique_ids:
+            targets = self._cache.get((from_db, to_db, id_))
+            if targets:
+                result[id_] = list(targets)
+        return result
@@ -80,7 +80,7 @@ def check_publication_pdfs(publications_file: Path, pdf_dir: Path) -> Dict:
 
     # Get all PDFs and markdowns in directory
     pdfs_on_disk = {p.stem: p for p in pdf_dir.glob("*.pdf")}
-    mds_on_disk = {p.stem: p for p in pdf_dir.glob("*.md")}
+    mds_on_disk = {p.stem for p in pdf_dir.glob("*.md")}
 
     print(f"PDFs in {pdf_dir.name}/: {len(pdfs_on_disk)}")
     print(f"Markdown files in {pdf_dir.name}/: {len(mds_on_disk)}")
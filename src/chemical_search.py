@@ -6,12 +6,17 @@ biodegradation and extends the chemicals table with structured data.
 
 import argparse
 import json
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 import pandas as pd
-import requests
+
+try:
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import snapshot_get
+except ImportError:
+    from apis.rate_limits import throttle
+    from apis.snapshots import snapshot_get
 
 
 class ChemicalSearcher:
@@ -25,7 +30,6 @@ class ChemicalSearcher:
         """
         self.pubchem_base = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
         self.chebi_base = "https://www.ebi.ac.uk/chebi"
-        self.rate_limit_delay = 0.5  # seconds between API calls
         self.source_label = source_label
 
         # Major PFAS compounds
@@ -61,7 +65,8 @@ class ChemicalSearcher:
             try:
                 # Search by name
                 url = f"{self.pubchem_base}/compound/name/{compound_name}/JSON"
-                response = requests.get(url, timeout=30)
+                throttle('pubchem')
+                response = snapshot_get(url, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -71,8 +76,6 @@ class ChemicalSearcher:
                         if compound:
                             compounds.append(compound)
 
-                time.sleep(self.rate_limit_delay)
-
             except Exception as e:
                 print(f"    Error searching {compound_name}: {e}")
                 continue
@@ -93,7 +96,8 @@ class ChemicalSearcher:
             try:
                 # Search by name
                 url = f"{self.pubchem_base}/compound/name/{term}/JSON"
-                response = requests.get(url, timeout=30)
+                throttle('pubchem')
+                response = snapshot_get(url, timeout=30)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -104,8 +108,6 @@ class ChemicalSearcher:
                         if compound:
                             compounds.append(compound)
 
-                time.sleep(self.rate_limit_delay)
-
             except Exception as e:
                 print(f"    Error searching {term}: {e}")
                 continue
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""Identify and clean up failed PDF downloads (HTML error pages, paywalls, etc.)."""
+"""Identify and clean up failed PDF downloads (HTML error pages, paywalls, etc.).
+
+download_pdfs_from_publications.py now validates the %PDF header and size
+before a download is committed, so this script is only needed to audit
+files that were saved by older runs or copied in by hand.
+"""
 
 import os
 from pathlib import Path
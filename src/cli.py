@@ -57,6 +57,12 @@ Examples:
         help="Sheet name or index for Excel files (default: first sheet)"
     )
     
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream Excel rows in read-only mode (bounded memory for huge workbooks)"
+    )
+
     # PDF-specific options
     parser.add_argument(
         "--pages",
@@ -86,7 +92,7 @@ Examples:
             sheet = args.sheet
             if sheet and sheet.isdigit():
                 sheet = int(sheet)
-            content = xlsx_to_tsv(args.input, output_path, sheet_name=sheet)
+            content = xlsx_to_tsv(args.input, output_path, sheet_name=sheet, streaming=args.streaming)
             
         elif extension == '.docx':
             # Handle Word docs
@@ -12,11 +12,17 @@ Usage:
 """
 
 import argparse
+import hashlib
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict
+
 import pandas as pd
-import hashlib
+
+try:
+    from src.sheet_diff import diff_tables, log_row_diff, read_xlsx_tables
+except ImportError:
+    from sheet_diff import diff_tables, log_row_diff, read_xlsx_tables
 
 
 class ExcelComparator:
@@ -77,14 +83,14 @@ class ExcelComparator:
         self.log("\nLoading Excel files...", "INFO")
 
         try:
-            excel1 = pd.ExcelFile(file1)
-            excel2 = pd.ExcelFile(file2)
+            tables1 = read_xlsx_tables(file1)
+            tables2 = read_xlsx_tables(file2)
         except Exception as e:
             self.log(f"Error loading Excel files: {e}", "ERROR")
             return {"error": str(e)}
 
-        sheets1 = set(excel1.sheet_names)
-        sheets2 = set(excel2.sheet_names)
+        sheets1 = set(tables1)
+        sheets2 = set(tables2)
 
         results = {
             'sheets_only_in_file1': sheets1 - sheets2,
@@ -109,10 +115,7 @@ class ExcelComparator:
             self.log(f"\n  Sheet: '{sheet_name}'", "INFO")
 
             try:
-                df1 = pd.read_excel(file1, sheet_name=sheet_name)
-                df2 = pd.read_excel(file2, sheet_name=sheet_name)
-
-                sheet_diff = self.compare_dataframes(df1, df2, sheet_name)
+                sheet_diff = self.compare_dataframes(tables1[sheet_name], tables2[sheet_name], sheet_name)
                 results['sheet_differences'][sheet_name] = sheet_diff
 
             except Exception as e:
@@ -125,10 +128,16 @@ class ExcelComparator:
     def compare_dataframes(self, df1: pd.DataFrame, df2: pd.DataFrame,
                           sheet_name: str) -> Dict[str, any]:
         """
-        Compare two dataframes in detail.
+        Compare two versions of a sheet, matching rows by ID.
+
+        Args:
+            df1: Sheet from the first file, as text
+            df2: Sheet from the second file, as text
+            sheet_name: Name of the sheet
 
         Returns:
-            Dictionary with comparison results
+            Dictionary with comparison results (see sheet_diff.diff_tables
+            for the row-level entries)
         """
         diff = {
             'identical': False,
@@ -153,7 +162,7 @@ class ExcelComparator:
 
         # Report column differences
         if not diff['columns_same']:
-            self.log(f"    Columns differ", "WARNING")
+            self.log("    Columns differ", "WARNING")
             self.differences_found = True
 
             if diff['added_columns']:
@@ -171,44 +180,14 @@ class ExcelComparator:
         else:
             self.log(f"    Columns: {len(df1.columns)} ✓", "INFO")
 
-        # Compare data for common columns
-        common_cols = set(df1.columns) & set(df2.columns)
-
-        if common_cols and df1.shape[0] > 0 and df2.shape[0] > 0:
-            # Compare values for common columns
-            data_same = True
-            for col in common_cols:
-                try:
-                    # Handle NaN values
-                    col_equal = df1[col].fillna('').equals(df2[col].fillna(''))
-
-                    if not col_equal:
-                        # Count differences
-                        if df1.shape[0] == df2.shape[0]:
-                            diff_mask = df1[col].fillna('') != df2[col].fillna('')
-                            diff_count = diff_mask.sum()
-                            diff['data_differences'][col] = diff_count
-                            data_same = False
-                        else:
-                            diff['data_differences'][col] = 'row count differs'
-                            data_same = False
-
-                except Exception as e:
-                    diff['data_differences'][col] = f'error: {e}'
-                    data_same = False
-
-            if diff['data_differences']:
-                self.log(f"    Data differences in {len(diff['data_differences'])} columns:", "WARNING")
-                self.differences_found = True
-                for col, count in sorted(diff['data_differences'].items()):
-                    if isinstance(count, int):
-                        self.log(f"      '{col}': {count} row(s) differ", "WARNING")
-                    else:
-                        self.log(f"      '{col}': {count}", "WARNING")
-            else:
-                self.log(f"    Data: identical ✓", "SUCCESS")
-
-            diff['identical'] = diff['shape_same'] and diff['columns_same'] and data_same
+        # Compare rows matched by ID
+        row_diff = diff_tables(df1, df2)
+        for key in ('id_column', 'added_rows', 'removed_rows', 'changed_rows', 'reordered', 'identical'):
+            diff[key] = row_diff[key]
+        diff['data_differences'] = row_diff['cell_changes']
+        log_row_diff(row_diff, self.log)
+        if not row_diff['identical']:
+            self.differences_found = True
 
         return diff
 
@@ -266,6 +245,10 @@ class ExcelComparator:
                 sheets_with_diffs = sum(1 for diff in results['sheet_differences'].values()
                                        if not diff.get('identical', False))
                 print(f"  - Sheets with differences: {sheets_with_diffs}/{len(results['common_sheets'])}")
+                sheet_diffs = [diff for diff in results['sheet_differences'].values() if 'error' not in diff]
+                print(f"  - Rows added: {sum(len(diff['added_rows']) for diff in sheet_diffs)}, "
+                      f"removed: {sum(len(diff['removed_rows']) for diff in sheet_diffs)}, "
+                      f"changed: {sum(len(diff['changed_rows']) for diff in sheet_diffs)}")
         else:
             print("RESULT: Files are IDENTICAL (content match)")
             print("=" * 80)
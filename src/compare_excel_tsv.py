@@ -14,9 +14,15 @@ Usage:
 import argparse
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Set, Optional
+from typing import Dict, Optional, Tuple
+
 import pandas as pd
 
+try:
+    from src.sheet_diff import diff_tables, log_row_diff, read_tsv_table, read_xlsx_tables
+except ImportError:
+    from sheet_diff import diff_tables, log_row_diff, read_tsv_table, read_xlsx_tables
+
 
 class ExcelTSVComparator:
     """Compare Excel file with TSV files."""
@@ -72,10 +78,16 @@ class ExcelTSVComparator:
     def compare_dataframes(self, df_excel: pd.DataFrame, df_tsv: pd.DataFrame,
                           sheet_name: str) -> Dict[str, any]:
         """
-        Compare Excel sheet DataFrame with TSV DataFrame.
+        Compare an Excel sheet with its TSV file, matching rows by ID.
+
+        Args:
+            df_excel: Sheet from the Excel file, as text
+            df_tsv: TSV file, as text
+            sheet_name: Name of the sheet
 
         Returns:
-            Dictionary with comparison results
+            Dictionary with comparison results (see sheet_diff.diff_tables
+            for the row-level entries)
         """
         diff = {
             'identical': False,
@@ -99,7 +111,7 @@ class ExcelTSVComparator:
 
         # Report column differences
         if not diff['columns_same']:
-            self.log(f"    Columns differ", "WARNING")
+            self.log("    Columns differ", "WARNING")
             self.differences_found = True
 
             if diff['added_columns']:
@@ -110,48 +122,14 @@ class ExcelTSVComparator:
         else:
             self.log(f"    Columns: {len(df_excel.columns)} ✓", "SUCCESS")
 
-        # Compare data for common columns
-        common_cols = set(df_excel.columns) & set(df_tsv.columns)
-
-        if common_cols and df_excel.shape[0] > 0 and df_tsv.shape[0] > 0:
-            # Compare values for common columns
-            data_same = True
-            for col in common_cols:
-                try:
-                    # Handle NaN values
-                    col_equal = df_excel[col].fillna('').equals(df_tsv[col].fillna(''))
-
-                    if not col_equal:
-                        # Count differences
-                        if df_excel.shape[0] == df_tsv.shape[0]:
-                            diff_mask = df_excel[col].fillna('') != df_tsv[col].fillna('')
-                            diff_count = diff_mask.sum()
-                            if diff_count > 0:
-                                diff['data_differences'][col] = diff_count
-                                data_same = False
-                        else:
-                            diff['data_differences'][col] = 'row count differs'
-                            data_same = False
-
-                except Exception as e:
-                    diff['data_differences'][col] = f'error: {e}'
-                    data_same = False
-
-            if diff['data_differences']:
-                self.log(f"    Data differences in {len(diff['data_differences'])} columns:", "WARNING")
-                self.differences_found = True
-                for col, count in sorted(diff['data_differences'].items()):
-                    if isinstance(count, int):
-                        self.log(f"      '{col}': {count} row(s) differ", "WARNING")
-                    else:
-                        self.log(f"      '{col}': {count}", "WARNING")
-            else:
-                self.log(f"    Data: identical ✓", "SUCCESS")
-
-            diff['identical'] = diff['shape_same'] and diff['columns_same'] and data_same
-        else:
-            # Can't compare data if no common columns or empty DataFrames
-            diff['identical'] = False
+        # Compare rows matched by ID (TSV as the earlier version)
+        row_diff = diff_tables(df_tsv, df_excel)
+        for key in ('id_column', 'added_rows', 'removed_rows', 'changed_rows', 'reordered', 'identical'):
+            diff[key] = row_diff[key]
+        diff['data_differences'] = row_diff['cell_changes']
+        log_row_diff(row_diff, self.log)
+        if not row_diff['identical']:
+            self.differences_found = True
 
         return diff
 
@@ -185,8 +163,8 @@ class ExcelTSVComparator:
         # Load Excel file
         self.log("Loading Excel file...", "INFO")
         try:
-            excel = pd.ExcelFile(excel_file)
-            sheet_names = excel.sheet_names
+            excel_tables = read_xlsx_tables(excel_file)
+            sheet_names = list(excel_tables)
             self.log(f"Found {len(sheet_names)} sheets in Excel file", "INFO")
         except Exception as e:
             self.log(f"Error loading Excel file: {e}", "ERROR")
@@ -225,8 +203,8 @@ class ExcelTSVComparator:
 
             # Load and compare
             try:
-                df_excel = pd.read_excel(excel_file, sheet_name=sheet_name)
-                df_tsv = pd.read_csv(tsv_path, sep='\t')
+                df_excel = excel_tables[sheet_name]
+                df_tsv = read_tsv_table(tsv_path)
 
                 diff = self.compare_dataframes(df_excel, df_tsv, sheet_name)
 
@@ -292,6 +270,9 @@ class ExcelTSVComparator:
                     print(f"      New columns in Excel: {', '.join(diff['added_columns'])}")
                 if diff.get('removed_columns'):
                     print(f"      Extra columns in TSV: {', '.join(diff['removed_columns'])}")
+                if diff['added_rows'] or diff['removed_rows'] or diff['changed_rows']:
+                    print(f"      Rows: {len(diff['added_rows'])} only in Excel, "
+                          f"{len(diff['removed_rows'])} only in TSV, {len(diff['changed_rows'])} changed")
             print()
 
         if results['sheets_without_tsv']:
@@ -6,11 +6,19 @@ column to track the source sheet for each reaction.
 """
 
 import argparse
+import csv
+import os
+from collections import Counter
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
+try:
+    from src.parsers import stream_xlsx_to_tsv, xlsx_sheet_names
+except ImportError:
+    from parsers import stream_xlsx_to_tsv, xlsx_sheet_names
+
 
 # Mapping of sheet names to reaction category values
 SHEET_CATEGORY_MAP = {
@@ -23,10 +31,109 @@ SHEET_CATEGORY_MAP = {
 }
 
 
+def sheet_category(sheet_name: str) -> str:
+    """Reaction category value for a sheet.
+
+    Examples:
+        >>> sheet_category('Dehalogenase')
+        'dehalogenase'
+        >>> sheet_category('New Sheet')
+        'new_sheet'
+    """
+    return SHEET_CATEGORY_MAP.get(sheet_name, sheet_name.lower().replace(' ', '_'))
+
+
+def concat_tsv_files(paths: List[Path], output_path: Path) -> Counter:
+    """Concatenate TSV files row by row, aligning columns by name.
+
+    Columns are ordered by first appearance, as with pd.concat; rows get ''
+    for columns their file does not have. The output is written atomically.
+
+    Args:
+        paths: TSV files to concatenate
+        output_path: Path for the combined TSV
+
+    Returns:
+        Row counts per reaction_category value
+    """
+    columns: List[str] = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            for name in next(csv.reader(f, delimiter='\t'), []):
+                if name not in columns:
+                    columns.append(name)
+
+    counts: Counter = Counter()
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.DictWriter(out, fieldnames=columns, delimiter='\t', lineterminator='\n', restval='')
+        writer.writeheader()
+        for path in paths:
+            with open(path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f, delimiter='\t'):
+                    writer.writerow(row)
+                    counts[row.get('reaction_category', '')] += 1
+    os.replace(tmp_path, output_path)
+    return counts
+
+
+def stream_reactions_excel(
+    excel_path: Path,
+    output_dir: Path,
+    create_unified: bool = True,
+    workers: Optional[int] = None
+) -> None:
+    """Convert reactions Excel to TSV files by streaming the sheets.
+
+    Same files as convert_reactions_excel(), but each sheet is read row by
+    row with openpyxl in read-only mode in its own process, and a row-hash
+    sidecar is written next to each TSV. Values are formatted per cell, so
+    whole-number floats are written as integers ('2' rather than '2.0';
+    see parsers.stream_xlsx_to_tsv).
+
+    Args:
+        excel_path: Path to input Excel file
+        output_dir: Directory for output TSV files
+        create_unified: If True, create unified reactions table
+        workers: Worker processes (default: one per sheet)
+    """
+    sheet_names = xlsx_sheet_names(excel_path)
+    outputs = {
+        sheet_name: output_dir / f"PFAS_Reactions_{sheet_category(sheet_name)}.tsv"
+        for sheet_name in sheet_names
+    }
+    # 'Important genes without enzymat' has a different structure - convert as-is
+    extra_columns = {
+        sheet_name: {'reaction_category': sheet_category(sheet_name), 'source': 'reactions_excel'}
+        for sheet_name in sheet_names
+        if sheet_name != 'Important genes without enzymat'
+    }
+
+    results = stream_xlsx_to_tsv(excel_path, outputs, workers=workers, extra_columns=extra_columns)
+    for result in results:
+        print(f"Processing sheet: {result['sheet']}")
+        print(f"  Saved: {result['path']} ({result['rows']} rows)")
+        print("")
+
+    reaction_files = [result['path'] for result in results if result['sheet'] in extra_columns]
+    if create_unified and reaction_files:
+        unified_path = output_dir / "PFAS_Data_for_AI_reactions.tsv"
+        category_counts = concat_tsv_files(reaction_files, unified_path)
+        print(f"Created unified reactions table: {unified_path}")
+        print(f"Total reactions: {sum(category_counts.values())}")
+        print("")
+
+        print("Reactions by category:")
+        for cat, count in category_counts.most_common():
+            print(f"  {cat}: {count}")
+
+
 def convert_reactions_excel(
     excel_path: Path,
     output_dir: Path,
-    create_unified: bool = True
+    create_unified: bool = True,
+    streaming: bool = False,
+    workers: Optional[int] = None
 ) -> None:
     """Convert reactions Excel to TSV files.
 
@@ -34,6 +141,9 @@ def convert_reactions_excel(
         excel_path: Path to input Excel file
         output_dir: Directory for output TSV files
         create_unified: If True, create unified reactions table
+        streaming: Stream the sheets in parallel processes in read-only mode
+            (see stream_reactions_excel)
+        workers: Worker processes for streaming (default: one per sheet)
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -41,6 +151,10 @@ def convert_reactions_excel(
     print(f"Output directory: {output_dir}")
     print("")
 
+    if streaming:
+        stream_reactions_excel(excel_path, output_dir, create_unified, workers)
+        return
+
     xl = pd.ExcelFile(excel_path)
     all_reactions = []
 
@@ -49,7 +163,7 @@ def convert_reactions_excel(
         df = pd.read_excel(xl, sheet_name)
 
         # Get reaction category
-        category = SHEET_CATEGORY_MAP.get(sheet_name, sheet_name.lower().replace(' ', '_'))
+        category = sheet_category(sheet_name)
 
         # Special handling for 'Important genes without enzymat' sheet
         if sheet_name == 'Important genes without enzymat':
@@ -118,6 +232,17 @@ def main():
         action='store_true',
         help='Do not create unified reactions table'
     )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Stream sheets in read-only mode, one process per sheet (bounded memory for huge workbooks)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for --streaming (default: one per sheet)'
+    )
 
     args = parser.parse_args()
 
@@ -128,7 +253,9 @@ def main():
     convert_reactions_excel(
         args.input,
         args.output_dir,
-        create_unified=not args.no_unified
+        create_unified=not args.no_unified,
+        streaming=args.streaming,
+        workers=args.workers
     )
 
     return 0
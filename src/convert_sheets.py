@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """Convert Excel files with multiple sheets to separate TSV files."""
 
+import argparse
 import pandas as pd
 from pathlib import Path
 import re
+from typing import Optional
+
+try:
+    from src.parsers import stream_xlsx_to_tsv, xlsx_sheet_names
+except ImportError:
+    from parsers import stream_xlsx_to_tsv, xlsx_sheet_names
 
 
 def sanitize_filename(name: str) -> str:
@@ -26,16 +33,38 @@ def sanitize_filename(name: str) -> str:
     return sanitized
 
 
-def convert_excel_sheets(input_path: str, output_dir: str) -> None:
+def convert_excel_sheets(
+    input_path: str,
+    output_dir: str,
+    streaming: bool = False,
+    workers: Optional[int] = None
+) -> None:
     """Convert each sheet in Excel file to separate TSV.
     
     Args:
         input_path: Path to Excel file
         output_dir: Directory to save TSV files
+        streaming: Stream rows with openpyxl in read-only mode, one process
+            per sheet, and write a row-hash sidecar next to each TSV.
+            Whole-number floats are then written as integers ('2' rather
+            than '2.0'; see parsers.stream_xlsx_to_tsv)
+        workers: Worker processes for streaming (default: one per sheet)
     """
     input_path = Path(input_path)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    safe_base = sanitize_filename(input_path.stem)
+
+    if streaming:
+        sheet_names = xlsx_sheet_names(input_path)
+        print(f"Streaming {input_path.name} with {len(sheet_names)} sheets:")
+        outputs = {
+            sheet_name: output_dir / f"{safe_base}_{sanitize_filename(sheet_name)}.tsv"
+            for sheet_name in sheet_names
+        }
+        for result in stream_xlsx_to_tsv(input_path, outputs, workers=workers):
+            print(f"  - {result['sheet']} → {result['path'].name} ({result['rows']} rows)")
+        return
     
     # Read all sheets
     sheets = pd.read_excel(input_path, sheet_name=None)
@@ -43,8 +72,7 @@ def convert_excel_sheets(input_path: str, output_dir: str) -> None:
     print(f"Converting {input_path.name} with {len(sheets)} sheets:")
     
     for sheet_name, df in sheets.items():
-        # Create safe filename for both filename base and sheet name
-        safe_base = sanitize_filename(input_path.stem)
+        # Create safe filename for the sheet name
         safe_sheet = sanitize_filename(sheet_name)
         output_file = output_dir / f"{safe_base}_{safe_sheet}.tsv"
         
@@ -56,6 +84,19 @@ def convert_excel_sheets(input_path: str, output_dir: str) -> None:
 
 def main():
     """Convert Excel files to separate TSV per sheet."""
+    parser = argparse.ArgumentParser(description="Convert Excel sheets to TSV files")
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Stream rows in read-only mode, one process per sheet (bounded memory for huge workbooks)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for --streaming (default: one per sheet)'
+    )
+    args = parser.parse_args()
 
     # Convert PFAS Excel file
     files_to_convert = [
@@ -64,7 +105,7 @@ def main():
     
     for excel_file, output_dir in files_to_convert:
         if Path(excel_file).exists():
-            convert_excel_sheets(excel_file, output_dir)
+            convert_excel_sheets(excel_file, output_dir, streaming=args.streaming, workers=args.workers)
         else:
             print(f"File not found: {excel_file}")
 
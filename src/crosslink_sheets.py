@@ -10,15 +10,22 @@ This script adds cross-reference columns to TSV sheets by linking related data:
 - Biosamples → Genomes (organism matching)
 - Chemicals → Referenced in other tables
 
-The script is idempotent and can be run multiple times safely.
+The script is idempotent and can be run multiple times safely. Each sheet
+is read once, all link passes run in memory, and every modified sheet is
+written once at the end.
 """
 
 import argparse
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import re
 
+try:
+    from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
+except ImportError:
+    from sheet_store import DEFAULT_STORE_NAME, SheetStore
+
 
 def normalize_organism_name(name: str, level: str = 'exact') -> str:
     """
@@ -51,7 +58,66 @@ def normalize_organism_name(name: str, level: str = 'exact') -> str:
     return name
 
 
-def hierarchical_match_organism(query: str, genomes_df: pd.DataFrame) -> Dict[str, any]:
+ORGANISM_MATCH_LEVELS = ('exact', 'species', 'genus')
+
+# Organism index: match level → normalized name → [(genome name, taxon id), ...]
+OrganismIndex = Dict[str, Dict[str, List[Tuple[str, str]]]]
+
+
+def organism_keys(name: str) -> Tuple[str, str, str]:
+    """
+    Normalize organism name at all three match levels with one regex pass.
+
+    Same keys as normalize_organism_name() with 'exact', 'species' and 'genus'.
+
+    Examples:
+        >>> organism_keys("Methylobacterium extorquens strain AM1")
+        ('methylobacterium extorquens', 'methylobacterium extorquens', 'methylobacterium')
+        >>> organism_keys("Methylorubrum")
+        ('methylorubrum', 'methylorubrum', 'methylorubrum')
+    """
+    exact = normalize_organism_name(name, 'exact')
+    parts = exact.split()
+    species = f"{parts[0]} {parts[1]}" if len(parts) >= 2 else exact
+    genus = parts[0] if parts else exact
+    return exact, species, genus
+
+
+def build_organism_index(genomes_df: pd.DataFrame) -> OrganismIndex:
+    """
+    Index a genomes table by normalized organism name at each match level.
+
+    Genomes without an NCBITaxon id are left out, as in matching. Each list
+    keeps the genomes table order, so its first entry is the closest match.
+
+    Examples:
+        >>> genomes = pd.DataFrame({
+        ...     "Scientific name": ["Methylobacterium extorquens AM1", "Methylobacterium aquaticum"],
+        ...     "NCBITaxon id": [272630, 270351],
+        ... })
+        >>> build_organism_index(genomes)['genus']
+        {'methylobacterium': [('Methylobacterium extorquens AM1', '272630'), ('Methylobacterium aquaticum', '270351')]}
+    """
+    index: OrganismIndex = {level: {} for level in ORGANISM_MATCH_LEVELS}
+    if "NCBITaxon id" not in genomes_df.columns:
+        return index
+
+    names = genomes_df.get("Scientific name", pd.Series("", index=genomes_df.index))
+    for genome_name, taxon_id in zip(names, genomes_df["NCBITaxon id"]):
+        if pd.isna(taxon_id):
+            continue
+        entry = (genome_name, str(int(float(taxon_id))))
+        for level, key in zip(ORGANISM_MATCH_LEVELS, organism_keys(genome_name)):
+            if key:
+                index[level].setdefault(key, []).append(entry)
+    return index
+
+
+def hierarchical_match_organism(
+    query: str,
+    genomes_df: pd.DataFrame,
+    index: Optional[OrganismIndex] = None
+) -> Dict[str, any]:
     """
     Match organism name to genomes table using hierarchical matching.
 
@@ -60,58 +126,39 @@ def hierarchical_match_organism(query: str, genomes_df: pd.DataFrame) -> Dict[st
     2. Species-level match (genus + species)
     3. Genus-level match (as fallback)
 
+    Pass an index from build_organism_index() to match many names against
+    the same genomes table.
+
     Returns dict with:
         - exact_matches: [(name, taxon_id), ...]
         - closest_match: (name, taxon_id, match_level) or None
+
+    Examples:
+        >>> genomes = pd.DataFrame({
+        ...     "Scientific name": ["Methylobacterium extorquens AM1", "Methylobacterium aquaticum"],
+        ...     "NCBITaxon id": [272630, 270351],
+        ... })
+        >>> hierarchical_match_organism("Methylobacterium extorquens PA1", genomes)["closest_match"]
+        ('Methylobacterium extorquens AM1', '272630', 'species')
     """
     if pd.isna(query) or not str(query).strip():
         return {"exact_matches": [], "closest_match": None}
 
-    query_str = str(query).strip()
-    exact_matches = []
-    species_matches = []
-    genus_matches = []
-
-    # Normalize query at different levels
-    query_exact = normalize_organism_name(query_str, 'exact')
-    query_species = normalize_organism_name(query_str, 'species')
-    query_genus = normalize_organism_name(query_str, 'genus')
+    if index is None:
+        index = build_organism_index(genomes_df)
 
-    # Search through genomes
-    for idx, row in genomes_df.iterrows():
-        genome_name = row.get("Scientific name", "")
-        taxon_id = row.get("NCBITaxon id")
+    exact_key, species_key, genus_key = organism_keys(str(query).strip())
+    exact_matches = list(index['exact'].get(exact_key, []))
 
-        if pd.isna(taxon_id):
-            continue
-
-        taxon_id_str = str(int(float(taxon_id)))
-
-        # Exact match
-        genome_exact = normalize_organism_name(genome_name, 'exact')
-        if query_exact == genome_exact:
-            exact_matches.append((genome_name, taxon_id_str))
-            continue
-
-        # Species-level match
-        genome_species = normalize_organism_name(genome_name, 'species')
-        if query_species and genome_species and query_species == genome_species:
-            species_matches.append((genome_name, taxon_id_str))
-            continue
-
-        # Genus-level match
-        genome_genus = normalize_organism_name(genome_name, 'genus')
-        if query_genus and genome_genus and query_genus == genome_genus:
-            genus_matches.append((genome_name, taxon_id_str))
-
-    # Determine closest match
+    # A genome matching at a finer level is never counted at a coarser one,
+    # so coarser lists only matter when the finer ones are empty
     closest_match = None
     if exact_matches:
         closest_match = (exact_matches[0][0], exact_matches[0][1], 'exact')
-    elif species_matches:
-        closest_match = (species_matches[0][0], species_matches[0][1], 'species')
-    elif genus_matches:
-        closest_match = (genus_matches[0][0], genus_matches[0][1], 'genus')
+    elif species_key and species_key in index['species']:
+        closest_match = (*index['species'][species_key][0], 'species')
+    elif genus_key and genus_key in index['genus']:
+        closest_match = (*index['genus'][genus_key][0], 'genus')
 
     return {
         "exact_matches": exact_matches,
@@ -119,18 +166,150 @@ def hierarchical_match_organism(query: str, genomes_df: pd.DataFrame) -> Dict[st
     }
 
 
+def match_organisms(organisms: pd.Series, index: OrganismIndex) -> pd.DataFrame:
+    """
+    Resolve a column of organism names against an organism index.
+
+    Each distinct name is matched once; rows are then filled with a
+    vectorized lookup on the distinct names.
+
+    Args:
+        organisms: Organism names (NaN for rows without one)
+        index: Index from build_organism_index()
+
+    Returns:
+        DataFrame aligned with organisms, with columns exact_name,
+        exact_taxon_id (first exact match), exact_taxon_ids (all exact
+        matches, '; '-joined), closest_name, closest_taxon_id and
+        match_level; NaN where there is no match
+    """
+    columns = [
+        'exact_name', 'exact_taxon_id', 'exact_taxon_ids',
+        'closest_name', 'closest_taxon_id', 'match_level'
+    ]
+    values = organisms.dropna()
+    resolved = {}
+    for value in pd.unique(values):
+        match = hierarchical_match_organism(value, None, index)
+        exact_matches = match["exact_matches"]
+        closest_match = match["closest_match"]
+        resolved[value] = (
+            exact_matches[0][0] if exact_matches else None,
+            exact_matches[0][1] if exact_matches else None,
+            "; ".join(taxon_id for _, taxon_id in exact_matches) if exact_matches else None,
+            *(closest_match if closest_match else (None, None, None))
+        )
+
+    table = pd.DataFrame.from_dict(resolved, orient='index', columns=columns)
+    matches = table.reindex(values.to_numpy())
+    matches.index = values.index
+    return matches.reindex(organisms.index)
+
+
+def organism_column(df: pd.DataFrame, *names: str) -> pd.Series:
+    """
+    Organism names from the first of several columns that has a value.
+
+    Examples:
+        >>> df = pd.DataFrame({"organism": ["E. coli", None], "Organism": [None, "B. subtilis"]})
+        >>> organism_column(df, "organism", "Organism").tolist()
+        ['E. coli', 'B. subtilis']
+    """
+    organisms = pd.Series(None, index=df.index, dtype=object)
+    for name in names:
+        if name in df.columns:
+            organisms = organisms.where(organisms.notna(), df[name])
+    return organisms
+
+
+def fill_matched(df: pd.DataFrame, mask: pd.Series, values: Dict[str, pd.Series]) -> None:
+    """Set cross-reference columns on the matched rows, keeping the others."""
+    for column, column_values in values.items():
+        df[column] = df[column].astype(object)
+        df.loc[mask, column] = column_values[mask]
+
+
+class SheetSet:
+    """
+    TSV sheets shared by the crosslink passes of one run.
+
+    Each sheet is read once; passes edit copies of the loaded DataFrames and
+    store them back, so later passes see earlier links without re-reading
+    the file, and save() writes every modified sheet once at the end.
+    Organism indexes are built once per genomes sheet.
+
+    With autosave=True (the default when a crosslink function is called on
+    its own), stored sheets are written immediately.
+
+    With a working store, sheets are read from the store (as strings) and
+    save() writes only their changed rows back to it; the TSVs are left for
+    the store's export.
+    """
+
+    def __init__(self, autosave: bool = False, store: Optional[SheetStore] = None):
+        self.autosave = autosave
+        self.sheet_store = store
+        self.tables: Dict[str, pd.DataFrame] = {}
+        self.modified: List[str] = []
+        self._organism_indexes: Dict[str, OrganismIndex] = {}
+
+    def load(self, path: str) -> pd.DataFrame:
+        """Sheet contents, read from disk on first use (do not modify)."""
+        key = str(path)
+        if key not in self.tables:
+            if self.sheet_store is not None:
+                self.tables[key] = self.sheet_store.read(Path(key))
+            else:
+                self.tables[key] = pd.read_csv(key, sep='\t')
+        return self.tables[key]
+
+    def edit(self, path: str) -> pd.DataFrame:
+        """Copy of a sheet for a pass to modify and store()."""
+        return self.load(path).copy()
+
+    def organism_index(self, genomes_file: str) -> OrganismIndex:
+        """Organism index of a genomes sheet (built once)."""
+        key = str(genomes_file)
+        if key not in self._organism_indexes:
+            self._organism_indexes[key] = build_organism_index(self.load(key))
+        return self._organism_indexes[key]
+
+    def store(self, path: str, df: pd.DataFrame) -> None:
+        """Replace a sheet with a pass's result."""
+        key = str(path)
+        self.tables[key] = df
+        self._organism_indexes.pop(key, None)
+        if key not in self.modified:
+            self.modified.append(key)
+        if self.autosave:
+            self.save()
+
+    def save(self) -> List[str]:
+        """Write each modified sheet once; returns the paths written."""
+        saved = self.modified
+        for key in saved:
+            if self.sheet_store is not None:
+                self.sheet_store.write(Path(key), self.tables[key])
+            else:
+                self.tables[key].to_csv(key, sep='\t', index=False)
+        self.modified = []
+        return saved
+
+
 def crosslink_genes_to_genomes(
     genes_file: str,
     genomes_file: str,
-    output_file: str
+    output_file: str,
+    sheets: Optional[SheetSet] = None
 ) -> None:
     """Link genes/proteins to their source genomes with hierarchical matching."""
     print("\n" + "=" * 80)
     print("Cross-linking Genes → Genomes")
     print("=" * 80)
 
-    genes_df = pd.read_csv(genes_file, sep='\t')
-    genomes_df = pd.read_csv(genomes_file, sep='\t')
+    sheets = sheets or SheetSet(autosave=True)
+    genes_df = sheets.edit(genes_file)
+    genomes_df = sheets.load(genomes_file)
 
     print(f"Loaded {len(genes_df)} genes and {len(genomes_df)} genomes")
 
@@ -147,61 +326,56 @@ def crosslink_genes_to_genomes(
         genes_df['genome_match_level'] = ""
 
     # Match each gene to its genome
-    exact_count = 0
-    species_count = 0
-    genus_count = 0
-
-    for idx, row in genes_df.iterrows():
-        organism = row.get("organism (from taxa and genomes tab)")
-        if pd.isna(organism):
-            continue
-
-        match_result = hierarchical_match_organism(organism, genomes_df)
-        exact_matches = match_result["exact_matches"]
-        closest_match = match_result["closest_match"]
+    matches = match_organisms(
+        organism_column(genes_df, "organism (from taxa and genomes tab)"),
+        sheets.organism_index(genomes_file)
+    )
+    exact = matches['exact_name'].notna()
+    closest = matches['match_level'].notna()
 
-        # Fill in exact match columns (only for exact matches)
-        if exact_matches:
-            genome_name, taxon_id = exact_matches[0]
-            genes_df.at[idx, 'genome_ncbitaxon_id'] = taxon_id
-            genes_df.at[idx, 'genome_scientific_name'] = genome_name
-            exact_count += 1
+    # Fill in exact match columns (only for exact matches)
+    fill_matched(genes_df, exact, {
+        'genome_ncbitaxon_id': matches['exact_taxon_id'],
+        'genome_scientific_name': matches['exact_name'],
+    })
 
-        # Fill in closest match columns (for any match)
-        if closest_match:
-            genome_name, taxon_id, match_level = closest_match
-            genes_df.at[idx, 'closest_genome_ncbitaxon_id'] = taxon_id
-            genes_df.at[idx, 'closest_genome_name'] = genome_name
-            genes_df.at[idx, 'genome_match_level'] = match_level
+    # Fill in closest match columns (for any match)
+    fill_matched(genes_df, closest, {
+        'closest_genome_ncbitaxon_id': matches['closest_taxon_id'],
+        'closest_genome_name': matches['closest_name'],
+        'genome_match_level': matches['match_level'],
+    })
 
-            if match_level == 'species':
-                species_count += 1
-            elif match_level == 'genus':
-                genus_count += 1
+    exact_count = int(exact.sum())
+    species_count = int((matches['match_level'] == 'species').sum())
+    genus_count = int((matches['match_level'] == 'genus').sum())
 
-    # Save
-    genes_df.to_csv(output_file, sep='\t', index=False)
+    # Store (written now, or once at the end of a crosslink run)
+    sheets.store(output_file, genes_df)
 
     total_linked = exact_count + species_count + genus_count
     print(f"✓ Linked {total_linked}/{len(genes_df)} genes to genomes")
     print(f"  - Exact matches: {exact_count}")
     print(f"  - Species-level: {species_count}")
     print(f"  - Genus-level: {genus_count}")
-    print(f"✓ Saved to {output_file}")
+    if sheets.autosave:
+        print(f"✓ Saved to {output_file}")
 
 
 def crosslink_pathways_to_genomes(
     pathways_file: str,
     genomes_file: str,
-    output_file: str
+    output_file: str,
+    sheets: Optional[SheetSet] = None
 ) -> None:
     """Link pathways to their source genomes with hierarchical matching."""
     print("\n" + "=" * 80)
     print("Cross-linking Pathways → Genomes")
     print("=" * 80)
 
-    pathways_df = pd.read_csv(pathways_file, sep='\t')
-    genomes_df = pd.read_csv(genomes_file, sep='\t')
+    sheets = sheets or SheetSet(autosave=True)
+    pathways_df = sheets.edit(pathways_file)
+    genomes_df = sheets.load(genomes_file)
 
     print(f"Loaded {len(pathways_df)} pathways and {len(genomes_df)} genomes")
 
@@ -214,59 +388,54 @@ def crosslink_pathways_to_genomes(
         pathways_df['genome_match_level'] = ""
 
     # Match each pathway to genomes
-    exact_count = 0
-    species_count = 0
-    genus_count = 0
-
-    for idx, row in pathways_df.iterrows():
-        organism = row.get("organism")
-        if pd.isna(organism):
-            continue
-
-        match_result = hierarchical_match_organism(organism, genomes_df)
-        exact_matches = match_result["exact_matches"]
-        closest_match = match_result["closest_match"]
+    matches = match_organisms(
+        organism_column(pathways_df, "organism"),
+        sheets.organism_index(genomes_file)
+    )
+    exact = matches['exact_name'].notna()
+    closest = matches['match_level'].notna()
 
-        # Fill in exact match IDs (all exact matches)
-        if exact_matches:
-            taxon_ids = [taxon_id for _, taxon_id in exact_matches]
-            pathways_df.at[idx, 'genome_ncbitaxon_ids'] = "; ".join(taxon_ids)
-            exact_count += 1
+    # Fill in exact match IDs (all exact matches)
+    fill_matched(pathways_df, exact, {
+        'genome_ncbitaxon_ids': matches['exact_taxon_ids'],
+    })
 
-        # Fill in closest match info
-        if closest_match:
-            genome_name, taxon_id, match_level = closest_match
-            pathways_df.at[idx, 'closest_genome_ncbitaxon_ids'] = taxon_id
-            pathways_df.at[idx, 'genome_match_level'] = match_level
+    # Fill in closest match info
+    fill_matched(pathways_df, closest, {
+        'closest_genome_ncbitaxon_ids': matches['closest_taxon_id'],
+        'genome_match_level': matches['match_level'],
+    })
 
-            if match_level == 'species':
-                species_count += 1
-            elif match_level == 'genus':
-                genus_count += 1
+    exact_count = int(exact.sum())
+    species_count = int((matches['match_level'] == 'species').sum())
+    genus_count = int((matches['match_level'] == 'genus').sum())
 
-    # Save
-    pathways_df.to_csv(output_file, sep='\t', index=False)
+    # Store (written now, or once at the end of a crosslink run)
+    sheets.store(output_file, pathways_df)
 
     total_linked = exact_count + species_count + genus_count
     print(f"✓ Linked {total_linked}/{len(pathways_df)} pathways to genomes")
     print(f"  - Exact matches: {exact_count}")
     print(f"  - Species-level: {species_count}")
     print(f"  - Genus-level: {genus_count}")
-    print(f"✓ Saved to {output_file}")
+    if sheets.autosave:
+        print(f"✓ Saved to {output_file}")
 
 
 def crosslink_pathways_to_genes(
     pathways_file: str,
     genes_file: str,
-    output_file: str
+    output_file: str,
+    sheets: Optional[SheetSet] = None
 ) -> None:
     """Link pathways to specific gene/protein IDs."""
     print("\n" + "=" * 80)
     print("Cross-linking Pathways → Genes")
     print("=" * 80)
     
-    pathways_df = pd.read_csv(pathways_file, sep='\t')
-    genes_df = pd.read_csv(genes_file, sep='\t')
+    sheets = sheets or SheetSet(autosave=True)
+    pathways_df = sheets.edit(pathways_file)
+    genes_df = sheets.load(genes_file)
     
     print(f"Loaded {len(pathways_df)} pathways and {len(genes_df)} genes")
     
@@ -318,24 +487,27 @@ def crosslink_pathways_to_genes(
             pathways_df.at[idx, 'gene_protein_ids'] = "; ".join(sorted(set(found_gene_ids)))
             linked_count += 1
     
-    # Save
-    pathways_df.to_csv(output_file, sep='\t', index=False)
+    # Store (written now, or once at the end of a crosslink run)
+    sheets.store(output_file, pathways_df)
     print(f"✓ Linked {linked_count}/{len(pathways_df)} pathways to genes")
-    print(f"✓ Saved to {output_file}")
+    if sheets.autosave:
+        print(f"✓ Saved to {output_file}")
 
 
 def crosslink_biosamples_to_genomes(
     biosamples_file: str,
     genomes_file: str,
-    output_file: str
+    output_file: str,
+    sheets: Optional[SheetSet] = None
 ) -> None:
     """Link biosamples to their source genomes with hierarchical matching."""
     print("\n" + "=" * 80)
     print("Cross-linking Biosamples → Genomes")
     print("=" * 80)
 
-    biosamples_df = pd.read_csv(biosamples_file, sep='\t')
-    genomes_df = pd.read_csv(genomes_file, sep='\t')
+    sheets = sheets or SheetSet(autosave=True)
+    biosamples_df = sheets.edit(biosamples_file)
+    genomes_df = sheets.load(genomes_file)
 
     print(f"Loaded {len(biosamples_df)} biosamples and {len(genomes_df)} genomes")
 
@@ -352,64 +524,56 @@ def crosslink_biosamples_to_genomes(
         biosamples_df['genome_match_level'] = ""
 
     # Match each biosample to genome
-    exact_count = 0
-    species_count = 0
-    genus_count = 0
-
-    for idx, row in biosamples_df.iterrows():
-        organism = row.get("organism")
-        if pd.isna(organism):
-            organism = row.get("Organism")
-
-        if pd.isna(organism):
-            continue
-
-        match_result = hierarchical_match_organism(organism, genomes_df)
-        exact_matches = match_result["exact_matches"]
-        closest_match = match_result["closest_match"]
+    matches = match_organisms(
+        organism_column(biosamples_df, "organism", "Organism"),
+        sheets.organism_index(genomes_file)
+    )
+    exact = matches['exact_name'].notna()
+    closest = matches['match_level'].notna()
 
-        # Fill in exact match columns
-        if exact_matches:
-            genome_name, taxon_id = exact_matches[0]
-            biosamples_df.at[idx, 'genome_ncbitaxon_id'] = taxon_id
-            biosamples_df.at[idx, 'genome_scientific_name'] = genome_name
-            exact_count += 1
+    # Fill in exact match columns
+    fill_matched(biosamples_df, exact, {
+        'genome_ncbitaxon_id': matches['exact_taxon_id'],
+        'genome_scientific_name': matches['exact_name'],
+    })
 
-        # Fill in closest match columns
-        if closest_match:
-            genome_name, taxon_id, match_level = closest_match
-            biosamples_df.at[idx, 'closest_genome_ncbitaxon_id'] = taxon_id
-            biosamples_df.at[idx, 'closest_genome_name'] = genome_name
-            biosamples_df.at[idx, 'genome_match_level'] = match_level
+    # Fill in closest match columns
+    fill_matched(biosamples_df, closest, {
+        'closest_genome_ncbitaxon_id': matches['closest_taxon_id'],
+        'closest_genome_name': matches['closest_name'],
+        'genome_match_level': matches['match_level'],
+    })
 
-            if match_level == 'species':
-                species_count += 1
-            elif match_level == 'genus':
-                genus_count += 1
+    exact_count = int(exact.sum())
+    species_count = int((matches['match_level'] == 'species').sum())
+    genus_count = int((matches['match_level'] == 'genus').sum())
 
-    # Save
-    biosamples_df.to_csv(output_file, sep='\t', index=False)
+    # Store (written now, or once at the end of a crosslink run)
+    sheets.store(output_file, biosamples_df)
 
     total_linked = exact_count + species_count + genus_count
     print(f"✓ Linked {total_linked}/{len(biosamples_df)} biosamples to genomes")
     print(f"  - Exact matches: {exact_count}")
     print(f"  - Species-level: {species_count}")
     print(f"  - Genus-level: {genus_count}")
-    print(f"✓ Saved to {output_file}")
+    if sheets.autosave:
+        print(f"✓ Saved to {output_file}")
 
 
 def crosslink_structures_to_genes(
     structures_file: str,
     genes_file: str,
-    output_file: str
+    output_file: str,
+    sheets: Optional[SheetSet] = None
 ) -> None:
     """Link structures to gene/protein entries."""
     print("\n" + "=" * 80)
     print("Cross-linking Structures → Genes")
     print("=" * 80)
     
-    structures_df = pd.read_csv(structures_file, sep='\t')
-    genes_df = pd.read_csv(genes_file, sep='\t')
+    sheets = sheets or SheetSet(autosave=True)
+    structures_df = sheets.edit(structures_file)
+    genes_df = sheets.load(genes_file)
     
     print(f"Loaded {len(structures_df)} structures and {len(genes_df)} genes")
     
@@ -445,10 +609,11 @@ def crosslink_structures_to_genes(
             structures_df.at[idx, 'gene_protein_ids'] = "; ".join(sorted(set(found_gene_ids)))
             linked_count += 1
     
-    # Save
-    structures_df.to_csv(output_file, sep='\t', index=False)
+    # Store (written now, or once at the end of a crosslink run)
+    sheets.store(output_file, structures_df)
     print(f"✓ Linked {linked_count}/{len(structures_df)} structures to genes")
-    print(f"✓ Saved to {output_file}")
+    if sheets.autosave:
+        print(f"✓ Saved to {output_file}")
 
 
 def main():
@@ -494,6 +659,12 @@ Cross-linking relationships:
         default="data/txt/sheet",
         help="Data directory (default: data/txt/sheet)"
     )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Cross-link the sheets in the DuckDB working store (<data-dir>/{DEFAULT_STORE_NAME}) "
+             "instead of rewriting the TSVs; export it with src/sheet_store.py"
+    )
 
     args = parser.parse_args()
 
@@ -549,31 +720,41 @@ Cross-linking relationships:
     print(f"Operations: {', '.join(ops_to_run)}")
     print("=" * 80)
 
-    # Run operations
-    for op_name in ops_to_run:
-        op_info = operations[op_name]
-
-        # Check if all input files exist
-        missing_files = []
-        for key, path in op_info.items():
-            if key not in ["func", "output_file"] and not path.exists():
-                missing_files.append(str(path))
-
-        if missing_files:
-            print(f"\n⚠️  Skipping {op_name}: missing files")
-            for f in missing_files:
-                print(f"   - {f}")
-            continue
-
-        # Run cross-linking function
-        try:
-            func = op_info["func"]
-            func_args = {k: str(v) for k, v in op_info.items() if k != "func"}
-            func(**func_args)
-        except Exception as e:
-            print(f"\n❌ Error in {op_name}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Run operations against sheets loaded once, then write each modified sheet once
+    store = SheetStore(data_dir / DEFAULT_STORE_NAME) if args.store else None
+    try:
+        sheets = SheetSet(store=store)
+        for op_name in ops_to_run:
+            op_info = operations[op_name]
+
+            # Check if all input files exist
+            missing_files = []
+            for key, path in op_info.items():
+                if key not in ["func", "output_file"] and not path.exists():
+                    missing_files.append(str(path))
+
+            if missing_files:
+                print(f"\n⚠️  Skipping {op_name}: missing files")
+                for f in missing_files:
+                    print(f"   - {f}")
+                continue
+
+            # Run cross-linking function
+            try:
+                func = op_info["func"]
+                func_args = {k: str(v) for k, v in op_info.items() if k != "func"}
+                func(**func_args, sheets=sheets)
+            except Exception as e:
+                print(f"\n❌ Error in {op_name}: {e}")
+                import traceback
+                traceback.print_exc()
+
+        print()
+        for path in sheets.save():
+            print(f"✓ Saved to {path}" if store is None else f"✓ Stored {path} in {store.path}")
+    finally:
+        if store is not None:
+            store.close()
 
     print("\n" + "=" * 80)
     print("✓ CROSS-LINKING COMPLETE")
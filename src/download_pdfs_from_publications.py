@@ -3,17 +3,50 @@
 
 This script reads the publications table and downloads PDFs from URLs,
 handling different sources like PMC, direct PDFs, and DOI links.
+
+Downloads run through PDFDownloadEngine, which:
+- Fetches in a thread pool with per-host concurrency limits and delays
+- Reuses keep-alive connections (one requests.Session per worker thread)
+- Resumes partial transfers with HTTP Range requests, only from the URL
+  that wrote the partial file and only while its ETag/Last-Modified holds
+- Writes to a temp file and renames atomically after validating the
+  %PDF magic and minimum size, so HTML error pages never land as .pdf
 """
 
 import argparse
+import json
+import os
 import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# Files smaller than this are treated as failed downloads (same threshold
+# cleanup_failed_pdfs.py uses for files already on disk)
+MIN_PDF_SIZE = 5000
+
+# PDF spec allows junk before the header; readers look in the first 1 KB
+PDF_MAGIC = b'%PDF'
+PDF_HEADER_WINDOW = 1024
+
+PARTIAL_SUFFIX = '.part'
+
+# Beside <output>.part: the URL and validator (ETag/Last-Modified) of its bytes
+PARTIAL_SOURCE_SUFFIX = '.source.json'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
 
 
 def sanitize_filename(url: str, title: Optional[str] = None) -> str:
@@ -72,6 +105,313 @@ def convert_pmc_to_pdf_url(pmc_url: str) -> Optional[str]:
     return None
 
 
+def validate_pdf_file(path: Path, min_size: int = MIN_PDF_SIZE) -> Tuple[bool, str]:
+    """Check that a file on disk looks like a real PDF.
+
+    Args:
+        path: File to check
+        min_size: Minimum acceptable size in bytes
+
+    Returns:
+        Tuple of (is_valid, reason). Reason is empty when valid.
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     html = Path(tmp) / 'x.pdf'
+        ...     _ = html.write_bytes(b'<!DOCTYPE html><html>Login</html>')
+        ...     validate_pdf_file(html, min_size=10)
+        (False, 'HTML page, not PDF')
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     pdf = Path(tmp) / 'x.pdf'
+        ...     _ = pdf.write_bytes(b'%PDF-1.7\\n' + b'0' * 100)
+        ...     validate_pdf_file(pdf, min_size=10)
+        (True, '')
+    """
+    if not path.exists():
+        return False, "missing"
+
+    size = path.stat().st_size
+    with open(path, 'rb') as f:
+        header = f.read(PDF_HEADER_WINDOW)
+
+    if PDF_MAGIC not in header:
+        lowered = header.lower()
+        if b'<html' in lowered or b'<!doctype' in lowered:
+            return False, "HTML page, not PDF"
+        return False, "missing %PDF header"
+
+    if size < min_size:
+        return False, f"too small ({size} bytes)"
+
+    return True, ""
+
+
+def content_range_start(header: Optional[str]) -> Optional[int]:
+    """First byte offset of a 206 Content-Range header, None if unparseable.
+
+    Examples:
+        >>> content_range_start('bytes 5000-9999/10000')
+        5000
+        >>> content_range_start('bytes */10000') is None, content_range_start(None) is None
+        (True, True)
+    """
+    match = re.match(r'\s*bytes\s+(\d+)-\d+/', header or '')
+    return int(match.group(1)) if match else None
+
+
+def content_range_total(header: Optional[str]) -> Optional[int]:
+    """Complete length given by a Content-Range header, None if unknown.
+
+    Examples:
+        >>> content_range_total('bytes */10000'), content_range_total('bytes 0-9/*')
+        (10000, None)
+    """
+    match = re.match(r'\s*bytes\s+(?:\*|\d+-\d+)/(\d+)', header or '')
+    return int(match.group(1)) if match else None
+
+
+def range_validator(response: requests.Response) -> Optional[str]:
+    """Validator to send as If-Range when resuming this response's body.
+
+    A strong ETag is preferred; weak ETags are not allowed in If-Range, so
+    Last-Modified is used instead when the server sends no strong ETag.
+    """
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+class PDFDownloadEngine:
+    """Concurrent PDF downloader with per-host politeness.
+
+    Each worker thread keeps its own keep-alive session. A host may have at
+    most ``per_host_limit`` transfers in flight, and consecutive requests to
+    the same host start at least ``per_host_delay`` seconds apart. Requests
+    to different publishers do not wait on each other.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        per_host_delay: float = 1.0,
+        timeout: int = 30,
+        min_size: int = MIN_PDF_SIZE,
+        chunk_size: int = 65536
+    ):
+        """Initialize download engine.
+
+        Args:
+            max_workers: Size of the download thread pool
+            per_host_limit: Maximum concurrent transfers per host
+            per_host_delay: Minimum seconds between request starts per host
+            timeout: Request timeout in seconds
+            min_size: Minimum valid PDF size in bytes
+            chunk_size: Streaming chunk size in bytes
+        """
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.per_host_delay = per_host_delay
+        self.timeout = timeout
+        self.min_size = min_size
+        self.chunk_size = chunk_size
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_next_start: Dict[str, float] = defaultdict(float)
+
+    def _session(self) -> requests.Session:
+        """Get this thread's keep-alive session, creating it on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_maxsize=self.per_host_limit)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+        return session
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """Hold a per-host concurrency slot and honour the per-host delay.
+
+        Args:
+            url: URL being requested (its netloc is the politeness key)
+        """
+        host = urlparse(url).netloc.lower()
+
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+
+        with semaphore:
+            # Reserve the next start time under the lock so concurrent
+            # workers for the same host are spaced out rather than bunched
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._host_next_start[host])
+                self._host_next_start[host] = start_at + self.per_host_delay
+            wait = start_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    def download(self, url: str, output_path: Path) -> Tuple[bool, str]:
+        """Download a single URL to output_path, resuming any partial file.
+
+        The transfer goes to ``<output>.part``, with the URL and validator
+        (strong ETag or Last-Modified) of its bytes recorded beside it in
+        ``<output>.part.source.json``. A partial file is only resumed by the
+        same URL, with the validator sent as If-Range so a changed document
+        comes back whole, and a 206 is only appended when its Content-Range
+        starts where the partial file ends; otherwise the transfer restarts.
+        On success the partial file is validated and atomically renamed over
+        output_path. It is kept after network errors so the next run can
+        resume it, and removed when the server returned something that is
+        not a PDF.
+
+        Args:
+            url: URL to download from
+            output_path: Final path for the PDF
+
+        Returns:
+            Tuple of (success, message)
+        """
+        part_path = output_path.with_name(output_path.name + PARTIAL_SUFFIX)
+        source_path = part_path.with_name(part_path.name + PARTIAL_SOURCE_SUFFIX)
+
+        offset = 0
+        validator = None
+        if part_path.exists():
+            try:
+                source = json.loads(source_path.read_text())
+            except (OSError, ValueError):
+                source = {}
+            if source.get('url') == url and source.get('validator'):
+                offset = part_path.stat().st_size
+                validator = source['validator']
+            else:
+                # Written by another candidate URL, or not resumable
+                part_path.unlink()
+                source_path.unlink(missing_ok=True)
+
+        resumed_at = 0
+        try:
+            with self._host_slot(url):
+                while True:
+                    headers = {}
+                    if offset > 0:
+                        headers['Range'] = f"bytes={offset}-"
+                        headers['If-Range'] = validator
+                    response = self._session().get(
+                        url, headers=headers, timeout=self.timeout, stream=True
+                    )
+                    with response:
+                        content_range = response.headers.get('Content-Range')
+                        if offset > 0 and response.status_code == 416:
+                            # Range past the end: complete if the server's length is ours
+                            if content_range_total(content_range) == offset:
+                                resumed_at = offset
+                                break
+                        elif offset > 0 and response.status_code == 206:
+                            if content_range_start(content_range) == offset:
+                                with open(part_path, 'ab') as f:
+                                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                                        if chunk:
+                                            f.write(chunk)
+                                resumed_at = offset
+                                break
+                        else:
+                            response.raise_for_status()
+                            if response.status_code != 206:
+                                # A full body: record where it comes from, then start over
+                                source_path.write_text(json.dumps(
+                                    {'url': url, 'validator': range_validator(response)}
+                                ))
+                                with open(part_path, 'wb') as f:
+                                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                                        if chunk:
+                                            f.write(chunk)
+                                break
+
+                    # Unusable range response: drop the partial file, fetch it whole
+                    if offset == 0:
+                        return False, f"error downloading: unexpected {response.status_code} response"
+                    part_path.unlink(missing_ok=True)
+                    offset = 0
+
+        except requests.exceptions.RequestException as e:
+            return False, f"error downloading: {e}"
+
+        is_valid, reason = validate_pdf_file(part_path, self.min_size)
+        if not is_valid:
+            part_path.unlink(missing_ok=True)
+            source_path.unlink(missing_ok=True)
+            return False, f"rejected: {reason}"
+
+        os.replace(part_path, output_path)
+        source_path.unlink(missing_ok=True)
+        size_kb = output_path.stat().st_size / 1024
+        resumed = f", resumed at {resumed_at / 1024:.1f} KB" if resumed_at > 0 else ""
+        return True, f"downloaded ({size_kb:.1f} KB{resumed})"
+
+    def download_first(self, urls: List[str], output_path: Path) -> Tuple[bool, str]:
+        """Try candidate URLs in order until one yields a valid PDF.
+
+        Args:
+            urls: Candidate URLs (e.g. converted PMC URL, then fallbacks)
+            output_path: Final path for the PDF
+
+        Returns:
+            Tuple of (success, message for the last attempt)
+        """
+        message = "no candidate URLs"
+        for url in urls:
+            success, message = self.download(url, output_path)
+            if success:
+                return True, message
+        return False, message
+
+    def download_many(
+        self,
+        jobs: List[Tuple[List[str], Path]]
+    ) -> Dict[Path, Tuple[bool, str]]:
+        """Download many PDFs concurrently.
+
+        Args:
+            jobs: List of (candidate_urls, output_path)
+
+        Returns:
+            Dictionary mapping output_path to (success, message)
+        """
+        results: Dict[Path, Tuple[bool, str]] = {}
+        if not jobs:
+            return results
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.download_first, urls, output_path): output_path
+                for urls, output_path in jobs
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                output_path = futures[future]
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, f"unexpected error: {e}"
+                results[output_path] = (success, message)
+                mark = "✓" if success else "✗"
+                print(f"  [{done}/{len(jobs)}] {mark} {output_path.name}: {message}")
+
+        return results
+
+
 def download_pdf(url: str, output_path: Path, timeout: int = 30) -> bool:
     """Download PDF from URL.
 
@@ -83,56 +423,59 @@ def download_pdf(url: str, output_path: Path, timeout: int = 30) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-
-        response = requests.get(url, headers=headers, timeout=timeout, stream=True)
-        response.raise_for_status()
-
-        # Check if response is actually a PDF
-        content_type = response.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type and not url.endswith('.pdf'):
-            print(f"  ⚠️  Warning: Content type is '{content_type}', may not be PDF")
-
-        # Write to file
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-
-        # Verify file was created and has content
-        if output_path.exists() and output_path.stat().st_size > 0:
-            size_kb = output_path.stat().st_size / 1024
-            print(f"  ✓ Downloaded: {output_path.name} ({size_kb:.1f} KB)")
-            return True
-        else:
-            print(f"  ✗ Failed: File is empty")
-            if output_path.exists():
-                output_path.unlink()
-            return False
-
-    except requests.exceptions.RequestException as e:
-        print(f"  ✗ Error downloading: {e}")
-        return False
-    except Exception as e:
-        print(f"  ✗ Unexpected error: {e}")
-        return False
+    engine = PDFDownloadEngine(max_workers=1, per_host_delay=0.0, timeout=timeout)
+    success, message = engine.download(url, Path(output_path))
+    mark = "✓" if success else "✗"
+    print(f"  {mark} {Path(output_path).name}: {message}")
+    return success
+
+
+def candidate_urls(url: str) -> List[str]:
+    """Build the ordered list of URLs to try for a publication.
+
+    Args:
+        url: URL from the publications table
+
+    Returns:
+        Candidate download URLs, most likely first
+
+    Examples:
+        >>> candidate_urls("https://pmc.ncbi.nlm.nih.gov/articles/PMC9301485/")
+        ['https://www.ncbi.nlm.nih.gov/pmc/articles/PMC9301485/pdf/', 'https://pmc.ncbi.nlm.nih.gov/articles/PMC9301485/pdf/']
+        >>> candidate_urls("https://example.org/paper.pdf")
+        ['https://example.org/paper.pdf']
+    """
+    urls = []
+    pdf_url = convert_pmc_to_pdf_url(url)
+    if pdf_url:
+        urls.append(pdf_url)
+    else:
+        urls.append(url)
+
+    # Alternative: append /pdf to URL if it's PMC
+    if 'pmc.ncbi.nlm.nih.gov' in url and not url.endswith('/pdf/'):
+        urls.append(url.rstrip('/') + '/pdf/')
+
+    return urls
 
 
 def download_pdfs_from_publications(
     publications_file: str,
     output_dir: str = "data/publications",
     skip_existing: bool = True,
-    delay: float = 1.0
+    delay: float = 1.0,
+    max_workers: int = 8,
+    per_host_limit: int = 2
 ) -> None:
     """Download PDFs from publications table.
 
     Args:
         publications_file: Path to publications TSV file
         output_dir: Directory to save PDFs
-        skip_existing: Skip files that already exist
-        delay: Delay between downloads (seconds)
+        skip_existing: Skip files that already exist and pass PDF validation
+        delay: Minimum delay between downloads from the same host (seconds)
+        max_workers: Number of concurrent download threads
+        per_host_limit: Maximum concurrent downloads per host
     """
     publications_file = Path(publications_file)
     output_dir = Path(output_dir)
@@ -164,56 +507,49 @@ def download_pdfs_from_publications(
     print(f"Found {len(df)} publications")
     print(f"Output directory: {output_dir}")
     print(f"Skip existing: {skip_existing}")
+    print(f"Workers: {max_workers} (max {per_host_limit} per host, {delay}s per-host delay)")
     print()
 
-    downloaded = 0
     skipped = 0
-    failed = 0
-
-    for idx, row in df.iterrows():
-        url = row[url_col]
-        title = row.get(title_col, '') if title_col else ''
+    invalid_existing = 0
+    jobs: Dict[Path, List[str]] = {}
 
-        if not url or pd.isna(url) or url.strip() == '':
-            print(f"[{idx+1}/{len(df)}] Skipping: No URL")
+    titles = df[title_col] if title_col else pd.Series([''] * len(df), index=df.index)
+    for url, title in zip(df[url_col].str.strip(), titles):
+        if not url:
             skipped += 1
             continue
 
-        print(f"[{idx+1}/{len(df)}] Processing: {url}")
-
         # Generate filename
-        filename = sanitize_filename(url, title)
-        output_path = output_dir / f"{filename}.pdf"
+        output_path = output_dir / f"{sanitize_filename(url, title)}.pdf"
 
-        # Check if already exists
-        if skip_existing and output_path.exists():
-            size_kb = output_path.stat().st_size / 1024
-            print(f"  ⊙ Exists: {output_path.name} ({size_kb:.1f} KB)")
+        # Several rows can resolve to the same file; download it once
+        if output_path in jobs:
             skipped += 1
             continue
 
-        # Try to convert PMC URL to PDF
-        pdf_url = convert_pmc_to_pdf_url(url)
-        if pdf_url:
-            print(f"  → Converted to PDF URL: {pdf_url}")
-            url = pdf_url
-
-        # Download PDF
-        if download_pdf(url, output_path):
-            downloaded += 1
-        else:
-            failed += 1
-            # Try alternative: append /pdf to URL if it's PMC
-            if 'pmc.ncbi.nlm.nih.gov' in url and not url.endswith('/pdf/'):
-                alt_url = url.rstrip('/') + '/pdf/'
-                print(f"  → Trying alternative URL: {alt_url}")
-                if download_pdf(alt_url, output_path):
-                    downloaded += 1
-                    failed -= 1
-
-        # Rate limiting
-        if idx < len(df) - 1:
-            time.sleep(delay)
+        # Check if already exists (and is a real PDF, not a saved error page)
+        if skip_existing and output_path.exists():
+            is_valid, reason = validate_pdf_file(output_path)
+            if is_valid:
+                skipped += 1
+                continue
+            print(f"  ⚠️  Existing {output_path.name} is invalid ({reason}), re-downloading")
+            invalid_existing += 1
+
+        jobs[output_path] = candidate_urls(url)
+
+    print(f"Queued {len(jobs)} downloads ({skipped} skipped)")
+
+    engine = PDFDownloadEngine(
+        max_workers=max_workers,
+        per_host_limit=per_host_limit,
+        per_host_delay=delay
+    )
+    results = engine.download_many([(urls, path) for path, urls in jobs.items()])
+
+    downloaded = sum(1 for success, _ in results.values() if success)
+    failed = len(results) - downloaded
 
     print()
     print("=" * 60)
@@ -221,7 +557,8 @@ def download_pdfs_from_publications(
     print("=" * 60)
     print(f"Total publications: {len(df)}")
     print(f"  ✓ Downloaded: {downloaded}")
-    print(f"  ⊙ Skipped (existing): {skipped}")
+    print(f"  ⊙ Skipped (existing/no URL/duplicate): {skipped}")
+    print(f"  ⚠️  Replaced invalid existing files: {invalid_existing}")
     print(f"  ✗ Failed: {failed}")
     print()
 
@@ -232,6 +569,7 @@ def download_pdfs_from_publications(
         print("  - Broken or moved links")
         print("  - Network connectivity issues")
         print()
+        print("Interrupted transfers are kept as *.pdf.part and resumed on the next run.")
         print("You may need to manually download failed PDFs.")
 
 
@@ -261,7 +599,19 @@ def main():
         '--delay',
         type=float,
         default=1.0,
-        help='Delay between downloads in seconds (default: 1.0)'
+        help='Delay between downloads from the same host in seconds (default: 1.0)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of concurrent download threads (default: 8)'
+    )
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        default=2,
+        help='Maximum concurrent downloads per host (default: 2)'
     )
 
     args = parser.parse_args()
@@ -270,7 +620,9 @@ def main():
         publications_file=args.publications_file,
         output_dir=args.output_dir,
         skip_existing=not args.no_skip_existing,
-        delay=args.delay
+        delay=args.delay,
+        max_workers=args.workers,
+        per_host_limit=args.per_host
     )
 
 
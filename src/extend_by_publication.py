@@ -13,11 +13,50 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import pandas as pd
 
+try:
+    from src.markdown_corpus import MarkdownCorpus, publication_stem
+    from src.publication_index import PublicationIndex, keyword_in_text
+except ImportError:
+    from markdown_corpus import MarkdownCorpus, publication_stem
+    from publication_index import PublicationIndex, keyword_in_text
+
+
+# Bump when extract_keywords_from_row changes; older caches are discarded
+KEYWORD_CACHE_VERSION = 1
+
+KEYWORD_CACHE_SUFFIX = '.keywords.json'
+
+# Weight configuration for biological curator standards
+KEYWORD_WEIGHTS = {
+    'organisms': 2.0,      # High value: organism specificity is critical
+    'genes': 2.5,          # Highest value: gene/protein mentions are highly specific
+    'chemicals': 1.5,      # Medium-high: chemical names can be ambiguous
+    'pathways': 2.0,       # High value: pathway mentions indicate mechanistic relevance
+    'identifiers': 2.0,    # High value: ontology IDs are specific and unambiguous
+    'general': 0.5         # Low value: generic terms less specific
+}
+
+# Minimum keyword length and match mode per keyword type:
+# - organisms, genes, identifiers: word boundaries on both sides for specificity
+# - chemicals: word boundary at the start only (e.g., "eu3+" in "Eu3+ ion")
+# - pathways (longer phrases) and general terms: substring match
+KEYWORD_MATCHING = {
+    'organisms': (3, 'word'),
+    'genes': (3, 'word'),
+    'chemicals': (3, 'prefix'),
+    'pathways': (4, 'substring'),
+    'identifiers': (3, 'word'),
+    'general': (4, 'substring')
+}
+
 
 def extract_publication_id(url: str) -> Optional[str]:
     """
@@ -59,50 +98,54 @@ def extract_publication_id(url: str) -> Optional[str]:
     return None
 
 
-def get_markdown_path(pub_id: str, markdown_dir: Path) -> Optional[Path]:
+def get_markdown_path(
+    pub_id: str,
+    markdown_dir: Path,
+    corpus: Optional[MarkdownCorpus] = None
+) -> Optional[Path]:
     """
     Get the markdown file path for a publication ID.
 
     Args:
         pub_id: Publication identifier (DOI, PMC, PMID, etc.)
         markdown_dir: Directory containing markdown files
+        corpus: Updated corpus store of markdown_dir, for an indexed lookup
 
     Returns:
         Path to markdown file or None if not found
     """
+    if corpus is not None:
+        return corpus.path_for(pub_id)
+
     # Convert pub_id to expected filename
-    if pub_id.startswith('10.'):
-        # DOI: convert to doi_XX_XXXX format
-        filename = f"doi_{pub_id.replace('/', '-').replace('.', '_')}.md"
-    elif pub_id.startswith('PMC'):
-        filename = f"{pub_id}.md"
-    elif pub_id.startswith('PMID:'):
-        filename = f"{pub_id.replace(':', '_')}.md"
-    elif pub_id.startswith('arXiv:'):
-        # ArXiv files might be saved with title
-        # Search for any file containing the arxiv ID
-        arxiv_id = pub_id.replace('arXiv:', '')
-        for md_file in markdown_dir.glob('*.md'):
-            if arxiv_id.replace('.', '_') in md_file.stem:
-                return md_file
-        return None
-    else:
+    stem = publication_stem(pub_id)
+    if stem is None:
+        if pub_id.startswith('arXiv:'):
+            # ArXiv files might be saved with title
+            # Search for any file containing the arxiv ID
+            arxiv_id = pub_id.replace('arXiv:', '')
+            for md_file in markdown_dir.glob('*.md'):
+                if arxiv_id.replace('.', '_') in md_file.stem:
+                    return md_file
         return None
 
-    md_path = markdown_dir / filename
+    md_path = markdown_dir / f"{stem}.md"
     return md_path if md_path.exists() else None
 
 
-def read_markdown_content(md_path: Path) -> str:
+def read_markdown_content(md_path: Path, corpus: Optional[MarkdownCorpus] = None) -> str:
     """
     Read markdown file content.
 
     Args:
         md_path: Path to markdown file
+        corpus: Corpus store to read from instead of the file, if it holds it
 
     Returns:
         Markdown content as string
     """
+    if corpus is not None and md_path.name in corpus:
+        return corpus.text(md_path.name)
     try:
         with open(md_path, 'r', encoding='utf-8') as f:
             return f.read()
@@ -187,6 +230,104 @@ def extract_keywords_from_row(row: pd.Series, sheet_name: str) -> Dict[str, Set[
     return keywords
 
 
+def row_content_hash(row: pd.Series) -> str:
+    """
+    Hash a row's column names and string values.
+
+    Non-string values (NaN) hash alike, since keyword extraction ignores them.
+
+    Args:
+        row: Pandas Series representing a row
+
+    Returns:
+        Hex digest of the row content
+
+    Examples:
+        >>> nan_row = pd.Series({'gene': 'xoxF', 'source': float('nan')})
+        >>> row_content_hash(nan_row) == row_content_hash(pd.Series({'gene': 'xoxF', 'source': None}))
+        True
+        >>> row_content_hash(pd.Series({'gene': 'xoxF'})) == row_content_hash(pd.Series({'gene': 'mxaF'}))
+        False
+    """
+    content = [[str(col), value if isinstance(value, str) else None] for col, value in row.items()]
+    return hashlib.sha1(json.dumps(content).encode('utf-8')).hexdigest()
+
+
+class RowKeywordCache:
+    """
+    Keyword sets per row content hash, persisted next to a sheet.
+
+    Stored as <sheet>.keywords.json beside the TSV, so across publications
+    and across runs only new or changed rows are re-tokenized.
+    """
+
+    def __init__(self, sheet_path: Path):
+        """
+        Initialize cache and load the stored copy, if any.
+
+        Args:
+            sheet_path: Path to the TSV sheet
+        """
+        self.path = sheet_path.with_name(sheet_path.stem + KEYWORD_CACHE_SUFFIX)
+        self.signatures: Dict[str, Dict[str, Set[str]]] = {}
+        self.used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"  ⚠️  Ignoring unreadable keyword cache {self.path}: {e}")
+                data = {}
+            if data.get('format_version') == KEYWORD_CACHE_VERSION:
+                self.signatures = {
+                    row_hash: {keyword_type: set(values) for keyword_type, values in keywords.items()}
+                    for row_hash, keywords in data.get('rows', {}).items()
+                }
+
+    def get(self, row: pd.Series, sheet_name: str) -> Dict[str, Set[str]]:
+        """
+        Get a row's keywords, extracting them only if the row content is new.
+
+        Args:
+            row: Pandas Series representing a row
+            sheet_name: Name of the sheet
+
+        Returns:
+            Dictionary mapping keyword types to sets of keywords
+        """
+        row_hash = row_content_hash(row)
+        self.used.add(row_hash)
+        keywords = self.signatures.get(row_hash)
+        if keywords is None:
+            self.misses += 1
+            keywords = self.signatures[row_hash] = extract_keywords_from_row(row, sheet_name)
+        else:
+            self.hits += 1
+        return keywords
+
+    def save(self) -> None:
+        """Write the keywords of rows seen in this run atomically, if changed."""
+        if not self.used or (not self.misses and self.used == set(self.signatures)):
+            return
+        data = {
+            'format_version': KEYWORD_CACHE_VERSION,
+            'rows': {
+                row_hash: {keyword_type: sorted(values) for keyword_type, values in self.signatures[row_hash].items()}
+                for row_hash in sorted(self.used)
+            }
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"  ⚠️  Error writing keyword cache {self.path}: {e}")
+
+
 def is_publication_relevant(
     markdown_content: str,
     keywords: Dict[str, Set[str]],
@@ -214,84 +355,43 @@ def is_publication_relevant(
         Tuple of (is_relevant, score, match_details)
     """
     content_lower = markdown_content.lower()
+    return score_keywords(
+        keywords,
+        lambda keyword, mode: keyword_in_text(keyword, content_lower, mode),
+        min_score
+    )
 
-    score = 0.0
-    match_details = {
-        'organisms': 0,
-        'genes': 0,
-        'chemicals': 0,
-        'pathways': 0,
-        'identifiers': 0,
-        'general': 0
-    }
 
-    # Weight configuration for biological curator standards
-    weights = {
-        'organisms': 2.0,      # High value: organism specificity is critical
-        'genes': 2.5,          # Highest value: gene/protein mentions are highly specific
-        'chemicals': 1.5,      # Medium-high: chemical names can be ambiguous
-        'pathways': 2.0,       # High value: pathway mentions indicate mechanistic relevance
-        'identifiers': 2.0,    # High value: ontology IDs are specific and unambiguous
-        'general': 0.5         # Low value: generic terms less specific
-    }
+def score_keywords(
+    keywords: Dict[str, Set[str]],
+    matches: Callable[[str, str], bool],
+    min_score: float = 3.0
+) -> Tuple[bool, float, Dict[str, int]]:
+    """
+    Apply the weighted relevance scoring of is_publication_relevant.
 
-    # Check organisms with word boundaries for specificity
-    for organism in keywords.get('organisms', set()):
-        if len(organism) < 3:
-            continue
-        # Use word boundaries to avoid false matches
-        if re.search(r'\b' + re.escape(organism) + r'\b', content_lower):
-            score += weights['organisms']
-            match_details['organisms'] += 1
-
-    # Check gene names with word boundaries
-    for gene in keywords.get('genes', set()):
-        if len(gene) < 3:
-            continue
-        # Genes: require word boundary match for specificity
-        if re.search(r'\b' + re.escape(gene) + r'\b', content_lower):
-            score += weights['genes']
-            match_details['genes'] += 1
-
-    # Check chemical names with word boundaries
-    for chemical in keywords.get('chemicals', set()):
-        if len(chemical) < 3:
-            continue
-        # Allow partial match for chemical formulas (e.g., "eu3+" in "Eu3+ ion")
-        if re.search(r'\b' + re.escape(chemical), content_lower):
-            score += weights['chemicals']
-            match_details['chemicals'] += 1
-
-    # Check pathway names
-    for pathway in keywords.get('pathways', set()):
-        if len(pathway) < 4:
-            continue
-        # Pathway names can be longer phrases, use substring match
-        if pathway in content_lower:
-            score += weights['pathways']
-            match_details['pathways'] += 1
-
-    # Check ontology identifiers (exact match required)
-    for identifier in keywords.get('identifiers', set()):
-        if len(identifier) < 3:
-            continue
-        # IDs must match exactly with word boundaries
-        if re.search(r'\b' + re.escape(identifier) + r'\b', content_lower):
-            score += weights['identifiers']
-            match_details['identifiers'] += 1
-
-    # Check general keywords (lower weight)
-    for keyword in keywords.get('general', set()):
-        if len(keyword) < 4:
-            continue
-        # General terms: substring match is acceptable
-        if keyword in content_lower:
-            score += weights['general']
-            match_details['general'] += 1
+    Args:
+        keywords: Dictionary of keyword types to sets of keywords
+        matches: Callable (keyword, match mode) → whether the publication matches
+        min_score: Minimum weighted score required for relevance
+
+    Returns:
+        Tuple of (is_relevant, score, match_details)
+    """
+    score = 0.0
+    match_details = {keyword_type: 0 for keyword_type in KEYWORD_MATCHING}
+
+    for keyword_type, (min_length, mode) in KEYWORD_MATCHING.items():
+        for keyword in keywords.get(keyword_type, set()):
+            if len(keyword) < min_length:
+                continue
+            if matches(keyword, mode):
+                score += KEYWORD_WEIGHTS[keyword_type]
+                match_details[keyword_type] += 1
 
     # Biological curator standard: require meaningful score from specific entities
     # Don't rely solely on general keywords
-    specific_score = score - (match_details['general'] * weights['general'])
+    specific_score = score - (match_details['general'] * KEYWORD_WEIGHTS['general'])
 
     # Relevant if: total score meets threshold AND has at least some specific matches
     is_relevant = (score >= min_score) and (specific_score >= 1.0 or match_details['identifiers'] > 0)
@@ -331,17 +431,27 @@ def process_sheet(
     publications: pd.DataFrame,
     markdown_dir: Path,
     min_keyword_matches: int = 3,
-    dry_run: bool = False
+    dry_run: bool = False,
+    index: Optional[PublicationIndex] = None,
+    corpus: Optional[MarkdownCorpus] = None
 ) -> Dict[str, int]:
     """
     Process a single data sheet and update source columns.
 
+    Keywords are looked up per row content hash in the sheet's keyword
+    cache, so only new or changed rows (including rows whose source changes
+    here) are re-tokenized, and matched through the publication index, so
+    each distinct keyword is searched once per corpus rather than once per
+    row and paper.
+
     Args:
         sheet_path: Path to TSV sheet
         publications: DataFrame of publications
         markdown_dir: Directory containing markdown files
         min_keyword_matches: Minimum keyword matches for relevance
         dry_run: If True, don't write changes
+        index: Publication index (built from markdown_dir if not given)
+        corpus: Corpus store of markdown_dir (built if not given)
 
     Returns:
         Dictionary with statistics
@@ -369,6 +479,17 @@ def process_sheet(
         'publications_added': 0
     }
 
+    if corpus is None:
+        corpus = MarkdownCorpus(markdown_dir, read_only=dry_run)
+        corpus.update()
+        corpus.save()
+    if index is None:
+        index = PublicationIndex(markdown_dir, corpus=corpus)
+        index.update()
+
+    keyword_cache = RowKeywordCache(sheet_path)
+    row_keywords: Dict[object, Dict[str, Set[str]]] = {}
+
     # Process each publication
     for _, pub_row in publications.iterrows():
         # Case-insensitive column access
@@ -380,13 +501,11 @@ def process_sheet(
             continue
 
         # Get markdown file
-        md_path = get_markdown_path(pub_id, markdown_dir)
+        md_path = get_markdown_path(pub_id, markdown_dir, corpus)
         if not md_path:
             continue
 
-        # Read markdown content
-        markdown_content = read_markdown_content(md_path)
-        if not markdown_content or len(markdown_content) < 200:
+        if index.length(md_path.name) < 200:
             # Skip placeholder/empty files
             continue
 
@@ -396,8 +515,10 @@ def process_sheet(
         # Check each row in the sheet
         rows_matched = 0
         for idx, row in df.iterrows():
-            # Extract keywords from row
-            keywords = extract_keywords_from_row(row, sheet_name)
+            # Extract keywords from row (the source column can change below)
+            keywords = row_keywords.get(idx)
+            if keywords is None:
+                keywords = row_keywords[idx] = keyword_cache.get(row, sheet_name)
 
             # Check if we have any meaningful keywords
             total_keywords = sum(len(v) for v in keywords.values())
@@ -405,9 +526,9 @@ def process_sheet(
                 continue
 
             # Check relevance using curator standards
-            is_relevant, score, match_details = is_publication_relevant(
-                markdown_content,
+            is_relevant, score, match_details = score_keywords(
                 keywords,
+                lambda keyword, mode: md_path.name in index.find(keyword, mode),
                 min_score=min_keyword_matches
             )
 
@@ -418,6 +539,7 @@ def process_sheet(
 
                 if updated_source != current_source:
                     df.at[idx, 'source'] = updated_source
+                    row_keywords.pop(idx, None)
                     stats['updated'] += 1
                     stats['publications_added'] += 1
 
@@ -428,6 +550,10 @@ def process_sheet(
         if rows_matched > 0:
             print(f"  ✓ Matched {rows_matched} rows with curator standards")
 
+    if not dry_run:
+        keyword_cache.save()
+    print(f"\n  Keyword cache: {keyword_cache.hits} rows reused, {keyword_cache.misses} tokenized")
+
     # Write updated sheet
     if stats['updated'] > 0 and not dry_run:
         try:
@@ -525,6 +651,18 @@ def main():
                 continue
             sheet_paths.append(tsv_file)
 
+    # Load and index the markdown corpus once for all sheets
+    corpus = MarkdownCorpus(args.markdown_dir, read_only=args.dry_run)
+    stored, _ = corpus.update()
+    corpus.save()
+    print(f"Markdown corpus: {len(corpus)} documents ({stored} stored)")
+    index = PublicationIndex(args.markdown_dir, corpus=corpus)
+    indexed, removed = index.update()
+    if not args.dry_run:
+        index.save()
+    print(f"Publication index: {len(index.documents)} documents "
+          f"({indexed} re-indexed, {removed} removed)")
+
     # Process each sheet
     total_stats = {
         'rows': 0,
@@ -543,7 +681,9 @@ def main():
             publications,
             args.markdown_dir,
             min_keyword_matches=args.min_score,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            index=index,
+            corpus=corpus
         )
 
         total_stats['rows'] += stats['rows']
@@ -18,6 +18,11 @@ import pandas as pd
 
 from reaction_search import parse_ec_numbers, parse_rhea_id, get_rhea_url
 
+try:
+    from src.apis.kegg_client import KEGGClient
+except ImportError:
+    from apis.kegg_client import KEGGClient
+
 
 # Category-specific enrichment strategies
 CATEGORY_ENRICHMENT = {
@@ -57,6 +62,19 @@ CATEGORY_ENRICHMENT = {
 }
 
 
+# Genes table columns holding EC numbers, gene IDs and annotations
+# (the base and extended genes tables name them differently)
+EC_COLUMNS = ['EC', 'EC Number']
+GENE_ID_COLUMNS = ['Gene/Protein Identifier', 'gene or protein id']
+ANNOTATION_COLUMNS = ['Annotation', 'annotation']
+
+# Deepest EC level used for class matches (e.g. 3.8.1 for 3.8.1.6)
+EC_CLASS_LEVELS = 3
+# Shallowest EC class matched: a top-level class such as 3 (3.-.-.-, any
+# hydrolase) is too broad to link a reaction to genes
+EC_MIN_CLASS_LEVELS = 2
+
+
 def load_genes_table(genes_tsv: Path) -> pd.DataFrame:
     """Load genes and proteins table.
 
@@ -73,12 +91,121 @@ def load_genes_table(genes_tsv: Path) -> pd.DataFrame:
     return pd.read_csv(genes_tsv, sep='\t')
 
 
-def match_genes_by_ec(reaction_row: pd.Series, genes_df: pd.DataFrame) -> List[str]:
+def gene_id_column(genes_df: pd.DataFrame) -> pd.Series:
+    """Gene ID of each row: the first non-empty of GENE_ID_COLUMNS (NaN if none)."""
+    gene_ids = pd.Series(float('nan'), index=genes_df.index, dtype=object)
+    for column in reversed(GENE_ID_COLUMNS):
+        if column in genes_df.columns:
+            gene_ids = genes_df[column].where(genes_df[column].notna(), gene_ids)
+    return gene_ids
+
+
+def ec_class(ec: str, levels: int = EC_CLASS_LEVELS) -> str:
+    """EC class of an EC number: its first specific levels, up to levels deep.
+
+    Classes shallower than EC_MIN_CLASS_LEVELS (such as '3' for 3.-.-.-)
+    are returned too, but ECIndex does not match genes on them.
+
+    Examples:
+        >>> ec_class('3.8.1.6')
+        '3.8.1'
+        >>> ec_class('3.8.1.-')
+        '3.8.1'
+        >>> ec_class('1.21.-.-')
+        '1.21'
+        >>> ec_class('3.-.-.-')
+        '3'
+    """
+    specific = []
+    for part in ec.split('.')[:levels]:
+        if not part.strip().isdigit():
+            break
+        specific.append(part.strip())
+    return '.'.join(specific)
+
+
+class ECIndex:
+    """Gene IDs of a genes table by EC number and by EC class, built once.
+
+    A lookup returns the genes annotated with the EC number itself or, if
+    there are none, the genes in its class (3.8.1.* for 3.8.1.6 or 3.8.1.-;
+    1.21.*.* for 1.21.-.-). Classes are at least EC_MIN_CLASS_LEVELS deep,
+    so 3.-.-.- matches only genes annotated 3.-.-.- itself, not every
+    hydrolase. Genes come back in table order.
+
+    Examples:
+        >>> genes = pd.DataFrame({
+        ...     'gene or protein id': ['dhaA', 'rdhA', 'fdeA'],
+        ...     'EC': ['3.8.1.5', '1.21.99.5', '3.8.1.2'],
+        ... })
+        >>> index = ECIndex(genes)
+        >>> index.genes_for(['EC:3.8.1.5']), index.genes_for(['EC:3.8.1.-']), index.genes_for(['EC:1.21.-.-'])
+        (['dhaA'], ['dhaA', 'fdeA'], ['rdhA'])
+        >>> index.genes_for(['EC:3.-.-.-'])
+        []
+    """
+
+    def __init__(self, genes_df: pd.DataFrame):
+        """Index the EC columns of a genes table.
+
+        Args:
+            genes_df: Genes dataframe
+        """
+        # EC number / EC class → gene IDs, in table order
+        self.exact: Dict[str, List[str]] = {}
+        self.classes: Dict[str, List[str]] = {}
+        if genes_df.empty:
+            return
+
+        gene_ids = gene_id_column(genes_df)
+        ec_columns = [genes_df[column].astype(str) for column in EC_COLUMNS if column in genes_df.columns]
+        for gene_id, *ecs in zip(gene_ids, *ec_columns):
+            if pd.isna(gene_id):
+                continue
+            gene_id = str(gene_id)
+            for ec in dict.fromkeys(ecs):
+                self._add(self.exact, ec, gene_id)
+                parts = ec_class(ec).split('.')
+                for level in range(EC_MIN_CLASS_LEVELS, len(parts) + 1):
+                    self._add(self.classes, '.'.join(parts[:level]), gene_id)
+
+    @staticmethod
+    def _add(index: Dict[str, List[str]], key: str, gene_id: str) -> None:
+        """Add a gene ID under a key, once."""
+        gene_ids = index.setdefault(key, [])
+        if gene_id not in gene_ids[-1:]:
+            gene_ids.append(gene_id)
+
+    def genes_for(self, ec_numbers: List[str]) -> List[str]:
+        """Gene IDs matching any of a reaction's EC numbers, without repeats.
+
+        Args:
+            ec_numbers: EC numbers, with or without the 'EC:' prefix
+
+        Returns:
+            Matching gene IDs, by EC number and then table order
+        """
+        matching_genes = {}
+        for ec in ec_numbers:
+            ec_clean = ec.replace('EC:', '')
+            matches = self.exact.get(ec_clean)
+            if not matches:
+                matches = self.classes.get(ec_class(ec_clean), [])
+            matching_genes.update(dict.fromkeys(matches))
+        return list(matching_genes)
+
+
+def match_genes_by_ec(
+    reaction_row: pd.Series,
+    genes_df: pd.DataFrame,
+    ec_index: Optional[ECIndex] = None
+) -> List[str]:
     """Match genes to reaction based on EC numbers.
 
     Args:
         reaction_row: Reaction data row
         genes_df: Genes dataframe
+        ec_index: Index of genes_df (built here if not given)
 
     Returns:
         List of matching gene IDs
@@ -93,34 +220,9 @@ def match_genes_by_ec(reaction_row: pd.Series, genes_df: pd.DataFrame) -> List[s
     if not ec_numbers:
         return []
 
-    # Match against genes table
-    matching_genes = []
-    for ec in ec_numbers:
-        ec_clean = ec.replace('EC:', '')
-
-        # Try exact match first
-        exact_matches = genes_df[
-            (genes_df['EC'].astype(str) == ec_clean) |
-            (genes_df['EC Number'].astype(str) == ec_clean)
-        ]
-
-        # If no exact match, try EC class match (e.g., 3.8.1.* matches 3.8.1.6)
-        if exact_matches.empty:
-            # Extract EC class (first 3 numbers)
-            ec_parts = ec_clean.split('.')
-            if len(ec_parts) >= 3:
-                ec_class = '.'.join(ec_parts[:3])
-                exact_matches = genes_df[
-                    (genes_df['EC'].astype(str).str.startswith(ec_class, na=False)) |
-                    (genes_df['EC Number'].astype(str).str.startswith(ec_class, na=False))
-                ]
-
-        for _, gene in exact_matches.iterrows():
-            gene_id = gene.get('Gene/Protein Identifier') or gene.get('gene or protein id')
-            if pd.notna(gene_id) and gene_id not in matching_genes:
-                matching_genes.append(str(gene_id))
-
-    return matching_genes
+    if ec_index is None:
+        ec_index = ECIndex(genes_df)
+    return ec_index.genes_for(ec_numbers)
 
 
 def match_genes_by_annotation(category: str, genes_df: pd.DataFrame) -> Dict[str, List[str]]:
@@ -142,31 +244,54 @@ def match_genes_by_annotation(category: str, genes_df: pd.DataFrame) -> Dict[str
     if not target_genes:
         return {}
 
+    # Annotation text and gene ID of each gene, prepared once for all targets
+    annotations = [
+        genes_df[column].astype(str).str.lower()
+        for column in ANNOTATION_COLUMNS if column in genes_df.columns
+    ]
+    gene_ids = gene_id_column(genes_df)
+    has_id = gene_ids.notna()
+
     gene_mapping = {}
     for target in target_genes:
-        # Search in annotation columns
-        matches = genes_df[
-            (genes_df['Annotation'].astype(str).str.contains(target, case=False, na=False)) |
-            (genes_df['annotation'].astype(str).str.contains(target, case=False, na=False))
-        ]
-
-        gene_ids = []
-        for _, gene in matches.iterrows():
-            gene_id = gene.get('Gene/Protein Identifier') or gene.get('gene or protein id')
-            if pd.notna(gene_id):
-                gene_ids.append(str(gene_id))
+        matches = pd.Series(False, index=genes_df.index)
+        for annotation in annotations:
+            matches |= annotation.str.contains(target.lower(), regex=False)
 
-        if gene_ids:
-            gene_mapping[target] = gene_ids
+        gene_ids_matched = gene_ids[matches & has_id].astype(str).tolist()
+        if gene_ids_matched:
+            gene_mapping[target] = gene_ids_matched
 
     return gene_mapping
 
 
+def add_kegg_pathways(df: pd.DataFrame, kegg_client: KEGGClient) -> pd.DataFrame:
+    """Add a kegg_pathways column by joining EC numbers to KEGG pathways.
+
+    Uses the locally cached KEGG `link/pathway/enzyme` table, so this is a
+    local join rather than one request per reaction.
+
+    Args:
+        df: Reaction dataframe with an ec_number column (semicolon-separated)
+        kegg_client: KEGG client providing the cached link table
+
+    Returns:
+        DataFrame with kegg_pathways column
+    """
+    df['kegg_pathways'] = df['ec_number'].apply(
+        lambda ecs: ';'.join(sorted(kegg_client.pathways_for_ec(ecs.split(';')))) if ecs else ''
+    )
+    linked_count = (df['kegg_pathways'] != '').sum()
+    print(f"  Linked {linked_count} reactions to KEGG pathways via EC numbers")
+    return df
+
+
 def enrich_category_sheet(
     input_tsv: Path,
     output_tsv: Path,
     genes_tsv: Path,
-    category: str
+    category: str,
+    kegg_client: Optional[KEGGClient] = None
 ) -> None:
     """Enrich a category-specific reaction sheet.
 
@@ -175,6 +300,7 @@ def enrich_category_sheet(
         output_tsv: Output enriched TSV file
         genes_tsv: Path to genes table
         category: Reaction category name
+        kegg_client: If given, add KEGG pathways linked to each reaction's EC numbers
     """
     print(f"\nEnriching {category} reactions...")
     print(f"Input: {input_tsv}")
@@ -207,13 +333,19 @@ def enrich_category_sheet(
     # Generate URLs
     df['url'] = df['rhea_id'].apply(lambda x: get_rhea_url(x) if pd.notna(x) else '')
 
+    if kegg_client is not None:
+        df = add_kegg_pathways(df, kegg_client)
+
     # Category-specific enrichment
     if category in ['dehalogenase', 'hydrocarbon_degradation', 'oxygenase_cometabolism']:
-        # Link reactions to genes via EC numbers
-        df['linked_genes'] = df.apply(
-            lambda row: ';'.join(match_genes_by_ec(row, genes_df)),
-            axis=1
-        )
+        # Link reactions to genes via EC numbers, looked up in an index of
+        # the genes table (each distinct EC list resolved once)
+        ec_index = ECIndex(genes_df)
+        linked = {
+            ecs: ';'.join(ec_index.genes_for(ecs.split(';'))) if ecs else ''
+            for ecs in df['ec_number'].unique()
+        }
+        df['linked_genes'] = df['ec_number'].map(linked)
         linked_count = (df['linked_genes'] != '').sum()
         print(f"  Linked {linked_count} reactions to genes via EC numbers")
 
@@ -272,6 +404,11 @@ def main():
         default=Path('data/txt/sheet/PFAS_Data_for_AI_genes_and_proteins_extended.tsv'),
         help='Path to genes table'
     )
+    parser.add_argument(
+        '--kegg-pathways',
+        action='store_true',
+        help='Add KEGG pathways linked via EC numbers (uses cached KEGG tables)'
+    )
 
     args = parser.parse_args()
 
@@ -287,7 +424,8 @@ def main():
         input_tsv,
         output_tsv,
         args.genes_table,
-        args.category
+        args.category,
+        kegg_client=KEGGClient() if args.kegg_pathways else None
     )
 
     return 0
@@ -6,12 +6,30 @@ from scientific publications and populate the experimental data tables.
 
 import argparse
 import json
+import os
 import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
+try:
+    from src.extraction_ledger import DEFAULT_LEDGER_NAME, ExtractionLedger
+    from src.markdown_corpus import MarkdownCorpus
+    from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
+except ImportError:
+    from extraction_ledger import DEFAULT_LEDGER_NAME, ExtractionLedger
+    from markdown_corpus import MarkdownCorpus
+    from sheet_store import DEFAULT_STORE_NAME, SheetStore
+
+
+# Bump when the extraction rules change, so the next batch run retracts and
+# re-extracts the records of every document
+EXTRACTOR_VERSION = 2
+
 
 class DocumentExtractor:
     """Extract experimental data from markdown-converted PDF text."""
@@ -55,6 +73,98 @@ class DocumentExtractor:
         'IAM': (3, 5),   # IAM 1529
     }
 
+    # PFAS-relevant gene symbol groups searched by extract_genes, in reporting
+    # order (case-sensitive: bacterial genes are lowercase, e.g. rdh, deh, crc)
+    GENE_GROUPS = [
+        ('dehalogenase', ('rdhA', 'rdhB', 'rdhC')),  # Reductive dehalogenases
+        ('dehalogenase', ('dehH', 'dehI', 'dehA', 'dehB')),  # Haloacid dehalogenases
+        ('dehalogenase', ('dhaA',)),  # Haloalkane dehalogenase
+        ('dehalogenase', ('pceA', 'tceA')),  # Chloroethene reductive dehalogenases
+        ('fluoride_resistance', ('crcA', 'crcB')),  # Fluoride exporters
+        ('fluoride_resistance', ('fexA', 'fexB')),  # Fluoride export proteins
+        ('oxygenase', ('alkB', 'alkM', 'alkG')),  # Alkane monooxygenases
+        ('oxygenase', ('nahAc', 'nahAd')),  # Naphthalene dioxygenase
+        ('oxygenase', ('catA', 'catB')),  # Catechol dioxygenases
+    ]
+
+    # Keywords that mark an organism mention as biological (matched against
+    # lowercased text, so the uppercase collection names never match)
+    BIO_CONTEXT_KEYWORDS = (
+        'strain', 'isolate', 'culture', 'species', 'bacterium',
+        'bacteria', 'microorganism', 'organism', 'genus', 'grown',
+        'cultivated', 'inoculated', 'incubated', 'ATCC', 'DSM', 'JCM'
+    )
+
+    # Characters on either side of an organism mention searched for keywords
+    BIO_CONTEXT_WINDOW = 100
+
+    # Patterns are compiled once per process and shared by all extractors
+    PFAS_ION_RE = re.compile(
+        r'\b(La|Ce|Pr|Nd|Pm|Sm|Eu|Gd|Tb|Dy|Ho|Er|Tm|Yb|Lu)(?:³⁺|3\+|\(III\))\b', re.IGNORECASE
+    )
+    LANTHANOPHORE_RE = re.compile(r'\b([A-Z][a-z]*lanthanin|[A-Za-z]*(?:sidero)?phore)\b', re.IGNORECASE)
+    METHYLO_RE = re.compile(r'\bMethylobacterium\s+(\w+)')
+    # Min 3 chars each to avoid "In et", "The global"
+    BINOMIAL_RE = re.compile(r'\b([A-Z][a-z]{2,}\s+[a-z]{3,})\b')
+    # Only known genera, to avoid false positives
+    SP_STRAIN_RE = re.compile(rf'\b({"|".join(KNOWN_GENERA)})\s+sp\.?\s+([A-Z0-9\-]{{1,10}})\b')
+    LATIN_RE = re.compile(r'^[A-Za-z]+$')
+    STRAIN_ID_RE = re.compile(r'^([A-Z]+)\s+(\d+)$')
+
+    # Literal vocabularies share one case-sensitive scan: gene symbols and
+    # culture collection IDs (digit counts are checked per collection)
+    VOCABULARY_RE = re.compile(
+        r'\b(?:(?P<gene>' + '|'.join(s for _, symbols in GENE_GROUPS for s in symbols) + r')'
+        r'|(?P<strain>(?P<collection>' + '|'.join(sorted(CULTURE_COLLECTIONS, key=len, reverse=True)) +
+        r')\s+(?P<digits>\d+)))\b'
+    )
+    # Genera and context keywords share one scan over the lowercased text.
+    # The lookahead reports overlapping hits (e.g. "organism" inside
+    # "microorganism"); shortest keywords come first so a hit is as small
+    # as possible for the window containment check.
+    CONTEXT_RE = re.compile(
+        '(?=(?:(?P<genus>' + '|'.join(g.lower() for g in KNOWN_GENERA) + ')'
+        '|(?P<keyword>' + '|'.join(sorted(BIO_CONTEXT_KEYWORDS, key=len)) + ')))'
+    )
+
+    ASSAY_PATTERNS = {
+        'TRL': re.compile(r'\b(?:time-resolved|TR)\s*luminescence\b', re.IGNORECASE),
+        'ICP-OES': re.compile(r'\bICP-OES\b|\binductively coupled plasma[- ]optical emission\b', re.IGNORECASE),
+        'ICP-MS': re.compile(r'\bICP-MS\b|\binductively coupled plasma[- ]mass spectr\w+', re.IGNORECASE),
+        'FACS': re.compile(r'\bFACS\b|\bflow cytometry\b|\bflow cytometric sorting\b', re.IGNORECASE),
+        'fluorescence': re.compile(r'\bfluorescence spectroscopy\b|\bfluorometric\b', re.IGNORECASE),
+        'UV-Vis': re.compile(r'\bUV[- ]?Vis\b|\bultraviolet[- ]?visible spectroscopy\b', re.IGNORECASE),
+        'XRF': re.compile(r'\bXRF\b|\bX-ray fluorescence\b', re.IGNORECASE),
+    }
+    DETECTION_LIMIT_RE = re.compile(
+        r'(?:detection limit|LOD|limit of detection)[:\s]*(?:of\s*)?(\d+\.?\d*\s*(?:nM|μM|ppm|ppb|ng/mL|μg/L))',
+        re.IGNORECASE
+    )
+
+    PROCESS_PATTERNS = {
+        'bioleaching': re.compile(r'\bbioleaching\b', re.IGNORECASE),
+        'biomineralization': re.compile(r'\bbiomineralization\b|\bbioprecipitation\b', re.IGNORECASE),
+        'biosorption': re.compile(r'\bbiosorption\b|\badsorption\b', re.IGNORECASE),
+        'bioaccumulation': re.compile(r'\bbioaccumulation\b|\buptake\b', re.IGNORECASE),
+    }
+    PH_RE = re.compile(r'\bpH\s*[:\s]*(\d+\.?\d*)', re.IGNORECASE)
+    TEMPERATURE_RE = re.compile(r'(\d+)\s*°?C\b')
+    REE_CONCENTRATION_RE = re.compile(r'(\d+\.?\d*\s*(?:μM|mM|ppm|mg/L))\s*(?:Eu|Tb|La|Ce|Nd|PFAS|REE)', re.IGNORECASE)
+
+    # Tables written by pdf_to_markdown --tables, header row first
+    TABLE_BLOCK_RE = re.compile(r'^```tsv\n(.*?)\n```$', re.MULTILINE | re.DOTALL)
+    # Table column headers and the condition they hold (first match wins).
+    # Headers must name the condition: a bare unit (°C) or a bare "rate"
+    # (flow rate, growth rate) is not enough.
+    TABLE_COLUMNS = {
+        'pH': re.compile(r'^pH\b', re.IGNORECASE),
+        'temperature': re.compile(r'\btemp(?:erature)?\b', re.IGNORECASE),
+        'detection_limit': re.compile(r'\bLOD\b|\bdetection limit\b|\blimit of detection\b', re.IGNORECASE),
+        'ree_concentration': re.compile(r'\bconc(?:entration)?\b', re.IGNORECASE),
+        'degradation_rate': re.compile(r'\b(?:degradation|defluorination|removal)\b', re.IGNORECASE),
+    }
+    TABLE_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
     def __init__(self, markdown_text: str, source_file: str, source_label: str = "extend2"):
         """Initialize extractor with markdown text.
 
@@ -76,6 +186,94 @@ class DocumentExtractor:
             'genes': [],
             'strains': []
         }
+        self._context_cache: Dict[str, bool] = {}
+
+    @cached_property
+    def _lower_text(self) -> str:
+        """Lowercased document text, computed once."""
+        return self.markdown_text.lower()
+
+    @cached_property
+    def _vocabulary_hits(self) -> List[re.Match]:
+        """Gene symbol and culture collection matches, in document order."""
+        return list(self.VOCABULARY_RE.finditer(self.markdown_text))
+
+    @cached_property
+    def _context_index(self) -> Optional[Tuple[Dict[str, List[int]], List[int], List[int]]]:
+        """Position index of genera and context keywords in the lowercased text.
+
+        Returns:
+            (genus → start offsets, keyword starts, keyword ends), or None if
+            lowercasing changed the text length (offsets would not line up
+            with the original text)
+        """
+        if len(self._lower_text) != len(self.markdown_text):
+            return None
+        genus_positions: Dict[str, List[int]] = {}
+        keyword_starts: List[int] = []
+        keyword_ends: List[int] = []
+        for match in self.CONTEXT_RE.finditer(self._lower_text):
+            if match.group('genus'):
+                genus_positions.setdefault(match.group('genus'), []).append(match.start())
+            else:
+                keyword_starts.append(match.start())
+                keyword_ends.append(match.start() + len(match.group('keyword')))
+        return genus_positions, keyword_starts, keyword_ends
+
+    @cached_property
+    def _tables(self) -> List[Tuple[List[str], List[List[str]]]]:
+        """Tables embedded as TSV blocks, as (header, rows)."""
+        tables = []
+        for match in self.TABLE_BLOCK_RE.finditer(self.markdown_text):
+            lines = [line.split('\t') for line in match.group(1).split('\n')]
+            tables.append((lines[0], lines[1:]))
+        return tables
+
+    @cached_property
+    def _table_columns(self) -> List[Tuple[Dict[str, int], List[List[str]]]]:
+        """Tables with a recognized condition column, as (condition → column, rows)."""
+        tables = []
+        for header, rows in self._tables:
+            columns: Dict[str, int] = {}
+            for column, name in enumerate(header):
+                condition = next(
+                    (key for key, pattern in self.TABLE_COLUMNS.items() if pattern.search(name)), None
+                )
+                if condition is not None and condition not in columns:
+                    columns[condition] = column
+            if columns:
+                tables.append((columns, rows))
+        return tables
+
+    def _table_value(self, condition: str, subject: re.Pattern) -> Optional[str]:
+        """Table cell for a condition, from the first row naming the subject.
+
+        Only a row with another cell matching the subject (the assay,
+        process or organism being extracted) is used, so a value reported
+        for something else in the same table is never picked up.
+
+        Args:
+            condition: Condition key of TABLE_COLUMNS
+            subject: Pattern the row must match outside the condition column
+
+        Returns:
+            The non-empty cell, or None
+        """
+        for columns, rows in self._table_columns:
+            column = columns.get(condition)
+            if column is None:
+                continue
+            for row in rows:
+                if column >= len(row) or not row[column]:
+                    continue
+                if any(subject.search(cell) for i, cell in enumerate(row) if i != column):
+                    return row[column]
+        return None
+
+    def _table_number(self, condition: str, subject: re.Pattern) -> Optional[float]:
+        """First number in the table cell for a condition and subject, if any."""
+        match = self.TABLE_NUMBER_RE.search(self._table_value(condition, subject) or '')
+        return float(match.group(0)) if match else None
 
     def _is_valid_binomial(self, name: str) -> bool:
         """Validate binomial nomenclature format.
@@ -103,7 +301,7 @@ class DocumentExtractor:
             return False
 
         # Check Latin characters only (no numbers or special chars)
-        if not re.match(r'^[A-Za-z]+$', genus + species):
+        if not self.LATIN_RE.match(genus + species):
             return False
 
         return True
@@ -111,33 +309,72 @@ class DocumentExtractor:
     def _appears_in_biological_context(self, organism: str) -> bool:
         """Check if organism appears in biological context.
 
+        Requires at least two (case-insensitive) mentions, one of which has a
+        context keyword within BIO_CONTEXT_WINDOW characters. Mentions and
+        keywords are looked up in the position index, so each check costs
+        O(mentions of the genus) rather than a scan of the document.
+
         Args:
             organism: Organism name to check
 
         Returns:
             True if appears in biological context
         """
-        # Find all occurrences
-        occurrences = [m.start() for m in re.finditer(
-            re.escape(organism), self.markdown_text, re.IGNORECASE)]
+        cached = self._context_cache.get(organism)
+        if cached is None:
+            cached = self._context_cache[organism] = self._check_biological_context(organism)
+        return cached
+
+    def _check_biological_context(self, organism: str) -> bool:
+        """Uncached implementation of _appears_in_biological_context."""
+        index = self._context_index
+        genus = organism.split()[0] if organism.strip() else ''
+        if index is None or genus not in self.KNOWN_GENERA:
+            return self._scan_biological_context(organism)
+
+        genus_positions, keyword_starts, keyword_ends = index
+        needle = organism.lower()
+        genus = genus.lower()
+
+        # Every mention starts with a mention of its genus; keep the
+        # non-overlapping ones, as re.finditer would
+        occurrences = []
+        next_free = 0
+        for pos in genus_positions.get(genus, []):
+            if pos >= next_free and self._lower_text.startswith(needle, pos):
+                occurrences.append(pos)
+                next_free = pos + len(needle)
 
         if len(occurrences) < 2:
             # Single mention likely false positive
             return False
 
-        # Check context around each occurrence
-        bio_keywords = {
-            'strain', 'isolate', 'culture', 'species', 'bacterium',
-            'bacteria', 'microorganism', 'organism', 'genus', 'grown',
-            'cultivated', 'inoculated', 'incubated', 'ATCC', 'DSM', 'JCM'
-        }
+        text_length = len(self.markdown_text)
+        for pos in occurrences:
+            start = max(0, pos - self.BIO_CONTEXT_WINDOW)
+            end = min(text_length, pos + self.BIO_CONTEXT_WINDOW)
+            i = bisect_left(keyword_starts, start)
+            while i < len(keyword_starts) and keyword_starts[i] < end:
+                if keyword_ends[i] <= end:
+                    return True
+                i += 1
+
+        return False
+
+    def _scan_biological_context(self, organism: str) -> bool:
+        """Context check by scanning the text (used when the index cannot be)."""
+        occurrences = [m.start() for m in re.finditer(
+            re.escape(organism), self.markdown_text, re.IGNORECASE)]
+
+        if len(occurrences) < 2:
+            return False
 
         for pos in occurrences:
-            start = max(0, pos - 100)
-            end = min(len(self.markdown_text), pos + 100)
+            start = max(0, pos - self.BIO_CONTEXT_WINDOW)
+            end = min(len(self.markdown_text), pos + self.BIO_CONTEXT_WINDOW)
             context = self.markdown_text[start:end].lower()
 
-            if any(kw in context for kw in bio_keywords):
+            if any(kw in context for kw in self.BIO_CONTEXT_KEYWORDS):
                 return True
 
         return False
@@ -151,14 +388,12 @@ class DocumentExtractor:
         Returns:
             True if valid strain ID format
         """
-        # Check against known culture collections
-        for collection, (min_digits, max_digits) in self.CULTURE_COLLECTIONS.items():
-            # Case-sensitive match for collection prefix
-            pattern = rf'^{collection}\s+(\d{{{min_digits},{max_digits}}})$'
-            if re.match(pattern, strain_id):
-                return True
-
-        return False
+        # Check against known culture collections (case-sensitive prefix)
+        match = self.STRAIN_ID_RE.match(strain_id)
+        if not match or match.group(1) not in self.CULTURE_COLLECTIONS:
+            return False
+        min_digits, max_digits = self.CULTURE_COLLECTIONS[match.group(1)]
+        return min_digits <= len(match.group(2)) <= max_digits
 
     def extract_all(self) -> Dict[str, List[Dict]]:
         """Extract data for all sheet types.
@@ -184,9 +419,8 @@ class DocumentExtractor:
         """
         chemicals = []
 
-        # Pattern for PFAS ions (Eu³⁺, Tb³⁺, etc.)
-        PFAS_pattern = r'\b(La|Ce|Pr|Nd|Pm|Sm|Eu|Gd|Tb|Dy|Ho|Er|Tm|Yb|Lu)(?:³⁺|3\+|\(III\))\b'
-        PFASs_found = set(re.findall(PFAS_pattern, self.markdown_text, re.IGNORECASE))
+        # PFAS ions (Eu³⁺, Tb³⁺, etc.)
+        PFASs_found = set(self.PFAS_ION_RE.findall(self.markdown_text))
 
         for element in PFASs_found:
             chemicals.append({
@@ -204,9 +438,8 @@ class DocumentExtractor:
                 'source': self.source_label
             })
 
-        # Pattern for lanthanophores and siderophores (case-insensitive)
-        lanthanophore_pattern = r'\b([A-Z][a-z]*lanthanin|[A-Za-z]*(?:sidero)?phore)\b'
-        lanthanophores_raw = re.findall(lanthanophore_pattern, self.markdown_text, re.IGNORECASE)
+        # Lanthanophores and siderophores (case-insensitive)
+        lanthanophores_raw = self.LANTHANOPHORE_RE.findall(self.markdown_text)
         # Capitalize first letter for consistency
         lanthanophores = set(name.capitalize() for name in lanthanophores_raw
                             if 'lanthan' in name.lower() or 'siderophore' in name.lower())
@@ -228,11 +461,10 @@ class DocumentExtractor:
             })
 
         # Look for Methylobacterium species (relevant for lanthanophore production)
-        methylo_pattern = r'\bMethylobacterium\s+(\w+)'
-        methylo_matches = re.findall(methylo_pattern, self.markdown_text)
-        if methylo_matches and 'siderophore' in self.markdown_text.lower():
+        methylo_match = self.METHYLO_RE.search(self.markdown_text)
+        if methylo_match and 'siderophore' in self._lower_text:
             # If Methylobacterium mentioned with siderophore, add generic siderophore entry
-            species = methylo_matches[0]
+            species = methylo_match.group(1)
             chemicals.append({
                 'chemical_id': f"Custom_Siderophore_Methylobacterium_{species}_from_{self.source_file}",
                 'chemical_name': f"Siderophore from Methylobacterium {species}",
@@ -258,36 +490,27 @@ class DocumentExtractor:
     def extract_assays(self) -> List[Dict]:
         """Extract assay methods from PDF.
 
+        The detection limit is taken from the text around the assay mention;
+        only if none is found there, from a table row naming the assay.
+
         Returns:
             List of assay dictionaries
         """
         assays = []
 
-        # Common assay method patterns
-        assay_patterns = {
-            'TRL': r'\b(?:time-resolved|TR)\s*luminescence\b',
-            'ICP-OES': r'\bICP-OES\b|\binductively coupled plasma[- ]optical emission\b',
-            'ICP-MS': r'\bICP-MS\b|\binductively coupled plasma[- ]mass spectr\w+',
-            'FACS': r'\bFACS\b|\bflow cytometry\b|\bflow cytometric sorting\b',
-            'fluorescence': r'\bfluorescence spectroscopy\b|\bfluorometric\b',
-            'UV-Vis': r'\bUV[- ]?Vis\b|\bultraviolet[- ]?visible spectroscopy\b',
-            'XRF': r'\bXRF\b|\bX-ray fluorescence\b'
-        }
-
-        for assay_type, pattern in assay_patterns.items():
-            matches = re.finditer(pattern, self.markdown_text, re.IGNORECASE)
-            for match in matches:
+        for assay_type, pattern in self.ASSAY_PATTERNS.items():
+            for match in pattern.finditer(self.markdown_text):
                 # Extract context around match (200 chars)
                 start = max(0, match.start() - 100)
                 end = min(len(self.markdown_text), match.end() + 100)
                 context = self.markdown_text[start:end]
 
                 # Try to extract detection limit
-                detection_limit = None
-                limit_pattern = r'(?:detection limit|LOD|limit of detection)[:\s]*(?:of\s*)?(\d+\.?\d*\s*(?:nM|μM|ppm|ppb|ng/mL|μg/L))'
-                limit_match = re.search(limit_pattern, context, re.IGNORECASE)
+                limit_match = self.DETECTION_LIMIT_RE.search(context)
                 if limit_match:
                     detection_limit = limit_match.group(1)
+                else:
+                    detection_limit = self._table_value('detection_limit', pattern)
 
                 assays.append({
                     'assay_id': f"Custom_{assay_type}_from_{self.source_file}",
@@ -312,22 +535,17 @@ class DocumentExtractor:
     def extract_bioprocesses(self) -> List[Dict]:
         """Extract bioprocess conditions from PDF.
 
+        Conditions are taken from the text around the process mention. A
+        table row naming the process fills in only the ones the text does not
+        give (pH, temperature, concentration), plus the degradation rate.
+
         Returns:
             List of bioprocess dictionaries
         """
         bioprocesses = []
 
-        # Bioprocess type patterns
-        process_patterns = {
-            'bioleaching': r'\bbioleaching\b',
-            'biomineralization': r'\bbiomineralization\b|\bbioprecipitation\b',
-            'biosorption': r'\bbiosorption\b|\badsorption\b',
-            'bioaccumulation': r'\bbioaccumulation\b|\buptake\b'
-        }
-
-        for process_type, pattern in process_patterns.items():
-            matches = re.finditer(pattern, self.markdown_text, re.IGNORECASE)
-            for match in matches:
+        for process_type, pattern in self.PROCESS_PATTERNS.items():
+            for match in pattern.finditer(self.markdown_text):
                 # Extract context (500 chars)
                 start = max(0, match.start() - 250)
                 end = min(len(self.markdown_text), match.end() + 250)
@@ -339,25 +557,30 @@ class DocumentExtractor:
                 organism = None
 
                 # Try to extract pH
-                pH = None
-                pH_pattern = r'\bpH\s*[:\s]*(\d+\.?\d*)'
-                pH_match = re.search(pH_pattern, context, re.IGNORECASE)
+                pH_match = self.PH_RE.search(context)
                 if pH_match:
                     pH = float(pH_match.group(1))
+                else:
+                    pH = self._table_number('pH', pattern)
 
                 # Try to extract temperature
-                temperature = None
-                temp_pattern = r'(\d+)\s*°?C\b'
-                temp_match = re.search(temp_pattern, context)
+                temp_match = self.TEMPERATURE_RE.search(context)
                 if temp_match:
                     temperature = float(temp_match.group(1))
+                else:
+                    temperature = self._table_number('temperature', pattern)
 
                 # Try to extract REE concentration
-                ree_conc = None
-                conc_pattern = r'(\d+\.?\d*\s*(?:μM|mM|ppm|mg/L))\s*(?:Eu|Tb|La|Ce|Nd|PFAS|REE)'
-                conc_match = re.search(conc_pattern, context, re.IGNORECASE)
+                conc_match = self.REE_CONCENTRATION_RE.search(context)
                 if conc_match:
                     ree_conc = conc_match.group(1)
+                else:
+                    ree_conc = self._table_value('ree_concentration', pattern)
+
+                parameters = {'source': f'Extracted from {self.source_file}'}
+                degradation_rate = self._table_value('degradation_rate', pattern)
+                if degradation_rate:
+                    parameters['degradation_rate'] = degradation_rate
 
                 bioprocesses.append({
                     'process_id': f"Custom_{process_type}_from_{self.source_file}",
@@ -371,7 +594,7 @@ class DocumentExtractor:
                     'pH': pH,
                     'temperature': temperature,
                     'competing_ions': None,
-                    'process_parameters': json.dumps({'source': f'Extracted from {self.source_file}'}),
+                    'process_parameters': json.dumps(parameters),
                     'optimization_history': None,
                     'Download URL': None,
                     'source': self.source_label
@@ -392,17 +615,8 @@ class DocumentExtractor:
         organisms = []
         seen_organisms = set()
 
-        # Pattern 1: Genus species (binomial nomenclature)
-        # Min 3 chars each to avoid "In et", "The global"
-        binomial_pattern = r'\b([A-Z][a-z]{2,}\s+[a-z]{3,})\b'
-
-        # Pattern 2: Genus sp. STRAIN (e.g., "Pseudomonas sp. 273")
-        # Only match known genera to avoid false positives
-        genus_list = '|'.join(self.KNOWN_GENERA)
-        sp_pattern = rf'\b({genus_list})\s+sp\.?\s+([A-Z0-9\-]{{1,10}})\b'
-
-        # Extract binomial names
-        binomial_matches = re.findall(binomial_pattern, self.markdown_text)
+        # Extract binomial names (Genus species)
+        binomial_matches = self.BINOMIAL_RE.findall(self.markdown_text)
         for organism_name in binomial_matches:
             organism_name = organism_name.strip()
 
@@ -426,7 +640,7 @@ class DocumentExtractor:
                 })
 
         # Extract sp. designations (e.g., "Pseudomonas sp. 273")
-        sp_matches = re.findall(sp_pattern, self.markdown_text)
+        sp_matches = self.SP_STRAIN_RE.findall(self.markdown_text)
         for genus, strain in sp_matches:
             organism_name = f"{genus} sp. {strain}"
 
@@ -457,57 +671,37 @@ class DocumentExtractor:
         genes = []
         seen_genes = set()
 
-        # PFAS-relevant gene patterns (case-sensitive for gene symbols)
-        # Bacterial genes typically: lowercase italics (rdh, deh, crc, alk)
-        # Proteins typically: Capital first letter (RdhA, DehA, CrcB)
-        gene_patterns = {
-            # Dehalogenase genes (specific symbols only)
-            'dehalogenase': [
-                r'\b(rdhA|rdhB|rdhC)\b',  # Reductive dehalogenases
-                r'\b(dehH|dehI|dehA|dehB)\b',  # Haloacid dehalogenases
-                r'\b(dhaA)\b',  # Haloalkane dehalogenase
-                r'\b(pceA|tceA)\b',  # Chloroethene reductive dehalogenases
-            ],
-            # Fluoride resistance (specific symbols)
-            'fluoride_resistance': [
-                r'\b(crcA|crcB)\b',  # Fluoride exporters
-                r'\b(fexA|fexB)\b',  # Fluoride export proteins
-            ],
-            # Oxygenases (specific known genes)
-            'oxygenase': [
-                r'\b(alkB|alkM|alkG)\b',  # Alkane monooxygenases
-                r'\b(nahAc|nahAd)\b',  # Naphthalene dioxygenase
-                r'\b(catA|catB)\b',  # Catechol dioxygenases
-            ],
-        }
+        # Validation: the document must discuss genes/proteins at all
+        bio_context = any(kw in self._lower_text
+                          for kw in ['gene', 'protein', 'enzyme', 'encodes', 'catalyzes'])
+        if not bio_context:
+            self.extracted_data['genes'] = genes
+            return genes
 
-        # Flatten patterns and extract
-        for gene_type, patterns in gene_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, self.markdown_text)
-                for gene_name in matches:
-                    gene_name = gene_name.strip()
-
-                    # Validation: gene must appear in biological context
-                    if gene_name and gene_name not in seen_genes:
-                        # Check if appears near biological keywords
-                        bio_context = any(kw in self.markdown_text.lower()
-                                        for kw in ['gene', 'protein', 'enzyme', 'encodes', 'catalyzes'])
-
-                        if bio_context:
-                            seen_genes.add(gene_name)
-                            genes.append({
-                                'gene_or_protein_id': gene_name,
-                                'gene_name': gene_name,
-                                'annotation': f"{gene_type} gene",
-                                'organism': None,
-                                'ec_number': None,
-                                'go_terms': None,
-                                'chebi_terms': None,
-                                'sequence_download_url': None,
-                                'source': self.source_label,
-                                'paper_reference': self.source_file
-                            })
+        # Report genes group by group, each group in document order
+        group_of = {
+            symbol: i for i, (_, symbols) in enumerate(self.GENE_GROUPS) for symbol in symbols
+        }
+        hits = sorted(
+            (group_of[m.group('gene')], m.start(), m.group('gene'))
+            for m in self._vocabulary_hits if m.group('gene')
+        )
+
+        for group_index, _, gene_name in hits:
+            if gene_name not in seen_genes:
+                seen_genes.add(gene_name)
+                genes.append({
+                    'gene_or_protein_id': gene_name,
+                    'gene_name': gene_name,
+                    'annotation': f"{self.GENE_GROUPS[group_index][0]} gene",
+                    'organism': None,
+                    'ec_number': None,
+                    'go_terms': None,
+                    'chebi_terms': None,
+                    'sequence_download_url': None,
+                    'source': self.source_label,
+                    'paper_reference': self.source_file
+                })
 
         self.extracted_data['genes'] = genes
         return genes
@@ -524,40 +718,42 @@ class DocumentExtractor:
         strains = []
         seen_strains = set()
 
-        # Build specific patterns for each culture collection
-        for collection, (min_digits, max_digits) in self.CULTURE_COLLECTIONS.items():
-            # Case-sensitive pattern (ATCC, not Atcc or atcc)
-            pattern = rf'\b({collection}\s+\d{{{min_digits},{max_digits}}})\b'
-
-            matches = re.findall(pattern, self.markdown_text)
-            for strain_id in matches:
-                strain_id = strain_id.strip()
-
-                if strain_id not in seen_strains and self._is_valid_strain_id(strain_id):
-                    seen_strains.add(strain_id)
-                    strains.append({
-                        'strain_id': strain_id,
-                        'strain_designation': strain_id,
-                        'organism': None,
-                        'culture_collection_id': strain_id,
-                        'isolation_source': None,
-                        'source': self.source_label,
-                        'paper_reference': self.source_file
-                    })
+        # Report strains collection by collection, each in document order
+        collection_order = {name: i for i, name in enumerate(self.CULTURE_COLLECTIONS)}
+        hits = sorted(
+            (collection_order[m.group('collection')], m.start(), m.group('strain'))
+            for m in self._vocabulary_hits if m.group('strain')
+        )
+
+        for _, _, strain_id in hits:
+            if strain_id not in seen_strains and self._is_valid_strain_id(strain_id):
+                seen_strains.add(strain_id)
+                strains.append({
+                    'strain_id': strain_id,
+                    'strain_designation': strain_id,
+                    'organism': None,
+                    'culture_collection_id': strain_id,
+                    'isolation_source': None,
+                    'source': self.source_label,
+                    'paper_reference': self.source_file
+                })
 
         self.extracted_data['strains'] = strains
         return strains
 
 
-def read_markdown_file(md_path: Path) -> str:
+def read_markdown_file(md_path: Path, corpus: Optional[MarkdownCorpus] = None) -> str:
     """Read markdown file content.
 
     Args:
         md_path: Path to markdown file
+        corpus: Corpus store to read from instead of the file, if it holds it
 
     Returns:
         Markdown text content
     """
+    if corpus is not None and md_path.name in corpus:
+        return corpus.text(md_path.name)
     try:
         return md_path.read_text(encoding='utf-8')
     except Exception as e:
@@ -591,144 +787,265 @@ def extract_doi(markdown_text: str, filename: str) -> str:
     return filename
 
 
-def append_to_tsv(data: List[Dict], tsv_path: Path, sheet_type: str):
+# ID column used to deduplicate each sheet type
+ID_COLUMNS = {
+    'chemicals': 'chemical_id',
+    'assays': 'assay_id',
+    'bioprocesses': 'process_id',
+    'screening_results': 'experiment_id',
+    'protocols': 'protocol_id',
+    'organisms': 'scientific_name',
+    'genes': 'gene_or_protein_id',
+    'strains': 'strain_id'
+}
+
+# Sheet types whose file name differs from the sheet type
+SHEET_FILENAMES = {
+    'organisms': 'taxa_and_genomes',
+    'genes': 'genes_and_proteins',
+}
+
+
+def append_to_tsv(
+    data: List[Dict],
+    tsv_path: Path,
+    sheet_type: str,
+    retract: Optional[Set[Tuple[str, str]]] = None,
+    store: Optional[SheetStore] = None
+):
     """Append extracted data to TSV file, removing duplicates.
 
+    The existing file is read once, rows listed in retract are dropped,
+    records whose ID is already present (in the file or earlier in data) are
+    dropped, and the result is written to a temporary file that atomically
+    replaces the original. With a working store, the retracted rows are
+    deleted from and the new records appended to the store's copy of the
+    sheet instead, and the TSV is left for the store's export.
+
     Args:
         data: List of extracted records
         tsv_path: Path to TSV file
         sheet_type: Type of sheet (for ID column name)
+        retract: (record ID, source) pairs of rows to remove first
+        store: Working store holding the sheet (default: rewrite the TSV)
     """
-    if not data:
+    if not data and not retract:
         return
 
-    # Determine ID column name
-    id_columns = {
-        'chemicals': 'chemical_id',
-        'assays': 'assay_id',
-        'bioprocesses': 'process_id',
-        'screening_results': 'experiment_id',
-        'protocols': 'protocol_id',
-        'organisms': 'scientific_name',
-        'genes': 'gene_or_protein_id',
-        'strains': 'strain_id'
-    }
-    id_col = id_columns.get(sheet_type)
+    id_col = ID_COLUMNS.get(sheet_type)
 
-    # Load existing data with string dtype to preserve integer formats
-    # (pandas converts int columns to float when there are NaN values)
-    if tsv_path.exists():
+    retracted = 0
+    if store is not None:
+        if retract:
+            retracted = store.delete(tsv_path, pd.DataFrame(sorted(retract), columns=[id_col, 'source']))
+        seen_ids = store.values(tsv_path, id_col)
+    elif tsv_path.exists():
+        # Load existing data with string dtype to preserve integer formats
+        # (pandas converts int columns to float when there are NaN values)
         existing_df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False)
+        if retract and id_col in existing_df.columns and 'source' in existing_df.columns:
+            keep = [
+                (record_id, source) not in retract
+                for record_id, source in zip(existing_df[id_col], existing_df['source'])
+            ]
+            retracted = len(keep) - sum(keep)
+            existing_df = existing_df[keep].reset_index(drop=True)
         existing_df = existing_df.replace('', pd.NA)
-        existing_ids = set(existing_df[id_col].dropna()) if id_col in existing_df.columns else set()
+        seen_ids = set(existing_df[id_col].dropna()) if id_col in existing_df.columns else set()
     else:
         existing_df = pd.DataFrame()
-        existing_ids = set()
+        seen_ids = set()
 
     # Filter out duplicates
-    new_data = [d for d in data if d.get(id_col) not in existing_ids]
-
-    if new_data:
+    new_data = []
+    for record in data:
+        record_id = record.get(id_col)
+        if record_id not in seen_ids:
+            seen_ids.add(record_id)
+            new_data.append(record)
+
+    if new_data or retracted:
         new_df = pd.DataFrame(new_data)
-        combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-        # Replace pd.NA with empty string for TSV format
-        combined_df = combined_df.fillna('')
-        combined_df.to_csv(tsv_path, sep='\t', index=False)
+        if store is not None:
+            store.append(tsv_path, new_df)
+        else:
+            combined_df = pd.concat([existing_df, new_df], ignore_index=True) if not existing_df.empty else new_df
+            # Replace pd.NA with empty string for TSV format
+            combined_df = combined_df.fillna('')
+            tmp_path = tsv_path.with_name(tsv_path.name + '.tmp')
+            combined_df.to_csv(tmp_path, sep='\t', index=False)
+            os.replace(tmp_path, tsv_path)
+        if retracted:
+            print(f"  Retracted {retracted} previously extracted records from {sheet_type}")
         print(f"  Added {len(new_data)} new records to {sheet_type}")
     else:
         print(f"  No new records to add to {sheet_type} (all duplicates)")
 
 
-def batch_extract_from_directory(pdf_dir: Path, output_dir: Path, summary_only: bool = False, source_label: str = "extend2"):
+def extract_markdown_file(
+    md_file: Path,
+    source_label: str = "extend2",
+    corpus: Optional[MarkdownCorpus] = None
+) -> Optional[Tuple[str, Dict[str, List[Dict]]]]:
+    """Extract all sheet types from one markdown file (runs in worker processes).
+
+    Args:
+        md_file: Markdown file
+        source_label: Source label; "extend2" means use the paper's DOI
+        corpus: Corpus store holding the file (mapped lazily in each worker)
+
+    Returns:
+        (source, extracted data by sheet type), or None if the file is empty
+    """
+    markdown_text = read_markdown_file(md_file, corpus)
+    if not markdown_text:
+        return None
+
+    # Extract DOI to use as source identifier (or use source_label if not provided)
+    if source_label == "extend2":
+        doi = extract_doi(markdown_text, md_file.stem)
+    else:
+        doi = source_label
+
+    extractor = DocumentExtractor(markdown_text, md_file.stem, doi)
+    return doi, extractor.extract_all()
+
+
+def batch_extract_from_directory(
+    pdf_dir: Path,
+    output_dir: Path,
+    summary_only: bool = False,
+    source_label: str = "extend2",
+    workers: Optional[int] = None,
+    force: bool = False,
+    store: Optional[SheetStore] = None
+):
     """Extract data from all markdown files (converted from PDFs) in directory.
 
+    Files are read from the directory's memory-mapped corpus store and
+    extracted in a process pool. Records are collected per sheet and each
+    output TSV is written once at the end.
+
+    An extraction ledger next to the output TSVs (see extraction_ledger)
+    makes reruns incremental: unchanged files are skipped, and the records
+    of changed or deleted files are retracted before the changed files are
+    extracted again. With summary_only every file is extracted, and the
+    ledger and the corpus store are left alone (the corpus is read-only).
+
     Args:
         pdf_dir: Directory containing markdown files
         output_dir: Directory for output TSV files
         summary_only: If True, only print summary without modifying files
         source_label: Source label for tracking (default: "extend2")
+        workers: Worker processes (defaults to the CPU count)
+        force: Retract and re-extract every file, even if unchanged
+        store: Working store to write the sheets to (default: rewrite the TSVs)
     """
     # Look for markdown files (converted from PDFs)
-    md_files = list(pdf_dir.glob("*.md"))
+    corpus = MarkdownCorpus(pdf_dir, read_only=summary_only)
+    corpus.update()
+    corpus.save()
+    names = corpus.names()
 
-    if not md_files:
+    if not names:
         print(f"No markdown files found in {pdf_dir}")
         print(f"Please run PDF to markdown conversion first:")
         print(f"  uv run python src/pdf_to_markdown.py --batch {pdf_dir}")
         return
 
+    retract: Dict[str, Set[Tuple[str, str]]] = {}
+    if summary_only:
+        ledger = None
+        todo = names
+    else:
+        ledger = ExtractionLedger(output_dir / DEFAULT_LEDGER_NAME, EXTRACTOR_VERSION)
+        hashes = {name: ledger.content_hash(corpus, name) for name in names}
+        changed = [
+            name for name in names
+            if force or not ledger.is_current(name, hashes[name], source_label)
+        ]
+        removed = [name for name in ledger.documents if name not in corpus]
+        stale = changed + removed
+        retract = ledger.retractions(stale)
+        # Unchanged files that also emitted a retracted record provide it again
+        todo = sorted(set(changed) | set(ledger.claimants(retract, exclude=stale)))
+        for name in removed:
+            ledger.remove(name)
+
+        if len(todo) < len(names):
+            print(f"Skipping {len(names) - len(todo)} markdown files unchanged since the last run")
+        if removed:
+            print(f"Retracting records of {len(removed)} deleted markdown files")
+
+    md_files = [pdf_dir / name for name in todo]
     print(f"Found {len(md_files)} markdown files to process:")
     for md in md_files:
         print(f"  - {md.name}")
     print("")
 
-    total_extracted = {
-        'chemicals': 0,
-        'assays': 0,
-        'bioprocesses': 0,
-        'screening_results': 0,
-        'protocols': 0,
-        'organisms': 0,
-        'genes': 0,
-        'strains': 0
-    }
-
-    for md_file in md_files:
-        print(f"Processing: {md_file.name}")
-        print("-" * 60)
-
-        # Read markdown file
-        markdown_text = read_markdown_file(md_file)
-
-        if not markdown_text:
-            print(f"  Skipping {md_file.name} (empty or error reading file)")
-            print()
-            continue
-
-        # Extract DOI to use as source identifier (or use source_label if not provided)
-        if source_label == "extend2":
-            # Auto-extract DOI from markdown
-            doi = extract_doi(markdown_text, md_file.stem)
-            print(f"  Source: {doi}")
-        else:
-            # Use provided source label
-            doi = source_label
-
-        # Extract data with DOI as source
-        extractor = DocumentExtractor(markdown_text, md_file.stem, doi)
-        extracted = extractor.extract_all()
-
-        # Print summary
-        print(f"Extracted from {md_file.name}:")
-        print(f"  - {len(extracted['chemicals'])} chemicals")
-        print(f"  - {len(extracted['assays'])} assays")
-        print(f"  - {len(extracted['bioprocesses'])} bioprocesses")
-        print(f"  - {len(extracted['screening_results'])} screening results")
-        print(f"  - {len(extracted['protocols'])} protocols")
-        print(f"  - {len(extracted['organisms'])} organisms")
-        print(f"  - {len(extracted['genes'])} genes")
-        print(f"  - {len(extracted['strains'])} strains")
+    total_extracted = {sheet_type: 0 for sheet_type in ID_COLUMNS}
+    records_by_sheet: Dict[str, List[Dict]] = {sheet_type: [] for sheet_type in ID_COLUMNS}
+
+    if md_files:
+        workers = min(workers or os.cpu_count() or 1, len(md_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                extract_markdown_file, md_files, [source_label] * len(md_files), [corpus] * len(md_files),
+                chunksize=4
+            )
+
+            # Results arrive in file order, so output order does not depend on workers
+            for md_file, result in zip(md_files, results):
+                print(f"Processing: {md_file.name}")
+                print("-" * 60)
+
+                if result is None:
+                    print(f"  Skipping {md_file.name} (empty or error reading file)")
+                    print()
+                    if ledger is not None:
+                        ledger.record(md_file.name, corpus, hashes[md_file.name], source_label, '', {})
+                    continue
+
+                doi, extracted = result
+                if source_label == "extend2":
+                    print(f"  Source: {doi}")
+
+                # Print summary
+                print(f"Extracted from {md_file.name}:")
+                print(f"  - {len(extracted['chemicals'])} chemicals")
+                print(f"  - {len(extracted['assays'])} assays")
+                print(f"  - {len(extracted['bioprocesses'])} bioprocesses")
+                print(f"  - {len(extracted['screening_results'])} screening results")
+                print(f"  - {len(extracted['protocols'])} protocols")
+                print(f"  - {len(extracted['organisms'])} organisms")
+                print(f"  - {len(extracted['genes'])} genes")
+                print(f"  - {len(extracted['strains'])} strains")
+                print("")
+
+                # Update totals
+                for key in total_extracted:
+                    total_extracted[key] += len(extracted[key])
+                    records_by_sheet[key].extend(extracted[key])
+
+                if ledger is not None:
+                    emitted = {}
+                    for key, id_col in ID_COLUMNS.items():
+                        ids = sorted({str(record[id_col]) for record in extracted[key] if record.get(id_col)})
+                        if ids:
+                            emitted[key] = ids
+                    ledger.record(md_file.name, corpus, hashes[md_file.name], source_label, doi, emitted)
+
+    # Write each TSV file once (if not summary only)
+    if not summary_only:
+        for sheet_type, records in records_by_sheet.items():
+            if records or retract.get(sheet_type):
+                filename = SHEET_FILENAMES.get(sheet_type, sheet_type)
+                tsv_path = output_dir / f"PFAS_Data_for_AI_{filename}_extended.tsv"
+                append_to_tsv(records, tsv_path, sheet_type, retract.get(sheet_type), store=store)
+        # Only after the sheets are written, so an interrupted run is redone
+        ledger.save()
         print("")
 
-        # Update totals
-        for key in total_extracted:
-            total_extracted[key] += len(extracted[key])
-
-        # Append to TSV files (if not summary only)
-        if not summary_only:
-            # Map sheet types to actual file names
-            filename_mapping = {
-                'organisms': 'taxa_and_genomes',
-                'genes': 'genes_and_proteins',
-                # All others use their sheet_type name directly
-            }
-
-            for sheet_type, records in extracted.items():
-                if records:
-                    filename = filename_mapping.get(sheet_type, sheet_type)
-                    tsv_path = output_dir / f"PFAS_Data_for_AI_{filename}_extended.tsv"
-                    append_to_tsv(records, tsv_path, sheet_type)
-
     print("=" * 60)
     print("EXTRACTION SUMMARY")
     print("=" * 60)
@@ -766,11 +1083,37 @@ def main():
         action='store_true',
         help='Print summary without modifying files'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for extraction (default: CPU count)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Retract and re-extract all markdown files, even if unchanged since the last run'
+    )
+    parser.add_argument(
+        '--store',
+        action='store_true',
+        help=f'Write through the DuckDB working store (<output-dir>/{DEFAULT_STORE_NAME}) '
+             'instead of rewriting the TSVs; export it with src/sheet_store.py'
+    )
 
     args = parser.parse_args()
 
-    # Extract from all PDFs
-    batch_extract_from_directory(args.pdf_dir, args.output_dir, args.summary_only)
+    store = SheetStore(args.output_dir / DEFAULT_STORE_NAME) if args.store and not args.summary_only else None
+
+    try:
+        # Extract from all PDFs
+        batch_extract_from_directory(
+            args.pdf_dir, args.output_dir, args.summary_only, workers=args.workers, force=args.force,
+            store=store
+        )
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+"""Ledger of the records extracted from each markdown document.
+
+batch_extract_from_directory records, per markdown file, the content hash,
+the extractor version and source label it was processed with, and the IDs of
+the records it emitted for each sheet. On the next run:
+- documents whose hash, extractor version and label are unchanged are skipped
+- changed or deleted documents have their previous records retracted from
+  the sheets (rows with the emitted ID and the document's source), and
+  changed documents are extracted again
+- unchanged documents that emitted a retracted ID are extracted again too,
+  so a record another document also provides is restored from that document
+
+The ledger is stored as JSON next to the output sheets.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+try:
+    from src.markdown_corpus import MarkdownCorpus
+except ImportError:
+    from markdown_corpus import MarkdownCorpus
+
+
+LEDGER_FORMAT_VERSION = 1
+
+DEFAULT_LEDGER_NAME = "extraction_ledger.json"
+
+
+class ExtractionLedger:
+    """Document → emitted record IDs, keyed by content hash and extractor version."""
+
+    def __init__(self, path: Path, extractor_version: int):
+        """Initialize ledger and load the stored copy, if any.
+
+        Args:
+            path: Ledger file
+            extractor_version: Version of the extraction rules in use
+        """
+        self.path = Path(path)
+        self.extractor_version = extractor_version
+        # name → {'sha256', 'size', 'mtime_ns', 'extractor_version',
+        #         'source_label', 'source', 'records': {sheet_type: [ids]}}
+        self.documents: Dict[str, Dict] = {}
+        self._dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"  ⚠️  Ignoring unreadable extraction ledger {self.path}: {e}")
+                data = {}
+            if data.get('format_version') == LEDGER_FORMAT_VERSION:
+                self.documents = data.get('documents', {})
+
+    def save(self) -> None:
+        """Write the ledger atomically if it changed."""
+        if not self._dirty:
+            return
+        data = {'format_version': LEDGER_FORMAT_VERSION, 'documents': self.documents}
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def content_hash(self, corpus: MarkdownCorpus, name: str) -> str:
+        """SHA-256 of a stored document, reusing the ledger's hash if size and mtime match."""
+        stored = corpus.documents[name]
+        entry = self.documents.get(name)
+        if entry and entry['size'] == stored['size'] and entry['mtime_ns'] == stored['mtime_ns']:
+            return entry['sha256']
+        with corpus.view(name) as view:
+            return hashlib.sha256(view).hexdigest()
+
+    def is_current(self, name: str, sha256: str, source_label: str) -> bool:
+        """Whether a document was already extracted from this content with these rules."""
+        entry = self.documents.get(name)
+        return bool(
+            entry
+            and entry['sha256'] == sha256
+            and entry['extractor_version'] == self.extractor_version
+            and entry['source_label'] == source_label
+        )
+
+    def retractions(self, names: Iterable[str]) -> Dict[str, Set[Tuple[str, str]]]:
+        """(record ID, source) pairs previously emitted by documents, per sheet type."""
+        retract: Dict[str, Set[Tuple[str, str]]] = {}
+        for name in names:
+            entry = self.documents.get(name)
+            if not entry:
+                continue
+            for sheet_type, ids in entry['records'].items():
+                retract.setdefault(sheet_type, set()).update((record_id, entry['source']) for record_id in ids)
+        return retract
+
+    def claimants(self, retract: Dict[str, Set[Tuple[str, str]]], exclude: Iterable[str]) -> List[str]:
+        """Other documents that emitted any of the retracted record IDs."""
+        retracted_ids = {
+            sheet_type: {record_id for record_id, _ in pairs} for sheet_type, pairs in retract.items()
+        }
+        excluded = set(exclude)
+        return sorted(
+            name for name, entry in self.documents.items()
+            if name not in excluded and any(
+                retracted_ids.get(sheet_type, set()).intersection(ids)
+                for sheet_type, ids in entry['records'].items()
+            )
+        )
+
+    def record(
+        self,
+        name: str,
+        corpus: MarkdownCorpus,
+        sha256: str,
+        source_label: str,
+        source: str,
+        records: Dict[str, List[str]]
+    ) -> None:
+        """Store what a document emitted in this run."""
+        stored = corpus.documents[name]
+        self.documents[name] = {
+            'sha256': sha256,
+            'size': stored['size'],
+            'mtime_ns': stored['mtime_ns'],
+            'extractor_version': self.extractor_version,
+            'source_label': source_label,
+            'source': source,
+            'records': records,
+        }
+        self._dirty = True
+
+    def remove(self, name: str) -> None:
+        """Forget a deleted document."""
+        if self.documents.pop(name, None) is not None:
+            self._dirty = True
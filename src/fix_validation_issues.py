@@ -12,8 +12,29 @@ Categories of fixes:
 import argparse
 import pandas as pd
 from pathlib import Path
+from typing import Optional
 import re
 
+try:
+    from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
+except ImportError:
+    from sheet_store import DEFAULT_STORE_NAME, SheetStore
+
+
+def load_table(input_file: str, store: Optional[SheetStore] = None) -> pd.DataFrame:
+    """Read a table from its TSV file, or from the working store."""
+    if store is not None:
+        return store.read(Path(input_file))
+    return pd.read_csv(input_file, sep='\t')
+
+
+def save_table(df: pd.DataFrame, output_file: str, store: Optional[SheetStore] = None) -> None:
+    """Write a table to its TSV file, or its changed rows to the working store."""
+    if store is not None:
+        store.write(Path(output_file), df)
+    else:
+        df.to_csv(output_file, sep='\t', index=False)
+
 
 def fix_chebi_ids(df: pd.DataFrame, column: str) -> int:
     """Fix CHEBI IDs with duplicate prefix."""
@@ -101,13 +122,13 @@ def fix_ftp_urls(df: pd.DataFrame, url_column: str) -> int:
     return fixed_count
 
 
-def fix_chemicals_table(input_file: str, output_file: str) -> dict:
+def fix_chemicals_table(input_file: str, output_file: str, store: Optional[SheetStore] = None) -> dict:
     """Fix validation issues in chemicals table."""
     print("\n" + "=" * 80)
     print("Fixing Chemicals Table")
     print("=" * 80)
     
-    df = pd.read_csv(input_file, sep='\t')
+    df = load_table(input_file, store)
     print(f"Loaded {len(df)} chemical records")
     
     fixes = {
@@ -122,7 +143,7 @@ def fix_chemicals_table(input_file: str, output_file: str) -> dict:
     fixes['pubchem_ids'] = fix_pubchem_ids(df, 'pubchem_id')
     
     # Save
-    df.to_csv(output_file, sep='\t', index=False)
+    save_table(df, output_file, store)
     
     print(f"✓ Fixed {fixes['chebi_ids']} CHEBI IDs")
     print(f"✓ Fixed {fixes['pubchem_ids']} PubChem IDs")
@@ -131,13 +152,13 @@ def fix_chemicals_table(input_file: str, output_file: str) -> dict:
     return fixes
 
 
-def fix_publications_table(input_file: str, output_file: str) -> dict:
+def fix_publications_table(input_file: str, output_file: str, store: Optional[SheetStore] = None) -> dict:
     """Fix validation issues in publications table."""
     print("\n" + "=" * 80)
     print("Fixing Publications Table")
     print("=" * 80)
 
-    df = pd.read_csv(input_file, sep='\t')
+    df = load_table(input_file, store)
     print(f"Loaded {len(df)} publication records")
 
     fixes = {
@@ -150,7 +171,7 @@ def fix_publications_table(input_file: str, output_file: str) -> dict:
     fixes['urls'] += fix_publication_urls(df, 'Download URL')
 
     # Save
-    df.to_csv(output_file, sep='\t', index=False)
+    save_table(df, output_file, store)
 
     print(f"✓ Fixed {fixes['urls']} publication URLs")
     print(f"✓ Saved to {output_file}")
@@ -158,13 +179,13 @@ def fix_publications_table(input_file: str, output_file: str) -> dict:
     return fixes
 
 
-def fix_genomes_table(input_file: str, output_file: str) -> dict:
+def fix_genomes_table(input_file: str, output_file: str, store: Optional[SheetStore] = None) -> dict:
     """Fix validation issues in genomes table."""
     print("\n" + "=" * 80)
     print("Fixing Genomes Table")
     print("=" * 80)
     
-    df = pd.read_csv(input_file, sep='\t')
+    df = load_table(input_file, store)
     print(f"Loaded {len(df)} genome records")
     
     fixes = {
@@ -184,7 +205,7 @@ def fix_genomes_table(input_file: str, output_file: str) -> dict:
         print(f"   Consider running: make update-genomes")
     
     # Save (no automatic fixes for now)
-    df.to_csv(output_file, sep='\t', index=False)
+    save_table(df, output_file, store)
     
     print(f"✓ Analyzed genome URLs")
     print(f"✓ Saved to {output_file}")
@@ -270,6 +291,12 @@ Fixes applied:
         default="data/txt/sheet",
         help="Data directory (default: data/txt/sheet)"
     )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Fix tables in the DuckDB working store (<data-dir>/{DEFAULT_STORE_NAME}) "
+             "instead of rewriting the TSVs; export it with src/sheet_store.py"
+    )
 
     args = parser.parse_args()
 
@@ -329,30 +356,37 @@ Fixes applied:
     # Track total fixes
     total_fixes = {}
 
-    # Process tables
-    for table_name in tables_to_process:
-        table_info = tables[table_name]
-        
-        # Check if input file exists
-        if not table_info["input"].exists():
-            print(f"\n⚠️  Skipping {table_name}: file not found")
-            continue
-        
-        # Run fix function
-        try:
-            fixes = table_info["func"](
-                str(table_info["input"]),
-                str(table_info["output"])
-            )
-            
-            # Accumulate fixes
-            for fix_type, count in fixes.items():
-                total_fixes[fix_type] = total_fixes.get(fix_type, 0) + count
-                
-        except Exception as e:
-            print(f"\n❌ Error fixing {table_name}: {e}")
-            import traceback
-            traceback.print_exc()
+    store = SheetStore(data_dir / DEFAULT_STORE_NAME) if args.store else None
+
+    try:
+        # Process tables
+        for table_name in tables_to_process:
+            table_info = tables[table_name]
+
+            # Check if input file exists
+            if not table_info["input"].exists():
+                print(f"\n⚠️  Skipping {table_name}: file not found")
+                continue
+
+            # Run fix function
+            try:
+                fixes = table_info["func"](
+                    str(table_info["input"]),
+                    str(table_info["output"]),
+                    store=store
+                )
+
+                # Accumulate fixes
+                for fix_type, count in fixes.items():
+                    total_fixes[fix_type] = total_fixes.get(fix_type, 0) + count
+
+            except Exception as e:
+                print(f"\n❌ Error fixing {table_name}: {e}")
+                import traceback
+                traceback.print_exc()
+    finally:
+        if store is not None:
+            store.close()
 
     # Add missing organisms if requested
     organisms_added = 0
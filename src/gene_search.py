@@ -1,12 +1,19 @@
 """Gene and protein search functions for extending PFAS biodegradation genes."""
 
-import time
 from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
-import requests
 from pathlib import Path
 from Bio import Entrez
 
+try:
+    from src.apis.kegg_client import KEGGClient
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import snapshot_get
+except ImportError:
+    from apis.kegg_client import KEGGClient
+    from apis.rate_limits import throttle
+    from apis.snapshots import snapshot_get
+
 
 def get_pfas_genes_database() -> List[Dict]:
     """Get comprehensive database of PFAS biodegradation-related genes and proteins.
@@ -186,7 +193,8 @@ def search_uniprot_genes(organism_list: List[str]) -> List[Dict]:
                 "size": "20"
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            throttle('uniprot')
+            response = snapshot_get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 lines = response.text.strip().split('\n')
@@ -203,8 +211,6 @@ def search_uniprot_genes(organism_list: List[str]) -> List[Dict]:
                                 "chebi": ""
                             })
             
-            time.sleep(1)  # Rate limiting
-            
         except Exception as e:
             print(f"Error searching UniProt for {organism}: {e}")
     
@@ -249,8 +255,14 @@ def get_gene_download_url(gene_id: str, organism: str = "") -> str:
         return f"https://www.ncbi.nlm.nih.gov/gene/?term={gene_id}"
 
 
-def search_kegg_genes() -> List[Dict]:
+def search_kegg_genes(kegg_client: Optional[KEGGClient] = None) -> List[Dict]:
     """Search KEGG for PFAS-related genes.
+
+    EC numbers are joined in from the locally cached KEGG `list/ko` table,
+    so no per-KO requests are made.
+
+    Args:
+        kegg_client: KEGG client to use (default: new client with default cache)
     
     Returns:
         List of gene records from KEGG
@@ -266,13 +278,16 @@ def search_kegg_genes() -> List[Dict]:
         ("K00600", "glycine hydroxymethyltransferase"),
         ("K01938", "formate--tetrahydrofolate ligase")
     ]
+
+    client = kegg_client or KEGGClient()
+    ko_ec = client.ko_ec_numbers(ko_id for ko_id, _ in kegg_genes)
     
     for ko_id, description in kegg_genes:
         genes.append({
             "gene_id": ko_id,
             "organism": "Various methylotrophic bacteria",
             "annotation": description,
-            "ec": "",
+            "ec": "; ".join(ko_ec.get(ko_id, [])),
             "go": "",
             "chebi": ""
         })
@@ -9,7 +9,7 @@ This module provides:
 - Common query patterns for organisms, proteins, pathways, chemicals
 - Result caching and batching utilities
 - Source label helpers for extend3_* variants
-- TSV export utilities
+- TSV export utilities (optionally through the DuckDB sheet store)
 """
 
 from pathlib import Path
@@ -17,6 +17,8 @@ from typing import List, Dict, Any, Optional, Set, Tuple
 import pandas as pd
 from src.kg_analysis.kg_database import KnowledgeGraphDB
 from src.kg_analysis.kg_function_database import FunctionKnowledgeGraphDB
+from src.sheet_store import SheetStore
+from src.table_index import TableIndex
 
 
 class KGMiningSession:
@@ -112,17 +114,24 @@ def load_taxon_ids(
 
 
 def load_existing_gene_ids(
-    genes_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_genes_and_proteins_extended.tsv"
+    genes_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_genes_and_proteins_extended.tsv",
+    store: Optional[SheetStore] = None
 ) -> Set[str]:
     """
     Load existing gene/protein IDs to avoid duplicates.
 
     Args:
         genes_file: Path to genes TSV file
+        store: Working store to read the sheet from (default: read the TSV)
 
     Returns:
         Set of existing gene_protein_id values
     """
+    if store is not None:
+        gene_ids = store.values(Path(genes_file), "gene_protein_id")
+        print(f"Loaded {len(gene_ids)} existing gene IDs from {genes_file} (working store)")
+        return gene_ids
+
     if not Path(genes_file).exists():
         print(f"⚠️  File not found: {genes_file}")
         return set()
@@ -134,17 +143,24 @@ def load_existing_gene_ids(
 
 
 def load_existing_pathway_ids(
-    pathways_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_pathways_extended.tsv"
+    pathways_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_pathways_extended.tsv",
+    store: Optional[SheetStore] = None
 ) -> Set[str]:
     """
     Load existing pathway IDs to avoid duplicates.
 
     Args:
         pathways_file: Path to pathways TSV file
+        store: Working store to read the sheet from (default: read the TSV)
 
     Returns:
         Set of existing pathway_id values
     """
+    if store is not None:
+        pathway_ids = store.values(Path(pathways_file), "pathway_id")
+        print(f"Loaded {len(pathway_ids)} existing pathway IDs from {pathways_file} (working store)")
+        return pathway_ids
+
     if not Path(pathways_file).exists():
         print(f"⚠️  File not found: {pathways_file}")
         return set()
@@ -156,17 +172,24 @@ def load_existing_pathway_ids(
 
 
 def load_existing_chemical_ids(
-    chemicals_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_chemicals_extended.tsv"
+    chemicals_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_chemicals_extended.tsv",
+    store: Optional[SheetStore] = None
 ) -> Set[str]:
     """
     Load existing chemical IDs to avoid duplicates.
 
     Args:
         chemicals_file: Path to chemicals TSV file
+        store: Working store to read the sheet from (default: read the TSV)
 
     Returns:
         Set of existing chemical_id values
     """
+    if store is not None:
+        chemical_ids = store.values(Path(chemicals_file), "chemical_id")
+        print(f"Loaded {len(chemical_ids)} existing chemical IDs from {chemicals_file} (working store)")
+        return chemical_ids
+
     if not Path(chemicals_file).exists():
         print(f"⚠️  File not found: {chemicals_file}")
         return set()
@@ -325,25 +348,50 @@ def deduplicate_and_merge(
 def save_extended_table(
     df: pd.DataFrame,
     output_file: str,
-    append: bool = False
+    append: bool = False,
+    store: Optional[SheetStore] = None,
+    key: Optional[str] = None
 ) -> None:
     """
     Save extended table to TSV file.
 
+    Appending only writes rows that are not already in the table: a key → row
+    hashes index is kept beside the TSV (see table_index). A row with new
+    contents for a key that has a single row supersedes that row, and
+    superseded rows are compacted away periodically; keys with several
+    distinct rows keep them all.
+
     Args:
         df: DataFrame to save
         output_file: Output TSV file path
         append: If True, append to existing file
+        store: Working store to write the sheet to instead of the TSV
+            (written out by exporting the store)
+        key: Column identifying a record when appending (default: whole row)
     """
     output_path = Path(output_file)
+
+    if store is not None:
+        if append and key is not None:
+            updated, appended = store.upsert(output_path, df, key)
+            print(f"✓ Stored {appended} new and {updated} updated records for {output_file} in {store.path}")
+        elif append:
+            store.append(output_path, df)
+            print(f"✓ Stored {len(df)} records for {output_file} in {store.path}")
+        else:
+            store.replace(output_path, df)
+            print(f"✓ Stored {len(df)} records for {output_file} in {store.path}")
+        return
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    index = TableIndex(output_path, key)
 
-    if append and output_path.exists():
-        # Load existing data and concatenate
-        existing = pd.read_csv(output_path, sep='\t')
-        df = pd.concat([existing, df], ignore_index=True)
+    if append:
+        added, changed = index.append(df)
+        print(f"✓ Saved {added} new and {changed} updated records to {output_file} ({index.rows} rows)")
+        return
 
-    df.to_csv(output_path, sep='\t', index=False)
+    index.write(df)
     print(f"✓ Saved {len(df)} records to {output_file}")
 
 
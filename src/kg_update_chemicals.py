@@ -24,6 +24,7 @@ from src.kg_mining_utils import (
     summarize_extraction,
     format_source_label
 )
+from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
 
 
 def query_chemicals_from_function_kg(
@@ -208,7 +209,8 @@ def format_chemical_records(
 def extend_chemicals_from_kg(
     output_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_chemicals_extended.tsv",
     source_label: str = "kg_update",
-    append: bool = True
+    append: bool = True,
+    store: Optional[SheetStore] = None
 ) -> pd.DataFrame:
     """
     Main workflow: Update chemicals table using function KG mining.
@@ -217,6 +219,8 @@ def extend_chemicals_from_kg(
         output_file: Output TSV file path
         source_label: Source label for new records
         append: If True, append to existing file
+        store: Working store to read and write the output sheet through
+            (default: the TSV file)
 
     Returns:
         DataFrame with new chemical records
@@ -232,7 +236,7 @@ def extend_chemicals_from_kg(
         return pd.DataFrame()
 
     # Load existing chemical IDs to avoid duplicates
-    existing_ids = load_existing_chemical_ids(output_file)
+    existing_ids = load_existing_chemical_ids(output_file, store=store)
 
     # Query function KG
     with KGMiningSession(use_function_kg=True, use_phenotype_kg=False) as session:
@@ -258,7 +262,7 @@ def extend_chemicals_from_kg(
             return pd.DataFrame()
 
         # Save results
-        save_extended_table(chemical_records, output_file, append=append)
+        save_extended_table(chemical_records, output_file, append=append, store=store, key="chemical_id")
 
         # Summary
         summarize_extraction(
@@ -291,14 +295,27 @@ def main():
         action="store_true",
         help="Overwrite instead of append"
     )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Write through the DuckDB working store ({DEFAULT_STORE_NAME} beside the output) "
+             "instead of rewriting the TSV; export it with src/sheet_store.py"
+    )
 
     args = parser.parse_args()
 
-    extend_chemicals_from_kg(
-        output_file=args.output,
-        source_label=args.source_label,
-        append=not args.no_append
-    )
+    store = SheetStore(Path(args.output).parent / DEFAULT_STORE_NAME) if args.store else None
+
+    try:
+        extend_chemicals_from_kg(
+            output_file=args.output,
+            source_label=args.source_label,
+            append=not args.no_append,
+            store=store
+        )
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
@@ -26,6 +26,7 @@ from src.kg_mining_utils import (
     summarize_extraction,
     format_source_label
 )
+from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
 
 
 def query_proteins_from_function_kg(
@@ -210,7 +211,8 @@ def extend_genes_from_kg(
     output_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_genes_and_proteins_extended.tsv",
     source_label: str = "kg_update",
     limit_per_taxon: int = 2000,
-    append: bool = True
+    append: bool = True,
+    store: Optional[SheetStore] = None
 ) -> pd.DataFrame:
     """
     Main workflow: Update genes table using function KG mining.
@@ -220,6 +222,8 @@ def extend_genes_from_kg(
         source_label: Source label for new records
         limit_per_taxon: Max proteins to retrieve per taxon
         append: If True, append to existing file
+        store: Working store to read and write the output sheet through
+            (default: the TSV file)
 
     Returns:
         DataFrame with new gene records
@@ -235,7 +239,7 @@ def extend_genes_from_kg(
         return pd.DataFrame()
 
     # Load existing gene IDs to avoid duplicates
-    existing_ids = load_existing_gene_ids(output_file)
+    existing_ids = load_existing_gene_ids(output_file, store=store)
 
     # Query function KG
     with KGMiningSession(use_function_kg=True, use_phenotype_kg=False) as session:
@@ -268,7 +272,7 @@ def extend_genes_from_kg(
             return pd.DataFrame()
 
         # Save results
-        save_extended_table(gene_records, output_file, append=append)
+        save_extended_table(gene_records, output_file, append=append, store=store, key="gene or protein id")
 
         # Summary
         summarize_extraction(
@@ -307,15 +311,28 @@ def main():
         action="store_true",
         help="Overwrite instead of append"
     )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Write through the DuckDB working store ({DEFAULT_STORE_NAME} beside the output) "
+             "instead of rewriting the TSV; export it with src/sheet_store.py"
+    )
 
     args = parser.parse_args()
 
-    extend_genes_from_kg(
-        output_file=args.output,
-        source_label=args.source_label,
-        limit_per_taxon=args.limit,
-        append=not args.no_append
-    )
+    store = SheetStore(Path(args.output).parent / DEFAULT_STORE_NAME) if args.store else None
+
+    try:
+        extend_genes_from_kg(
+            output_file=args.output,
+            source_label=args.source_label,
+            limit_per_taxon=args.limit,
+            append=not args.no_append,
+            store=store
+        )
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
@@ -22,6 +22,7 @@ from src.kg_mining_utils import (
     summarize_extraction,
     format_source_label
 )
+from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
 
 
 def get_existing_taxa(
@@ -231,7 +232,8 @@ def format_taxa_records(
 
 def extend_genomes_from_kg(
     output_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_taxa_and_genomes_extended.tsv",
-    append: bool = True
+    append: bool = True,
+    store: Optional[SheetStore] = None
 ) -> pd.DataFrame:
     """
     Main workflow: Extend taxa table using KG mining.
@@ -239,6 +241,8 @@ def extend_genomes_from_kg(
     Args:
         output_file: Output TSV file path
         append: If True, append to existing file
+        store: Working store to read and write the output sheet through
+            (default: the TSV file)
 
     Returns:
         DataFrame with new taxa records
@@ -321,7 +325,7 @@ def extend_genomes_from_kg(
         return pd.DataFrame()
 
     # Save results
-    save_extended_table(combined_records, output_file, append=append)
+    save_extended_table(combined_records, output_file, append=append, store=store, key="NCBITaxon id")
 
     # Summary
     summarize_extraction(
@@ -349,13 +353,26 @@ def main():
         action="store_true",
         help="Overwrite instead of append"
     )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Write through the DuckDB working store ({DEFAULT_STORE_NAME} beside the output) "
+             "instead of rewriting the TSV; export it with src/sheet_store.py"
+    )
 
     args = parser.parse_args()
 
-    extend_genomes_from_kg(
-        output_file=args.output,
-        append=not args.no_append
-    )
+    store = SheetStore(Path(args.output).parent / DEFAULT_STORE_NAME) if args.store else None
+
+    try:
+        extend_genomes_from_kg(
+            output_file=args.output,
+            append=not args.no_append,
+            store=store
+        )
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
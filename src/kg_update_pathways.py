@@ -24,6 +24,7 @@ from src.kg_mining_utils import (
     summarize_extraction,
     format_source_label
 )
+from src.sheet_store import DEFAULT_STORE_NAME, SheetStore
 
 
 def query_pathways_from_function_kg(
@@ -197,7 +198,8 @@ def create_pathway_id_column(df: pd.DataFrame) -> pd.DataFrame:
 def extend_pathways_from_kg(
     output_file: str = "data/txt/sheet/extended/BER_CMM_Data_for_AI_pathways_extended.tsv",
     source_label: str = "kg_update",
-    append: bool = True
+    append: bool = True,
+    store: Optional[SheetStore] = None
 ) -> pd.DataFrame:
     """
     Main workflow: Extend pathways table using function KG mining.
@@ -206,6 +208,8 @@ def extend_pathways_from_kg(
         output_file: Output TSV file path
         source_label: Source label for new records
         append: If True, append to existing file
+        store: Working store to read and write the output sheet through
+            (default: the TSV file)
 
     Returns:
         DataFrame with new pathway records
@@ -221,7 +225,7 @@ def extend_pathways_from_kg(
         return pd.DataFrame()
 
     # Load existing pathway IDs to avoid duplicates
-    existing_ids = load_existing_pathway_ids(output_file)
+    existing_ids = load_existing_pathway_ids(output_file, store=store)
 
     # Query function KG
     with KGMiningSession(use_function_kg=True, use_phenotype_kg=False) as session:
@@ -258,7 +262,7 @@ def extend_pathways_from_kg(
             return pd.DataFrame()
 
         # Save results
-        save_extended_table(pathway_records, output_file, append=append)
+        save_extended_table(pathway_records, output_file, append=append, store=store)
 
         # Summary
         summarize_extraction(
@@ -291,14 +295,27 @@ def main():
         action="store_true",
         help="Overwrite instead of append"
     )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Write through the DuckDB working store ({DEFAULT_STORE_NAME} beside the output) "
+             "instead of rewriting the TSV; export it with src/sheet_store.py"
+    )
 
     args = parser.parse_args()
 
-    extend_pathways_from_kg(
-        output_file=args.output,
-        source_label=args.source_label,
-        append=not args.no_append
-    )
+    store = SheetStore(Path(args.output).parent / DEFAULT_STORE_NAME) if args.store else None
+
+    try:
+        extend_pathways_from_kg(
+            output_file=args.output,
+            source_label=args.source_label,
+            append=not args.no_append,
+            store=store
+        )
+    finally:
+        if store is not None:
+            store.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,359 @@
+"""Sharded, memory-mapped store for the publication markdown corpus.
+
+The markdown files converted from PDFs are copied into a few append-only
+shard files (UTF-8 text blobs) with a JSON offset index. Consumers then:
+- resolve a publication identifier (DOI, PMC, PMID, arXiv) to its markdown
+  file with a dictionary lookup instead of globbing the directory
+- read a document as a zero-copy memoryview of the memory-mapped shard, or
+  decode it to text, instead of opening and reading the file again
+
+The store lives in a `corpus/` directory next to the markdown files and is
+updated incrementally: files whose size or modification time changed are
+appended to the last shard again, and the shards are compacted once more
+than half of their bytes belong to replaced or deleted documents.
+
+The markdown files stay the source of truth; the store can be deleted at any
+time and is rebuilt on the next update(). A read-only corpus (for preview
+runs such as --dry-run) never writes: new or changed files are read from
+the markdown directory instead of being appended to a shard.
+"""
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+CORPUS_FORMAT_VERSION = 1
+
+DEFAULT_CORPUS_DIR = "corpus"
+
+INDEX_NAME = "index.json"
+
+# Start a new shard once the last one reaches this size
+SHARD_MAX_BYTES = 64 * 1024 * 1024
+
+# arXiv identifiers as they appear in markdown file names (dots → underscores)
+ARXIV_STEM_RE = re.compile(r'(?<!\d)(\d{4}_\d{4,5})(?!\d)')
+
+
+def publication_stem(pub_id: str) -> Optional[str]:
+    """Markdown file stem for a DOI, PMC or PMID publication identifier.
+
+    Args:
+        pub_id: Publication identifier (e.g. '10.1038/nature16174', 'PMC6764073',
+            'PMID:38269599')
+
+    Returns:
+        File stem, or None for other identifiers (arXiv IDs are matched
+        inside file names instead)
+
+    Examples:
+        >>> publication_stem("10.1038/nature16174")
+        'doi_10_1038-nature16174'
+        >>> publication_stem("PMID:38269599")
+        'PMID_38269599'
+        >>> publication_stem("arXiv:2301.12345") is None
+        True
+    """
+    if pub_id.startswith('10.'):
+        return f"doi_{pub_id.replace('/', '-').replace('.', '_')}"
+    if pub_id.startswith('PMC'):
+        return pub_id
+    if pub_id.startswith('PMID:'):
+        return pub_id.replace(':', '_')
+    return None
+
+
+def stem_arxiv_ids(stem: str) -> List[str]:
+    """arXiv identifiers embedded in a markdown file stem.
+
+    Examples:
+        >>> stem_arxiv_ids("arxiv_2301_12345_lanthanide_uptake")
+        ['arXiv:2301.12345']
+        >>> stem_arxiv_ids("PMID_38269599")
+        []
+    """
+    return [f"arXiv:{match.replace('_', '.')}" for match in ARXIV_STEM_RE.findall(stem)]
+
+
+class MarkdownCorpus:
+    """Memory-mapped copy of the markdown files in one directory.
+
+    Examples:
+        >>> corpus = MarkdownCorpus(Path("data/publications"))  # doctest: +SKIP
+        >>> corpus.update()  # doctest: +SKIP
+        >>> corpus.path_for("PMID:32120220")  # doctest: +SKIP
+        PosixPath('data/publications/PMID_32120220.md')
+    """
+
+    def __init__(self, markdown_dir: Path, corpus_dir: Optional[Path] = None, read_only: bool = False):
+        """Initialize store and load the stored index, if any.
+
+        Args:
+            markdown_dir: Directory containing markdown files
+            corpus_dir: Store directory (defaults to markdown_dir/corpus)
+            read_only: Never write shards or the index
+        """
+        self.markdown_dir = Path(markdown_dir)
+        self.read_only = read_only
+        self.corpus_dir = Path(corpus_dir) if corpus_dir else self.markdown_dir / DEFAULT_CORPUS_DIR
+        self.index_path = self.corpus_dir / INDEX_NAME
+        # name → {'shard', 'offset', 'length', 'size', 'mtime_ns'}
+        self.documents: Dict[str, Dict] = {}
+        self.shards: List[str] = []
+        self._ids: Dict[str, str] = {}
+        self._maps: Dict[int, Tuple[object, mmap.mmap]] = {}
+        self._dirty = False
+
+        if self.index_path.exists():
+            self._load()
+
+    def __getstate__(self) -> Dict:
+        # Memory maps cannot be pickled; worker processes map shards lazily
+        state = self.__dict__.copy()
+        state['_maps'] = {}
+        return state
+
+    def _load(self) -> None:
+        """Read the stored index (ignored if unreadable or another version)."""
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  ⚠️  Ignoring unreadable corpus index {self.index_path}: {e}")
+            return
+        if data.get('format_version') != CORPUS_FORMAT_VERSION:
+            return
+        shards = data.get('shards', [])
+        if all((self.corpus_dir / shard).exists() for shard in shards):
+            self.shards = shards
+            self.documents = data.get('documents', {})
+            self._build_ids()
+
+    def _build_ids(self) -> None:
+        """Build the identifier → document name lookup table."""
+        self._ids = {}
+        for name in sorted(self.documents):
+            stem = name[:-len('.md')]
+            self._ids.setdefault(stem, name)
+            for arxiv_id in stem_arxiv_ids(stem):
+                self._ids.setdefault(arxiv_id, name)
+
+    def save(self) -> None:
+        """Write the index atomically if it changed (never for a read-only corpus)."""
+        if not self._dirty or self.read_only:
+            return
+        self.corpus_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            'format_version': CORPUS_FORMAT_VERSION,
+            'shards': self.shards,
+            'documents': self.documents,
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def close(self) -> None:
+        """Unmap all shards."""
+        for handle, mapped in self._maps.values():
+            mapped.close()
+            handle.close()
+        self._maps = {}
+
+    def _shard_path(self, shard: int) -> Path:
+        return self.corpus_dir / self.shards[shard]
+
+    def _new_shard(self) -> int:
+        """Create an empty shard file and return its number."""
+        self.corpus_dir.mkdir(parents=True, exist_ok=True)
+        number = 0
+        while f"shard_{number:03d}.txt" in self.shards or (self.corpus_dir / f"shard_{number:03d}.txt").exists():
+            number += 1
+        name = f"shard_{number:03d}.txt"
+        (self.corpus_dir / name).touch()
+        self.shards.append(name)
+        return len(self.shards) - 1
+
+    def update(self) -> Tuple[int, int]:
+        """Append new or changed markdown files and drop deleted ones.
+
+        Returns:
+            (documents added or replaced, documents removed)
+        """
+        current = {path.name: path for path in self.markdown_dir.glob('*.md')}
+        removed = [name for name in self.documents if name not in current]
+        for name in removed:
+            del self.documents[name]
+
+        changed = []
+        for name, path in sorted(current.items()):
+            stat = path.stat()
+            entry = self.documents.get(name)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                continue
+            changed.append((name, path, stat))
+
+        if self.read_only:
+            # Served from the markdown files by view(), see the 'shard': None entries
+            for name, path, stat in changed:
+                self.documents[name] = {
+                    'shard': None,
+                    'offset': 0,
+                    'length': stat.st_size,
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                }
+            if changed or removed:
+                self._build_ids()
+            return len(changed), len(removed)
+
+        if changed:
+            # Appending can grow a shard past its mapped size
+            self.close()
+            shard = len(self.shards) - 1 if self.shards else self._new_shard()
+            for name, path, stat in changed:
+                try:
+                    data = path.read_bytes()
+                except OSError as e:
+                    print(f"  ⚠️  Error reading {path}: {e}")
+                    data = b''
+                if self._shard_path(shard).stat().st_size + len(data) > SHARD_MAX_BYTES:
+                    shard = self._new_shard()
+                with open(self._shard_path(shard), 'ab') as f:
+                    offset = f.tell()
+                    f.write(data)
+                self.documents[name] = {
+                    'shard': shard,
+                    'offset': offset,
+                    'length': len(data),
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                }
+
+        if changed or removed:
+            self._dirty = True
+            self._build_ids()
+            self._compact_if_sparse()
+        return len(changed), len(removed)
+
+    def _compact_if_sparse(self) -> None:
+        """Rewrite the shards once less than half of their bytes are live."""
+        live = sum(entry['length'] for entry in self.documents.values())
+        total = sum(
+            self._shard_path(shard).stat().st_size for shard in range(len(self.shards))
+        )
+        if total <= 2 * live:
+            return
+
+        self.close()
+        old_shards = [self._shard_path(shard) for shard in range(len(self.shards))]
+        entries = sorted(self.documents.items(), key=lambda item: (item[1]['shard'], item[1]['offset']))
+        contents = []
+        for name, entry in entries:
+            with open(old_shards[entry['shard']], 'rb') as f:
+                f.seek(entry['offset'])
+                contents.append((name, f.read(entry['length'])))
+
+        self.shards = []
+        for path in old_shards:
+            path.unlink()
+        shard = self._new_shard()
+        for name, data in contents:
+            if self._shard_path(shard).stat().st_size + len(data) > SHARD_MAX_BYTES:
+                shard = self._new_shard()
+            with open(self._shard_path(shard), 'ab') as f:
+                offset = f.tell()
+                f.write(data)
+            self.documents[name].update(shard=shard, offset=offset)
+        self._dirty = True
+
+    def _map(self, shard: int) -> Optional[mmap.mmap]:
+        """Memory-map a shard read-only (None for an empty shard)."""
+        if shard not in self._maps:
+            handle = open(self._shard_path(shard), 'rb')
+            if os.fstat(handle.fileno()).st_size == 0:
+                handle.close()
+                return None
+            self._maps[shard] = (handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+        return self._maps[shard][1]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.documents
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def names(self) -> List[str]:
+        """Names of the stored markdown files, sorted."""
+        return sorted(self.documents)
+
+    def stems(self) -> Iterator[str]:
+        """Stems of the stored markdown files."""
+        return (name[:-len('.md')] for name in self.documents)
+
+    def name_for(self, pub_id: str) -> Optional[str]:
+        """Look up the markdown file name for a publication identifier.
+
+        Args:
+            pub_id: DOI, PMC ID, 'PMID:...' or 'arXiv:...'
+
+        Returns:
+            File name, or None if no stored document matches
+        """
+        stem = publication_stem(pub_id)
+        if stem is not None:
+            return self._ids.get(stem)
+        if pub_id.startswith('arXiv:'):
+            name = self._ids.get(pub_id)
+            if name is None:
+                # IDs the stem pattern does not capture; same test as a file search
+                arxiv_stem = pub_id.replace('arXiv:', '').replace('.', '_')
+                name = next((n for n in sorted(self.documents) if arxiv_stem in n[:-len('.md')]), None)
+            return name
+        return None
+
+    def path_for(self, pub_id: str) -> Optional[Path]:
+        """Look up the markdown file path for a publication identifier."""
+        name = self.name_for(pub_id)
+        return self.markdown_dir / name if name else None
+
+    def view(self, name: str) -> memoryview:
+        """Zero-copy view of a stored document's UTF-8 bytes.
+
+        Documents a read-only corpus has not stored are read from their file.
+
+        Raises:
+            KeyError: If the document is not stored
+        """
+        entry = self.documents[name]
+        if entry['shard'] is None:
+            try:
+                return memoryview((self.markdown_dir / name).read_bytes())
+            except OSError as e:
+                print(f"  ⚠️  Error reading {self.markdown_dir / name}: {e}")
+                return memoryview(b'')
+        mapped = self._map(entry['shard'])
+        if mapped is None or not entry['length']:
+            return memoryview(b'')
+        with memoryview(mapped) as whole:
+            return whole[entry['offset']:entry['offset'] + entry['length']]
+
+    def text(self, name: str) -> str:
+        """Decoded text of a stored document ('' if missing or not UTF-8)."""
+        if name not in self.documents:
+            return ""
+        with self.view(name) as view:
+            try:
+                return str(view, 'utf-8')
+            except UnicodeDecodeError as e:
+                print(f"  ⚠️  Error reading {name}: {e}")
+                return ""
+
+    def length(self, name: str) -> int:
+        """Byte length of a stored document (0 if not stored)."""
+        entry = self.documents.get(name)
+        return entry['length'] if entry else 0
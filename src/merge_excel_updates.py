@@ -18,6 +18,7 @@ import shutil
 from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime
 import json
+import time
 
 
 class ExcelMerger:
@@ -124,6 +125,9 @@ class ExcelMerger:
         3. Merge rows by ID, preferring new Excel data for non-generated columns
         4. Keep extended rows that don't exist in Excel
 
+        Rows are matched on the ID column with indexed lookups; an ID that
+        occurs more than once in the old data matches its first row.
+
         Args:
             old_df: Existing dataframe with generated data
             new_df: New dataframe from Excel
@@ -155,51 +159,31 @@ class ExcelMerger:
         if id_col not in result_cols:
             result_cols.insert(0, id_col)
 
-        # Merge data row by row
-        merged_rows = []
-        new_ids = set(new_df[id_col].values)
-        old_ids = set(old_df_renamed[id_col].values) if id_col in old_df_renamed.columns else set()
-
-        # Process rows from new Excel
-        for _, new_row in new_df.iterrows():
-            row_id = new_row[id_col]
-            merged_row = {}
+        if id_col not in old_df_renamed.columns:
+            return new_df.reindex(columns=result_cols)
 
-            # Start with new Excel data
-            for col in new_row.index:
-                merged_row[col] = new_row[col]
+        # First old row of each ID, indexed by ID (empty IDs never match)
+        old_keyed = old_df_renamed[old_df_renamed[id_col].notna()]
+        old_keyed = old_keyed.drop_duplicates(subset=[id_col], keep='first').set_index(id_col)
 
-            # Overlay generated columns from old data if this ID existed before
-            if row_id in old_ids and id_col in old_df_renamed.columns:
-                old_row = old_df_renamed[old_df_renamed[id_col] == row_id].iloc[0]
-                for gen_col in schema_diff['generated_columns']:
-                    actual_col = schema_diff['renamed_columns'].get(gen_col, gen_col)
-                    if actual_col in old_row.index and pd.notna(old_row[actual_col]):
-                        merged_row[actual_col] = old_row[actual_col]
-
-            merged_rows.append(merged_row)
+        # Rows from new Excel, with generated columns from the old row of the
+        # same ID overlaid where the old value is present
+        merged = new_df.reindex(columns=result_cols).reset_index(drop=True)
+        for gen_col in schema_diff['generated_columns']:
+            actual_col = schema_diff['renamed_columns'].get(gen_col, gen_col)
+            if actual_col not in old_keyed.columns:
+                continue
+            old_values = merged[id_col].map(old_keyed[actual_col])
+            merged[actual_col] = old_values.where(old_values.notna(), merged[actual_col])
 
         # Add extended rows that don't exist in new Excel
-        extended_ids = old_ids - new_ids
-        if extended_ids and id_col in old_df_renamed.columns:
-            self.log(f"    Preserving {len(extended_ids)} extended rows not in Excel", "DETAIL")
-            for ext_id in extended_ids:
-                old_row = old_df_renamed[old_df_renamed[id_col] == ext_id].iloc[0]
-                merged_row = {}
-
-                # Copy all available data from old row
-                for col in result_cols:
-                    if col in old_row.index:
-                        merged_row[col] = old_row[col]
-                    else:
-                        merged_row[col] = None
-
-                merged_rows.append(merged_row)
-
-        # Create result dataframe with correct column order
-        result_df = pd.DataFrame(merged_rows, columns=result_cols)
+        extended = old_keyed[~old_keyed.index.isin(merged[id_col])]
+        if not extended.empty:
+            self.log(f"    Preserving {len(extended)} extended rows not in Excel", "DETAIL")
+            extended = extended.reset_index().reindex(columns=result_cols)
+            merged = pd.concat([merged, extended], ignore_index=True)
 
-        return result_df
+        return merged
 
     def backup_tsv(self, tsv_path: Path, backup_dir: Path):
         """Backup a TSV file."""
@@ -276,9 +260,11 @@ class ExcelMerger:
             return False
 
         # Merge dataframes
+        start = time.perf_counter()
         merged_df = self.merge_dataframes(old_df, new_excel_df, schema_diff, id_col)
+        elapsed = time.perf_counter() - start
 
-        self.log(f"  ✓ Merged result: {len(merged_df)} rows, {len(merged_df.columns)} columns")
+        self.log(f"  ✓ Merged result: {len(merged_df)} rows, {len(merged_df.columns)} columns ({elapsed:.2f}s)")
 
         # Apply changes
         if not self.dry_run:
@@ -23,7 +23,6 @@ from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
 import pandas as pd
-import time
 
 try:
     from src.apis.uniprot_client import UniProtClient
@@ -165,8 +164,6 @@ class ProteinDataMiner:
 
                 print(f"✓ P:{len(pathway_data.get('KEGG', []))} C:{len(chebi_data)} Pub:{len(pub_data)}")
 
-                time.sleep(0.5)  # Rate limiting
-
             except Exception as e:
                 print(f"❌ Error: {e}")
                 continue
@@ -1,6 +1,5 @@
 """NCBI search functions for finding bacteria and archaea relevant to PFAS biodegradation."""
 
-import time
 from typing import Dict, List, Optional, Set, Tuple
 import requests
 import pandas as pd
@@ -9,6 +8,13 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 import re
 
+try:
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import entrez_call
+except ImportError:
+    from apis.rate_limits import throttle
+    from apis.snapshots import entrez_call
+
 
 # Configure Entrez with email (required by NCBI)
 Entrez.email = "your.email@example.com"  # Should be configured by user
@@ -113,7 +119,9 @@ def search_ncbi_assembly(
             search_query += f" AND {domain_filter}[Organism]"
             
         # Search assembly database
-        handle = Entrez.esearch(
+        throttle('ncbi')
+        handle = entrez_call(
+            Entrez.esearch,
             db="assembly",
             term=search_query,
             retmax=retmax,
@@ -126,7 +134,9 @@ def search_ncbi_assembly(
             return []
             
         # Fetch detailed records
-        handle = Entrez.esummary(
+        throttle('ncbi')
+        handle = entrez_call(
+            Entrez.esummary,
             db="assembly",
             id=",".join(search_results["IdList"])
         )
@@ -185,7 +195,9 @@ def search_ncbi_biosample(
             search_query += f" AND {organism_filter}[Organism]"
             
         # Search biosample database
-        handle = Entrez.esearch(
+        throttle('ncbi')
+        handle = entrez_call(
+            Entrez.esearch,
             db="biosample",
             term=search_query,
             retmax=retmax,
@@ -198,7 +210,9 @@ def search_ncbi_biosample(
             return []
             
         # Fetch detailed records
-        handle = Entrez.efetch(
+        throttle('ncbi')
+        handle = entrez_call(
+            Entrez.efetch,
             db="biosample",
             id=",".join(search_results["IdList"]),
             rettype="xml"
@@ -294,12 +308,10 @@ def search_pfas_organisms() -> Tuple[List[Dict], List[Dict]]:
             retmax=50
         )
         all_assemblies.extend(assemblies)
-        time.sleep(0.5)  # Rate limiting
 
         print(f"  Searching biosamples for: {term}")
         biosamples = search_ncbi_biosample(term, retmax=50)
         all_biosamples.extend(biosamples)
-        time.sleep(0.5)  # Rate limiting
 
     # Search known PFAS-degrading organisms
     for organism in pfas_organisms[:6]:  # Limit to avoid rate limiting
@@ -309,7 +321,6 @@ def search_pfas_organisms() -> Tuple[List[Dict], List[Dict]]:
             retmax=30
         )
         all_assemblies.extend(assemblies)
-        time.sleep(0.5)  # Rate limiting
     
     # Remove duplicates
     seen_assembly_ids = set()
@@ -369,7 +380,6 @@ def enhance_existing_data(existing_df: pd.DataFrame, data_type: str = "genome")
                             enhanced_df.at[idx, "Annotation download URL"] = best_match["annotation_url"]
                         if pd.isna(row.get("NCBITaxon id", "")):
                             enhanced_df.at[idx, "NCBITaxon id"] = best_match["taxid"]
-                    time.sleep(0.5)  # Rate limiting
     
     elif data_type == "biosample":
         # Add download URL column if it doesn't exist
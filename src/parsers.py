@@ -1,22 +1,32 @@
 """File parsers for converting various formats to text/TSV.
 
 This module provides parsers for:
-- Excel files (xlsx/xls) to TSV
+- Excel files (xlsx/xls) to TSV, optionally streamed row by row so huge
+  workbooks convert in bounded memory
 - Word documents (docx) to text
 - PDF files to text
 """
 
 import csv
+import hashlib
 import io
+import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Dict, Iterator, Optional, Sequence, TextIO, Tuple, Union, List
 
 import pandas as pd
 from docx import Document
+from openpyxl import load_workbook
 import PyPDF2
 
 
+# Sidecar next to each streamed TSV: one hash per data row, in row order
+ROW_HASHES_SUFFIX = ".rowhashes"
+
+
 def sanitize_filename(filename: str) -> str:
     """Replace spaces and other problematic characters with underscores.
     
@@ -37,10 +47,287 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
+def xlsx_header(values: Sequence) -> List[str]:
+    """Column names for an Excel header row, named the way pandas names them.
+
+    Empty header cells become 'Unnamed: <index>' and repeated names get a
+    '.1', '.2', ... suffix, as with pandas.read_excel.
+
+    Args:
+        values: Header cell values
+
+    Returns:
+        Column names
+
+    Examples:
+        >>> xlsx_header(["id", None, "name", "id", "id"])
+        ['id', 'Unnamed: 1', 'name', 'id.1', 'id.2']
+    """
+    names = []
+    seen = set()
+    counts: Dict[str, int] = {}
+    for index, value in enumerate(values):
+        base = f"Unnamed: {index}" if value is None or value == '' else str(value)
+        name = base
+        count = counts.get(base, 0)
+        while name in seen:
+            count += 1
+            name = f"{base}.{count}"
+        counts[base] = count
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def format_cell(value) -> str:
+    """TSV field for an Excel cell value.
+
+    Whole-number floats are written as integers; other values are written
+    as stored in the workbook. pandas.read_excel does this only for columns
+    that are whole numbers throughout, so a float column keeps '2.0' there.
+
+    Examples:
+        >>> format_cell(None)
+        ''
+        >>> format_cell(75692)
+        '75692'
+        >>> format_cell(2.0)
+        '2'
+        >>> format_cell(0.25)
+        '0.25'
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def row_hash(fields: Sequence[str]) -> str:
+    """SHA-1 of a row's TSV fields, used to diff conversions row by row.
+
+    Examples:
+        >>> row_hash(["a", "b"]) == row_hash(["a", "b"])
+        True
+        >>> row_hash(["a", "b"]) == row_hash(["a b"])
+        False
+    """
+    return hashlib.sha1('\x1f'.join(fields).encode('utf-8')).hexdigest()
+
+
+def xlsx_sheet_names(input_path: Union[str, Path]) -> List[str]:
+    """Sheet names of a workbook, without reading the sheets."""
+    workbook = load_workbook(input_path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def iter_xlsx_rows(
+    input_path: Union[str, Path],
+    sheet_name: str
+) -> Iterator[Tuple]:
+    """Stream the non-empty rows of one sheet with openpyxl in read-only mode.
+
+    Rows are yielded as tuples of cell values with trailing empty cells
+    removed, so memory use does not depend on the sheet size.
+
+    Args:
+        input_path: Path to input Excel file
+        sheet_name: Sheet to read
+
+    Yields:
+        Cell values of each row that has at least one value
+    """
+    workbook = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        yield from _nonempty_rows(workbook[sheet_name])
+    finally:
+        workbook.close()
+
+
+def iter_xlsx_sheets(input_path: Union[str, Path]) -> Iterator[Tuple[str, Iterator[Tuple]]]:
+    """Stream every sheet of a workbook, opening the workbook once.
+
+    Each sheet's rows are yielded as by iter_xlsx_rows and must be consumed
+    before moving on to the next sheet.
+
+    Args:
+        input_path: Path to input Excel file
+
+    Yields:
+        (sheet name, iterator over the sheet's non-empty rows)
+    """
+    workbook = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        for sheet_name in workbook.sheetnames:
+            yield sheet_name, _nonempty_rows(workbook[sheet_name])
+    finally:
+        workbook.close()
+
+
+def _nonempty_rows(worksheet) -> Iterator[Tuple]:
+    """Rows of a read-only worksheet that have a value, without trailing empty cells."""
+    for values in worksheet.iter_rows(values_only=True):
+        end = len(values)
+        while end and (values[end - 1] is None or values[end - 1] == ''):
+            end -= 1
+        if end:
+            yield values[:end]
+
+
+def write_sheet_tsv(
+    input_path: Union[str, Path],
+    sheet_name: str,
+    output: TextIO,
+    extra_columns: Optional[Dict[str, str]] = None,
+    hashes: Optional[TextIO] = None
+) -> Tuple[int, int]:
+    """Stream one sheet into a TSV file object.
+
+    The first non-empty row is the header and the table is as wide as the
+    widest row, as with pandas.read_excel. Rows are spooled to a temporary
+    file while the width is not yet known, so only one row is held in memory.
+
+    Args:
+        input_path: Path to input Excel file
+        sheet_name: Sheet to convert
+        output: Text file object receiving the TSV
+        extra_columns: Constant columns to append to every row (replacing
+            sheet columns of the same name)
+        hashes: Text file object receiving one row_hash() per data row
+
+    Returns:
+        (data rows written, columns written)
+    """
+    extra_columns = extra_columns or {}
+    width = 0
+    header: Tuple = ()
+    data_rows = 0
+    with tempfile.TemporaryFile('w+', newline='', encoding='utf-8') as spool:
+        spool_writer = csv.writer(spool, delimiter='\t', lineterminator='\n')
+        for values in iter_xlsx_rows(input_path, sheet_name):
+            width = max(width, len(values))
+            if not header:
+                header = values
+                continue
+            spool_writer.writerow([format_cell(value) for value in values])
+            data_rows += 1
+
+        columns = xlsx_header(tuple(header) + (None,) * (width - len(header)))
+        keep = [i for i, name in enumerate(columns) if name not in extra_columns]
+        constants = list(extra_columns.values())
+
+        writer = csv.writer(output, delimiter='\t', lineterminator='\n')
+        writer.writerow([columns[i] for i in keep] + list(extra_columns))
+        spool.seek(0)
+        for fields in csv.reader(spool, delimiter='\t'):
+            fields.extend([''] * (width - len(fields)))
+            row = [fields[i] for i in keep] + constants
+            writer.writerow(row)
+            if hashes is not None:
+                hashes.write(row_hash(row) + '\n')
+
+    return data_rows, len(keep) + len(constants)
+
+
+def stream_sheet_to_tsv(
+    input_path: Union[str, Path],
+    sheet_name: str,
+    output_path: Union[str, Path],
+    extra_columns: Optional[Dict[str, str]] = None
+) -> Dict:
+    """Stream one sheet to a TSV file plus its row-hash sidecar.
+
+    Both files are written atomically; the sidecar is the TSV path with
+    ROW_HASHES_SUFFIX appended.
+
+    Args:
+        input_path: Path to input Excel file
+        sheet_name: Sheet to convert
+        output_path: Path for output TSV file
+        extra_columns: Constant columns to append to every row
+
+    Returns:
+        Dict with 'sheet', 'path', 'hashes_path', 'rows' and 'columns'
+    """
+    output_path = Path(output_path)
+    hashes_path = output_path.with_name(output_path.name + ROW_HASHES_SUFFIX)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    tmp_hashes_path = hashes_path.with_name(hashes_path.name + '.tmp')
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as output, \
+            open(tmp_hashes_path, 'w', encoding='utf-8') as hashes:
+        rows, columns = write_sheet_tsv(input_path, sheet_name, output, extra_columns, hashes)
+    os.replace(tmp_path, output_path)
+    os.replace(tmp_hashes_path, hashes_path)
+    return {
+        'sheet': sheet_name,
+        'path': output_path,
+        'hashes_path': hashes_path,
+        'rows': rows,
+        'columns': columns,
+    }
+
+
+def _stream_sheet_worker(args: Tuple) -> Dict:
+    """Process pool entry point for stream_sheet_to_tsv."""
+    return stream_sheet_to_tsv(*args)
+
+
+def stream_xlsx_to_tsv(
+    input_path: Union[str, Path],
+    outputs: Dict[str, Union[str, Path]],
+    workers: Optional[int] = None,
+    extra_columns: Optional[Dict[str, Dict[str, str]]] = None
+) -> List[Dict]:
+    """Stream several sheets to per-sheet TSV files, in parallel processes.
+
+    Each worker opens the workbook in read-only mode and converts one sheet
+    with stream_sheet_to_tsv(), so memory stays bounded by one row per
+    sheet rather than the whole workbook.
+
+    The output is not always identical to xlsx_to_tsv(): values are
+    formatted per cell (format_cell) rather than per pandas column, so every
+    whole-number float is written as an integer. An integer column with
+    blanks keeps '75692' where xlsx_to_tsv() writes '75692.0' (pandas makes
+    the column float), and a float column writes '2' for 2.0 where
+    xlsx_to_tsv() writes '2.0' (e.g. media_gradient; chemicals and
+    publications differ the same way).
+
+    Args:
+        input_path: Path to input Excel file
+        outputs: Sheet name → output TSV path, in conversion order
+        workers: Worker processes (default: one per sheet, up to the CPU count)
+        extra_columns: Sheet name → constant columns to append to its rows
+
+    Returns:
+        stream_sheet_to_tsv() results, in the order of outputs
+
+    Examples:
+        >>> results = stream_xlsx_to_tsv(  # doctest: +SKIP
+        ...     "data.xlsx", {"Sheet1": "data_Sheet1.tsv", "Sheet2": "data_Sheet2.tsv"})
+        >>> results[0]['rows']  # doctest: +SKIP
+        116
+    """
+    extra_columns = extra_columns or {}
+    tasks = [
+        (str(input_path), sheet_name, str(output_path), extra_columns.get(sheet_name))
+        for sheet_name, output_path in outputs.items()
+    ]
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1 or len(tasks) <= 1:
+        return [_stream_sheet_worker(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_stream_sheet_worker, tasks))
+
+
 def xlsx_to_tsv(
     input_path: Union[str, Path], 
     output_path: Optional[Union[str, Path]] = None,
-    sheet_name: Union[str, int, None] = 0
+    sheet_name: Union[str, int, None] = 0,
+    streaming: bool = False
 ) -> str:
     """Convert Excel file to TSV format.
     
@@ -48,6 +335,9 @@ def xlsx_to_tsv(
         input_path: Path to input Excel file
         output_path: Path for output TSV file. If None, returns TSV string
         sheet_name: Sheet to convert (name, index, or None for all sheets)
+        streaming: Read rows with openpyxl in read-only mode instead of
+            loading the sheets with pandas (values are formatted per cell,
+            see stream_xlsx_to_tsv)
         
     Returns:
         TSV content as string if output_path is None, otherwise empty string
@@ -60,6 +350,34 @@ def xlsx_to_tsv(
     """
     input_path = Path(input_path)
     
+    if streaming:
+        names = xlsx_sheet_names(input_path)
+        if sheet_name is None:
+            selected = names
+        elif isinstance(sheet_name, int):
+            selected = [names[sheet_name]]
+        else:
+            selected = [sheet_name]
+
+        output = io.StringIO()
+        if output_path:
+            output_path = Path(output_path)
+            # Sanitize the filename to replace spaces with underscores
+            output_path = output_path.parent / sanitize_filename(output_path.name)
+            output = open(output_path, 'w', newline='', encoding='utf-8')
+
+        for i, name in enumerate(selected):
+            if sheet_name is None:
+                if i:
+                    output.write("\n\n")
+                output.write(f"# Sheet: {name}\n")
+            write_sheet_tsv(input_path, name, output)
+
+        if output_path:
+            output.close()
+            return ""
+        return output.getvalue()
+
     # Read Excel file
     if sheet_name is None:
         # Read all sheets
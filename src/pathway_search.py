@@ -1,17 +1,25 @@
 """Pathway search functions for extending PFAS biodegradation pathways."""
 
-import time
 from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
-import requests
 from pathlib import Path
 
+try:
+    from src.apis.kegg_client import KEGGClient
+except ImportError:
+    from apis.kegg_client import KEGGClient
 
-def search_kegg_pathways(keywords: List[str]) -> List[Dict]:
+
+def search_kegg_pathways(keywords: List[str], kegg_client: Optional[KEGGClient] = None) -> List[Dict]:
     """Search KEGG database for pathways related to keywords.
+
+    Keywords are matched against a local copy of KEGG `list/pathway`, which
+    is downloaded once and cached (see KEGGClient), instead of issuing one
+    `find` request per keyword.
     
     Args:
         keywords: List of keywords to search for
+        kegg_client: KEGG client to use (default: new client with default cache)
         
     Returns:
         List of pathway records with metadata
@@ -22,30 +30,17 @@ def search_kegg_pathways(keywords: List[str]) -> List[Dict]:
         >>> len(pathways) >= 0  # doctest: +SKIP
         True
     """
+    client = kegg_client or KEGGClient()
     pathways = []
     
     for keyword in keywords:
-        try:
-            # Search KEGG pathway database
-            search_url = f"http://rest.kegg.jp/find/pathway/{keyword}"
-            response = requests.get(search_url, timeout=10)
-            
-            if response.status_code == 200:
-                lines = response.text.strip().split('\n')
-                for line in lines:
-                    if line and '\t' in line:
-                        pathway_id, description = line.split('\t', 1)
-                        pathways.append({
-                            "pathway_id": pathway_id,
-                            "pathway_name": description.strip(),
-                            "search_keyword": keyword,
-                            "database": "KEGG"
-                        })
-            
-            time.sleep(0.5)  # Rate limiting for KEGG API
-            
-        except Exception as e:
-            print(f"Error searching KEGG for {keyword}: {e}")
+        for pathway_id, description in client.find_local("pathway", keyword):
+            pathways.append({
+                "pathway_id": f"path:{pathway_id}",
+                "pathway_name": description.strip(),
+                "search_keyword": keyword,
+                "database": "KEGG"
+            })
     
     # Remove duplicates
     seen = set()
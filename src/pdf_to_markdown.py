@@ -2,12 +2,34 @@
 
 This script uses PyMuPDF (fitz) to extract text from PDFs and convert to markdown,
 preserving structure for better data extraction.
+
+With tables enabled, PyMuPDF's table finder also runs on every page: each
+table is appended to its page as a fenced ```tsv block (which
+DocumentExtractor reads cell by cell), and all tables of a PDF are written
+column by column to a <name>.tables.json sidecar next to the markdown.
+
+Batch conversion runs one worker process per PDF (up to the CPU count), so a
+crash or hang in one PDF cannot take down the batch; workers that exceed the
+per-file timeout are killed. A manifest in the output directory records the
+content hash of every converted PDF, and unchanged PDFs are skipped on the
+next run.
 """
 
 import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing.connection import wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     import fitz  # PyMuPDF
@@ -17,21 +39,213 @@ except ImportError:
     print("Warning: PyMuPDF not installed. Install with: uv pip install pymupdf")
 
 
+# Bump when the markdown output changes, so existing conversions are redone
+CONVERTER_VERSION = 1
+
+MANIFEST_NAME = "pdf_to_markdown_manifest.json"
+
+# Seconds before a single PDF conversion is killed
+DEFAULT_TIMEOUT = 300
+
+# Smallest page range worth handing to a separate process
+MIN_PAGES_PER_WORKER = 25
+
+EXCESS_BLANK_LINES = re.compile(r'\n\s*\n\s*\n+')
+LINE_BREAK_HYPHEN = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+
+TABLES_SUFFIX = ".tables.json"
+
+
+def tables_path(markdown_path: Path) -> Path:
+    """Sidecar file holding the tables of a markdown file.
+
+    Examples:
+        >>> tables_path(Path("data/publications/PMC6764073.md"))
+        PosixPath('data/publications/PMC6764073.tables.json')
+    """
+    return markdown_path.with_name(markdown_path.stem + TABLES_SUFFIX)
+
+
+def clean_cell(cell: Optional[str]) -> str:
+    """Flatten a table cell to one line without tabs (None becomes '').
+
+    Examples:
+        >>> clean_cell("Removal\\nefficiency\\t(%)")
+        'Removal efficiency (%)'
+        >>> clean_cell(None)
+        ''
+    """
+    return ' '.join(cell.split()) if cell else ''
+
+
+def tsv_block(rows: List[List[str]]) -> str:
+    """Format table rows as a fenced markdown TSV block.
+
+    Examples:
+        >>> tsv_block([['Strain', 'pH'], ['A6', '4.5']])
+        '```tsv\\nStrain\\tpH\\nA6\\t4.5\\n```'
+    """
+    return "```tsv\n" + "\n".join("\t".join(row) for row in rows) + "\n```"
+
+
+def page_ranges(page_count: int, workers: int, min_pages: int = MIN_PAGES_PER_WORKER) -> List[Tuple[int, int]]:
+    """Split pages into contiguous ranges for parallel conversion.
+
+    Args:
+        page_count: Number of pages
+        workers: Maximum number of ranges
+        min_pages: Minimum pages per range
+
+    Returns:
+        List of (start, stop) page index ranges covering all pages
+
+    Examples:
+        >>> page_ranges(100, 4)
+        [(0, 25), (25, 50), (50, 75), (75, 100)]
+        >>> page_ranges(60, 8)
+        [(0, 30), (30, 60)]
+        >>> page_ranges(10, 4)
+        [(0, 10)]
+    """
+    count = max(1, min(workers, page_count // min_pages))
+    size, extra = divmod(page_count, count)
+    ranges = []
+    start = 0
+    for i in range(count):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _write_page_range(
+    pdf_path: Path,
+    start: int,
+    stop: Optional[int],
+    path: Path,
+    tables: bool = False
+) -> Tuple[int, List[Dict]]:
+    """Stream the markdown for a page range to path (runs in worker processes).
+
+    Returns:
+        (number of characters written, tables found in the range)
+    """
+    chars = 0
+    converter = PDFToMarkdownConverter(pdf_path, tables=tables)
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in converter.iter_markdown(start, stop):
+            f.write(chunk)
+            chars += len(chunk)
+    return chars, converter.tables
+
+
 class PDFToMarkdownConverter:
     """Convert PDF to markdown format."""
 
-    def __init__(self, pdf_path: Path):
+    def __init__(self, pdf_path: Path, tables: bool = False):
         """Initialize converter with PDF path.
 
         Args:
             pdf_path: Path to PDF file
+            tables: Also extract tables (slower)
         """
         self.pdf_path = pdf_path
         self.pdf_name = pdf_path.stem
+        self.extract_tables = tables
+        # Tables found by iter_markdown, in page order
+        self.tables: List[Dict] = []
+
+    def _header(self) -> str:
+        """Markdown title block that precedes the first page."""
+        return (
+            f"# {self.pdf_name}\n\n"
+            f"**Source PDF**: {self.pdf_path.name}\n\n"
+            "---\n\n"
+        )
+
+    def iter_markdown(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield markdown one page at a time.
+
+        The title block is yielded first when the range starts at page 0, so
+        the chunks of consecutive ranges concatenate to the full document.
 
-    def convert_to_markdown(self) -> str:
+        Args:
+            start: First page index (0-based)
+            stop: Page index to stop before (defaults to the last page)
+
+        Yields:
+            Markdown chunks
+        """
+        if start == 0:
+            yield self._header()
+
+        doc = fitz.open(self.pdf_path)
+        try:
+            stop = doc.page_count if stop is None else min(stop, doc.page_count)
+            for page_index in range(start, stop):
+                page = doc[page_index]
+                text = self._clean_text(page.get_text())
+                yield f"## Page {page_index + 1}\n\n{text}\n\n"
+                if self.extract_tables:
+                    for table in self._page_tables(page):
+                        self.tables.append(table)
+                        yield f"### Table {table['page']}.{table['index']}\n\n{tsv_block(table['rows'])}\n\n"
+        finally:
+            doc.close()
+
+    def _page_tables(self, page) -> List[Dict]:
+        """Find the tables on a page.
+
+        Returns:
+            Tables with page number, index on the page, bounding box and
+            cleaned rows (header first); tables under 2 rows or columns are
+            dropped
+        """
+        tables = []
+        for table in page.find_tables().tables:
+            rows = [[clean_cell(cell) for cell in row] for row in table.extract()]
+            if table.header.external:
+                rows.insert(0, [clean_cell(name) for name in table.header.names])
+            # Drop columns that are empty in every row
+            keep = [i for i in range(max((len(row) for row in rows), default=0))
+                    if any(i < len(row) and row[i] for row in rows)]
+            rows = [[row[i] if i < len(row) else '' for i in keep] for row in rows]
+            rows = [row for row in rows if any(row)]
+            if len(rows) < 2 or len(keep) < 2:
+                continue
+            tables.append({
+                'page': page.number + 1,
+                'index': len(tables) + 1,
+                'bbox': [round(v, 1) for v in table.bbox],
+                'rows': rows,
+            })
+        return tables
+
+    def write_tables(self, markdown_path: Path) -> None:
+        """Write the extracted tables column by column to the sidecar file."""
+        sidecar = {
+            'pdf': self.pdf_path.name,
+            'tables': [
+                {
+                    'page': table['page'],
+                    'index': table['index'],
+                    'bbox': table['bbox'],
+                    'columns': [
+                        {'name': name, 'values': [row[i] for row in table['rows'][1:]]}
+                        for i, name in enumerate(table['rows'][0])
+                    ],
+                }
+                for table in self.tables
+            ],
+        }
+        _write_atomic(tables_path(markdown_path), json.dumps(sidecar, indent=1, ensure_ascii=False))
+
+    def convert_to_markdown(self, strict: bool = False) -> str:
         """Convert PDF to markdown format.
 
+        Args:
+            strict: Raise conversion errors instead of returning placeholder text
+
         Returns:
             Markdown-formatted text content
         """
@@ -39,34 +253,90 @@ class PDFToMarkdownConverter:
             return self._fallback_text_extraction()
 
         try:
-            doc = fitz.open(self.pdf_path)
-            markdown_content = []
-
-            # Add title from filename
-            markdown_content.append(f"# {self.pdf_name}\n\n")
-            markdown_content.append(f"**Source PDF**: {self.pdf_path.name}\n\n")
-            markdown_content.append("---\n\n")
+            return "".join(self.iter_markdown())
+        except Exception as e:
+            if strict:
+                raise
+            print(f"Error converting {self.pdf_path.name}: {e}")
+            return self._fallback_text_extraction()
 
-            # Extract text from each page
-            for page_num, page in enumerate(doc, 1):
-                # Get page text
-                text = page.get_text()
+    def page_count(self) -> int:
+        """Number of pages in the PDF."""
+        with fitz.open(self.pdf_path) as doc:
+            return doc.page_count
 
-                # Clean up text
-                text = self._clean_text(text)
+    def write_markdown(
+        self,
+        output_path: Path,
+        page_workers: int = 1,
+        strict: bool = False
+    ) -> int:
+        """Stream markdown to output_path as pages are converted.
 
-                # Add page marker
-                markdown_content.append(f"## Page {page_num}\n\n")
-                markdown_content.append(text)
-                markdown_content.append("\n\n")
+        Each page is written as soon as it is extracted, so memory use does
+        not grow with page count. With page_workers > 1, large PDFs are split
+        into page ranges converted by separate processes (each opening its own
+        document) and the parts are concatenated in page order. Output is
+        written to a temporary file and moved into place when complete.
 
-            doc.close()
+        With table extraction enabled the table sidecar is written too;
+        otherwise a sidecar left by an earlier conversion is removed.
 
-            return "".join(markdown_content)
+        Args:
+            output_path: Markdown file to write
+            page_workers: Processes to split one PDF across
+            strict: Raise conversion errors instead of writing placeholder text
 
+        Returns:
+            Number of characters written
+        """
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        self.tables = []
+        try:
+            if not HAS_PYMUPDF:
+                raise RuntimeError("PyMuPDF not installed")
+            ranges = page_ranges(self.page_count(), page_workers) if page_workers > 1 else []
+            if len(ranges) > 1:
+                chars, self.tables = self._write_parallel(tmp_path, ranges)
+            else:
+                chars, self.tables = _write_page_range(self.pdf_path, 0, None, tmp_path, self.extract_tables)
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            if strict:
+                raise
             print(f"Error converting {self.pdf_path.name}: {e}")
-            return self._fallback_text_extraction()
+            content = self._fallback_text_extraction()
+            tmp_path.write_text(content, encoding='utf-8')
+            chars = len(content)
+
+        os.replace(tmp_path, output_path)
+        if self.extract_tables:
+            self.write_tables(output_path)
+        else:
+            tables_path(output_path).unlink(missing_ok=True)
+        return chars
+
+    def _write_parallel(self, tmp_path: Path, ranges: List[Tuple[int, int]]) -> Tuple[int, List[Dict]]:
+        """Convert page ranges in worker processes and merge them in order."""
+        part_paths = [tmp_path.with_name(f"{tmp_path.name}.{i}") for i in range(len(ranges))]
+        try:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(_write_page_range, self.pdf_path, start, stop, part_path, self.extract_tables)
+                    for (start, stop), part_path in zip(ranges, part_paths)
+                ]
+                results = [future.result() for future in futures]
+            chars = sum(part_chars for part_chars, _ in results)
+            tables = [table for _, part_tables in results for table in part_tables]
+
+            with open(tmp_path, 'wb') as out:
+                for part_path in part_paths:
+                    with open(part_path, 'rb') as part:
+                        shutil.copyfileobj(part, out)
+            return chars, tables
+        finally:
+            for part_path in part_paths:
+                part_path.unlink(missing_ok=True)
 
     def _clean_text(self, text: str) -> str:
         """Clean extracted text.
@@ -78,10 +348,10 @@ class PDFToMarkdownConverter:
             Cleaned text
         """
         # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = EXCESS_BLANK_LINES.sub('\n\n', text)
 
         # Fix hyphenation at line breaks
-        text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+        text = LINE_BREAK_HYPHEN.sub(r'\1\2', text)
 
         # Preserve chemical formulas and Greek letters
         # (already handled by PyMuPDF in most cases)
@@ -97,12 +367,19 @@ class PDFToMarkdownConverter:
         return f"# {self.pdf_name}\n\n**Note**: PyMuPDF not available. Using placeholder.\n\nInstall PyMuPDF with: `uv pip install pymupdf`\n"
 
 
-def convert_pdf_to_markdown(pdf_path: Path, output_path: Optional[Path] = None) -> Path:
-    """Convert a single PDF to markdown.
+def convert_pdf_to_markdown(
+    pdf_path: Path,
+    output_path: Optional[Path] = None,
+    page_workers: int = 1,
+    tables: bool = False
+) -> Path:
+    """Convert a single PDF to markdown, streaming pages to the output file.
 
     Args:
         pdf_path: Path to input PDF file
         output_path: Optional output path (defaults to same name with .md extension)
+        page_workers: Processes to split the PDF's pages across
+        tables: Also extract tables into TSV blocks and a sidecar file
 
     Returns:
         Path to output markdown file
@@ -112,47 +389,259 @@ def convert_pdf_to_markdown(pdf_path: Path, output_path: Optional[Path] = None)
 
     print(f"Converting {pdf_path.name} to markdown...")
 
-    converter = PDFToMarkdownConverter(pdf_path)
-    markdown_content = converter.convert_to_markdown()
-
-    # Write markdown file
-    output_path.write_text(markdown_content, encoding='utf-8')
+    converter = PDFToMarkdownConverter(pdf_path, tables=tables)
+    chars = converter.write_markdown(output_path, page_workers=page_workers)
 
     print(f"  Saved to: {output_path}")
-    print(f"  Size: {len(markdown_content)} characters")
+    print(f"  Size: {chars} characters")
+    if tables:
+        print(f"  Tables: {len(converter.tables)} → {tables_path(output_path)}")
 
     return output_path
 
 
-def batch_convert_pdfs(pdf_dir: Path, output_dir: Optional[Path] = None) -> List[Path]:
-    """Convert all PDFs in directory to markdown.
+def _write_atomic(path: Path, content: str) -> None:
+    """Write text via a temporary file so readers never see partial output."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Compute the SHA-256 hex digest of a file.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Dict]:
+    """Load the conversion manifest.
+
+    Entries from another converter version are dropped, so their PDFs are
+    converted again.
+
+    Args:
+        manifest_path: Manifest JSON file
+
+    Returns:
+        Dictionary mapping PDF file name to its manifest entry
+    """
+    if not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+    if manifest.get('converter_version') != CONVERTER_VERSION:
+        return {}
+    return manifest.get('files', {})
+
+
+def save_manifest(manifest_path: Path, entries: Dict[str, Dict]) -> None:
+    """Write the conversion manifest atomically."""
+    manifest = {
+        'converter_version': CONVERTER_VERSION,
+        'updated': datetime.now().isoformat(timespec='seconds'),
+        'files': dict(sorted(entries.items())),
+    }
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2))
+
+
+def _pdf_hash(pdf_path: Path, entry: Optional[Dict]) -> str:
+    """Hash a PDF, reusing the manifest hash when size and mtime are unchanged."""
+    stat = pdf_path.stat()
+    if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return entry['sha256']
+    return file_sha256(pdf_path)
+
+
+def _remove_partial_output(output_path: Path) -> None:
+    """Remove the temp file (and page-range parts) of an aborted conversion."""
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+    for part_path in output_path.parent.glob(glob.escape(tmp_path.name) + '.*'):
+        part_path.unlink(missing_ok=True)
+
+
+def _convert_worker(pdf_path: Path, output_path: Path, tables: bool, conn) -> None:
+    """Convert one PDF in a worker process and report the outcome over conn."""
+    try:
+        chars = PDFToMarkdownConverter(pdf_path, tables=tables).write_markdown(output_path, strict=True)
+        conn.send(('ok', chars, None))
+    except Exception as e:
+        conn.send(('failed', 0, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def run_conversions(
+    jobs: List[Tuple[Path, Path]],
+    workers: int,
+    timeout: float,
+    tables: bool = False
+) -> Iterator[Tuple[Path, Path, str, int, Optional[str]]]:
+    """Convert PDFs in isolated worker processes.
+
+    Each PDF gets its own process, so a crash (e.g. a segfault in MuPDF) or
+    a hang only affects that file. Processes running longer than timeout are
+    killed.
+
+    Args:
+        jobs: (pdf_path, output_path) pairs
+        workers: Maximum concurrent processes
+        timeout: Seconds allowed per PDF
+        tables: Also extract tables
+
+    Yields:
+        (pdf_path, output_path, status, characters, error) as conversions
+        finish; status is 'ok', 'failed', 'crashed' or 'timeout'
+    """
+    ctx = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+    pending = deque(jobs)
+    running = {}  # connection -> (pdf_path, output_path, process, deadline)
+
+    while pending or running:
+        while pending and len(running) < workers:
+            pdf_path, output_path = pending.popleft()
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_convert_worker, args=(pdf_path, output_path, tables, send_conn))
+            process.start()
+            send_conn.close()
+            running[recv_conn] = (pdf_path, output_path, process, time.monotonic() + timeout)
+
+        for conn in wait(list(running), timeout=1.0):
+            pdf_path, output_path, process, _ = running.pop(conn)
+            try:
+                status, chars, error = conn.recv()
+            except EOFError:
+                process.join()
+                _remove_partial_output(output_path)
+                status, chars, error = 'crashed', 0, f"worker exited with code {process.exitcode}"
+            conn.close()
+            process.join()
+            yield pdf_path, output_path, status, chars, error
+
+        now = time.monotonic()
+        for conn, (pdf_path, output_path, process, deadline) in list(running.items()):
+            if now > deadline:
+                process.kill()
+                process.join()
+                conn.close()
+                _remove_partial_output(output_path)
+                del running[conn]
+                yield pdf_path, output_path, 'timeout', 0, f"exceeded {timeout:.0f}s"
+
+
+def batch_convert_pdfs(
+    pdf_dir: Path,
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    force: bool = False,
+    retry_failed: bool = False,
+    tables: bool = False
+) -> List[Path]:
+    """Convert all PDFs in directory to markdown, skipping unchanged ones.
 
     Args:
         pdf_dir: Directory containing PDF files
         output_dir: Optional output directory (defaults to same directory)
+        workers: Worker processes (defaults to the CPU count)
+        timeout: Seconds allowed per PDF before its worker is killed
+        force: Reconvert every PDF regardless of the manifest
+        retry_failed: Retry PDFs that failed or timed out with the same content
+        tables: Also extract tables; PDFs converted with the other setting
+            are reconverted
 
     Returns:
-        List of paths to generated markdown files
+        List of paths to up-to-date markdown files (converted or skipped)
     """
     if output_dir is None:
         output_dir = pdf_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
 
-    pdf_files = list(pdf_dir.glob("*.pdf"))
+    pdf_files = sorted(pdf_dir.glob("*.pdf"))
 
     if not pdf_files:
         print(f"No PDF files found in {pdf_dir}")
         return []
 
-    print(f"Found {len(pdf_files)} PDF files to convert\n")
+    manifest_path = output_dir / MANIFEST_NAME
+    entries = {} if force else load_manifest(manifest_path)
 
     markdown_files = []
+    jobs = []
+    hashes = {}
+    skipped_failed = 0
     for pdf_file in pdf_files:
         output_path = output_dir / f"{pdf_file.stem}.md"
-        md_path = convert_pdf_to_markdown(pdf_file, output_path)
-        markdown_files.append(md_path)
-        print()
-
-    print(f"Converted {len(markdown_files)} PDFs to markdown")
+        entry = entries.get(pdf_file.name)
+        sha256 = _pdf_hash(pdf_file, entry)
+        hashes[pdf_file.name] = sha256
+
+        if entry and entry.get('sha256') == sha256 and entry.get('tables', False) == tables:
+            if entry.get('status') == 'ok' and output_path.exists():
+                markdown_files.append(output_path)
+                continue
+            if entry.get('status') != 'ok' and not retry_failed:
+                skipped_failed += 1
+                continue
+        jobs.append((pdf_file, output_path))
+
+    print(f"Found {len(pdf_files)} PDF files: {len(jobs)} to convert, "
+          f"{len(markdown_files)} up to date, {skipped_failed} previously failed")
+    if not jobs:
+        return markdown_files
+    print(f"Converting with {min(workers, len(jobs))} worker process(es), {timeout:.0f}s timeout per PDF\n")
+
+    failed = 0
+    try:
+        for done, (pdf_file, output_path, status, chars, error) in enumerate(
+            run_conversions(jobs, workers, timeout, tables), 1
+        ):
+            stat = pdf_file.stat()
+            entries[pdf_file.name] = {
+                'sha256': hashes[pdf_file.name],
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'markdown': output_path.name,
+                'status': status,
+                'characters': chars,
+                'converted': datetime.now().isoformat(timespec='seconds'),
+                'tables': tables,
+            }
+            if error:
+                entries[pdf_file.name]['error'] = error
+
+            if status == 'ok':
+                markdown_files.append(output_path)
+                print(f"[{done}/{len(jobs)}] {pdf_file.name} → {output_path.name} ({chars} characters)")
+            else:
+                failed += 1
+                print(f"[{done}/{len(jobs)}] {pdf_file.name}: {status} ({error})")
+
+            # Persist progress so an interrupted batch resumes where it stopped
+            if done % 20 == 0:
+                save_manifest(manifest_path, entries)
+    finally:
+        save_manifest(manifest_path, entries)
+
+    print(f"\nConverted {len(jobs) - failed} PDFs to markdown ({failed} failed)")
+    if failed:
+        print("Failed PDFs are skipped until they change; use --retry-failed to retry them")
     return markdown_files
 
 
@@ -172,6 +661,12 @@ def main():
         type=Path,
         help='Output markdown file path'
     )
+    parser.add_argument(
+        '--page-workers',
+        type=int,
+        default=1,
+        help='Split a single large PDF across this many processes by page range'
+    )
     parser.add_argument(
         '--batch',
         type=Path,
@@ -182,15 +677,50 @@ def main():
         type=Path,
         help='Output directory for batch conversion'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for batch conversion (default: CPU count)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f'Seconds allowed per PDF in batch mode (default: {DEFAULT_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reconvert all PDFs, ignoring the manifest'
+    )
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help='Retry PDFs that previously failed or timed out'
+    )
+    parser.add_argument(
+        '--tables',
+        action='store_true',
+        help='Also extract tables as TSV blocks plus a <name>.tables.json sidecar (slower)'
+    )
 
     args = parser.parse_args()
 
     if args.batch:
         # Batch conversion
-        batch_convert_pdfs(args.batch, args.output_dir)
+        batch_convert_pdfs(
+            args.batch,
+            args.output_dir,
+            workers=args.workers,
+            timeout=args.timeout,
+            force=args.force,
+            retry_failed=args.retry_failed,
+            tables=args.tables
+        )
     elif args.pdf_path:
         # Single file conversion
-        convert_pdf_to_markdown(args.pdf_path, args.output)
+        convert_pdf_to_markdown(args.pdf_path, args.output, page_workers=args.page_workers, tables=args.tables)
     else:
         parser.print_help()
         print("\nError: Either provide a PDF path or use --batch")
@@ -0,0 +1,326 @@
+"""Persistent inverted index over the publication markdown corpus.
+
+Maps every word token of the (lowercased) markdown files in a directory to
+the documents containing it. Keyword lookups first narrow the documents down
+with postings lists, then confirm the exact match on the few candidates, and
+the result for each (keyword, match mode) is memoized. Cross-referencing many
+sheet rows against many papers therefore costs one lookup per distinct
+keyword instead of one full-text regex search per row and paper.
+
+The index is stored as JSON next to the markdown files and updated
+incrementally: only files whose size or modification time changed are
+re-tokenized.
+
+Match modes mirror the regular expressions used for relevance scoring:
+- 'word':      \\bkeyword\\b
+- 'prefix':    \\bkeyword
+- 'substring': keyword anywhere
+"""
+
+import json
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    from src.markdown_corpus import MarkdownCorpus
+except ImportError:
+    from markdown_corpus import MarkdownCorpus
+
+
+INDEX_FORMAT_VERSION = 1
+
+DEFAULT_INDEX_NAME = "publication_index.json"
+
+MATCH_MODES = ('word', 'prefix', 'substring')
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def keyword_runs(keyword: str, mode: str) -> List[Tuple[str, bool, bool]]:
+    """Split a keyword into word-character runs with their closure on each side.
+
+    A run is closed on a side when the match guarantees a word boundary
+    there: a non-word character inside the keyword, or a regex \\b at the
+    keyword's edge. A run closed on both sides must be a whole token of the
+    document, closed on the left only a token prefix, on the right only a
+    token suffix, and otherwise a token substring.
+
+    Args:
+        keyword: Lowercased keyword
+        mode: Match mode ('word', 'prefix' or 'substring')
+
+    Returns:
+        List of (run, left_closed, right_closed)
+
+    Examples:
+        >>> keyword_runs("pseudomonas putida", "word")
+        [('pseudomonas', True, True), ('putida', True, True)]
+        >>> keyword_runs("eu3+", "prefix")
+        [('eu3', True, True)]
+        >>> keyword_runs("methane oxidation", "substring")
+        [('methane', False, True), ('oxidation', True, False)]
+    """
+    leading = mode in ('word', 'prefix')
+    trailing = mode == 'word'
+    runs = []
+    for match in TOKEN_RE.finditer(keyword):
+        start, end = match.span()
+        left_closed = start > 0 or leading
+        right_closed = end < len(keyword) or trailing
+        runs.append((match.group(0), left_closed, right_closed))
+    return runs
+
+
+def _is_word_char(char: str) -> bool:
+    """Same test as the regex class \\w for str patterns."""
+    return char.isalnum() or char == '_'
+
+
+def keyword_in_text(keyword: str, text: str, mode: str) -> bool:
+    """Check a keyword against lowercased text with the given match mode.
+
+    Equivalent to re.search with \\b anchors, but finds candidate positions
+    with str.find and only tests the boundary characters.
+
+    Examples:
+        >>> keyword_in_text("xoxf", "the xoxf gene", "word")
+        True
+        >>> keyword_in_text("xox", "the xoxf gene", "word")
+        False
+        >>> keyword_in_text("xox", "the xoxf gene", "prefix")
+        True
+        >>> keyword_in_text("oxf", "the xoxf gene", "substring")
+        True
+    """
+    if mode == 'substring' or not keyword:
+        return keyword in text
+
+    first_is_word = _is_word_char(keyword[0])
+    last_is_word = _is_word_char(keyword[-1])
+    pos = text.find(keyword)
+    while pos != -1:
+        before_is_word = pos > 0 and _is_word_char(text[pos - 1])
+        if before_is_word != first_is_word:
+            if mode == 'prefix':
+                return True
+            end = pos + len(keyword)
+            after_is_word = end < len(text) and _is_word_char(text[end])
+            if after_is_word != last_is_word:
+                return True
+        pos = text.find(keyword, pos + 1)
+    return False
+
+
+class PublicationIndex:
+    """Token → document index for the markdown files in one directory.
+
+    Examples:
+        >>> index = PublicationIndex(Path("data/publications"))  # doctest: +SKIP
+        >>> index.update()  # doctest: +SKIP
+        >>> "PMID_32120220.md" in index.find("pseudomonas", "word")  # doctest: +SKIP
+        True
+    """
+
+    def __init__(
+        self,
+        markdown_dir: Path,
+        index_path: Optional[Path] = None,
+        corpus: Optional[MarkdownCorpus] = None
+    ):
+        """Initialize index and load the stored copy, if any.
+
+        Args:
+            markdown_dir: Directory containing markdown files
+            index_path: Index file (defaults to markdown_dir/publication_index.json)
+            corpus: Updated corpus store to read documents from (default: read files)
+        """
+        self.markdown_dir = Path(markdown_dir)
+        self.corpus = corpus
+        self.index_path = Path(index_path) if index_path else self.markdown_dir / DEFAULT_INDEX_NAME
+        self.documents: Dict[str, Dict] = {}
+        self._postings: Optional[Dict[str, Set[str]]] = None
+        self._sorted_tokens: List[str] = []
+        self._sorted_reversed: List[str] = []
+        self._token_blob = ''
+        self._token_offsets: List[int] = []
+        self._content: Dict[str, str] = {}
+        self._run_cache: Dict[Tuple[str, bool, bool], FrozenSet[str]] = {}
+        self._find_cache: Dict[Tuple[str, str], FrozenSet[str]] = {}
+        self._dirty = False
+
+        if self.index_path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        """Read the stored index (ignored if unreadable or another version)."""
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  ⚠️  Ignoring unreadable index {self.index_path}: {e}")
+            return
+        if data.get('format_version') == INDEX_FORMAT_VERSION:
+            self.documents = data.get('documents', {})
+
+    def save(self) -> None:
+        """Write the index atomically if it changed."""
+        if not self._dirty:
+            return
+        data = {'format_version': INDEX_FORMAT_VERSION, 'documents': self.documents}
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def update(self) -> Tuple[int, int]:
+        """Re-index new or changed markdown files and drop deleted ones.
+
+        Returns:
+            (documents indexed, documents removed)
+        """
+        current = {path.name: path for path in self.markdown_dir.glob('*.md')}
+        removed = [name for name in self.documents if name not in current]
+        for name in removed:
+            del self.documents[name]
+
+        indexed = 0
+        for name, path in sorted(current.items()):
+            stat = path.stat()
+            entry = self.documents.get(name)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                continue
+            raw = self._read(path)
+            content = raw.lower()
+            self.documents[name] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'length': len(raw),
+                'tokens': sorted(set(TOKEN_RE.findall(content))),
+            }
+            self._content[name] = content
+            indexed += 1
+
+        if indexed or removed:
+            self._dirty = True
+            self._postings = None
+            self._run_cache.clear()
+            self._find_cache.clear()
+        return indexed, len(removed)
+
+    def _read(self, path: Path) -> str:
+        """Read a markdown file ('' if unreadable)."""
+        if self.corpus is not None and path.name in self.corpus:
+            return self.corpus.text(path.name)
+        try:
+            return path.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"  ⚠️  Error reading {path}: {e}")
+            return ""
+
+    def content(self, name: str) -> str:
+        """Lowercased content of an indexed document (read once)."""
+        if name not in self._content:
+            self._content[name] = self._read(self.markdown_dir / name).lower()
+        return self._content[name]
+
+    def length(self, name: str) -> int:
+        """Character length of an indexed document (0 if not indexed)."""
+        entry = self.documents.get(name)
+        return entry['length'] if entry else 0
+
+    def _build_postings(self) -> Dict[str, Set[str]]:
+        """Build token → documents postings from the per-document token lists."""
+        if self._postings is None:
+            postings: Dict[str, Set[str]] = defaultdict(set)
+            for name, entry in self.documents.items():
+                for token in entry['tokens']:
+                    postings[token].add(name)
+            self._postings = dict(postings)
+            self._sorted_tokens = sorted(self._postings)
+            self._sorted_reversed = sorted(token[::-1] for token in self._postings)
+            # All tokens in one string, for fast substring search
+            self._token_blob = '\n'.join(self._sorted_tokens)
+            self._token_offsets = []
+            offset = 0
+            for token in self._sorted_tokens:
+                self._token_offsets.append(offset)
+                offset += len(token) + 1
+        return self._postings
+
+    def _documents_for_run(self, run: str, left_closed: bool, right_closed: bool) -> FrozenSet[str]:
+        """Documents containing a token compatible with one keyword run."""
+        key = (run, left_closed, right_closed)
+        if key in self._run_cache:
+            return self._run_cache[key]
+
+        postings = self._build_postings()
+        if left_closed and right_closed:
+            tokens = [run] if run in postings else []
+        elif left_closed:
+            tokens = []
+            i = bisect_left(self._sorted_tokens, run)
+            while i < len(self._sorted_tokens) and self._sorted_tokens[i].startswith(run):
+                tokens.append(self._sorted_tokens[i])
+                i += 1
+        elif right_closed:
+            reversed_run = run[::-1]
+            tokens = []
+            i = bisect_left(self._sorted_reversed, reversed_run)
+            while i < len(self._sorted_reversed) and self._sorted_reversed[i].startswith(reversed_run):
+                tokens.append(self._sorted_reversed[i][::-1])
+                i += 1
+        else:
+            tokens = []
+            pos = self._token_blob.find(run)
+            while pos != -1:
+                i = bisect_right(self._token_offsets, pos) - 1
+                tokens.append(self._sorted_tokens[i])
+                # Continue after this token; its other matches add nothing
+                pos = self._token_blob.find(run, self._token_offsets[i] + len(self._sorted_tokens[i]) + 1)
+
+        documents = frozenset().union(*(postings[token] for token in tokens)) if tokens else frozenset()
+        self._run_cache[key] = documents
+        return documents
+
+    def find(self, keyword: str, mode: str) -> FrozenSet[str]:
+        """Find the documents matching a lowercased keyword.
+
+        Args:
+            keyword: Lowercased keyword
+            mode: 'word', 'prefix' or 'substring'
+
+        Returns:
+            Names of matching documents
+        """
+        key = (keyword, mode)
+        if key in self._find_cache:
+            return self._find_cache[key]
+
+        runs = keyword_runs(keyword, mode)
+        if len(runs) == 1 and runs[0][0] == keyword:
+            # A single-token keyword matches exactly the documents with a
+            # compatible token, so no text needs to be checked
+            result = self._documents_for_run(*runs[0])
+            self._find_cache[key] = result
+            return result
+
+        candidates: Optional[FrozenSet[str]] = None
+        for run in runs:
+            documents = self._documents_for_run(*run)
+            candidates = documents if candidates is None else candidates & documents
+            if not candidates:
+                break
+        if candidates is None:
+            # No word characters to look up; check every document
+            candidates = frozenset(self.documents)
+
+        result = frozenset(
+            name for name in candidates if keyword_in_text(keyword, self.content(name), mode)
+        )
+        self._find_cache[key] = result
+        return result
@@ -1,13 +1,18 @@
 """Publication search functions for extending PFAS biodegradation literature."""
 
-import time
 from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
-import requests
 from pathlib import Path
 import json
 from Bio import Entrez
 
+try:
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import entrez_call, snapshot_get
+except ImportError:
+    from apis.rate_limits import throttle
+    from apis.snapshots import entrez_call, snapshot_get
+
 
 def search_pubmed_publications() -> List[Dict]:
     """Search PubMed for PFAS biodegradation publications.
@@ -31,7 +36,9 @@ def search_pubmed_publications() -> List[Dict]:
     
     try:
         for term in search_terms[:2]:  # Limit to avoid rate limits
-            handle = Entrez.esearch(
+            throttle('ncbi')
+            handle = entrez_call(
+                Entrez.esearch,
                 db="pubmed",
                 term=term,
                 retmax=10,
@@ -42,7 +49,9 @@ def search_pubmed_publications() -> List[Dict]:
             
             if search_results["IdList"]:
                 # Fetch publication details
-                handle = Entrez.efetch(
+                throttle('ncbi')
+                handle = entrez_call(
+                    Entrez.efetch,
                     db="pubmed",
                     id=",".join(search_results["IdList"][:5]),
                     rettype="abstract",
@@ -63,7 +72,8 @@ def search_pubmed_publications() -> List[Dict]:
                         # Try to get PMC ID for full text
                         pmc_url = f"https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/?ids={pmid}&format=json"
                         try:
-                            pmc_response = requests.get(pmc_url, timeout=5)
+                            throttle('ncbi_anonymous')
+                            pmc_response = snapshot_get(pmc_url, timeout=5)
                             if pmc_response.status_code == 200:
                                 pmc_data = pmc_response.json()
                                 if pmc_data["records"] and "pmcid" in pmc_data["records"][0]:
@@ -82,8 +92,6 @@ def search_pubmed_publications() -> List[Dict]:
                     except KeyError:
                         continue
             
-            time.sleep(1)  # Rate limiting
-            
     except Exception as e:
         print(f"Error searching PubMed: {e}")
     
@@ -12,6 +12,11 @@ from urllib.parse import urlencode
 
 import pandas as pd
 
+try:
+    from src.apis.kegg_client import KEGGClient, strip_db_prefix
+except ImportError:
+    from apis.kegg_client import KEGGClient, strip_db_prefix
+
 
 def parse_ec_numbers(enzyme_class_str: str) -> List[str]:
     """Extract EC numbers from enzyme class string.
@@ -203,22 +208,41 @@ def search_rhea_reactions(query: str, max_results: int = 10) -> List[Dict]:
     return []
 
 
-def search_kegg_reactions(query: str, max_results: int = 10) -> List[Dict]:
+def search_kegg_reactions(
+    query: str,
+    max_results: int = 10,
+    kegg_client: Optional[KEGGClient] = None
+) -> List[Dict]:
     """Search KEGG Reaction database.
 
-    Note: This is a placeholder for future implementation. The KEGG API
-    has usage restrictions and requires careful rate limiting.
+    Matches the query against the locally cached KEGG `list/reaction` table
+    (downloaded once by KEGGClient) and joins EC numbers from
+    `link/enzyme/reaction`.
 
     Args:
         query: Search query string
         max_results: Maximum number of results to return
+        kegg_client: KEGG client to use (default: new client with default cache)
 
     Returns:
         List of reaction dictionaries
     """
-    print("  KEGG Reaction API search not yet implemented")
-    print("  Future: Use KEGG REST API with rate limiting")
-    return []
+    client = kegg_client or KEGGClient()
+    enzyme_links = client.link_table('enzyme', 'reaction')
+
+    reactions = []
+    for reaction_id, description in client.find_local('reaction', query)[:max_results]:
+        ec_numbers = [
+            strip_db_prefix(ec) for ec in enzyme_links.get(f"rn:{reaction_id}", [])
+        ]
+        reactions.append({
+            'kegg_reaction_id': reaction_id,
+            'description': description,
+            'ec_number': ';'.join(ec_numbers),
+            'url': get_kegg_reaction_url(reaction_id)
+        })
+
+    return reactions
 
 
 def extend_reactions_table(
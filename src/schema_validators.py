@@ -0,0 +1,203 @@
+"""Per-slot record validators compiled from the LinkML schema.
+
+tsv_to_linkml checks every record it emits against these validators instead
+of instantiating the generated linkml_models dataclasses. Each slot of each
+class is compiled once into a function that coerces a value to the slot's
+range, as the generated __post_init__ methods do (str() for strings, int()
+for integers, ...), and checks it against the slot's pattern and, for enum
+ranges, its permissible values. A class validator adds the required-slot
+check and reports slots the class does not define.
+
+Problems are returned as messages rather than raised, so a whole table can
+be converted and its issues reported together.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from linkml_runtime.utils.schemaview import SchemaView
+
+DEFAULT_SCHEMA = Path("schema/pfas_biodegradation.yaml")
+
+# A slot check returns the coerced value and an error message (or None)
+SlotCheck = Callable[[Any], Tuple[Any, Optional[str]]]
+
+URI_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:\S+$')
+
+
+def _to_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(value)
+    return int(value)
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError(value)
+    return float(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('true', 'yes', '1'):
+        return True
+    if text in ('false', 'no', '0'):
+        return False
+    raise ValueError(value)
+
+
+def _to_uri(value: Any) -> str:
+    value = _to_str(value)
+    if not URI_PATTERN.match(value):
+        raise ValueError(value)
+    return value
+
+
+# LinkML type (by its base) → coercion
+TYPE_COERCIONS: Dict[str, Callable[[Any], Any]] = {
+    'str': _to_str,
+    'int': _to_int,
+    'float': _to_float,
+    'Decimal': _to_float,
+    'Bool': _to_bool,
+    'URI': _to_uri,
+    'URIorCURIE': _to_str,
+}
+
+
+def compile_slot(schema: SchemaView, slot) -> SlotCheck:
+    """Compile the check of one induced slot.
+
+    Args:
+        schema: Schema the slot belongs to
+        slot: Induced slot definition (from SchemaView.class_induced_slots)
+
+    Returns:
+        Function coercing a value and returning (value, error)
+    """
+    slot_range = slot.range or schema.schema.default_range or 'string'
+    pattern = re.compile(slot.pattern) if slot.pattern else None
+
+    if slot_range in schema.all_enums():
+        permissible = set(schema.get_enum(slot_range).permissible_values)
+        coerce = _to_str
+    elif slot_range in schema.all_types():
+        permissible = None
+        coerce = TYPE_COERCIONS.get(schema.induced_type(slot_range).base, _to_str)
+    else:
+        # Class ranges (inlined records) are not checked here
+        permissible = None
+        coerce = None
+
+    def check_one(value: Any) -> Tuple[Any, Optional[str]]:
+        if coerce is None:
+            return value, None
+        try:
+            value = coerce(value)
+        except (TypeError, ValueError):
+            return value, f"'{value}' is not a valid {slot_range}"
+        if permissible is not None and value not in permissible:
+            return value, f"'{value}' is not a permissible {slot_range} value"
+        if pattern is not None and not pattern.search(str(value)):
+            return value, f"'{value}' does not match {slot.pattern}"
+        return value, None
+
+    if not slot.multivalued:
+        return check_one
+
+    def check_many(values: Any) -> Tuple[Any, Optional[str]]:
+        if not isinstance(values, list):
+            values = [values]
+        checked = []
+        error = None
+        for value in values:
+            value, value_error = check_one(value)
+            checked.append(value)
+            error = error or value_error
+        return checked, error
+
+    return check_many
+
+
+class ClassValidator:
+    """Compiled slot checks of one schema class."""
+
+    def __init__(self, schema: SchemaView, class_name: str):
+        """Compile the induced slots of a class.
+
+        Args:
+            schema: Schema defining the class
+            class_name: Class to validate records of
+        """
+        self.class_name = class_name
+        self.checks: Dict[str, SlotCheck] = {}
+        self.required: List[str] = []
+        for slot in schema.class_induced_slots(class_name):
+            self.checks[slot.name] = compile_slot(schema, slot)
+            if slot.required or slot.identifier:
+                self.required.append(slot.name)
+
+    def validate(self, record: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Coerce a record's values to their slot ranges and check them.
+
+        Args:
+            record: Slot → value (empty slots left out)
+
+        Returns:
+            (coerced record, error messages)
+
+        Examples:
+            >>> validator = load_validators()['GenomeRecord']  # doctest: +SKIP
+            >>> validator.validate({'scientific_name': 'Ralstonia', 'ncbi_taxon_id': 1076})  # doctest: +SKIP
+            ({'scientific_name': 'Ralstonia', 'ncbi_taxon_id': '1076'}, [])
+        """
+        errors = [
+            f"missing required slot '{name}'" for name in self.required
+            if record.get(name) in (None, '', [])
+        ]
+        checked = {}
+        for name, value in record.items():
+            check = self.checks.get(name)
+            if check is None:
+                errors.append(f"slot '{name}' is not defined for {self.class_name}")
+                checked[name] = value
+                continue
+            checked[name], error = check(value)
+            if error:
+                errors.append(f"{name}: {error}")
+        return checked, errors
+
+
+@lru_cache(maxsize=None)
+def load_schema(schema_path: Union[str, Path] = DEFAULT_SCHEMA) -> SchemaView:
+    """Schema view of a schema file, loaded once per process."""
+    return SchemaView(str(schema_path))
+
+
+@lru_cache(maxsize=None)
+def load_validators(schema_path: Union[str, Path] = DEFAULT_SCHEMA) -> Dict[str, ClassValidator]:
+    """Validators of all classes of a schema, compiled once per process."""
+    schema = load_schema(schema_path)
+    return {class_name: ClassValidator(schema, class_name) for class_name in schema.all_classes()}
+
+
+def load_table_classes(schema_path: Union[str, Path] = DEFAULT_SCHEMA) -> Dict[str, str]:
+    """Record class of each table slot of the schema's container (tree_root) class."""
+    schema = load_schema(schema_path)
+    roots = [c.name for c in schema.all_classes().values() if c.tree_root]
+    if not roots:
+        return {}
+    return {
+        slot.name: slot.range for slot in schema.class_induced_slots(roots[0])
+        if slot.range in schema.all_classes()
+    }
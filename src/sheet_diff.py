@@ -0,0 +1,224 @@
+"""Keyed row diff between two versions of a sheet.
+
+Used by compare_excel_files and compare_excel_tsv. Rows are matched on the
+sheet's ID column (detected as merge_excel_updates does, so a diff reports
+what merge-excel would match) rather than on their position, so inserted,
+deleted or reordered rows do not show up as changes to every row below them.
+Without a unique ID column, rows are matched by position.
+
+Each row is hashed over the columns both versions share. Rows are then
+joined on their key, and only rows whose hashes differ are compared cell by
+cell. Values are compared as TSV text: workbooks are streamed with the same
+cell formatting as the Excel → TSV conversion, and TSVs are read as text.
+"""
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from src.merge_excel_updates import ExcelMerger
+    from src.parsers import format_cell, iter_xlsx_sheets, xlsx_header
+except ImportError:
+    from merge_excel_updates import ExcelMerger
+    from parsers import format_cell, iter_xlsx_sheets, xlsx_header
+
+
+# Number of added/removed row keys and cell changes listed per sheet
+SHOWN_PER_SHEET = 10
+
+# Text of a whole-number float, as written to a TSV from a float column
+WHOLE_FLOAT = re.compile(r'-?\d+\.0')
+
+
+def sheet_table(rows: Iterable[Tuple]) -> pd.DataFrame:
+    """Text table of a streamed sheet: first row as header, '' for empty cells.
+
+    The table is as wide as the widest row and columns are named as
+    pandas.read_excel names them.
+
+    Examples:
+        >>> sheet_table([("id", "n"), ("A", 1.0), ("B", None, "x")]).values.tolist()
+        [['A', '1', ''], ['B', '', 'x']]
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    body = [[format_cell(value) for value in values] for values in rows]
+    width = max([len(header)] + [len(values) for values in body])
+    columns = xlsx_header(tuple(header) + (None,) * (width - len(header)))
+    body = [values + [''] * (width - len(values)) for values in body]
+    return pd.DataFrame(body, columns=columns, dtype=object)
+
+
+def read_xlsx_tables(path: Union[str, Path]) -> Dict[str, pd.DataFrame]:
+    """Text tables of all sheets of a workbook, streamed in one pass."""
+    return {sheet_name: sheet_table(rows) for sheet_name, rows in iter_xlsx_sheets(path)}
+
+
+def read_tsv_table(path: Union[str, Path]) -> pd.DataFrame:
+    """Text table of a TSV file ('' for empty fields)."""
+    return pd.read_csv(path, sep='\t', dtype=str, keep_default_na=False)
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Text of a table with whole-number floats written as integers.
+
+    A TSV written from a float column holds '2.0' where the workbook cell
+    reads as '2'; both compare equal.
+
+    Examples:
+        >>> normalize(pd.DataFrame({"n": ["2.0", "2.5", "-3.0", "v1.0"]}))["n"].tolist()
+        ['2', '2.5', '-3', 'v1.0']
+    """
+    df = df.copy()
+    for i in range(len(df.columns)):
+        # Sheets repeat values a lot, so each distinct value is rewritten once
+        codes, uniques = pd.factorize(df.iloc[:, i].astype(str))
+        fixed = np.array(
+            [value[:-2] if WHOLE_FLOAT.fullmatch(value) else value for value in uniques], dtype=object
+        )
+        df.iloc[:, i] = fixed[codes] if len(fixed) else df.iloc[:, i]
+    return df
+
+
+def key_column(old: pd.DataFrame, new: pd.DataFrame) -> Optional[str]:
+    """ID column of the new table that the old table also has, if any."""
+    if new.empty or len(new.columns) == 0:
+        return None
+    id_col = ExcelMerger(verbose=False).detect_id_column(new.where(new != ''))
+    return id_col if id_col in old.columns else None
+
+
+def row_keys(df: pd.DataFrame, id_col: Optional[str]) -> pd.Series:
+    """Unique key of each row: its ID (numbered if repeated) or its position.
+
+    Examples:
+        >>> row_keys(pd.DataFrame({"id": ["A", "B", "A"]}), "id").tolist()
+        ['A', 'B', 'A (2)']
+        >>> row_keys(pd.DataFrame({"id": ["A", "B"]}), None).tolist()
+        ['row 1', 'row 2']
+    """
+    if id_col is None:
+        return pd.Series([f"row {i}" for i in range(1, len(df) + 1)], index=df.index)
+    ids = df[id_col].astype(str)
+    occurrence = df.groupby(id_col, sort=False).cumcount()
+    suffix = np.where(occurrence > 0, ' (' + (occurrence + 1).astype(str) + ')', '')
+    return ids + suffix
+
+
+def row_hashes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """64-bit hash of the given columns of each row (all equal if there are none)."""
+    if not columns:
+        return np.zeros(len(df), dtype=np.uint64)
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def diff_tables(old: pd.DataFrame, new: pd.DataFrame, id_col: Optional[str] = None) -> Dict[str, any]:
+    """Rows added, removed and changed from one version of a sheet to another.
+
+    Args:
+        old: Earlier version, as text
+        new: Later version, as text
+        id_col: Column identifying a row (default: detected, else position)
+
+    Returns:
+        Dictionary with 'id_column', 'added_columns', 'removed_columns',
+        'added_rows' and 'removed_rows' (row keys), 'changed_rows'
+        ({row key: {column: (old, new)}}), 'cell_changes' ({column: count}),
+        'reordered' and 'identical'
+
+    Examples:
+        >>> old = pd.DataFrame({"id": ["A", "B", "C"], "v": ["1", "2", "3"]})
+        >>> new = pd.DataFrame({"id": ["C", "A", "D"], "v": ["3", "9", "4"]})
+        >>> diff = diff_tables(old, new, "id")
+        >>> diff['added_rows'], diff['removed_rows'], diff['changed_rows']
+        (['D'], ['B'], {'A': {'v': ('1', '9')}})
+    """
+    old = normalize(old)
+    new = normalize(new)
+    if id_col is None:
+        id_col = key_column(old, new)
+    common = [column for column in new.columns if column in old.columns]
+
+    diff = {
+        'id_column': id_col,
+        'added_columns': [column for column in new.columns if column not in old.columns],
+        'removed_columns': [column for column in old.columns if column not in new.columns],
+        'added_rows': [],
+        'removed_rows': [],
+        'changed_rows': {},
+        'cell_changes': {},
+        'reordered': False,
+        'identical': False,
+    }
+
+    old_keys = row_keys(old, id_col)
+    new_keys = row_keys(new, id_col)
+    old_hashes = pd.Series(row_hashes(old, common), index=old_keys.to_numpy())
+    new_hashes = pd.Series(row_hashes(new, common), index=new_keys.to_numpy())
+
+    if not (old_hashes.index.equals(new_hashes.index) and (old_hashes.to_numpy() == new_hashes.to_numpy()).all()):
+        added = ~new_hashes.index.isin(old_hashes.index)
+        diff['added_rows'] = new_hashes.index[added].tolist()
+        diff['removed_rows'] = old_hashes.index[~old_hashes.index.isin(new_hashes.index)].tolist()
+
+        matched = new_hashes.index[~added]
+        diff['reordered'] = old_hashes.index[old_hashes.index.isin(matched)].tolist() != matched.tolist()
+        changed = matched[old_hashes[matched].to_numpy() != new_hashes[matched].to_numpy()]
+
+        # Cell-level comparison of the changed rows only
+        old_cells = old[common].set_axis(old_keys.to_numpy()).loc[changed].to_numpy()
+        new_cells = new[common].set_axis(new_keys.to_numpy()).loc[changed].to_numpy()
+        differs = old_cells != new_cells
+        for row, column in zip(*np.nonzero(differs)):
+            diff['changed_rows'].setdefault(changed[row], {})[common[column]] = (
+                old_cells[row, column], new_cells[row, column]
+            )
+        diff['cell_changes'] = {
+            common[column]: int(count) for column, count in enumerate(differs.sum(axis=0)) if count
+        }
+
+    diff['identical'] = (
+        not diff['added_columns'] and not diff['removed_columns']
+        and not diff['added_rows'] and not diff['removed_rows'] and not diff['changed_rows']
+    )
+    return diff
+
+
+def log_row_diff(diff: Dict[str, any], log: Callable[[str, str], None]) -> None:
+    """Report the row-level part of a diff_tables result through a comparator's log."""
+    if diff['id_column']:
+        log(f"    Rows matched on '{diff['id_column']}'", "INFO")
+    else:
+        log("    No unique ID column, rows matched by position", "INFO")
+
+    for label, keys in (('added', diff['added_rows']), ('removed', diff['removed_rows'])):
+        if keys:
+            shown = ', '.join(keys[:SHOWN_PER_SHEET])
+            more = f" (+{len(keys) - SHOWN_PER_SHEET} more)" if len(keys) > SHOWN_PER_SHEET else ""
+            log(f"    Rows {label}: {len(keys)}: {shown}{more}", "WARNING")
+
+    if diff['changed_rows']:
+        log(f"    Rows changed: {len(diff['changed_rows'])}", "WARNING")
+        for column, count in sorted(diff['cell_changes'].items()):
+            log(f"      '{column}': {count} row(s) differ", "WARNING")
+        changes = [
+            (key, column, values)
+            for key, cells in diff['changed_rows'].items()
+            for column, values in cells.items()
+        ]
+        for key, column, (old_value, new_value) in changes[:SHOWN_PER_SHEET]:
+            log(f"      {key} / '{column}': '{old_value}' → '{new_value}'", "INFO")
+        if len(changes) > SHOWN_PER_SHEET:
+            log(f"      ... {len(changes) - SHOWN_PER_SHEET} more cell change(s)", "INFO")
+
+    if diff['reordered']:
+        log("    Row order differs", "INFO")
+
+    if not (diff['added_rows'] or diff['removed_rows'] or diff['changed_rows']):
+        log("    Data: identical ✓", "SUCCESS")
@@ -0,0 +1,553 @@
+"""DuckDB working store for the sheet TSVs.
+
+Scripts that edit sheets can read and write them through a SheetStore
+instead of re-parsing and rewriting whole TSV files. Each sheet is imported
+once into a table, appends, updates, upserts and deletes touch only the
+affected rows, and the TSVs are rewritten only when the store is exported:
+- every table has a _row primary key holding the row's position, so exports
+  keep the file's row order; the sheet's own columns are VARCHAR holding the
+  TSV text (NULL for empty cells), so a sheet round-trips byte for byte
+- a sheet whose TSV changed on disk since it was imported or exported is
+  re-imported on next use, unless the store holds unexported changes to it,
+  in which case the store copy is kept and a warning printed
+- export() writes every modified sheet atomically, in row order
+
+Once exported, the store can be deleted at any time; the next run imports
+the TSVs again.
+
+Usage:
+    python src/sheet_store.py status --data-dir data/txt/sheet
+    python src/sheet_store.py export --data-dir data/txt/sheet
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import duckdb
+import pandas as pd
+
+DEFAULT_STORE_NAME = "sheets.duckdb"
+
+# Row position column (the primary key of every sheet table)
+ROW_COLUMN = "_row"
+
+# DataFrame.attrs key marking a frame read from the store
+SHEET_ATTR = "sheet_store_table"
+
+FILES_TABLE = "_sheet_files"
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column or table name for SQL.
+
+    Examples:
+        >>> quote_identifier('Scientific name')
+        '"Scientific name"'
+        >>> quote_identifier('a"b')
+        '"a""b"'
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_name(path: Path) -> str:
+    """Store table holding a TSV file.
+
+    Examples:
+        >>> table_name(Path("data/txt/sheet/PFAS_Data_for_AI_assays.tsv"))
+        'PFAS_Data_for_AI_assays'
+    """
+    return Path(path).stem
+
+
+def to_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Cell values as TSV text, with None for empty cells.
+
+    Examples:
+        >>> to_text(pd.DataFrame({"id": ["A", "", None], "n": [1, 2, 3]})).values.tolist()
+        [['A', '1'], [None, '2'], [None, '3']]
+    """
+    text = pd.DataFrame(index=df.index)
+    for i, column in enumerate(df.columns):
+        values = df.iloc[:, i]
+        filled = values.notna()
+        converted = pd.Series([None] * len(df), index=df.index, dtype=object)
+        converted[filled] = values[filled].astype(str)
+        converted[converted == ''] = None
+        text[column] = converted
+    return text
+
+
+def slot(position: int) -> str:
+    """Storage column of the sheet column at a position.
+
+    Examples:
+        >>> slot(3)
+        'c3'
+    """
+    return f"c{position}"
+
+
+def file_state(path: Path) -> Tuple[Optional[int], Optional[int]]:
+    """(size, mtime_ns) of a file, or (None, None) if it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None, None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class SheetStore:
+    """Sheet TSVs held as DuckDB tables until exported.
+
+    Sheet columns are stored as c0, c1, ... (DuckDB column names are case
+    insensitive, and sheets have columns differing only in case); their
+    names and order are kept with the sheet's file entry.
+
+    Examples:
+        >>> with SheetStore(Path("data/txt/sheet/sheets.duckdb")) as store:  # doctest: +SKIP
+        ...     store.fill_empty(Path("data/txt/sheet/PFAS_Data_for_AI_assays.tsv"), "source", "extend1")
+        ...     store.export()
+    """
+
+    def __init__(self, path: Path):
+        """Open (or create) a store.
+
+        Args:
+            path: DuckDB database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = duckdb.connect(str(self.path))
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {FILES_TABLE} (
+                name VARCHAR PRIMARY KEY,
+                path VARCHAR,
+                size BIGINT,
+                mtime_ns BIGINT,
+                columns VARCHAR,
+                modified BOOLEAN
+            )
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _table(self, path: Path) -> str:
+        """Table of a sheet, importing the TSV if new or changed on disk."""
+        path = Path(path)
+        name = table_name(path)
+        entry = self.conn.execute(
+            f"SELECT path, size, mtime_ns, modified FROM {FILES_TABLE} WHERE name = ?", [name]
+        ).fetchone()
+        if entry is not None and entry[0] != str(path):
+            raise ValueError(f"Store {self.path} already holds {name} from {entry[0]}, not {path}")
+
+        if entry is None or (entry[1], entry[2]) != file_state(path):
+            if entry is not None and entry[3]:
+                print(f"  ⚠️  {path} changed on disk; keeping the unexported copy in {self.path}")
+            else:
+                self._import(path, name)
+        return name
+
+    def _import(self, path: Path, name: str) -> None:
+        """Load a TSV file into its table."""
+        try:
+            df = pd.read_csv(path, sep='\t', dtype=str, keep_default_na=False)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            df = pd.DataFrame()
+        size, mtime_ns = file_state(path)
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {FILES_TABLE} VALUES (?, ?, ?, ?, '[]', false)",
+            [name, str(path), size, mtime_ns]
+        )
+        self._create(name, df)
+
+    def _create(self, name: str, df: pd.DataFrame) -> None:
+        """(Re)create a table with a sheet's rows."""
+        self.conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(name)}")
+        self.conn.execute(f"CREATE TABLE {quote_identifier(name)} ({ROW_COLUMN} BIGINT PRIMARY KEY)")
+        self._set_columns(name, [])
+        self._add_columns(name, df.columns)
+        self._insert(name, df, range(len(df)))
+
+    def _columns(self, name: str) -> List[str]:
+        """Sheet columns of a table, in order."""
+        return json.loads(self.conn.execute(
+            f"SELECT columns FROM {FILES_TABLE} WHERE name = ?", [name]
+        ).fetchone()[0])
+
+    def _set_columns(self, name: str, columns: List[str]) -> None:
+        self.conn.execute(f"UPDATE {FILES_TABLE} SET columns = ? WHERE name = ?", [json.dumps(columns), name])
+
+    def _add_columns(self, name: str, columns: Iterable) -> bool:
+        """Append columns a table does not have yet; returns whether any were added."""
+        existing = self._columns(name)
+        added = False
+        for column in map(str, columns):
+            if column not in existing:
+                self.conn.execute(
+                    f"ALTER TABLE {quote_identifier(name)} ADD COLUMN {slot(len(existing))} VARCHAR"
+                )
+                existing.append(column)
+                added = True
+        if added:
+            self._set_columns(name, existing)
+        return added
+
+    def _slots(self, name: str, columns: Iterable) -> List[str]:
+        """Storage columns of sheet columns (which must exist)."""
+        existing = self._columns(name)
+        return [slot(existing.index(str(column))) for column in columns]
+
+    def _register(self, name: str, df: pd.DataFrame, rows: Optional[Iterable[int]] = None) -> List[str]:
+        """Register rows as the _incoming view; returns their storage columns."""
+        text = to_text(df)
+        slots = self._slots(name, df.columns)
+        text.columns = slots
+        text.insert(0, ROW_COLUMN, list(rows) if rows is not None else df.index)
+        self.conn.register('_incoming', text.reset_index(drop=True))
+        return slots
+
+    def _insert(self, name: str, df: pd.DataFrame, rows: Iterable[int]) -> None:
+        """Insert rows at the given _row positions."""
+        slots = self._register(name, df, rows)
+        names = ', '.join([ROW_COLUMN] + slots)
+        values = ', '.join([ROW_COLUMN] + [f"CAST({column} AS VARCHAR)" for column in slots])
+        self.conn.execute(f"INSERT INTO {quote_identifier(name)} ({names}) SELECT {values} FROM _incoming")
+        self.conn.unregister('_incoming')
+
+    def _mark_modified(self, name: str) -> None:
+        self.conn.execute(f"UPDATE {FILES_TABLE} SET modified = true WHERE name = ?", [name])
+
+    def _select(self, name: str) -> pd.DataFrame:
+        """All rows of a table in row order, with sheet column names and _row."""
+        columns = self._columns(name)
+        selected = ', '.join([ROW_COLUMN] + [slot(i) for i in range(len(columns))])
+        df = self.conn.execute(
+            f"SELECT {selected} FROM {quote_identifier(name)} ORDER BY {ROW_COLUMN}"
+        ).df()
+        df.columns = [ROW_COLUMN] + columns
+        return df.set_index(ROW_COLUMN)
+
+    def read(self, path: Path) -> pd.DataFrame:
+        """Sheet contents as strings (NaN for empty cells), indexed by _row.
+
+        Args:
+            path: Sheet TSV file
+
+        Returns:
+            DataFrame that write() can store back by changed rows only
+        """
+        name = self._table(path)
+        df = self._select(name)
+        df = df.mask(df.isna())
+        df.attrs[SHEET_ATTR] = name
+        return df
+
+    def columns(self, path: Path) -> List[str]:
+        """Columns of a sheet, in order."""
+        return self._columns(self._table(path))
+
+    def values(self, path: Path, column: str) -> Set[str]:
+        """Distinct non-empty values of a sheet column (empty if no such column)."""
+        name = self._table(path)
+        if column not in self._columns(name):
+            return set()
+        (stored,) = self._slots(name, [column])
+        rows = self.conn.execute(
+            f"SELECT DISTINCT {stored} FROM {quote_identifier(name)} WHERE {stored} IS NOT NULL"
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def replace(self, path: Path, df: pd.DataFrame) -> None:
+        """Replace a sheet's contents."""
+        name = self._table(path)
+        self._create(name, df)
+        self._mark_modified(name)
+
+    def append(self, path: Path, df: pd.DataFrame) -> int:
+        """Append rows after the last row of a sheet (adding any new columns)."""
+        name = self._table(path)
+        if df.empty:
+            return 0
+        self._add_columns(name, df.columns)
+        next_row = self.conn.execute(
+            f"SELECT COALESCE(MAX({ROW_COLUMN}) + 1, 0) FROM {quote_identifier(name)}"
+        ).fetchone()[0]
+        self._insert(name, df, range(next_row, next_row + len(df)))
+        self._mark_modified(name)
+        return len(df)
+
+    def _update_from_incoming(self, name: str, slots: List[str], match: str) -> int:
+        """Set columns of the rows matched against _incoming."""
+        table = quote_identifier(name)
+        assignments = ', '.join(f"{column} = CAST(_incoming.{column} AS VARCHAR)" for column in slots)
+        count = self.conn.execute(
+            f"UPDATE {table} SET {assignments} FROM _incoming WHERE {match.format(table=table)}"
+        ).fetchone()[0]
+        self.conn.unregister('_incoming')
+        return count
+
+    def update(self, path: Path, rows: pd.DataFrame) -> int:
+        """Overwrite the given columns of rows identified by their _row index."""
+        name = self._table(path)
+        if rows.empty:
+            return 0
+        self._add_columns(name, rows.columns)
+        slots = self._register(name, rows)
+        count = self._update_from_incoming(name, slots, f"{{table}}.{ROW_COLUMN} = _incoming.{ROW_COLUMN}")
+        self._mark_modified(name)
+        return count
+
+    def upsert(self, path: Path, df: pd.DataFrame, key: str) -> Tuple[int, int]:
+        """Update the rows whose key is stored once and append the others.
+
+        Rows identical to a stored row (on df's columns) are skipped. A row
+        whose key is held by a single stored row updates that row, matched
+        by _row (only the first such row of df per key); a row whose key is
+        new, or held by several stored rows (the same ID for another
+        organism, ...), is appended, so rows sharing a key are never
+        collapsed. Rows without a key are appended.
+
+        Returns:
+            (rows updated, rows appended)
+
+        Examples:
+            >>> import tempfile
+            >>> tmp = tempfile.TemporaryDirectory()
+            >>> sheet = Path(tmp.name) / "genes.tsv"
+            >>> pd.DataFrame({"id": ["K1", "K1", "K2"], "org": ["A", "B", "A"]}).to_csv(sheet, sep="\\t", index=False)
+            >>> store = SheetStore(Path(tmp.name) / DEFAULT_STORE_NAME)
+            >>> store.upsert(sheet, pd.DataFrame({"id": ["K1", "K1", "K2", "K3"], "org": ["B", "Z", "B", "A"]}), "id")
+            (1, 2)
+            >>> store.read(sheet).values.tolist()
+            [['K1', 'A'], ['K1', 'B'], ['K2', 'B'], ['K1', 'Z'], ['K3', 'A']]
+            >>> store.close()
+            >>> tmp.cleanup()
+        """
+        name = self._table(path)
+        if df.empty:
+            return 0, 0
+        self._add_columns(name, df.columns)
+        columns = [str(column) for column in df.columns]
+        incoming = to_text(df)
+        key_position = columns.index(key)
+
+        # Stored rows sharing a key with df, on df's columns
+        keys = [value for value in dict.fromkeys(incoming.iloc[:, key_position]) if value is not None]
+        stored_keys: Dict[str, List[int]] = {}
+        stored_fields: Set[Tuple] = set()
+        if keys:
+            (stored,) = self._slots(name, [key])
+            self.conn.register('_keys', pd.DataFrame({'k': pd.Series(keys, dtype=object)}))
+            selected = ', '.join([ROW_COLUMN] + self._slots(name, columns))
+            matches = self.conn.execute(
+                f"SELECT {selected} FROM {quote_identifier(name)} "
+                f"WHERE {stored} IN (SELECT k FROM _keys) ORDER BY {ROW_COLUMN}"
+            ).fetchall()
+            self.conn.unregister('_keys')
+            for row, *fields in matches:
+                stored_keys.setdefault(fields[key_position], []).append(row)
+                stored_fields.add(tuple(fields))
+
+        updates: Dict[int, int] = {}  # _row → position in df
+        appends: List[int] = []
+        seen: Set[Tuple] = set()
+        for position, fields in enumerate(incoming.itertuples(index=False, name=None)):
+            if fields in stored_fields or fields in seen:
+                continue
+            seen.add(fields)
+            rows = stored_keys.get(fields[key_position], [])
+            if len(rows) == 1 and rows[0] not in updates:
+                updates[rows[0]] = position
+            else:
+                appends.append(position)
+
+        updated = 0
+        if updates:
+            rows = df.iloc[list(updates.values())].copy()
+            rows.index = pd.Index(list(updates), name=ROW_COLUMN)
+            updated = self.update(path, rows)
+        appended = self.append(path, df.iloc[appends])
+        return updated, appended
+
+    def delete(self, path: Path, keys: pd.DataFrame) -> int:
+        """Delete rows matching any row of keys on all of its columns (empty matches empty)."""
+        name = self._table(path)
+        if keys.empty or not set(map(str, keys.columns)) <= set(self._columns(name)):
+            return 0
+        slots = self._register(name, keys)
+        table = quote_identifier(name)
+        match = ' AND '.join(
+            f"{table}.{column} IS NOT DISTINCT FROM CAST(_incoming.{column} AS VARCHAR)" for column in slots
+        )
+        count = self.conn.execute(f"DELETE FROM {table} USING _incoming WHERE {match}").fetchone()[0]
+        self.conn.unregister('_incoming')
+        if count:
+            self._mark_modified(name)
+        return count
+
+    def fill_empty(self, path: Path, column: str, value: str) -> int:
+        """Set a column (added if missing) to value where it is empty."""
+        name = self._table(path)
+        added = self._add_columns(name, [column])
+        (stored,) = self._slots(name, [column])
+        count = self.conn.execute(
+            f"UPDATE {quote_identifier(name)} SET {stored} = ? WHERE {stored} IS NULL", [value]
+        ).fetchone()[0]
+        if count or added:
+            self._mark_modified(name)
+        return count
+
+    def write(self, path: Path, df: pd.DataFrame) -> int:
+        """Store a sheet's new contents, writing only the rows that changed.
+
+        A DataFrame obtained from read() for the same sheet (possibly with
+        rows dropped or columns appended) is compared with the table and
+        only changed, removed and added rows are written; any other
+        DataFrame replaces the sheet.
+
+        Returns:
+            Number of rows written or deleted
+        """
+        name = self._table(path)
+        current_columns = self._columns(name)
+        columns = [str(column) for column in df.columns]
+        if (
+            df.attrs.get(SHEET_ATTR) != name
+            or df.index.name != ROW_COLUMN
+            or columns[:len(current_columns)] != current_columns
+            or len(set(columns)) != len(columns)
+        ):
+            self.replace(path, df)
+            return len(df)
+
+        current = self._select(name)
+        removed = current.index.difference(df.index)
+        added = df.index.difference(current.index)
+        common = df.index.intersection(current.index)
+
+        new_text = to_text(df.loc[common])
+        old_text = to_text(current.loc[common].reindex(columns=df.columns))
+        same = (new_text == old_text) | (new_text.isna() & old_text.isna())
+        changed = common[~same.all(axis=1).to_numpy()]
+
+        if len(removed):
+            self.conn.register('_removed', pd.DataFrame({ROW_COLUMN: removed}))
+            self.conn.execute(
+                f"DELETE FROM {quote_identifier(name)} WHERE {ROW_COLUMN} IN (SELECT {ROW_COLUMN} FROM _removed)"
+            )
+            self.conn.unregister('_removed')
+        self._add_columns(name, columns)
+        if len(added):
+            self._insert(name, df.loc[added], added)
+        self.update(path, df.loc[changed])
+
+        written = len(changed) + len(removed) + len(added)
+        if written or len(columns) > len(current_columns):
+            self._mark_modified(name)
+        return written
+
+    def modified(self) -> List[Path]:
+        """Sheets with changes not yet exported."""
+        rows = self.conn.execute(f"SELECT path FROM {FILES_TABLE} WHERE modified ORDER BY name").fetchall()
+        return [Path(row[0]) for row in rows]
+
+    def export(self, paths: Optional[Iterable[Path]] = None) -> List[Path]:
+        """Write modified sheets to their TSV files, in row order.
+
+        Args:
+            paths: Sheets to export (default: all modified sheets)
+
+        Returns:
+            Paths written
+        """
+        selected = {str(Path(path)) for path in paths} if paths is not None else None
+        written = []
+        for path in self.modified():
+            if selected is not None and str(path) not in selected:
+                continue
+            name = table_name(path)
+            df = self._select(name).fillna('')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            df.to_csv(tmp_path, sep='\t', index=False)
+            os.replace(tmp_path, path)
+            size, mtime_ns = file_state(path)
+            self.conn.execute(
+                f"UPDATE {FILES_TABLE} SET size = ?, mtime_ns = ?, modified = false WHERE name = ?",
+                [size, mtime_ns, name]
+            )
+            written.append(path)
+        return written
+
+    def status(self) -> List[Dict]:
+        """Imported sheets with their row counts and whether they await export."""
+        entries = self.conn.execute(f"SELECT name, path, modified FROM {FILES_TABLE} ORDER BY name").fetchall()
+        return [
+            {
+                'path': Path(path),
+                'rows': self.conn.execute(f"SELECT COUNT(*) FROM {quote_identifier(name)}").fetchone()[0],
+                'modified': modified,
+            }
+            for name, path, modified in entries
+        ]
+
+
+def main():
+    """Command-line interface."""
+    parser = argparse.ArgumentParser(
+        description="Import sheet TSVs into the DuckDB working store, or export its changes"
+    )
+    parser.add_argument(
+        'action',
+        choices=['import', 'export', 'status'],
+        help='import: load all TSVs; export: write modified sheets; status: list sheets'
+    )
+    parser.add_argument(
+        '--data-dir',
+        type=Path,
+        default=Path('data/txt/sheet'),
+        help='Directory containing the TSV files'
+    )
+    parser.add_argument(
+        '--store',
+        type=Path,
+        default=None,
+        help=f'Store file (default: <data-dir>/{DEFAULT_STORE_NAME})'
+    )
+
+    args = parser.parse_args()
+    store_path = args.store or args.data_dir / DEFAULT_STORE_NAME
+
+    with SheetStore(store_path) as store:
+        if args.action == 'import':
+            paths = sorted(args.data_dir.glob('*.tsv'))
+            for path in paths:
+                store.read(path)
+            print(f"✓ {len(paths)} sheets in {store_path}")
+        elif args.action == 'export':
+            written = store.export()
+            for path in written:
+                print(f"✓ Saved to {path}")
+            print(f"✓ Exported {len(written)} modified sheets")
+        else:
+            for entry in store.status():
+                flag = "modified" if entry['modified'] else "exported"
+                print(f"  {entry['path']}: {entry['rows']} rows ({flag})")
+
+
+if __name__ == "__main__":
+    main()
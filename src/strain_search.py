@@ -5,7 +5,6 @@ standardized strain information including culture collection IDs, type strain de
 and procurement details.
 """
 
-import time
 import re
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
@@ -14,6 +13,13 @@ from pathlib import Path
 from Bio import Entrez
 import sys
 
+try:
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import entrez_call
+except ImportError:
+    from apis.rate_limits import throttle
+    from apis.snapshots import entrez_call
+
 # Import KG-Microbe database interface
 try:
     from kg_analysis.kg_database import KnowledgeGraphDB
@@ -270,7 +276,8 @@ def query_ncbi_taxonomy(taxon_id: int) -> Dict:
     """
     try:
         # Fetch taxonomy record
-        handle = Entrez.efetch(db="taxonomy", id=str(taxon_id), retmode="xml")
+        throttle('ncbi')
+        handle = entrez_call(Entrez.efetch, db="taxonomy", id=str(taxon_id), retmode="xml")
         records = Entrez.read(handle)
         handle.close()
 
@@ -451,7 +458,6 @@ def create_extended_strains_table(
                 type_strain = 'no'
                 alternative_names = ''
 
-            time.sleep(0.5)  # Rate limiting for NCBI
         else:
             type_strain = 'no'
             alternative_names = ''
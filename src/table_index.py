@@ -0,0 +1,313 @@
+"""Key → row hashes index kept beside an append-only TSV table.
+
+save_extended_table (kg_mining_utils) grows the extended tables by appending
+rows to the end of the TSV instead of re-reading and rewriting it. The index,
+stored in <name>.tsv.keyindex, records the hashes of each row key's distinct
+rows, so that:
+- a row already in the table (same key, same contents) is not written again
+- a row with a new key is appended, and so is a new row for a key that
+  already has several distinct rows (the same ID for another organism, ...)
+- a row with new contents for a key that had a single distinct row is
+  appended and supersedes that row, which becomes stale
+- once stale rows make up more than COMPACT_FRACTION of the table, the file
+  is compacted: the stale rows, and only those, are dropped
+
+A key that is not unique in the table is never superseded, so compaction
+never drops a distinct row that was already there. Rows without a key value
+are keyed by their hash.
+
+The index file holds a snapshot line followed by one journal line per
+append, so an append writes only the entries of the rows it adds; the
+snapshot is rewritten when the table is rebuilt, rewritten or compacted.
+Every line records the table's size and modification time; if the TSV was
+changed by anything else, the index is rebuilt from the file on next use.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+try:
+    from src.parsers import row_hash
+except ImportError:
+    from parsers import row_hash
+
+
+INDEX_FORMAT_VERSION = 2
+
+KEY_INDEX_SUFFIX = ".keyindex"
+
+# Compact once this fraction of the table's rows is stale
+COMPACT_FRACTION = 0.25
+
+
+def text_rows(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Rows as TSV field text in the given columns ('' for empty or missing).
+
+    Examples:
+        >>> text_rows(pd.DataFrame({"id": ["A", None], "n": [1, 2]}), ["n", "id", "x"]).values.tolist()
+        [['1', 'A', ''], ['2', '', '']]
+    """
+    selected = df.reindex(columns=list(columns))
+    text = pd.DataFrame(index=df.index)
+    for i, column in enumerate(selected.columns):
+        values = selected.iloc[:, i]
+        text[column] = values.where(values.isna(), values.astype(str)).fillna('').astype(str)
+    return text
+
+
+def row_keys(text: pd.DataFrame, key: Optional[str], hashes: List[str]) -> List[str]:
+    """Index key of each row: its key value, or '#' + its hash if it has none.
+
+    Examples:
+        >>> text = pd.DataFrame({"id": ["A", ""]})
+        >>> row_keys(text, "id", ["h1", "h2"])
+        ['A', '#h2']
+    """
+    if key is None or key not in text.columns:
+        return ['#' + hashed for hashed in hashes]
+    return [value if value else '#' + hashed for value, hashed in zip(text[key], hashes)]
+
+
+def hash_rows(text: pd.DataFrame) -> List[str]:
+    """Row hash of each row of TSV field text."""
+    return [row_hash(fields) for fields in text.itertuples(index=False, name=None)]
+
+
+def file_state(path: Path) -> Tuple[Optional[int], Optional[int]]:
+    """(size, mtime_ns) of a file, or (None, None) if it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None, None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class TableIndex:
+    """Hashes of the distinct rows of every key of an append-only TSV table.
+
+    Examples:
+        >>> index = TableIndex(Path("data/txt/sheet/extended/genes.tsv"), "gene or protein id")  # doctest: +SKIP
+        >>> index.append(new_records)  # doctest: +SKIP
+        (120, 3)
+
+        Keys with several distinct rows keep them all:
+
+        >>> import tempfile
+        >>> tmp = tempfile.TemporaryDirectory()
+        >>> path = Path(tmp.name) / "genes.tsv"
+        >>> index = TableIndex(path, "id")
+        >>> index.append(pd.DataFrame({"id": ["K1", "K1", "K1", "K2"], "org": ["A", "B", "C", "A"]}))
+        (4, 0)
+        >>> index.append(pd.DataFrame({"id": ["K1", "K2"], "org": ["A", "B"]}))
+        (0, 1)
+        >>> index.compact()
+          Compacted genes.tsv: dropped 1 superseded rows
+        1
+        >>> TableIndex(path, "id").append(pd.DataFrame({"id": ["K1", "K2"], "org": ["D", "B"]}))
+        (1, 0)
+        >>> pd.read_csv(path, sep="\\t").values.tolist()
+        [['K1', 'A'], ['K1', 'B'], ['K1', 'C'], ['K2', 'B'], ['K1', 'D']]
+        >>> tmp.cleanup()
+    """
+
+    def __init__(self, table_path: Path, key: Optional[str] = None):
+        """Initialize index and load the stored copy, rebuilding it if stale.
+
+        Args:
+            table_path: TSV table
+            key: Column identifying a row (default: the whole row)
+        """
+        self.table_path = Path(table_path)
+        self.path = self.table_path.with_name(self.table_path.name + KEY_INDEX_SUFFIX)
+        self.key = key
+        self.columns: List[str] = []
+        self.rows = 0
+        # key → hashes of the key's distinct current rows, in table order
+        self.hashes: Dict[str, List[str]] = {}
+        # (key, hash) of superseded rows still in the table, and how many rows they are
+        self.superseded: Set[Tuple[str, str]] = set()
+        self.stale = 0
+
+        lines = self._read_index()
+        snapshot = lines[0] if lines else {}
+        if snapshot.get('format_version') != INDEX_FORMAT_VERSION or snapshot.get('key') != key:
+            self.rebuild()
+            return
+        self.columns = snapshot['columns']
+        self.rows = snapshot['rows']
+        self.hashes = snapshot['hashes']
+        self.superseded = {tuple(pair) for pair in snapshot['superseded']}
+        self.stale = snapshot['stale']
+        for entry in lines[1:]:
+            self._replay(entry)
+        if (lines[-1]['size'], lines[-1]['mtime_ns']) != file_state(self.table_path):
+            # Table changed outside the index: keep track of the rows superseded so far
+            self.rebuild(self.superseded)
+
+    def _read_index(self) -> List[Dict]:
+        """Snapshot and journal lines of the stored index, up to the first unreadable one."""
+        lines = []
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    lines.append(json.loads(line))
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  ⚠️  Ignoring unreadable table index entries in {self.path}: {e}")
+        return lines
+
+    def _read_table(self) -> pd.DataFrame:
+        """The table as TSV field text (empty if missing)."""
+        try:
+            return pd.read_csv(self.table_path, sep='\t', dtype=str, keep_default_na=False)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return pd.DataFrame()
+
+    def _index(self, text: pd.DataFrame, superseded: Iterable[Tuple[str, str]] = ()) -> None:
+        """Reset the index to a table's contents.
+
+        Args:
+            text: Table contents
+            superseded: (key, hash) of rows known to be superseded
+        """
+        superseded = {tuple(pair) for pair in superseded}
+        self.columns = [str(column) for column in text.columns]
+        self.rows = len(text)
+        self.hashes = {}
+        self.superseded = set()
+        self.stale = 0
+        hashes = hash_rows(text)
+        for key, hashed in zip(row_keys(text, self.key, hashes), hashes):
+            if (key, hashed) in superseded:
+                self.superseded.add((key, hashed))
+                self.stale += 1
+                continue
+            current = self.hashes.setdefault(key, [])
+            if hashed not in current:
+                current.append(hashed)
+
+    def _replay(self, entry: Dict) -> None:
+        """Apply a journal entry: drop its superseded rows, then add its rows."""
+        for key, hashed in entry['superseded']:
+            self.hashes[key].remove(hashed)
+            self.superseded.add((key, hashed))
+            self.stale += 1
+        for key, hashed in entry['added']:
+            self.hashes.setdefault(key, []).append(hashed)
+            if (key, hashed) in self.superseded:
+                # An earlier version is current again
+                self.superseded.discard((key, hashed))
+                self.stale -= 1
+        self.rows = entry['rows']
+
+    def rebuild(self, superseded: Iterable[Tuple[str, str]] = ()) -> None:
+        """Re-index the table from its file."""
+        self._index(self._read_table(), superseded)
+        self.save()
+
+    def save(self) -> None:
+        """Write the index snapshot atomically, recording the table's current state."""
+        size, mtime_ns = file_state(self.table_path)
+        data = {
+            'format_version': INDEX_FORMAT_VERSION,
+            'key': self.key,
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'columns': self.columns,
+            'rows': self.rows,
+            'hashes': self.hashes,
+            'superseded': sorted(self.superseded),
+            'stale': self.stale,
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(data) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def _log(self, entry: Dict) -> None:
+        """Append a journal entry to the index, recording the table's current state."""
+        entry['size'], entry['mtime_ns'] = file_state(self.table_path)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    def _rewrite(self, text: pd.DataFrame) -> None:
+        """Replace the table file atomically and re-index it."""
+        self.table_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.table_path.with_name(self.table_path.name + '.tmp')
+        text.to_csv(tmp_path, sep='\t', index=False)
+        os.replace(tmp_path, self.table_path)
+        self._index(text)
+        self.save()
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Replace the table's contents."""
+        self._rewrite(text_rows(df, [str(column) for column in df.columns]))
+
+    def append(self, df: pd.DataFrame) -> Tuple[int, int]:
+        """Append the rows that are new or changed; compact if too many are stale.
+
+        A row supersedes the current row of its key only if the key had a
+        single distinct row before this append; otherwise it is added
+        beside the key's other rows.
+
+        Returns:
+            (rows added, rows superseding a changed key) appended
+        """
+        new_columns = [str(column) for column in df.columns if str(column) not in self.columns]
+        if new_columns:
+            # The header changes, so the file is rewritten once with the new columns
+            self._rewrite(text_rows(self._read_table(), self.columns + new_columns))
+
+        text = text_rows(df, self.columns)
+        hashes = hash_rows(text)
+        keep = []
+        added: List[Tuple[str, str]] = []
+        superseded: List[Tuple[str, str]] = []
+        seen: Set[Tuple[str, str]] = set()
+        replaced: Set[str] = set()
+        for key, hashed in zip(row_keys(text, self.key, hashes), hashes):
+            # self.hashes is left as it was before the append until _replay
+            current = self.hashes.get(key, [])
+            if hashed in current or (key, hashed) in seen:
+                keep.append(False)
+                continue
+            keep.append(True)
+            seen.add((key, hashed))
+            added.append((key, hashed))
+            if len(current) == 1 and key not in replaced:
+                superseded.append((key, current[0]))
+                replaced.add(key)
+
+        new_rows = text[keep]
+        if new_rows.empty:
+            return 0, 0
+        with open(self.table_path, 'a') as f:
+            new_rows.to_csv(f, sep='\t', index=False, header=False)
+        entry = {'rows': self.rows + len(new_rows), 'added': added, 'superseded': superseded}
+        self._replay(entry)
+        self._log(entry)
+
+        if self.stale > COMPACT_FRACTION * self.rows:
+            self.compact()
+        return len(added) - len(superseded), len(superseded)
+
+    def compact(self) -> int:
+        """Drop the superseded rows, keeping every current row.
+
+        Returns:
+            Number of rows dropped
+        """
+        if not self.superseded:
+            return 0
+        text = self._read_table()
+        hashes = hash_rows(text)
+        stale = [pair in self.superseded for pair in zip(row_keys(text, self.key, hashes), hashes)]
+        dropped = sum(stale)
+        self._rewrite(text[[not is_stale for is_stale in stale]])
+        print(f"  Compacted {self.table_path.name}: dropped {dropped} superseded rows")
+        return dropped
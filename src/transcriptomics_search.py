@@ -4,14 +4,19 @@ This module searches NCBI SRA, GEO, and ArrayExpress for transcriptomics experim
 related to organisms in the taxa_and_genomes table.
 """
 
-import time
 from typing import Dict, List, Optional
 import pandas as pd
-import requests
 from pathlib import Path
 from Bio import Entrez
 import xml.etree.ElementTree as ET
 
+try:
+    from src.apis.rate_limits import throttle
+    from src.apis.snapshots import entrez_call, snapshot_get
+except ImportError:
+    from apis.rate_limits import throttle
+    from apis.snapshots import entrez_call, snapshot_get
+
 # Configure Entrez
 Entrez.email = "your.email@example.com"  # Should be configured
 
@@ -73,7 +78,9 @@ def search_ncbi_sra_transcriptomics(organisms: List[str]) -> List[Dict]:
             # Search SRA for RNA-seq experiments
             search_term = f'{organism}[Organism] AND biomol_rna[Properties] AND "rna seq"[Strategy]'
 
-            handle = Entrez.esearch(
+            throttle('ncbi')
+            handle = entrez_call(
+                Entrez.esearch,
                 db="sra",
                 term=search_term,
                 retmax=10,
@@ -88,7 +95,9 @@ def search_ncbi_sra_transcriptomics(organisms: List[str]) -> List[Dict]:
             print(f"  Found {len(search_results['IdList'])} SRA experiments for {organism}")
 
             # Fetch details for top results
-            handle = Entrez.efetch(
+            throttle('ncbi')
+            handle = entrez_call(
+                Entrez.efetch,
                 db="sra",
                 id=",".join(search_results["IdList"][:5]),
                 rettype="xml"
@@ -186,12 +195,8 @@ def search_ncbi_sra_transcriptomics(organisms: List[str]) -> List[Dict]:
                     print(f"    Error parsing experiment: {e}")
                     continue
 
-            # Rate limiting
-            time.sleep(1.0)
-
         except Exception as e:
             print(f"  Error searching SRA for {organism}: {e}")
-            time.sleep(1.0)
             continue
 
     return transcriptomics_data
@@ -215,7 +220,9 @@ def search_geo_transcriptomics(organisms: List[str]) -> List[Dict]:
             # Search GEO DataSets
             search_term = f'{organism}[Organism] AND "expression profiling by high throughput sequencing"[DataSet Type]'
 
-            handle = Entrez.esearch(
+            throttle('ncbi')
+            handle = entrez_call(
+                Entrez.esearch,
                 db="gds",
                 term=search_term,
                 retmax=5,
@@ -230,7 +237,9 @@ def search_geo_transcriptomics(organisms: List[str]) -> List[Dict]:
             print(f"  Found {len(search_results['IdList'])} GEO datasets for {organism}")
 
             # Fetch details
-            handle = Entrez.esummary(
+            throttle('ncbi')
+            handle = entrez_call(
+                Entrez.esummary,
                 db="gds",
                 id=",".join(search_results["IdList"])
             )
@@ -278,12 +287,8 @@ def search_geo_transcriptomics(organisms: List[str]) -> List[Dict]:
                     print(f"    Error parsing GEO record: {e}")
                     continue
 
-            # Rate limiting
-            time.sleep(1.0)
-
         except Exception as e:
             print(f"  Error searching GEO for {organism}: {e}")
-            time.sleep(1.0)
             continue
 
     return transcriptomics_data
@@ -316,7 +321,8 @@ def search_arrayexpress_transcriptomics(organisms: List[str]) -> List[Dict]:
                 "sortorder": "descending"
             }
 
-            response = requests.get(base_url, params=params, timeout=30)
+            throttle('ebi')
+            response = snapshot_get(base_url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -364,12 +370,8 @@ def search_arrayexpress_transcriptomics(organisms: List[str]) -> List[Dict]:
                     print(f"    Error parsing ArrayExpress record: {e}")
                     continue
 
-            # Rate limiting
-            time.sleep(1.0)
-
         except Exception as e:
             print(f"  Error searching ArrayExpress for {organism}: {e}")
-            time.sleep(1.0)
             continue
 
     return transcriptomics_data
@@ -2,121 +2,144 @@
 
 This script reads the extended TSV tables and converts them to LinkML database format
 for validation against the PFAS bioprocessing schema.
+
+Records are streamed table by table: each converter yields plain dicts, each
+record is checked against per-slot validators compiled once from the schema
+(see schema_validators) and written as soon as it is made, either into one
+YAML database file or as JSON Lines, one file per table. With --workers,
+tables are converted in separate processes and the YAML file is assembled
+from their parts in table order, so the output does not depend on workers.
 """
 
 import argparse
-import sys
+import csv
+import json
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
-from linkml_runtime.dumpers import yaml_dumper
+import yaml
 
-# Import generated LinkML models
 try:
-    from linkml_models import (
-        PFASBioprocessingDatabase,
-        GenomeRecord,
-        BiosampleRecord,
-        PathwayRecord,
-        GeneProteinRecord,
-        MacromolecularStructureRecord,
-        PublicationRecord,
-        DatasetRecord,
-        ChemicalCompoundRecord,
-        AssayMeasurementRecord,
-        BioprocessConditionsRecord,
-        ScreeningResultRecord,
-        ProtocolRecord,
-        StructureMethodEnum,
-        DataTypeEnum,
-        CompoundTypeEnum,
-        AssayTypeEnum,
-        ProcessTypeEnum,
-        HitClassificationEnum,
-        ProtocolTypeEnum,
-    )
+    from src.schema_validators import DEFAULT_SCHEMA, load_table_classes, load_validators
 except ImportError:
-    print("Error: LinkML models not found. Run 'uv run gen-python schema/PFAS_bioprocessing.yaml > src/linkml_models.py' first.")
-    sys.exit(1)
+    from schema_validators import DEFAULT_SCHEMA, load_table_classes, load_validators
+
+
+# libyaml's dumper when available, it is several times faster
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+OUTPUT_FORMATS = ('yaml', 'jsonl')
+
+# Most frequent schema issues listed per table
+SHOWN_ISSUES = 5
 
 
-def convert_genomes(tsv_path: Path) -> list[GenomeRecord]:
-    """Convert genomes TSV to GenomeRecord list.
+def iter_rows(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Rows of a TSV file as dicts, read one at a time, with None for empty fields."""
+    with open(tsv_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f, delimiter='\t'):
+            yield {column: value if value != '' else None for column, value in row.items() if column is not None}
+
+
+def text(row: Dict[str, Any], column: str) -> Optional[str]:
+    """Field of a row as text, None if empty or missing.
+
+    Examples:
+        >>> text({'a': 'x', 'b': None}, 'a'), text({'a': 'x', 'b': None}, 'b'), text({}, 'c')
+        ('x', None, None)
+    """
+    value = row.get(column)
+    return None if pd.isna(value) else str(value)
+
+
+def whole_number(value: Optional[str]) -> Optional[str]:
+    """Text of a number with a whole-number float written as an integer.
+
+    Examples:
+        >>> whole_number('75692.0'), whole_number('1.5'), whole_number(None)
+        ('75692', '1.5', None)
+    """
+    if value is not None and re.fullmatch(r'-?\d+\.0', value):
+        return value[:-2]
+    return value
+
+
+def compact(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Record without its empty slots, as the LinkML dumpers leave them out.
+
+    Examples:
+        >>> compact({'id': 'A', 'name': None, 'genes': []})
+        {'id': 'A'}
+    """
+    return {name: value for name, value in record.items() if value is not None and value != []}
+
+
+def convert_genomes(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert genomes TSV to GenomeRecord records.
 
     Args:
         tsv_path: Path to taxa_and_genomes_extended.tsv
 
-    Returns:
-        List of GenomeRecord instances
+    Yields:
+        GenomeRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('Scientific name')) or not row.get('Scientific name'):
             continue
 
-        record = GenomeRecord(
-            scientific_name=str(row['Scientific name']),
-            ncbi_taxon_id=int(row['NCBITaxon id']) if pd.notna(row.get('NCBITaxon id')) else None,
-            genome_identifier=str(row['Genome identifier (GenBank, IMG etc)']) if pd.notna(row.get('Genome identifier (GenBank, IMG etc)')) else None,
-            annotation_download_url=str(row['Annotation download URL']) if pd.notna(row.get('Annotation download URL')) else None
-        )
-        records.append(record)
-
-    return records
+        yield compact({
+            'scientific_name': str(row['Scientific name']),
+            'ncbi_taxon_id': whole_number(text(row, 'NCBITaxon id')),
+            'genome_identifier': text(row, 'Genome identifier (GenBank, IMG etc)'),
+            'annotation_download_url': text(row, 'Annotation download URL'),
+        })
 
 
-def convert_biosamples(tsv_path: Path) -> list[BiosampleRecord]:
-    """Convert biosamples TSV to BiosampleRecord list.
+def convert_biosamples(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert biosamples TSV to BiosampleRecord records.
 
     Args:
         tsv_path: Path to biosamples_extended.tsv
 
-    Returns:
-        List of BiosampleRecord instances
+    Yields:
+        BiosampleRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing Sample ID
         if pd.isna(row.get('Sample ID')) or not row.get('Sample ID'):
             continue
 
-        record = BiosampleRecord(
-            sample_id=str(row['Sample ID']),
-            sample_name=str(row['Sample Name']) if pd.notna(row.get('Sample Name')) else None,
-            organism=str(row['Organism']) if pd.notna(row.get('Organism')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
+        yield compact({
+            'sample_id': str(row['Sample ID']),
+            'sample_name': text(row, 'Sample Name'),
+            'organism': text(row, 'Organism'),
+            'download_url': text(row, 'Download URL'),
+        })
 
 
-def convert_pathways(tsv_path: Path) -> list[PathwayRecord]:
-    """Convert pathways TSV to PathwayRecord list.
+def convert_pathways(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert pathways TSV to PathwayRecord records.
 
     Args:
         tsv_path: Path to pathways_extended.tsv
 
-    Returns:
-        List of PathwayRecord instances
+    Yields:
+        PathwayRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('pathway id')) or pd.isna(row.get('pathway name')):
             continue
 
         # Extract first pathway ID from potentially multi-value field
         pathway_id_str = str(row['pathway id'])
-        import re
         # Try to extract first valid pathway ID
         ko_match = re.search(r'ko\d+|path:map\d+|PWY-?\d+|Custom_[A-Z0-9]+', pathway_id_str)
         pathway_id = ko_match.group(0) if ko_match else pathway_id_str.split(';')[0].split(',')[0].strip()
@@ -143,34 +166,29 @@ def convert_pathways(tsv_path: Path) -> list[PathwayRecord]:
             urls = re.findall(r'https?://[^\s;,()]+', url_str)
             download_url = urls[0] if urls else None
 
-        record = PathwayRecord(
-            pathway_id=pathway_id,
-            pathway_name=str(row['pathway name']),
-            organism=str(row['organism']) if pd.notna(row.get('organism')) else None,
-            genes=genes if genes else None,
-            genes_kegg=genes_kegg if genes_kegg else None,
-            download_url=download_url
-        )
-        records.append(record)
-
-    return records
+        yield compact({
+            'pathway_id': pathway_id,
+            'pathway_name': str(row['pathway name']),
+            'organism': text(row, 'organism'),
+            'genes': genes,
+            'genes_kegg': genes_kegg,
+            'download_url': download_url,
+        })
 
 
-def convert_genes_proteins(tsv_path: Path) -> list[GeneProteinRecord]:
-    """Convert genes/proteins TSV to GeneProteinRecord list.
+def convert_genes_proteins(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert genes/proteins TSV to GeneProteinRecord records.
 
     Args:
         tsv_path: Path to genes_and_proteins_extended.tsv
 
-    Returns:
-        List of GeneProteinRecord instances
+    Yields:
+        GeneProteinRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
     seen_ids = set()
     row_counter = {}
 
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         gene_id = row.get('gene or protein id')
         if pd.isna(gene_id) or not str(gene_id).strip():
@@ -181,7 +199,7 @@ def convert_genes_proteins(tsv_path: Path) -> list[GeneProteinRecord]:
         # Make gene_id unique by adding organism suffix if duplicate
         base_id = str(gene_id)
         unique_id = base_id
-        organism = str(row['organism (from taxa and genomes tab)']) if pd.notna(row.get('organism (from taxa and genomes tab)')) else None
+        organism = text(row, 'organism (from taxa and genomes tab)')
 
         if base_id in seen_ids:
             # Add counter to make it unique
@@ -200,200 +218,165 @@ def convert_genes_proteins(tsv_path: Path) -> list[GeneProteinRecord]:
         # Parse GO terms
         go_terms = None
         if pd.notna(row.get('GO')):
-            import re
             go_terms = re.findall(r'GO:\d{7}', str(row['GO']))
 
         # Parse CHEBI terms
         chebi_terms = None
         if pd.notna(row.get('CHEBI')):
-            import re
             chebi_terms = re.findall(r'CHEBI:\d+', str(row['CHEBI']))
 
-        record = GeneProteinRecord(
-            gene_protein_id=unique_id,
-            organism=organism,
-            annotation=str(row['annotation']),
-            ec_number=str(row['EC']) if pd.notna(row.get('EC')) and str(row['EC']).strip() else None,
-            go_terms=go_terms if go_terms else None,
-            chebi_terms=chebi_terms if chebi_terms else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
+        yield compact({
+            'gene_protein_id': unique_id,
+            'organism': organism,
+            'annotation': str(row['annotation']),
+            'ec_number': str(row['EC']) if pd.notna(row.get('EC')) and str(row['EC']).strip() else None,
+            'go_terms': go_terms,
+            'chebi_terms': chebi_terms,
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+# Method spellings in the sheet (lowercased) → structure_method_enum value
+STRUCTURE_METHODS = {
+    'x-ray crystallography': 'X-RAY DIFFRACTION',
+    'x-ray diffraction': 'X-RAY DIFFRACTION',
+    'nmr': 'SOLUTION NMR',
+    'nmr spectroscopy': 'SOLUTION NMR',
+    'solution nmr': 'SOLUTION NMR',
+    'solid-state nmr': 'SOLID-STATE NMR',
+    'cryo-em': 'ELECTRON MICROSCOPY',
+    'electron microscopy': 'ELECTRON MICROSCOPY',
+    'predicted': 'THEORETICAL MODEL',
+    'predicted structure': 'THEORETICAL MODEL',
+    'homology modeling': 'THEORETICAL MODEL',
+    'computational prediction': 'THEORETICAL MODEL',
+}
+
+
+def structure_method(value: Optional[str]) -> Optional[str]:
+    """Schema method of a sheet Method field: the first of its methods the enum has.
+
+    Examples:
+        >>> structure_method('X-ray crystallography'), structure_method('NMR, chemical characterization')
+        ('X-RAY DIFFRACTION', 'SOLUTION NMR')
+        >>> structure_method('Predicted/hypothetical'), structure_method('Chemical characterization')
+        ('THEORETICAL MODEL', None)
+    """
+    if value is None:
+        return None
+    for part in re.split(r'[,;/]', value):
+        method = STRUCTURE_METHODS.get(part.strip().lower())
+        if method is not None:
+            return method
+    return None
 
 
-def convert_structures(tsv_path: Path) -> list[MacromolecularStructureRecord]:
-    """Convert structures TSV to MacromolecularStructureRecord list.
+def convert_structures(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert structures TSV to MacromolecularStructureRecord records.
 
     Args:
         tsv_path: Path to macromolecular_structures_extended.tsv
 
-    Returns:
-        List of MacromolecularStructureRecord instances
+    Yields:
+        MacromolecularStructureRecord slot values
+
+    Examples:
+        >>> import tempfile
+        >>> tmp = tempfile.TemporaryDirectory()
+        >>> path = Path(tmp.name) / "structures.tsv"
+        >>> _ = path.write_text("Name\\tOrganism\\tPDB_ID\\tResolution\\tMethod\\n"
+        ...                     "XoxF-Ce\\tMethylobacterium extorquens\\t4MAE\\t1.6\\tX-ray crystallography\\n")
+        >>> records = list(convert_structures(path))
+        >>> records[0]['method']
+        'X-RAY DIFFRACTION'
+        >>> load_validators()['MacromolecularStructureRecord'].validate(records[0])[1]
+        []
+        >>> tmp.cleanup()
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing Name
         if pd.isna(row.get('Name')) or not row.get('Name'):
             continue
 
-        # Map method string to enum
-        method = None
-        if pd.notna(row.get('Method')):
-            method_str = str(row['Method'])
-            # Try to map to enum values
-            method_mapping = {
-                'X-ray crystallography': StructureMethodEnum['X-ray crystallography'],
-                'NMR': StructureMethodEnum['NMR spectroscopy'],
-                'NMR spectroscopy': StructureMethodEnum['NMR spectroscopy'],
-                'Cryo-EM': StructureMethodEnum['Cryo-EM'],
-                'Predicted structure': StructureMethodEnum['Predicted structure'],
-                'Homology modeling': StructureMethodEnum['Homology modeling'],
-                'Computational prediction': StructureMethodEnum['Computational prediction'],
-                'Chemical characterization': StructureMethodEnum['Chemical characterization'],
-            }
-            method = method_mapping.get(method_str, StructureMethodEnum['Multiple methods'])
-
-        record = MacromolecularStructureRecord(
-            structure_name=str(row['Name']),
-            organism=str(row['Organism']) if pd.notna(row.get('Organism')) else None,
-            components=str(row['Components']) if pd.notna(row.get('Components')) else None,
-            pdb_id=str(row['PDB_ID']) if pd.notna(row.get('PDB_ID')) and str(row['PDB_ID']) not in ['N/A', 'predicted', 'multiple'] else None,
-            resolution=str(row['Resolution']) if pd.notna(row.get('Resolution')) else None,
-            method=method,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
-
-
-def convert_publications(tsv_path: Path) -> list[PublicationRecord]:
-    """Convert publications TSV to PublicationRecord list.
+        yield compact({
+            'structure_name': str(row['Name']),
+            'organism': text(row, 'Organism'),
+            'components': text(row, 'Components'),
+            'pdb_id': str(row['PDB_ID']) if pd.notna(row.get('PDB_ID')) and str(row['PDB_ID']) not in ['N/A', 'predicted', 'multiple'] else None,
+            'resolution': text(row, 'Resolution'),
+            'method': structure_method(text(row, 'Method')),
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+def convert_publications(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert publications TSV to PublicationRecord records.
 
     Args:
         tsv_path: Path to publications_extended.tsv
 
-    Returns:
-        List of PublicationRecord instances
+    Yields:
+        PublicationRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing URL or Title
         if pd.isna(row.get('URL')) or pd.isna(row.get('Title')):
             continue
         if not str(row['URL']).strip() or not str(row['Title']).strip():
             continue
 
-        record = PublicationRecord(
-            url=str(row['URL']),
-            title=str(row['Title']),
-            journal=str(row['Journal']) if pd.notna(row.get('Journal')) else None,
-            year=int(row['Year']) if pd.notna(row.get('Year')) and str(row['Year']).isdigit() else None,
-            authors=str(row['Authors']) if pd.notna(row.get('Authors')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
+        yield compact({
+            'url': str(row['URL']),
+            'title': str(row['Title']),
+            'journal': text(row, 'Journal'),
+            'year': int(row['Year']) if pd.notna(row.get('Year')) and str(row['Year']).isdigit() else None,
+            'authors': text(row, 'Authors'),
+            'download_url': text(row, 'Download URL'),
+        })
 
-    return records
 
+def convert_datasets(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert datasets TSV to DatasetRecord records.
 
-def convert_datasets(tsv_path: Path) -> list[DatasetRecord]:
-    """Convert datasets TSV to DatasetRecord list.
+    The data type is passed through as written; values outside the schema's
+    enum are reported by the validator.
 
     Args:
         tsv_path: Path to datasets_extended.tsv
 
-    Returns:
-        List of DatasetRecord instances
+    Yields:
+        DatasetRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing Dataset name
         if pd.isna(row.get('Dataset name')) or not row.get('Dataset name'):
             continue
 
-        # Map data type to enum
-        data_type = None
-        if pd.notna(row.get('Data Type')):
-            dt_str = str(row['Data Type'])
-            # Try exact match first
-            try:
-                data_type = DataTypeEnum[dt_str]
-            except KeyError:
-                # Map common variations
-                dt_mapping = {
-                    'genomic DNA sequencing': DataTypeEnum['genomic DNA sequencing'],
-                    'RNA-seq': DataTypeEnum['RNA-seq'],
-                    'transcriptomics': DataTypeEnum['transcriptomics'],
-                    'proteomics': DataTypeEnum['proteomics'],
-                    'metabolomics': DataTypeEnum['metabolomics'],
-                    'metagenomics': DataTypeEnum['metagenomics'],
-                    'protein sequences': DataTypeEnum['protein sequences'],
-                    'pathways': DataTypeEnum['pathways'],
-                    'thermodynamics': DataTypeEnum['thermodynamics'],
-                }
-                data_type = dt_mapping.get(dt_str)
-
-        record = DatasetRecord(
-            dataset_name=str(row['Dataset name']),
-            data_type=data_type,
-            url=str(row['URL']) if pd.notna(row.get('URL')) else None,
-            size=str(row['Size (rows or MB)']) if pd.notna(row.get('Size (rows or MB)')) else None,
-            publication=str(row['Publication']) if pd.notna(row.get('Publication')) else None,
-            license=str(row['License']) if pd.notna(row.get('License')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
-
-
-def convert_chemicals(tsv_path: Path) -> list[ChemicalCompoundRecord]:
-    """Convert chemicals TSV to ChemicalCompoundRecord list.
+        yield compact({
+            'dataset_name': str(row['Dataset name']),
+            'data_type': text(row, 'Data Type'),
+            'url': text(row, 'URL'),
+            'size': text(row, 'Size (rows or MB)'),
+            'publication': text(row, 'Publication'),
+            'license': text(row, 'License'),
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+def convert_chemicals(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert chemicals TSV to ChemicalCompoundRecord records.
 
     Args:
         tsv_path: Path to chemicals.tsv
 
-    Returns:
-        List of ChemicalCompoundRecord instances
+    Yields:
+        ChemicalCompoundRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('chemical_id')) or pd.isna(row.get('chemical_name')):
             continue
 
-        # Map compound type to enum
-        compound_type = None
-        if pd.notna(row.get('compound_type')):
-            ct_str = str(row['compound_type'])
-            try:
-                compound_type = CompoundTypeEnum[ct_str]
-            except KeyError:
-                # Map common variations
-                ct_mapping = {
-                    'PFAS': CompoundTypeEnum.PFAS,
-                    'lanthanophore': CompoundTypeEnum.lanthanophore,
-                    'chelator': CompoundTypeEnum.chelator,
-                    'substrate': CompoundTypeEnum.substrate,
-                    'product': CompoundTypeEnum.product,
-                    'metabolite': CompoundTypeEnum.metabolite,
-                    'cofactor': CompoundTypeEnum.cofactor,
-                    'extractant': CompoundTypeEnum.extractant,
-                    'sensitizer': CompoundTypeEnum.sensitizer,
-                }
-                compound_type = ct_mapping.get(ct_str)
-
         # Parse molecular weight
         molecular_weight = None
         if pd.notna(row.get('molecular_weight')):
@@ -402,113 +385,73 @@ def convert_chemicals(tsv_path: Path) -> list[ChemicalCompoundRecord]:
             except (ValueError, TypeError):
                 pass
 
-        record = ChemicalCompoundRecord(
-            chemical_id=str(row['chemical_id']),
-            chemical_name=str(row['chemical_name']),
-            compound_type=compound_type,
-            molecular_formula=str(row['molecular_formula']) if pd.notna(row.get('molecular_formula')) else None,
-            molecular_weight=molecular_weight,
-            role_in_bioprocess=str(row['role_in_bioprocess']) if pd.notna(row.get('role_in_bioprocess')) else None,
-            chebi_id=str(row['chebi_id']) if pd.notna(row.get('chebi_id')) else None,
-            pubchem_id=str(row['pubchem_id']) if pd.notna(row.get('pubchem_id')) else None,
-            chembl_id=str(row['chembl_id']) if pd.notna(row.get('chembl_id')) else None,
-            properties=str(row['properties']) if pd.notna(row.get('properties')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
+        yield compact({
+            'chemical_id': str(row['chemical_id']),
+            'chemical_name': str(row['chemical_name']),
+            'compound_type': text(row, 'compound_type'),
+            'molecular_formula': text(row, 'molecular_formula'),
+            'molecular_weight': molecular_weight,
+            'role_in_bioprocess': text(row, 'role_in_bioprocess'),
+            'chebi_id': text(row, 'chebi_id'),
+            'pubchem_id': text(row, 'pubchem_id'),
+            'chembl_id': text(row, 'chembl_id'),
+            'properties': text(row, 'properties'),
+            'download_url': text(row, 'Download URL'),
+        })
 
-    return records
 
+# Abbreviated assay types → assay type
+ASSAY_TYPES = {
+    'TRL': 'time-resolved luminescence (TRL)',
+}
 
-def convert_assays(tsv_path: Path) -> list[AssayMeasurementRecord]:
-    """Convert assays TSV to AssayMeasurementRecord list.
+
+def convert_assays(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert assays TSV to AssayMeasurementRecord records.
 
     Args:
         tsv_path: Path to assays.tsv
 
-    Returns:
-        List of AssayMeasurementRecord instances
+    Yields:
+        AssayMeasurementRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('assay_id')) or pd.isna(row.get('assay_name')):
             continue
 
-        # Map assay type to enum
-        assay_type = None
-        if pd.notna(row.get('assay_type')):
-            at_str = str(row['assay_type'])
-            try:
-                assay_type = AssayTypeEnum[at_str]
-            except KeyError:
-                # Map common variations
-                at_mapping = {
-                    'time-resolved luminescence (TRL)': AssayTypeEnum['time-resolved luminescence (TRL)'],
-                    'TRL': AssayTypeEnum['time-resolved luminescence (TRL)'],
-                    'ICP-OES': AssayTypeEnum['ICP-OES'],
-                    'ICP-MS': AssayTypeEnum['ICP-MS'],
-                    'FACS': AssayTypeEnum['FACS'],
-                    'fluorescence spectroscopy': AssayTypeEnum['fluorescence spectroscopy'],
-                }
-                assay_type = at_mapping.get(at_str)
-
-        record = AssayMeasurementRecord(
-            assay_id=str(row['assay_id']),
-            assay_name=str(row['assay_name']),
-            assay_type=assay_type,
-            target_analytes=str(row['target_analytes']) if pd.notna(row.get('target_analytes')) else None,
-            detection_method=str(row['detection_method']) if pd.notna(row.get('detection_method')) else None,
-            detection_limit=str(row['detection_limit']) if pd.notna(row.get('detection_limit')) else None,
-            dynamic_range=str(row['dynamic_range']) if pd.notna(row.get('dynamic_range')) else None,
-            protocol_reference=str(row['protocol_reference']) if pd.notna(row.get('protocol_reference')) else None,
-            equipment_required=str(row['equipment_required']) if pd.notna(row.get('equipment_required')) else None,
-            sample_preparation=str(row['sample_preparation']) if pd.notna(row.get('sample_preparation')) else None,
-            data_output_format=str(row['data_output_format']) if pd.notna(row.get('data_output_format')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
-
-
-def convert_bioprocesses(tsv_path: Path) -> list[BioprocessConditionsRecord]:
-    """Convert bioprocesses TSV to BioprocessConditionsRecord list.
+        assay_type = text(row, 'assay_type')
+
+        yield compact({
+            'assay_id': str(row['assay_id']),
+            'assay_name': str(row['assay_name']),
+            'assay_type': ASSAY_TYPES.get(assay_type, assay_type),
+            'target_analytes': text(row, 'target_analytes'),
+            'detection_method': text(row, 'detection_method'),
+            'detection_limit': text(row, 'detection_limit'),
+            'dynamic_range': text(row, 'dynamic_range'),
+            'protocol_reference': text(row, 'protocol_reference'),
+            'equipment_required': text(row, 'equipment_required'),
+            'sample_preparation': text(row, 'sample_preparation'),
+            'data_output_format': text(row, 'data_output_format'),
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+def convert_bioprocesses(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert bioprocesses TSV to BioprocessConditionsRecord records.
 
     Args:
         tsv_path: Path to bioprocesses.tsv
 
-    Returns:
-        List of BioprocessConditionsRecord instances
+    Yields:
+        BioprocessConditionsRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('process_id')) or pd.isna(row.get('process_name')):
             continue
 
-        # Map process type to enum
-        process_type = None
-        if pd.notna(row.get('process_type')):
-            pt_str = str(row['process_type'])
-            try:
-                process_type = ProcessTypeEnum[pt_str]
-            except KeyError:
-                # Map common variations
-                pt_mapping = {
-                    'bioleaching': ProcessTypeEnum.bioleaching,
-                    'biomineralization': ProcessTypeEnum.biomineralization,
-                    'biosorption': ProcessTypeEnum.biosorption,
-                    'bioaccumulation': ProcessTypeEnum.bioaccumulation,
-                    'fermentation': ProcessTypeEnum.fermentation,
-                    'bioextraction': ProcessTypeEnum.bioextraction,
-                }
-                process_type = pt_mapping.get(pt_str)
-
         # Parse numeric fields
         pH = None
         if pd.notna(row.get('pH')):
@@ -525,223 +468,264 @@ def convert_bioprocesses(tsv_path: Path) -> list[BioprocessConditionsRecord]:
             except (ValueError, TypeError):
                 pass
 
-        record = BioprocessConditionsRecord(
-            process_id=str(row['process_id']),
-            process_name=str(row['process_name']),
-            process_type=process_type,
-            strain_used=str(row['strain_used']) if pd.notna(row.get('strain_used')) else None,
-            organism_used=str(row['organism_used']) if pd.notna(row.get('organism_used')) else None,
-            growth_conditions=str(row['growth_conditions']) if pd.notna(row.get('growth_conditions')) else None,
-            ree_concentration=str(row['ree_concentration']) if pd.notna(row.get('ree_concentration')) else None,
-            contact_time=str(row['contact_time']) if pd.notna(row.get('contact_time')) else None,
-            pH=pH,
-            temperature=temperature,
-            competing_ions=str(row['competing_ions']) if pd.notna(row.get('competing_ions')) else None,
-            process_parameters=str(row['process_parameters']) if pd.notna(row.get('process_parameters')) else None,
-            optimization_history=str(row['optimization_history']) if pd.notna(row.get('optimization_history')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
-
-
-def convert_screening_results(tsv_path: Path) -> list[ScreeningResultRecord]:
-    """Convert screening results TSV to ScreeningResultRecord list.
+        yield compact({
+            'process_id': str(row['process_id']),
+            'process_name': str(row['process_name']),
+            'process_type': text(row, 'process_type'),
+            'strain_used': text(row, 'strain_used'),
+            'organism_used': text(row, 'organism_used'),
+            'growth_conditions': text(row, 'growth_conditions'),
+            'ree_concentration': text(row, 'ree_concentration'),
+            'contact_time': text(row, 'contact_time'),
+            'pH': pH,
+            'temperature': temperature,
+            'competing_ions': text(row, 'competing_ions'),
+            'process_parameters': text(row, 'process_parameters'),
+            'optimization_history': text(row, 'optimization_history'),
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+def convert_screening_results(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert screening results TSV to ScreeningResultRecord records.
 
     Args:
         tsv_path: Path to screening_results.tsv
 
-    Returns:
-        List of ScreeningResultRecord instances
+    Yields:
+        ScreeningResultRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('experiment_id')):
             continue
 
-        # Map hit classification to enum
-        hit_classification = None
-        if pd.notna(row.get('hit_classification')):
-            hc_str = str(row['hit_classification'])
-            try:
-                hit_classification = HitClassificationEnum[hc_str]
-            except KeyError:
-                # Map common variations
-                hc_mapping = {
-                    'positive': HitClassificationEnum.positive,
-                    'negative': HitClassificationEnum.negative,
-                    'borderline': HitClassificationEnum.borderline,
-                    'false positive': HitClassificationEnum['false positive'],
-                    'validated': HitClassificationEnum.validated,
-                }
-                hit_classification = hc_mapping.get(hc_str)
-
-        record = ScreeningResultRecord(
-            experiment_id=str(row['experiment_id']),
-            plate_coordinates=str(row['plate_coordinates']) if pd.notna(row.get('plate_coordinates')) else None,
-            strain_barcode=str(row['strain_barcode']) if pd.notna(row.get('strain_barcode')) else None,
-            screening_assay=str(row['screening_assay']) if pd.notna(row.get('screening_assay')) else None,
-            target_ree=str(row['target_ree']) if pd.notna(row.get('target_ree')) else None,
-            measurement_values=str(row['measurement_values']) if pd.notna(row.get('measurement_values')) else None,
-            hit_classification=hit_classification,
-            validation_status=str(row['validation_status']) if pd.notna(row.get('validation_status')) else None,
-            follow_up_experiments=str(row['follow_up_experiments']) if pd.notna(row.get('follow_up_experiments')) else None,
-            assay_reference=str(row['assay_reference']) if pd.notna(row.get('assay_reference')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
-
-
-def convert_protocols(tsv_path: Path) -> list[ProtocolRecord]:
-    """Convert protocols TSV to ProtocolRecord list.
+        yield compact({
+            'experiment_id': str(row['experiment_id']),
+            'plate_coordinates': text(row, 'plate_coordinates'),
+            'strain_barcode': text(row, 'strain_barcode'),
+            'screening_assay': text(row, 'screening_assay'),
+            'target_ree': text(row, 'target_ree'),
+            'measurement_values': text(row, 'measurement_values'),
+            'hit_classification': text(row, 'hit_classification'),
+            'validation_status': text(row, 'validation_status'),
+            'follow_up_experiments': text(row, 'follow_up_experiments'),
+            'assay_reference': text(row, 'assay_reference'),
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+def convert_protocols(tsv_path: Path) -> Iterator[Dict[str, Any]]:
+    """Convert protocols TSV to ProtocolRecord records.
 
     Args:
         tsv_path: Path to protocols.tsv
 
-    Returns:
-        List of ProtocolRecord instances
+    Yields:
+        ProtocolRecord slot values
     """
-    df = pd.read_csv(tsv_path, sep='\t', dtype=str, keep_default_na=False); df = df.replace('', pd.NA)
-    records = []
-
-    for _, row in df.iterrows():
+    for row in iter_rows(tsv_path):
         # Skip rows with missing required fields
         if pd.isna(row.get('protocol_id')) or pd.isna(row.get('protocol_name')):
             continue
 
-        # Map protocol type to enum
-        protocol_type = None
-        if pd.notna(row.get('protocol_type')):
-            pt_str = str(row['protocol_type'])
-            try:
-                protocol_type = ProtocolTypeEnum[pt_str]
-            except KeyError:
-                # Map common variations
-                pt_mapping = {
-                    'assay protocol': ProtocolTypeEnum['assay protocol'],
-                    'cultivation protocol': ProtocolTypeEnum['cultivation protocol'],
-                    'extraction protocol': ProtocolTypeEnum['extraction protocol'],
-                    'transformation protocol': ProtocolTypeEnum['transformation protocol'],
-                    'screening protocol': ProtocolTypeEnum['screening protocol'],
-                    'sample preparation': ProtocolTypeEnum['sample preparation'],
-                    'quality control': ProtocolTypeEnum['quality control'],
-                }
-                protocol_type = pt_mapping.get(pt_str)
-
-        record = ProtocolRecord(
-            protocol_id=str(row['protocol_id']),
-            protocol_name=str(row['protocol_name']),
-            protocol_type=protocol_type,
-            protocol_version=str(row['protocol_version']) if pd.notna(row.get('protocol_version')) else None,
-            protocol_doi=str(row['protocol_doi']) if pd.notna(row.get('protocol_doi')) else None,
-            protocol_url=str(row['protocol_url']) if pd.notna(row.get('protocol_url')) else None,
-            associated_assays=str(row['associated_assays']) if pd.notna(row.get('associated_assays')) else None,
-            equipment_list=str(row['equipment_list']) if pd.notna(row.get('equipment_list')) else None,
-            success_criteria=str(row['success_criteria']) if pd.notna(row.get('success_criteria')) else None,
-            quality_control=str(row['quality_control']) if pd.notna(row.get('quality_control')) else None,
-            dbtl_iteration=str(row['dbtl_iteration']) if pd.notna(row.get('dbtl_iteration')) else None,
-            validation_status=str(row['validation_status']) if pd.notna(row.get('validation_status')) else None,
-            user_notes=str(row['user_notes']) if pd.notna(row.get('user_notes')) else None,
-            download_url=str(row['Download URL']) if pd.notna(row.get('Download URL')) else None
-        )
-        records.append(record)
-
-    return records
-
-
-def convert_all_tsvs(data_dir: Path, output_path: Optional[Path] = None) -> PFASBioprocessingDatabase:
-    """Convert all TSV files to LinkML database.
+        yield compact({
+            'protocol_id': str(row['protocol_id']),
+            'protocol_name': str(row['protocol_name']),
+            'protocol_type': text(row, 'protocol_type'),
+            'protocol_version': text(row, 'protocol_version'),
+            'protocol_doi': text(row, 'protocol_doi'),
+            'protocol_url': text(row, 'protocol_url'),
+            'associated_assays': text(row, 'associated_assays'),
+            'equipment_list': text(row, 'equipment_list'),
+            'success_criteria': text(row, 'success_criteria'),
+            'quality_control': text(row, 'quality_control'),
+            'dbtl_iteration': text(row, 'dbtl_iteration'),
+            'validation_status': text(row, 'validation_status'),
+            'user_notes': text(row, 'user_notes'),
+            'download_url': text(row, 'Download URL'),
+        })
+
+
+# Database slot → (TSV file, converter, record label, whether the file may be missing)
+TABLES = {
+    'genomes': ("PFAS_Data_for_AI_taxa_and_genomes_extended.tsv", convert_genomes, "genome", False),
+    'biosamples': ("PFAS_Data_for_AI_biosamples_extended.tsv", convert_biosamples, "biosample", False),
+    'pathways': ("PFAS_Data_for_AI_pathways_extended.tsv", convert_pathways, "pathway", False),
+    'genes_proteins': ("PFAS_Data_for_AI_genes_and_proteins_extended.tsv", convert_genes_proteins, "gene/protein", False),
+    'structures': ("PFAS_Data_for_AI_macromolecular_structures_extended.tsv", convert_structures, "structure", False),
+    'publications': ("PFAS_Data_for_AI_publications_extended.tsv", convert_publications, "publication", False),
+    'datasets': ("PFAS_Data_for_AI_datasets_extended.tsv", convert_datasets, "dataset", False),
+    # Experimental data tables
+    'chemicals': ("PFAS_Data_for_AI_chemicals.tsv", convert_chemicals, "chemical", True),
+    'assays': ("PFAS_Data_for_AI_assays.tsv", convert_assays, "assay", True),
+    'bioprocesses': ("PFAS_Data_for_AI_bioprocesses.tsv", convert_bioprocesses, "bioprocess", True),
+    'screening_results': ("PFAS_Data_for_AI_screening_results.tsv", convert_screening_results, "screening result", True),
+    'protocols': ("PFAS_Data_for_AI_protocols.tsv", convert_protocols, "protocol", True),
+}
+
+
+def write_record(stream, table: str, record: Dict[str, Any], output_format: str, first: bool) -> None:
+    """Write one record of a table to a YAML or JSON Lines stream.
+
+    YAML records are written as items of the table's list, so the parts of
+    all tables concatenate into one database document.
+    """
+    if output_format == 'jsonl':
+        stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return
+    if first:
+        stream.write(f"{table}:\n")
+    yaml.dump([record], stream, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+
+def convert_table(
+    table: str,
+    data_dir: Path,
+    output_path: Optional[Path] = None,
+    output_format: str = 'yaml',
+    schema_path: Path = DEFAULT_SCHEMA
+) -> Dict[str, Any]:
+    """Convert one table, checking and writing its records as they are made.
+
+    The output file is written atomically; a missing optional table gives
+    an empty file.
+
+    Args:
+        table: Database slot of the table (key of TABLES)
+        data_dir: Directory containing the TSV files
+        output_path: File to write the records to (None: check only)
+        output_format: 'yaml' (the table's part of the database) or 'jsonl'
+        schema_path: LinkML schema to check the records against
+
+    Returns:
+        Dict with 'table', 'label', 'found', 'records', 'invalid' (records
+        with schema issues) and 'issues' (message → count)
+    """
+    tsv_name, converter, label, optional = TABLES[table]
+    tsv_path = data_dir / tsv_name
+    found = tsv_path.exists() or not optional
+    class_name = load_table_classes(schema_path).get(table)
+    validator = load_validators(schema_path).get(class_name)
+
+    records = invalid = 0
+    issues = Counter()
+    if validator is None:
+        issues[f"table '{table}' is not defined by the schema"] += 1
+
+    tmp_path = output_path.with_name(output_path.name + '.tmp') if output_path else None
+    stream = open(tmp_path, 'w', encoding='utf-8') if tmp_path else None
+    try:
+        for record in (converter(tsv_path) if found else ()):
+            if validator is not None:
+                record, errors = validator.validate(record)
+                if errors:
+                    invalid += 1
+                    issues.update(errors)
+            if stream is not None:
+                write_record(stream, table, record, output_format, first=records == 0)
+            records += 1
+    finally:
+        if stream is not None:
+            stream.close()
+    if tmp_path:
+        os.replace(tmp_path, output_path)
+
+    return {
+        'table': table,
+        'label': label,
+        'found': found,
+        'records': records,
+        'invalid': invalid,
+        'issues': issues,
+    }
+
+
+def _convert_table_worker(args: Tuple) -> Dict[str, Any]:
+    """Process pool entry point for convert_table."""
+    return convert_table(*args)
+
+
+def print_table_summary(summary: Dict[str, Any]) -> None:
+    """Report the records and schema issues of one converted table."""
+    if not summary['found']:
+        return
+    print(f"  Converted {summary['records']} {summary['label']} records")
+    if summary['issues']:
+        print(f"    ⚠️  {summary['invalid']} with schema issues:")
+        for message, count in summary['issues'].most_common(SHOWN_ISSUES):
+            print(f"      {message} ({count})")
+        if len(summary['issues']) > SHOWN_ISSUES:
+            print(f"      ... {len(summary['issues']) - SHOWN_ISSUES} more kinds of issue")
+
+
+def convert_all_tsvs(
+    data_dir: Path,
+    output_path: Optional[Path] = None,
+    output_format: str = 'yaml',
+    workers: int = 1,
+    schema_path: Path = DEFAULT_SCHEMA
+) -> List[Dict[str, Any]]:
+    """Convert all TSV files to LinkML database records.
 
     Args:
         data_dir: Directory containing extended TSV files
-        output_path: Optional path to save YAML output
+        output_path: YAML database file, or directory of <table>.jsonl files
+            for 'jsonl' (None: check only)
+        output_format: 'yaml' or 'jsonl'
+        workers: Tables converted in parallel processes (1: in this process)
+        schema_path: LinkML schema to check the records against
 
     Returns:
-        PFASBioprocessingDatabase instance
+        convert_table() results, in table order
     """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
     print(f"Converting TSV files from {data_dir}...")
 
-    # Convert each table
-    genomes = convert_genomes(data_dir / "PFAS_Data_for_AI_taxa_and_genomes_extended.tsv")
-    print(f"  Converted {len(genomes)} genome records")
-
-    biosamples = convert_biosamples(data_dir / "PFAS_Data_for_AI_biosamples_extended.tsv")
-    print(f"  Converted {len(biosamples)} biosample records")
-
-    pathways = convert_pathways(data_dir / "PFAS_Data_for_AI_pathways_extended.tsv")
-    print(f"  Converted {len(pathways)} pathway records")
-
-    genes_proteins = convert_genes_proteins(data_dir / "PFAS_Data_for_AI_genes_and_proteins_extended.tsv")
-    print(f"  Converted {len(genes_proteins)} gene/protein records")
-
-    structures = convert_structures(data_dir / "PFAS_Data_for_AI_macromolecular_structures_extended.tsv")
-    print(f"  Converted {len(structures)} structure records")
-
-    publications = convert_publications(data_dir / "PFAS_Data_for_AI_publications_extended.tsv")
-    print(f"  Converted {len(publications)} publication records")
-
-    datasets = convert_datasets(data_dir / "PFAS_Data_for_AI_datasets_extended.tsv")
-    print(f"  Converted {len(datasets)} dataset records")
-
-    # Convert new experimental data tables
-    chemicals = []
-    chemicals_file = data_dir / "PFAS_Data_for_AI_chemicals.tsv"
-    if chemicals_file.exists():
-        chemicals = convert_chemicals(chemicals_file)
-        print(f"  Converted {len(chemicals)} chemical records")
-
-    assays = []
-    assays_file = data_dir / "PFAS_Data_for_AI_assays.tsv"
-    if assays_file.exists():
-        assays = convert_assays(assays_file)
-        print(f"  Converted {len(assays)} assay records")
-
-    bioprocesses = []
-    bioprocesses_file = data_dir / "PFAS_Data_for_AI_bioprocesses.tsv"
-    if bioprocesses_file.exists():
-        bioprocesses = convert_bioprocesses(bioprocesses_file)
-        print(f"  Converted {len(bioprocesses)} bioprocess records")
-
-    screening_results = []
-    screening_file = data_dir / "PFAS_Data_for_AI_screening_results.tsv"
-    if screening_file.exists():
-        screening_results = convert_screening_results(screening_file)
-        print(f"  Converted {len(screening_results)} screening result records")
-
-    protocols = []
-    protocols_file = data_dir / "PFAS_Data_for_AI_protocols.tsv"
-    if protocols_file.exists():
-        protocols = convert_protocols(protocols_file)
-        print(f"  Converted {len(protocols)} protocol records")
-
-    # Create database
-    database = PFASBioprocessingDatabase(
-        genomes=genomes,
-        biosamples=biosamples,
-        pathways=pathways,
-        genes_proteins=genes_proteins,
-        structures=structures,
-        publications=publications,
-        datasets=datasets,
-        chemicals=chemicals,
-        assays=assays,
-        bioprocesses=bioprocesses,
-        screening_results=screening_results,
-        protocols=protocols
-    )
-
-    # Save if output path provided
-    if output_path:
-        yaml_dumper.dump(database, str(output_path))
+    # Each table goes to its own file: the YAML parts are joined below
+    tables = list(TABLES)
+    if output_path is None:
+        parts = [None] * len(tables)
+    elif output_format == 'jsonl':
+        output_path.mkdir(parents=True, exist_ok=True)
+        parts = [output_path / f"{table}.jsonl" for table in tables]
+    else:
+        parts = [output_path.with_name(f"{output_path.name}.{table}.part") for table in tables]
+
+    # Compiled here so that forked workers inherit the validators
+    load_validators(schema_path)
+    load_table_classes(schema_path)
+
+    tasks = [
+        (table, data_dir, part, output_format, schema_path)
+        for table, part in zip(tables, parts)
+    ]
+    if workers <= 1:
+        summaries = []
+        for task in tasks:
+            summaries.append(_convert_table_worker(task))
+            print_table_summary(summaries[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Results arrive in table order, whichever worker finishes first
+            summaries = list(executor.map(_convert_table_worker, tasks))
+        for summary in summaries:
+            print_table_summary(summary)
+
+    if output_path is not None and output_format == 'yaml':
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        with open(tmp_path, 'wb') as output:
+            for part in parts:
+                with open(part, 'rb') as stream:
+                    output.write(stream.read())
+                part.unlink()
+        os.replace(tmp_path, output_path)
+
+    if output_path is not None:
         print(f"\nDatabase saved to {output_path}")
 
-    return database
+    return summaries
 
 
 def main():
@@ -759,22 +743,38 @@ def main():
         '--output',
         type=Path,
         default=Path('data/linkml_database.yaml'),
-        help='Output YAML file path (default: data/linkml_database.yaml)'
+        help='Output YAML file, or output directory with --format jsonl (default: data/linkml_database.yaml)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=OUTPUT_FORMATS,
+        default='yaml',
+        help='yaml: one database file; jsonl: one <table>.jsonl file per table (default: yaml)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Convert tables in this many parallel processes (default: 1)'
+    )
+    parser.add_argument(
+        '--schema',
+        type=Path,
+        default=DEFAULT_SCHEMA,
+        help=f'LinkML schema to check records against (default: {DEFAULT_SCHEMA})'
     )
 
     args = parser.parse_args()
 
     # Convert all TSVs
-    database = convert_all_tsvs(args.data_dir, args.output)
-
-    print(f"\nConversion complete!")
-    total_records = (
-        len(database.genomes) + len(database.biosamples) + len(database.pathways) +
-        len(database.genes_proteins) + len(database.structures) + len(database.publications) +
-        len(database.datasets) + len(database.chemicals) + len(database.assays) +
-        len(database.bioprocesses) + len(database.screening_results) + len(database.protocols)
-    )
-    print(f"Total records: {total_records}")
+    start = time.time()
+    summaries = convert_all_tsvs(args.data_dir, args.output, args.format, args.workers, args.schema)
+
+    print(f"\nConversion complete! ({time.time() - start:.2f}s)")
+    print(f"Total records: {sum(summary['records'] for summary in summaries)}")
+    invalid = sum(summary['invalid'] for summary in summaries)
+    if invalid:
+        print(f"⚠️  Records with schema issues: {invalid}")
 
 
 if __name__ == "__main__":
@@ -8,7 +8,6 @@ import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
-import time
 
 try:
     from src.apis.uniprot_client import UniProtClient
@@ -111,8 +110,6 @@ def extract_functions_from_uniprot(
                     all_proteins.extend(results)
                     print(f"    Found {len(results)} proteins")
 
-                time.sleep(0.5)  # Rate limiting
-
             except Exception as e:
                 print(f"    Error searching: {e}")
                 continue
@@ -181,8 +178,6 @@ def extract_functions_from_uniprot(
                 chemicals[chebi_id]['proteins'].add(accession)
                 chemicals[chebi_id]['organisms'].add(organism)
 
-            time.sleep(0.5)  # Rate limiting
-
         except Exception as e:
             print(f"  Error processing {accession}: {e}")
             continue
@@ -2,29 +2,184 @@
 
 This script checks referential integrity and consistency across the extended data tables,
 ensuring that references between sheets (genomes, genes, pathways, etc.) are valid.
+
+Tables are loaded once with every column read as text (no type inference, so
+identifiers keep their exact spelling), the identifier sets the rules join
+against are built once, and each rule works on whole columns. Rules are
+independent and run in a thread pool; their messages are reported in rule
+order.
+
+Validation is incremental (see validation_state): rules whose tables did not
+change since the last run reuse their findings, and row-by-row checks only
+revisit changed rows and rows referencing keys that now resolve differently.
 """
 
 import argparse
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
+try:
+    from src.validation_state import DEFAULT_STATE_NAME, ValidationState, content_hash, row_hashes
+except ImportError:
+    from validation_state import DEFAULT_STATE_NAME, ValidationState, content_hash, row_hashes
+
+
+# Bump when a validation rule changes, so the next run does not reuse the
+# stored findings and row results of unchanged tables
+RULES_VERSION = 1
+
+# Genus placeholders that are not expected in the genomes table
+UNLISTED_GENERA = ("Various", "Methylotroph")
+
+EXTENDED_TABLES = (
+    "taxa_and_genomes_extended.tsv",
+    "biosamples_extended.tsv",
+    "pathways_extended.tsv",
+    "genes_and_proteins_extended.tsv",
+    "macromolecular_structures_extended.tsv",
+    "publications_extended.tsv",
+    "datasets_extended.tsv",
+)
+
+EXPERIMENTAL_TABLES = (
+    "chemicals.tsv",
+    "assays.tsv",
+    "bioprocesses.tsv",
+    "screening_results.tsv",
+    "protocols.tsv",
+)
+
+# Tables each rule reads; a rule reuses its previous findings while they are unchanged
+RULE_TABLES = {
+    'required_columns': EXTENDED_TABLES,
+    'identifier_uniqueness': EXTENDED_TABLES + EXPERIMENTAL_TABLES,
+    'genome_references': (
+        "taxa_and_genomes_extended.tsv", "genes_and_proteins_extended.tsv",
+        "pathways_extended.tsv", "macromolecular_structures_extended.tsv",
+    ),
+    'biosample_references': ("biosamples_extended.tsv",),
+    'pathway_gene_references': ("pathways_extended.tsv", "genes_and_proteins_extended.tsv"),
+    'url_consistency': EXTENDED_TABLES,
+    'data_completeness': (
+        "taxa_and_genomes_extended.tsv", "biosamples_extended.tsv",
+        "genes_and_proteins_extended.tsv", "macromolecular_structures_extended.tsv",
+    ),
+    'experimental_cross_references': (
+        "screening_results.tsv", "assays.tsv", "protocols.tsv",
+        "bioprocesses.tsv", "taxa_and_genomes_extended.tsv",
+    ),
+    'chemical_references': ("chemicals.tsv",),
+}
+
+# Results of checking a set of rows: row label → (referenced keys, results)
+RowResults = Dict[object, Tuple[List[str], List[str]]]
+
+
+@dataclass
+class Findings:
+    """Messages produced by one validation rule."""
+
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    info: List[str] = field(default_factory=list)
+
+
+def column_values(df: pd.DataFrame, column: str) -> pd.Series:
+    """Non-empty cells of a column as stripped strings, keeping the row index.
+
+    Examples:
+        >>> df = pd.DataFrame({"id": [" A1 ", None, "B2"]})
+        >>> column_values(df, "id").tolist()
+        ['A1', 'B2']
+        >>> column_values(df, "missing").tolist()
+        []
+    """
+    if column not in df.columns:
+        return pd.Series([], dtype=object)
+    return df[column].dropna().astype(str).str.strip()
+
+
+def row_labels(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column used to name rows in messages (None where the column is missing)."""
+    if column in df.columns:
+        return df[column]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def first_words(values: pd.Series) -> pd.Series:
+    """First word of each value ('' for empty values).
+
+    Examples:
+        >>> first_words(pd.Series(["Pseudomonas putida KT2440", ""])).tolist()
+        ['Pseudomonas', '']
+    """
+    return values.str.split().str[0].fillna('')
+
+
+def genus_known(genera: pd.Series, organism_blob: str) -> pd.Series:
+    """Whether each genus occurs inside any genomes table organism name.
+
+    organism_blob holds the organism names joined by newlines; a genus has no
+    whitespace, so a substring test on the blob equals testing every name.
+    Each distinct genus is tested once.
+
+    Examples:
+        >>> genus_known(pd.Series(["Pseudo", "Bacillus"]), "Pseudomonas putida").tolist()
+        [True, False]
+    """
+    known = {genus: bool(genus) and genus in organism_blob for genus in genera.unique()}
+    return genera.map(known).astype(bool)
+
+
+def matches_mask(values: pd.Series, pattern: str) -> pd.Series:
+    """Boolean mask of values matching a regex at their start (re.match)."""
+    return values.str.match(pattern).astype(bool)
+
+
+def invalid_pubchem_ids(pubchem: pd.Series) -> pd.Series:
+    """Messages for PubChem IDs that are not numeric.
+
+    Examples:
+        >>> invalid_pubchem_ids(pd.Series(["9555", "69619.0", "CID 12"])).tolist()
+        ['Invalid PubChem ID format: CID 12 (should be numeric)']
+    """
+    # Remove .0 suffix if present (float-formatted IDs)
+    pubchem = pubchem.where(~pubchem.str.endswith('.0').astype(bool), pubchem.str[:-2])
+    invalid = pubchem[~pubchem.str.isdigit().astype(bool)]
+    return "Invalid PubChem ID format: " + invalid + " (should be numeric)"
+
 
 class ConsistencyValidator:
     """Validator for cross-sheet data consistency."""
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        workers: Optional[int] = None,
+        state: Optional[ValidationState] = None
+    ):
         """Initialize validator with data directory.
 
         Args:
             data_dir: Directory containing extended TSV files
+            workers: Threads for running validation rules (default: executor default)
+            state: Results of the previous run to validate incrementally against
+                (default: validate everything)
         """
         self.data_dir = data_dir
+        self.workers = workers
+        self.state = state
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
+        # Table file name → content hash (None if missing)
+        self.table_hashes: Dict[str, Optional[str]] = {}
 
         # Load all tables
         self.genomes_df = self._load_table("taxa_and_genomes_extended.tsv")
@@ -42,6 +197,20 @@ class ConsistencyValidator:
         self.screening_results_df = self._load_table("screening_results.tsv")
         self.protocols_df = self._load_table("protocols.tsv")
 
+        # Identifier sets the rules join against, built once
+        self.organisms: Set[str] = set(column_values(self.genomes_df, 'Scientific name'))
+        self.organism_blob = '\n'.join(sorted(self.organisms))
+        self.genome_ids: Set[str] = set(column_values(self.genomes_df, 'Genome identifier (GenBank, IMG etc)'))
+        self.sample_ids: Set[str] = set(column_values(self.biosamples_df, 'Sample ID'))
+        gene_ids = column_values(self.genes_df, 'gene or protein id')
+        # Also accept base IDs without suffixes
+        self.gene_ids: Set[str] = set(gene_ids) | set(
+            gene_ids[gene_ids.str.contains('_', regex=False).astype(bool)].str.split('_').str[0]
+        )
+        self.assay_ids: Set[str] = set(column_values(self.assays_df, 'assay_id'))
+        self.protocol_ids: Set[str] = set(column_values(self.protocols_df, 'protocol_id'))
+        self.process_ids: Set[str] = set(column_values(self.bioprocesses_df, 'process_id'))
+
     def _get_column(self, df: pd.DataFrame, *column_names: str):
         """Get column from DataFrame, trying multiple name variations.
 
@@ -70,148 +239,269 @@ class ConsistencyValidator:
         return any(col_name in df.columns for col_name in column_names)
 
     def _load_table(self, filename: str) -> pd.DataFrame:
-        """Load a TSV table.
+        """Load a TSV table with all columns as text.
 
         Args:
             filename: Filename of TSV (without path prefix)
 
         Returns:
-            DataFrame with the table data
+            DataFrame with the table data (empty cells as NaN)
         """
         filepath = self.data_dir / f"PFAS_Data_for_AI_{filename}"
         if not filepath.exists():
             self.warnings.append(f"File not found: {filepath}")
+            self.table_hashes[filename] = None
             return pd.DataFrame()
-        return pd.read_csv(filepath, sep='\t')
+        data = filepath.read_bytes()
+        self.table_hashes[filename] = content_hash(data)
+        return pd.read_csv(io.BytesIO(data), sep='\t', dtype=str)
+
+    def _row_results(
+        self,
+        rule: str,
+        df: pd.DataFrame,
+        columns: List[str],
+        check: Callable[[pd.DataFrame], RowResults],
+        resolve: Callable[[Set[str]], Dict[str, bool]]
+    ) -> List[str]:
+        """Results of a row-by-row check, in row order, rechecking only what changed.
+
+        Without a state store every row is checked. With one, a row reuses its
+        stored results if the columns the rule reads are unchanged and every
+        key it references resolves as before.
+
+        Args:
+            rule: Name of the check in the state store
+            df: Table to check
+            columns: Columns the check reads (including those named in messages)
+            check: Checks a subset of rows; returns results for rows with
+                references or results
+            resolve: Resolves referenced keys (e.g. to whether they exist)
+
+        Returns:
+            Results of all rows, in row order
+        """
+        if df.empty:
+            return []
+        if self.state is None:
+            checked = check(df)
+            return [result for label in df.index for result in checked.get(label, ((), ()))[1]]
+
+        hashes = row_hashes(df, columns)
+        cached_rows, cached_keys = self.state.row_cache(rule)
+        cached_hashes = set(hashes[hashes.isin(cached_rows.keys())])
+        keys = {key for row_hash in cached_hashes for key in cached_rows[row_hash][0]}
+        resolved = resolve(keys)
+        changed_keys = {key for key in keys if cached_keys.get(key) != resolved[key]}
+        reusable = {
+            row_hash for row_hash in cached_hashes
+            if not changed_keys.intersection(cached_rows[row_hash][0])
+        }
+        reuse = hashes.isin(reusable)
+
+        checked = check(df[~reuse.to_numpy()])
+        new_keys = {key for refs, _ in checked.values() for key in refs} - resolved.keys()
+        resolved.update(resolve(new_keys))
+
+        rows: Dict[str, List] = {}
+        results: List[str] = []
+        for label, row_hash, reused in zip(df.index, hashes, reuse):
+            if reused:
+                refs, row_results = cached_rows[row_hash]
+            else:
+                refs, row_results = checked.get(label, ([], []))
+                refs, row_results = list(refs), list(row_results)
+            rows[row_hash] = [refs, row_results]
+            results.extend(row_results)
+
+        used_keys = {key: resolved[key] for refs, _ in rows.values() for key in refs}
+        self.state.record_rows(rule, rows, used_keys, checked=int((~reuse).sum()), total=len(df))
+        return results
+
+    def _check_organisms(
+        self,
+        rows: pd.DataFrame,
+        column: str,
+        describe: Callable[[object, str, str], str],
+        skip: Tuple[str, ...] = ()
+    ) -> RowResults:
+        """Check organism names of rows by genus against the genomes table names.
+
+        Args:
+            rows: Rows to check
+            column: Organism column
+            describe: Message for (row label, organism, genus) of an unmatched organism
+            skip: Genera not expected in the genomes table
+
+        Returns:
+            Row label → ([genus], [message if unmatched])
+        """
+        organisms = column_values(rows, column)
+        genera = first_words(organisms)
+        unmatched = ~genus_known(genera, self.organism_blob) & (genera != '') & ~genera.isin(skip)
+        results: RowResults = {label: ([genus], []) for label, genus in genera[genera != ''].items()}
+        for label, org_str, genus in zip(organisms.index[unmatched], organisms[unmatched], genera[unmatched]):
+            results[label][1].append(describe(label, org_str, genus))
+        return results
+
+    def _resolve_genera(self, genera: Set[str]) -> Dict[str, bool]:
+        """Whether each genus occurs in a genomes table organism name."""
+        return {genus: genus in self.organism_blob for genus in genera}
+
+    def _check_references(
+        self,
+        rows: pd.DataFrame,
+        columns: List[str],
+        valid: Set[str],
+        describe: Callable[[object, str], str],
+        extract: Optional[Callable[[pd.Series], pd.Series]] = None
+    ) -> RowResults:
+        """Check the identifiers rows reference against a set of valid ones.
+
+        Args:
+            rows: Rows to check
+            columns: Reference columns, checked in this order within a row
+            valid: Valid identifiers
+            describe: Message for (row label, identifier) of an unknown identifier
+            extract: Pulls identifiers out of the stripped cells (default: the
+                non-empty cell itself)
+
+        Returns:
+            Row label → (referenced identifiers, messages for unknown ones)
+        """
+        results: RowResults = {}
+        for column in columns:
+            values = column_values(rows, column)
+            refs = extract(values) if extract else values[values != '']
+            known = refs.isin(valid).to_numpy()
+            for label, ref, is_known in zip(refs.index, refs, known):
+                entry = results.setdefault(label, ([], []))
+                entry[0].append(ref)
+                if not is_known:
+                    entry[1].append(describe(label, ref))
+        return results
+
+    def _check_values(
+        self,
+        rows: pd.DataFrame,
+        column: str,
+        produce: Callable[[pd.Series], pd.Series]
+    ) -> RowResults:
+        """Per-row results derived from one column, without references.
+
+        Args:
+            rows: Rows to check
+            column: Column to read
+            produce: Maps the stripped non-empty cells to results, keeping
+                their row labels (a label may repeat or be left out)
+
+        Returns:
+            Row label → ([], results)
+        """
+        results: RowResults = {}
+        for label, result in produce(column_values(rows, column)).items():
+            results.setdefault(label, ([], []))[1].append(result)
+        return results
 
-    def validate_genome_references(self) -> None:
+    @staticmethod
+    def _no_keys(keys: Set[str]) -> Dict[str, bool]:
+        """Resolver for checks without references."""
+        return {}
+
+    def validate_genome_references(self, findings: Optional[Findings] = None) -> None:
         """Validate that organism references in other tables match genome entries."""
+        report = findings or self
         if self.genomes_df.empty:
-            self.warnings.append("Genomes table is empty, skipping genome reference validation")
+            report.warnings.append("Genomes table is empty, skipping genome reference validation")
             return
 
-        # Build set of valid organism names and genome IDs
-        valid_organisms = set()
-        valid_genome_ids = set()
-
-        for _, row in self.genomes_df.iterrows():
-            if pd.notna(row.get('Scientific name')):
-                valid_organisms.add(str(row['Scientific name']).strip())
-            if pd.notna(row.get('Genome identifier (GenBank, IMG etc)')):
-                valid_genome_ids.add(str(row['Genome identifier (GenBank, IMG etc)']).strip())
+        report.info.append(f"Found {len(self.organisms)} organisms in genomes table")
+        report.info.append(f"Found {len(self.genome_ids)} genome IDs in genomes table")
 
-        self.info.append(f"Found {len(valid_organisms)} organisms in genomes table")
-        self.info.append(f"Found {len(valid_genome_ids)} genome IDs in genomes table")
-
-        # Check genes/proteins organism references
+        # Check genes/proteins organism references (fuzzy match on genus)
         if not self.genes_df.empty:
-            gene_organisms = set()
-            for _, row in self.genes_df.iterrows():
-                org = row.get('organism (from taxa and genomes tab)')
-                if pd.notna(org):
-                    org_str = str(org).strip()
-                    gene_organisms.add(org_str)
-                    # Check if organism exists (fuzzy match on genus)
-                    genus = org_str.split()[0] if org_str else ""
-                    matched = any(genus in valid_org for valid_org in valid_organisms)
-                    if not matched and genus and genus not in ["Various", "Methylotroph"]:
-                        self.warnings.append(
-                            f"Gene/protein organism '{org_str}' not found in genomes table (genus: {genus})"
-                        )
-
-            self.info.append(f"Found {len(gene_organisms)} unique organisms in genes/proteins table")
+            column = 'organism (from taxa and genomes tab)'
+            gene_organisms = column_values(self.genes_df, column)
+            report.warnings.extend(self._row_results(
+                'gene_organisms', self.genes_df, [column],
+                lambda rows: self._check_organisms(
+                    rows, column,
+                    lambda label, org_str, genus:
+                        f"Gene/protein organism '{org_str}' not found in genomes table (genus: {genus})",
+                    UNLISTED_GENERA
+                ),
+                self._resolve_genera
+            ))
+
+            report.info.append(f"Found {gene_organisms.nunique()} unique organisms in genes/proteins table")
 
         # Check pathways organism references
         if not self.pathways_df.empty:
-            pathway_organisms = set()
-            for _, row in self.pathways_df.iterrows():
-                org = row.get('organism')
-                if pd.notna(org):
-                    org_str = str(org).strip()
-                    pathway_organisms.add(org_str)
-
-            self.info.append(f"Found {len(pathway_organisms)} unique organisms in pathways table")
+            pathway_organisms = column_values(self.pathways_df, 'organism')
+            report.info.append(f"Found {pathway_organisms.nunique()} unique organisms in pathways table")
 
-        # Check structures organism references
+        # Check structures organism references (fuzzy match on genus)
         if not self.structures_df.empty:
-            structure_organisms = set()
-            for _, row in self.structures_df.iterrows():
-                org = row.get('Organism')
-                if pd.notna(org):
-                    org_str = str(org).strip()
-                    structure_organisms.add(org_str)
-                    # Check if organism exists (fuzzy match)
-                    genus = org_str.split()[0] if org_str else ""
-                    matched = any(genus in valid_org for valid_org in valid_organisms)
-                    if not matched and genus and genus not in ["Various", "Methylotroph"]:
-                        self.warnings.append(
-                            f"Structure organism '{org_str}' not found in genomes table (genus: {genus})"
-                        )
-
-            self.info.append(f"Found {len(structure_organisms)} unique organisms in structures table")
-
-    def validate_biosample_references(self) -> None:
+            structure_organisms = column_values(self.structures_df, 'Organism')
+            report.warnings.extend(self._row_results(
+                'structure_organisms', self.structures_df, ['Organism'],
+                lambda rows: self._check_organisms(
+                    rows, 'Organism',
+                    lambda label, org_str, genus:
+                        f"Structure organism '{org_str}' not found in genomes table (genus: {genus})",
+                    UNLISTED_GENERA
+                ),
+                self._resolve_genera
+            ))
+
+            report.info.append(f"Found {structure_organisms.nunique()} unique organisms in structures table")
+
+    def validate_biosample_references(self, findings: Optional[Findings] = None) -> None:
         """Validate biosample references and organism consistency."""
+        report = findings or self
         if self.biosamples_df.empty:
-            self.warnings.append("Biosamples table is empty, skipping biosample validation")
+            report.warnings.append("Biosamples table is empty, skipping biosample validation")
             return
 
-        # Build set of valid sample IDs
-        valid_sample_ids = set()
-        for _, row in self.biosamples_df.iterrows():
-            if pd.notna(row.get('Sample ID')):
-                valid_sample_ids.add(str(row['Sample ID']).strip())
-
-        self.info.append(f"Found {len(valid_sample_ids)} sample IDs in biosamples table")
+        report.info.append(f"Found {len(self.sample_ids)} sample IDs in biosamples table")
 
         # Check for duplicate sample IDs
         sample_ids = self.biosamples_df['Sample ID'].dropna()
         duplicates = sample_ids[sample_ids.duplicated()].unique()
         if len(duplicates) > 0:
-            self.errors.append(f"Found {len(duplicates)} duplicate sample IDs: {list(duplicates)[:5]}")
+            report.errors.append(f"Found {len(duplicates)} duplicate sample IDs: {list(duplicates)[:5]}")
 
-    def validate_pathway_gene_references(self) -> None:
+    def validate_pathway_gene_references(self, findings: Optional[Findings] = None) -> None:
         """Validate that genes mentioned in pathways exist in genes table."""
+        report = findings or self
         if self.pathways_df.empty or self.genes_df.empty:
-            self.warnings.append("Pathways or genes table is empty, skipping pathway-gene validation")
+            report.warnings.append("Pathways or genes table is empty, skipping pathway-gene validation")
             return
 
-        # Build set of valid gene IDs
-        valid_gene_ids = set()
-        for _, row in self.genes_df.iterrows():
-            gene_id = row.get('gene or protein id')
-            if pd.notna(gene_id):
-                gene_str = str(gene_id).strip()
-                valid_gene_ids.add(gene_str)
-                # Also add base ID without suffixes
-                if '_' in gene_str:
-                    base_id = gene_str.split('_')[0]
-                    valid_gene_ids.add(base_id)
-
-        self.info.append(f"Found {len(valid_gene_ids)} gene/protein IDs in genes table")
-
-        # Check pathway gene references
-        pathway_genes = set()
-        for _, row in self.pathways_df.iterrows():
-            # Check "genes (from genes & proteins tab)" column
-            genes_col = row.get('genes (from genes & proteins tab)')
-            if pd.notna(genes_col):
-                import re
-                # Extract K numbers
-                k_numbers = re.findall(r'K\d+', str(genes_col))
-                pathway_genes.update(k_numbers)
-
-        self.info.append(f"Found {len(pathway_genes)} unique gene IDs referenced in pathways")
+        report.info.append(f"Found {len(self.gene_ids)} gene/protein IDs in genes table")
+
+        # Extract K numbers from the "genes (from genes & proteins tab)" column
+        column = 'genes (from genes & proteins tab)'
+        pathway_genes = set(self._row_results(
+            'pathway_k_numbers', self.pathways_df, [column],
+            lambda rows: self._check_values(
+                rows, column, lambda values: values.str.findall(r'K\d+').explode().dropna()
+            ),
+            self._no_keys
+        ))
+
+        report.info.append(f"Found {len(pathway_genes)} unique gene IDs referenced in pathways")
 
         # Check which pathway genes are not in genes table
-        missing_genes = pathway_genes - valid_gene_ids
+        missing_genes = pathway_genes - self.gene_ids
         if missing_genes:
-            self.warnings.append(
+            report.warnings.append(
                 f"Found {len(missing_genes)} gene IDs in pathways not in genes table: {list(missing_genes)[:10]}"
             )
 
-    def validate_url_consistency(self) -> None:
+    def validate_url_consistency(self, findings: Optional[Findings] = None) -> None:
         """Validate that Download URLs are properly formatted and accessible."""
+        report = findings or self
         url_columns = [
             (self.genomes_df, 'Annotation download URL', 'genomes'),
             (self.biosamples_df, 'Download URL', 'biosamples'),
@@ -222,23 +512,22 @@ class ConsistencyValidator:
             (self.datasets_df, 'Download URL', 'datasets'),
         ]
 
-        import re
-        url_pattern = re.compile(r'https?://[^\s]+')
-
         for df, col_name, table_name in url_columns:
             if df.empty or col_name not in df.columns:
                 continue
 
-            urls = df[col_name].dropna()
-            invalid_urls = []
-
-            for url in urls:
-                url_str = str(url).strip()
-                if url_str and not url_pattern.match(url_str):
-                    invalid_urls.append(url_str[:100])  # First 100 chars
+            urls = column_values(df, col_name)
+            invalid_urls = self._row_results(
+                f'invalid_urls:{table_name}', df, [col_name],
+                lambda rows, col_name=col_name: self._check_values(
+                    rows, col_name,
+                    lambda values: values[(values != '') & ~matches_mask(values, r'https?://[^\s]+')].str[:100]
+                ),
+                self._no_keys
+            )  # First 100 chars
 
             if invalid_urls:
-                self.warnings.append(
+                report.warnings.append(
                     f"Found {len(invalid_urls)} invalid URLs in {table_name} table: {invalid_urls[:3]}"
                 )
 
@@ -246,10 +535,11 @@ class ConsistencyValidator:
             url_count = len(urls)
             total_count = len(df)
             coverage = (url_count / total_count * 100) if total_count > 0 else 0
-            self.info.append(f"{table_name}: {url_count}/{total_count} ({coverage:.1f}%) have download URLs")
+            report.info.append(f"{table_name}: {url_count}/{total_count} ({coverage:.1f}%) have download URLs")
 
-    def validate_identifier_uniqueness(self) -> None:
+    def validate_identifier_uniqueness(self, findings: Optional[Findings] = None) -> None:
         """Validate that primary identifiers are unique within each table."""
+        report = findings or self
         checks = [
             (self.genomes_df, 'Scientific name', 'genomes'),
             (self.biosamples_df, 'Sample ID', 'biosamples'),
@@ -272,11 +562,11 @@ class ConsistencyValidator:
             duplicates = ids[ids.duplicated()].unique()
 
             if len(duplicates) > 0:
-                self.errors.append(
+                report.errors.append(
                     f"{table_name} table: Found {len(duplicates)} duplicate {id_col} values: {list(duplicates)[:5]}"
                 )
             else:
-                self.info.append(f"{table_name} table: All {id_col} values are unique ({len(ids)} records)")
+                report.info.append(f"{table_name} table: All {id_col} values are unique ({len(ids)} records)")
 
         # Special handling for genes/proteins: check gene_id + organism combination
         if not self.genes_df.empty:
@@ -285,29 +575,25 @@ class ConsistencyValidator:
             organism_col = self._get_column(self.genes_df, 'organism (from taxa and genomes tab)', 'organism', 'Organism')
 
             if gene_id_col is not None and organism_col is not None:
-                gene_df = self.genes_df.copy()
-                # Create composite key
-                gene_df['composite_key'] = (
-                    gene_id_col.astype(str) + '::' +
-                    organism_col.astype(str)
-                )
-                composite_ids = gene_df['composite_key'].dropna()
+                # Composite key
+                composite_ids = gene_id_col.astype(str) + '::' + organism_col.astype(str)
                 duplicates = composite_ids[composite_ids.duplicated()].unique()
 
                 if len(duplicates) > 0:
-                    self.errors.append(
+                    report.errors.append(
                         f"genes/proteins table: Found {len(duplicates)} duplicate gene+organism combinations: {list(duplicates)[:5]}"
                     )
                 else:
                     # Count unique gene IDs (may have duplicates across organisms, which is OK)
                     unique_genes = gene_id_col.nunique()
                     total_records = len(gene_id_col.dropna())
-                    self.info.append(
+                    report.info.append(
                         f"genes/proteins table: {unique_genes} unique gene IDs across {total_records} records (duplicates across organisms are allowed)"
                     )
 
-    def validate_required_columns(self) -> None:
+    def validate_required_columns(self, findings: Optional[Findings] = None) -> None:
         """Validate that required columns exist in each table."""
+        report = findings or self
         # Map required columns with alternative names
         required_columns = {
             'genomes': [
@@ -365,10 +651,11 @@ class ConsistencyValidator:
                     missing.append(display_name)
 
             if missing:
-                self.errors.append(f"{table_name} table missing required columns: {missing}")
+                report.errors.append(f"{table_name} table missing required columns: {missing}")
 
-    def validate_data_completeness(self) -> None:
+    def validate_data_completeness(self, findings: Optional[Findings] = None) -> None:
         """Check for completeness of critical fields."""
+        report = findings or self
         checks = [
             (self.genomes_df, 'Genome identifier (GenBank, IMG etc)', 'genome IDs'),
             (self.genomes_df, 'Annotation download URL', 'genome annotation URLs'),
@@ -388,183 +675,179 @@ class ConsistencyValidator:
             coverage = (filled / total * 100) if total > 0 else 0
 
             if coverage < 50:
-                self.warnings.append(
+                report.warnings.append(
                     f"Low coverage for {field_name}: {filled}/{total} ({coverage:.1f}%)"
                 )
             else:
-                self.info.append(
+                report.info.append(
                     f"{field_name}: {filled}/{total} ({coverage:.1f}%) populated"
                 )
 
-    def validate_experimental_cross_references(self) -> None:
+    def validate_experimental_cross_references(self, findings: Optional[Findings] = None) -> None:
         """Validate cross-references between experimental data tables."""
+        report = findings or self
+        screening_ids = row_labels(self.screening_results_df, 'experiment_id')
+
         # Validate assay references in screening results
         if not self.screening_results_df.empty and not self.assays_df.empty:
-            valid_assay_ids = set()
-            for _, row in self.assays_df.iterrows():
-                if pd.notna(row.get('assay_id')):
-                    valid_assay_ids.add(str(row['assay_id']).strip())
-
-            self.info.append(f"Found {len(valid_assay_ids)} assay IDs in assays table")
+            report.info.append(f"Found {len(self.assay_ids)} assay IDs in assays table")
 
             # Check screening_assay and assay_reference columns
-            for _, row in self.screening_results_df.iterrows():
-                for col in ['screening_assay', 'assay_reference']:
-                    assay_ref = row.get(col)
-                    if pd.notna(assay_ref):
-                        assay_str = str(assay_ref).strip()
-                        if assay_str and assay_str not in valid_assay_ids:
-                            self.warnings.append(
-                                f"Screening result {row.get('experiment_id')} references unknown assay: {assay_str}"
-                            )
+            columns = ['screening_assay', 'assay_reference']
+            report.warnings.extend(self._row_results(
+                'screening_assays', self.screening_results_df, columns + ['experiment_id'],
+                lambda rows: self._check_references(
+                    rows, columns, self.assay_ids,
+                    lambda label, assay_str:
+                        f"Screening result {screening_ids[label]} references unknown assay: {assay_str}"
+                ),
+                lambda keys: {key: key in self.assay_ids for key in keys}
+            ))
 
         # Validate protocol references in assays
         if not self.assays_df.empty and not self.protocols_df.empty:
-            valid_protocol_ids = set()
-            for _, row in self.protocols_df.iterrows():
-                if pd.notna(row.get('protocol_id')):
-                    valid_protocol_ids.add(str(row['protocol_id']).strip())
-
-            self.info.append(f"Found {len(valid_protocol_ids)} protocol IDs in protocols table")
-
-            for _, row in self.assays_df.iterrows():
-                protocol_ref = row.get('protocol_reference')
-                if pd.notna(protocol_ref):
-                    protocol_str = str(protocol_ref).strip()
-                    if protocol_str and protocol_str not in valid_protocol_ids:
-                        self.warnings.append(
-                            f"Assay {row.get('assay_id')} references unknown protocol: {protocol_str}"
-                        )
-
-        # Validate organism references in bioprocesses
+            report.info.append(f"Found {len(self.protocol_ids)} protocol IDs in protocols table")
+
+            assay_ids = row_labels(self.assays_df, 'assay_id')
+            report.warnings.extend(self._row_results(
+                'assay_protocols', self.assays_df, ['protocol_reference', 'assay_id'],
+                lambda rows: self._check_references(
+                    rows, ['protocol_reference'], self.protocol_ids,
+                    lambda label, protocol_str:
+                        f"Assay {assay_ids[label]} references unknown protocol: {protocol_str}"
+                ),
+                lambda keys: {key: key in self.protocol_ids for key in keys}
+            ))
+
+        # Validate organism references in bioprocesses (fuzzy match on genus)
         if not self.bioprocesses_df.empty and not self.genomes_df.empty:
-            valid_organisms = set()
-            for _, row in self.genomes_df.iterrows():
-                if pd.notna(row.get('Scientific name')):
-                    valid_organisms.add(str(row['Scientific name']).strip())
-
-            for _, row in self.bioprocesses_df.iterrows():
-                organism = row.get('organism_used')
-                if pd.notna(organism):
-                    org_str = str(organism).strip()
-                    # Fuzzy match on genus
-                    genus = org_str.split()[0] if org_str else ""
-                    matched = any(genus in valid_org for valid_org in valid_organisms)
-                    if not matched and genus:
-                        self.warnings.append(
-                            f"Bioprocess {row.get('process_id')} references organism not in genomes table: {org_str}"
-                        )
+            process_ids = row_labels(self.bioprocesses_df, 'process_id')
+            report.warnings.extend(self._row_results(
+                'bioprocess_organisms', self.bioprocesses_df, ['organism_used', 'process_id'],
+                lambda rows: self._check_organisms(
+                    rows, 'organism_used',
+                    lambda label, org_str, genus:
+                        f"Bioprocess {process_ids[label]} references organism not in genomes table: {org_str}"
+                ),
+                self._resolve_genera
+            ))
 
         # Validate strain barcodes in screening results
         if not self.screening_results_df.empty:
-            strain_barcodes = set()
-            for _, row in self.screening_results_df.iterrows():
-                barcode = row.get('strain_barcode')
-                if pd.notna(barcode):
-                    strain_barcodes.add(str(barcode).strip())
-
-            if strain_barcodes:
-                self.info.append(f"Found {len(strain_barcodes)} unique strain barcodes in screening results")
+            strain_barcodes = column_values(self.screening_results_df, 'strain_barcode')
+            if len(strain_barcodes):
+                report.info.append(f"Found {strain_barcodes.nunique()} unique strain barcodes in screening results")
 
         # Validate follow-up experiment references in screening results
         if not self.screening_results_df.empty and not self.bioprocesses_df.empty:
-            valid_process_ids = set()
-            for _, row in self.bioprocesses_df.iterrows():
-                if pd.notna(row.get('process_id')):
-                    valid_process_ids.add(str(row['process_id']).strip())
-
-            for _, row in self.screening_results_df.iterrows():
-                follow_up = row.get('follow_up_experiments')
-                if pd.notna(follow_up):
-                    follow_str = str(follow_up).strip()
-                    # Extract process IDs (e.g., "BP-001 (biosorption scale-up)")
-                    import re
-                    process_ids = re.findall(r'BP-\d+', follow_str)
-                    for pid in process_ids:
-                        if pid not in valid_process_ids:
-                            self.warnings.append(
-                                f"Screening result {row.get('experiment_id')} references unknown bioprocess: {pid}"
-                            )
-
-    def validate_chemical_references(self) -> None:
+            # Extract process IDs (e.g., "BP-001 (biosorption scale-up)")
+            report.warnings.extend(self._row_results(
+                'screening_follow_ups', self.screening_results_df, ['follow_up_experiments', 'experiment_id'],
+                lambda rows: self._check_references(
+                    rows, ['follow_up_experiments'], self.process_ids,
+                    lambda label, pid:
+                        f"Screening result {screening_ids[label]} references unknown bioprocess: {pid}",
+                    extract=lambda values: values.str.findall(r'BP-\d+').explode().dropna()
+                ),
+                lambda keys: {key: key in self.process_ids for key in keys}
+            ))
+
+    def validate_chemical_references(self, findings: Optional[Findings] = None) -> None:
         """Validate chemical compound identifiers against external databases."""
+        report = findings or self
         if self.chemicals_df.empty:
-            self.warnings.append("Chemicals table is empty, skipping chemical validation")
+            report.warnings.append("Chemicals table is empty, skipping chemical validation")
             return
 
         # Check CHEBI ID format
-        chebi_count = 0
-        for _, row in self.chemicals_df.iterrows():
-            chebi = row.get('chebi_id')
-            if pd.notna(chebi):
-                import re
-                chebi_str = str(chebi).strip()
-                if re.match(r'CHEBI:\d+', chebi_str):
-                    chebi_count += 1
-                else:
-                    self.warnings.append(f"Invalid CHEBI ID format: {chebi_str}")
-
-        self.info.append(f"{chebi_count} chemicals have valid CHEBI IDs")
+        chebi_count = len(column_values(self.chemicals_df, 'chebi_id'))
+        for message in self._row_results(
+            'chebi_ids', self.chemicals_df, ['chebi_id'],
+            lambda rows: self._check_values(
+                rows, 'chebi_id',
+                lambda chebi: "Invalid CHEBI ID format: " + chebi[~matches_mask(chebi, r'CHEBI:\d+')]
+            ),
+            self._no_keys
+        ):
+            report.warnings.append(message)
+            chebi_count -= 1
+
+        report.info.append(f"{chebi_count} chemicals have valid CHEBI IDs")
 
         # Check PubChem ID format (should be numeric)
-        pubchem_count = 0
-        for _, row in self.chemicals_df.iterrows():
-            pubchem = row.get('pubchem_id')
-            if pd.notna(pubchem):
-                pubchem_str = str(pubchem).strip()
-                # Remove .0 suffix if present (pandas converts to float)
-                if pubchem_str.endswith('.0'):
-                    pubchem_str = pubchem_str[:-2]
-                if pubchem_str.isdigit():
-                    pubchem_count += 1
-                else:
-                    self.warnings.append(f"Invalid PubChem ID format: {pubchem_str} (should be numeric)")
-
-        self.info.append(f"{pubchem_count} chemicals have valid PubChem IDs")
+        pubchem_count = len(column_values(self.chemicals_df, 'pubchem_id'))
+        for message in self._row_results(
+            'pubchem_ids', self.chemicals_df, ['pubchem_id'],
+            lambda rows: self._check_values(rows, 'pubchem_id', invalid_pubchem_ids),
+            self._no_keys
+        ):
+            report.warnings.append(message)
+            pubchem_count -= 1
+
+        report.info.append(f"{pubchem_count} chemicals have valid PubChem IDs")
+
+    def _run_rule(self, rule: str, findings: Findings) -> None:
+        """Run validate_<rule>, or reuse its findings if its tables are unchanged."""
+        if self.state is not None:
+            inputs = {table: self.table_hashes.get(table) for table in RULE_TABLES[rule]}
+            cached = self.state.cached_findings(rule, inputs)
+            if cached is not None:
+                findings.errors.extend(cached['errors'])
+                findings.warnings.extend(cached['warnings'])
+                findings.info.extend(cached['info'])
+                return
+
+        getattr(self, f"validate_{rule}")(findings)
+
+        if self.state is not None:
+            self.state.record_findings(rule, inputs, asdict(findings))
 
     def run_all_validations(self) -> bool:
         """Run all validation checks.
 
+        The rules only read the loaded tables, so they run concurrently; each
+        collects its own findings, which are reported in rule order. With a
+        state store, rules whose tables are unchanged reuse their previous
+        findings, and the updated store is saved afterwards.
+
         Returns:
             True if no errors found, False otherwise
         """
         print("Running cross-sheet consistency validation...\n")
 
-        # Required columns check
-        print("1. Checking required columns...")
-        self.validate_required_columns()
-
-        # Identifier uniqueness check
-        print("2. Checking identifier uniqueness...")
-        self.validate_identifier_uniqueness()
-
-        # Genome reference validation
-        print("3. Validating genome references across sheets...")
-        self.validate_genome_references()
-
-        # Biosample validation
-        print("4. Validating biosample consistency...")
-        self.validate_biosample_references()
-
-        # Pathway-gene cross-references
-        print("5. Validating pathway-gene relationships...")
-        self.validate_pathway_gene_references()
-
-        # URL validation
-        print("6. Validating URL consistency...")
-        self.validate_url_consistency()
-
-        # Data completeness
-        print("7. Checking data completeness...")
-        self.validate_data_completeness()
-
-        # Experimental cross-references
-        print("8. Validating experimental cross-references...")
-        self.validate_experimental_cross_references()
+        rules = [
+            ("1. Checking required columns...", 'required_columns'),
+            ("2. Checking identifier uniqueness...", 'identifier_uniqueness'),
+            ("3. Validating genome references across sheets...", 'genome_references'),
+            ("4. Validating biosample consistency...", 'biosample_references'),
+            ("5. Validating pathway-gene relationships...", 'pathway_gene_references'),
+            ("6. Validating URL consistency...", 'url_consistency'),
+            ("7. Checking data completeness...", 'data_completeness'),
+            ("8. Validating experimental cross-references...", 'experimental_cross_references'),
+            ("9. Validating chemical identifiers...", 'chemical_references'),
+        ]
 
-        # Chemical identifiers
-        print("9. Validating chemical identifiers...")
-        self.validate_chemical_references()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            submitted = []
+            for message, rule in rules:
+                print(message)
+                findings = Findings()
+                submitted.append((findings, executor.submit(self._run_rule, rule, findings)))
+
+            for findings, future in submitted:
+                future.result()
+                self.errors.extend(findings.errors)
+                self.warnings.extend(findings.warnings)
+                self.info.extend(findings.info)
+
+        if self.state is not None:
+            checked = sum(counts[0] for counts in self.state.row_counts.values())
+            total = sum(counts[1] for counts in self.state.row_counts.values())
+            print(
+                f"\nIncremental validation: reused {len(self.state.reused_rules)}/{len(rules)} rules, "
+                f"rechecked {checked}/{total} rows"
+            )
+            self.state.save()
 
         # Print results
         print("\n" + "=" * 80)
@@ -616,10 +899,32 @@ def main():
         help='Treat warnings as errors (fail validation on warnings)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Threads for running validation rules (default: executor default)'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Revalidate everything instead of reusing results of unchanged tables and rows'
+    )
+    parser.add_argument(
+        '--no-state',
+        action='store_true',
+        help=f'Do not read or write the validation state store ({DEFAULT_STATE_NAME})'
+    )
+
     args = parser.parse_args()
 
     # Run validation
-    validator = ConsistencyValidator(args.data_dir)
+    state = None
+    if not args.no_state:
+        state = ValidationState(args.data_dir / DEFAULT_STATE_NAME, RULES_VERSION)
+        if args.full:
+            state.clear()
+    validator = ConsistencyValidator(args.data_dir, workers=args.workers, state=state)
     success = validator.run_all_validations()
 
     # Exit with appropriate code
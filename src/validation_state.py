@@ -0,0 +1,141 @@
+"""Stored results of the previous consistency validation run.
+
+validate_consistency keeps, next to the sheets:
+- for every rule, the content hashes of the tables it read and the findings
+  it produced, so a rule whose tables are all unchanged reuses its findings
+- for rules that check rows one by one, each row's results and the keys it
+  references (a genus, an assay ID, ...) together with how each key
+  resolved, stored under a hash of the columns the rule reads
+
+When a row-by-row rule has to run again, only rows with a new hash, or that
+reference a key which now resolves differently, are checked; the results of
+the other rows are taken from the store and merged in row order.
+
+Results are stored with the version of the validation rules that produced
+them; a state written under another rules version is ignored, so changing a
+rule revalidates every table. The store can be deleted at any time; the next
+run validates everything.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+STATE_FORMAT_VERSION = 1
+
+DEFAULT_STATE_NAME = "validation_state.json"
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 of a table file's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def row_hashes(df: pd.DataFrame, columns: Iterable[str]) -> pd.Series:
+    """Hash of the given columns of each row (missing columns count as empty).
+
+    Examples:
+        >>> df = pd.DataFrame({"id": ["A", "B", "A"], "note": ["x", "y", "z"]})
+        >>> hashes = row_hashes(df, ["id", "organism"])
+        >>> hashes[0] == hashes[2], hashes[0] == hashes[1]
+        (True, False)
+    """
+    columns = list(columns)
+    selected = pd.DataFrame(
+        {column: df[column] if column in df.columns else None for column in columns},
+        index=df.index
+    )
+    return pd.util.hash_pandas_object(selected, index=False).astype(str)
+
+
+class ValidationState:
+    """Per-rule findings and per-row results from the previous validation run."""
+
+    def __init__(self, path: Path, rules_version: int):
+        """Initialize state and load the stored copy, if any.
+
+        Args:
+            path: State file
+            rules_version: Version of the validation rules in use
+        """
+        self.path = Path(path)
+        self.rules_version = rules_version
+        # rule → {'inputs': {table: hash}, 'findings': {'errors', 'warnings', 'info'}}
+        self.findings: Dict[str, Dict] = {}
+        # row rule → {'rows': {row hash: [keys, results]}, 'keys': {key: resolved}}
+        self.rows: Dict[str, Dict] = {}
+        # This run: rules reused, and rows (checked, total) per row rule
+        self.reused_rules: List[str] = []
+        self.row_counts: Dict[str, Tuple[int, int]] = {}
+        self._dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"  ⚠️  Ignoring unreadable validation state {self.path}: {e}")
+                data = {}
+            if (
+                data.get('format_version') == STATE_FORMAT_VERSION
+                and data.get('rules_version') == rules_version
+            ):
+                self.findings = data.get('findings', {})
+                self.rows = data.get('rows', {})
+
+    def clear(self) -> None:
+        """Forget all stored results (the next rules run in full)."""
+        self.findings = {}
+        self.rows = {}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the state atomically if it changed."""
+        if not self._dirty:
+            return
+        data = {
+            'format_version': STATE_FORMAT_VERSION,
+            'rules_version': self.rules_version,
+            'findings': self.findings,
+            'rows': self.rows,
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def cached_findings(self, rule: str, inputs: Dict[str, Optional[str]]) -> Optional[Dict[str, List[str]]]:
+        """Findings of a rule from the previous run, if its input tables are unchanged."""
+        entry = self.findings.get(rule)
+        if entry is None or entry['inputs'] != inputs:
+            return None
+        self.reused_rules.append(rule)
+        return entry['findings']
+
+    def record_findings(self, rule: str, inputs: Dict[str, Optional[str]], findings: Dict[str, List[str]]) -> None:
+        """Store the findings of a rule run against the given input tables."""
+        self.findings[rule] = {'inputs': inputs, 'findings': findings}
+        self._dirty = True
+
+    def row_cache(self, rule: str) -> Tuple[Dict[str, List], Dict[str, bool]]:
+        """Stored (row hash → [keys, results], key → resolved) of a row rule."""
+        entry = self.rows.get(rule, {})
+        return entry.get('rows', {}), entry.get('keys', {})
+
+    def record_rows(
+        self,
+        rule: str,
+        rows: Dict[str, List],
+        keys: Dict[str, bool],
+        checked: int,
+        total: int
+    ) -> None:
+        """Replace the stored rows of a row rule with this run's rows."""
+        self.rows[rule] = {'rows': rows, 'keys': keys}
+        self.row_counts[rule] = (checked, total)
+        self._dirty = True